@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark de lecturas puntuales: consulta de texto vs sentencia preparada
+Mide la latencia de ida y vuelta de obtener_por_id (autos y el join de tres
+tablas de ventas) contra la base de datos configurada en .env
+
+Uso:
+    python benchmarks/bench_consultas_puntuales.py
+    python benchmarks/bench_consultas_puntuales.py --repeticiones 2000 --json
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from model.conexion import db  # noqa: E402
+from model.auto_model import AutoModel  # noqa: E402
+from model.venta_model import VentaModel  # noqa: E402
+
+CONSULTAS = {
+    "auto_por_id": (
+        f"SELECT {AutoModel.COLUMNAS_DETALLE} FROM autos WHERE id_auto = %s",
+        "SELECT id_auto FROM autos",
+    ),
+    "venta_por_id": (
+        f"""
+            SELECT {VentaModel.COLUMNAS_DETALLE}
+            FROM ventas v
+            INNER JOIN autos a ON v.id_auto = a.id_auto
+            INNER JOIN clientes c ON v.id_cliente = c.id_cliente
+            WHERE v.id_venta = %s
+        """,
+        "SELECT id_venta FROM ventas",
+    ),
+}
+
+
+def percentil(valores, p):
+    """Percentil p (0-100) de una lista de valores"""
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))
+    return ordenados[indice]
+
+
+def medir(funcion, query, ids, repeticiones):
+    """
+    Ejecuta la consulta repeticiones veces con ids al azar
+
+    Returns:
+        list: Latencias en microsegundos
+    """
+    latencias = []
+    for _ in range(repeticiones):
+        params = (random.choice(ids),)
+        inicio = time.perf_counter()
+        success, result = funcion(query, params)
+        latencias.append((time.perf_counter() - inicio) * 1_000_000)
+        if not success:
+            raise RuntimeError(result)
+    return latencias
+
+
+def resumen(latencias):
+    return {
+        "mediana_us": round(statistics.median(latencias), 1),
+        "p95_us": round(percentil(latencias, 95), 1),
+        "media_us": round(statistics.mean(latencias), 1),
+    }
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Latencia de lecturas puntuales: texto vs preparada")
+    parser.add_argument("--repeticiones", type=int, default=1000, help="Consultas por variante")
+    parser.add_argument("--calentamiento", type=int, default=50, help="Consultas previas sin medir")
+    parser.add_argument("--json", action="store_true", help="Imprimir resultados en JSON")
+    args = parser.parse_args(argv)
+
+    success, message = db.connect()
+    if not success:
+        print(f"❌ {message}")
+        return 1
+
+    # Medir siempre contra MySQL aunque la réplica local esté configurada
+    db.usar_replica(None)
+    random.seed(42)
+
+    variantes = {
+        "texto": lambda query, params: db.fetch_one(query, params),
+        "preparada": lambda query, params: db.fetch_preparada(query, params, una=True),
+    }
+
+    resultados = []
+    try:
+        for nombre, (query, query_ids) in CONSULTAS.items():
+            success, filas = db.fetch_all(query_ids)
+            if not success:
+                print(f"❌ {filas}")
+                return 1
+            ids = [next(iter(fila.values())) for fila in filas]
+            if not ids:
+                print(f"⚠️ {nombre}: la tabla está vacía, se omite")
+                continue
+
+            for variante, funcion in variantes.items():
+                medir(funcion, query, ids, args.calentamiento)
+                latencias = medir(funcion, query, ids, args.repeticiones)
+                resultados.append({"consulta": nombre, "variante": variante, **resumen(latencias)})
+    finally:
+        db.disconnect()
+
+    if args.json:
+        print(json.dumps(resultados, indent=2))
+        return 0
+
+    print(f"Latencia de lecturas puntuales ({args.repeticiones} consultas por variante)")
+    print(f"  {'consulta':<14} {'variante':<10} {'mediana':>10} {'p95':>10}")
+    for r in resultados:
+        print(
+            f"  {r['consulta']:<14} {r['variante']:<10} "
+            f"{r['mediana_us']:>8.0f}µs {r['p95_us']:>8.0f}µs"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
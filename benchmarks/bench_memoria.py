@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memoria por fila de los listados
+Compara las filas dict que retorna fetch_all con los registros compactos de
+model/registros.py usando datos sintéticos (no requiere base de datos)
+
+Uso:
+    python benchmarks/bench_memoria.py
+    python benchmarks/bench_memoria.py --filas 100000 --json
+"""
+import argparse
+import json
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from model.registros import Auto, Cliente, Venta  # noqa: E402
+
+MARCAS = ["Toyota", "Nissan", "Chevrolet", "Ford", "Honda", "Mazda", "Kia", "Volkswagen"]
+
+
+def fila_auto(i):
+    """Tupla sintética con las columnas de AutoModel.COLUMNAS_LISTA"""
+    return (
+        i, MARCAS[i % len(MARCAS)], f"Modelo {i % 50}", 2000 + i % 25, "Rojo",
+        "Manual" if i % 2 else "Automática", "Gasolina", Decimal(150000 + i),
+        f"https://res.cloudinary.com/demo/image/upload/autos/{i}.jpg",
+    )
+
+
+def fila_cliente(i):
+    """Tupla sintética con las columnas de ClienteModel.COLUMNAS_LISTA"""
+    return (i, f"Cliente {i}", f"55{i:08d}", f"cliente{i}@correo.com", f"Calle {i % 300} #{i}")
+
+
+def fila_venta(i):
+    """Tupla sintética con las columnas de VentaModel.COLUMNAS_LISTA"""
+    return (
+        i, i % 1000, i % 5000, datetime(2024, 1, 1) + timedelta(minutes=i),
+        Decimal(200000 + i), "Efectivo", MARCAS[i % len(MARCAS)], f"Modelo {i % 50}",
+        2000 + i % 25, f"Cliente {i % 5000}",
+    )
+
+
+def medir(construir, filas):
+    """
+    Mide los bytes asignados para retener la lista construida
+
+    Returns:
+        int: Bytes retenidos por la lista completa
+    """
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    resultado = construir(filas)
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del resultado
+    return despues - antes
+
+
+def comparar(nombre, record_cls, generar, n):
+    """Compara dict contra registro compacto para n filas"""
+    # Las tuplas de origen se crean fuera de la medición (simulan el cursor)
+    tuplas = [generar(i) for i in range(n)]
+    columnas = record_cls.CAMPOS
+
+    bytes_dict = medir(lambda filas: [dict(zip(columnas, f)) for f in filas], tuplas)
+    bytes_registro = medir(lambda filas: [record_cls._make(f) for f in filas], tuplas)
+
+    return {
+        "tabla": nombre,
+        "filas": n,
+        "bytes_por_fila_dict": round(bytes_dict / n, 1),
+        "bytes_por_fila_registro": round(bytes_registro / n, 1),
+        "reduccion_pct": round(100 * (1 - bytes_registro / bytes_dict), 1) if bytes_dict else 0.0,
+    }
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Memoria por fila: dict vs registro compacto")
+    parser.add_argument("--filas", type=int, default=50000, help="Filas sintéticas por tabla")
+    parser.add_argument("--json", action="store_true", help="Imprimir resultados en JSON")
+    args = parser.parse_args(argv)
+
+    resultados = [
+        comparar("autos", Auto, fila_auto, args.filas),
+        comparar("clientes", Cliente, fila_cliente, args.filas),
+        comparar("ventas", Venta, fila_venta, args.filas),
+    ]
+
+    if args.json:
+        print(json.dumps(resultados, indent=2))
+        return 0
+
+    print(f"Memoria retenida por fila ({args.filas} filas sintéticas)")
+    print(f"  {'tabla':<10} {'dict':>10} {'registro':>10} {'reducción':>10}")
+    for r in resultados:
+        print(
+            f"  {r['tabla']:<10} {r['bytes_por_fila_dict']:>9.0f}B "
+            f"{r['bytes_por_fila_registro']:>9.0f}B {r['reduccion_pct']:>9.1f}%"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark de arranque en frío
+Mide el costo de importación de los módulos de la aplicación con `-X importtime`
+y el tiempo hasta el primer pintado de la ventana principal
+
+Uso:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --modulo view.main_view --top 15
+    python benchmarks/bench_startup.py --objetivo-ms 1500 --repeticiones 5
+
+Retorna código 1 si la mediana del primer pintado supera el objetivo
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Tiempo objetivo hasta el primer pintado (ms) en un equipo de escritorio típico
+OBJETIVO_PRIMER_PINTADO_MS = 1500
+
+IMPORTTIME_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def medir_importaciones(modulo):
+    """
+    Ejecuta `python -X importtime -c 'import <modulo>'` y procesa la salida
+
+    Returns:
+        tuple: (total_us, lista de (modulo, self_us, acumulado_us, nivel))
+    """
+    cmd = [sys.executable, "-X", "importtime", "-c", f"import {modulo}"]
+    result = subprocess.run(cmd, cwd=ROOT_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        ultima = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "?"
+        raise RuntimeError(f"No se pudo importar {modulo}: {ultima}")
+
+    registros = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            self_us, acumulado_us, sangria, nombre = match.groups()
+            nivel = len(sangria) // 2
+            registros.append((nombre, int(self_us), int(acumulado_us), nivel))
+
+    total = sum(acumulado for _, _, acumulado, nivel in registros if nivel == 0)
+    return total, registros
+
+
+def medir_primer_pintado(timeout=60):
+    """
+    Inicia main.py con AUTOGEST_BENCH_FIRST_PAINT=1 y mide el tiempo hasta el primer pintado
+
+    Returns:
+        tuple: (ms_externo, ms_interno) o (None, mensaje_error)
+    """
+    env = dict(os.environ, AUTOGEST_BENCH_FIRST_PAINT="1")
+    inicio = time.perf_counter()
+    proceso = subprocess.Popen(
+        [sys.executable, str(ROOT_DIR / "main.py")],
+        cwd=ROOT_DIR, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    try:
+        for line in proceso.stdout:
+            if line.startswith("FIRST_PAINT_MS="):
+                externo = (time.perf_counter() - inicio) * 1000
+                interno = float(line.split("=", 1)[1])
+                proceso.wait(timeout)
+                return externo, interno
+        proceso.wait(timeout)
+        return None, (proceso.stderr.read().strip().splitlines() or ["sin salida"])[-1]
+    except subprocess.TimeoutExpired:
+        proceso.kill()
+        return None, "tiempo de espera agotado"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de arranque de AutoGest")
+    parser.add_argument("--modulo", default="view.main_view", help="Módulo a importar para -X importtime")
+    parser.add_argument("--top", type=int, default=10, help="Cantidad de módulos más costosos a mostrar")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Arranques para medir el primer pintado")
+    parser.add_argument("--objetivo-ms", type=float, default=OBJETIVO_PRIMER_PINTADO_MS)
+    parser.add_argument("--sin-ventana", action="store_true", help="Solo medir importaciones")
+    parser.add_argument("--json", help="Guardar los resultados en un archivo JSON")
+    args = parser.parse_args()
+
+    resultados = {"modulo": args.modulo, "objetivo_ms": args.objetivo_ms}
+
+    print(f"== Importación de {args.modulo} (-X importtime) ==")
+    try:
+        total_us, registros = medir_importaciones(args.modulo)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"Total: {total_us / 1000:.1f} ms")
+    costosos = sorted(registros, key=lambda r: r[1], reverse=True)[:args.top]
+    for nombre, self_us, acumulado_us, _ in costosos:
+        print(f"  {self_us / 1000:8.1f} ms propio  {acumulado_us / 1000:8.1f} ms acumulado  {nombre}")
+    resultados["importacion_ms"] = total_us / 1000
+    resultados["mas_costosos"] = [
+        {"modulo": n, "propio_ms": s / 1000, "acumulado_ms": a / 1000} for n, s, a, _ in costosos
+    ]
+
+    codigo = 0
+    if not args.sin_ventana:
+        print(f"\n== Tiempo al primer pintado ({args.repeticiones} arranques) ==")
+        externos = []
+        for i in range(args.repeticiones):
+            externo, interno = medir_primer_pintado()
+            if externo is None:
+                print(f"❌ No se pudo medir el primer pintado: {interno}")
+                break
+            externos.append(externo)
+            print(f"  arranque {i + 1}: {externo:.0f} ms (desde main.py: {interno:.0f} ms)")
+
+        if externos:
+            mediana = statistics.median(externos)
+            resultados["primer_pintado_ms"] = externos
+            resultados["primer_pintado_mediana_ms"] = mediana
+            estado = "✅" if mediana <= args.objetivo_ms else "❌"
+            print(f"{estado} Mediana: {mediana:.0f} ms (objetivo {args.objetivo_ms:.0f} ms)")
+            if mediana > args.objetivo_ms:
+                codigo = 1
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, indent=2)
+
+    return codigo
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks con datos sintéticos
+Carga autos, clientes y ventas generados con semilla (10k a 1M filas) y mide
+las consultas de los modelos, búsquedas, estadísticas, generación de PDFs,
+decodificación y redimensionado de imágenes y construcción de las vistas sin
+mostrarlas. Escribe los resultados en JSON para comparar entre commits.
+
+Motor de datos:
+    mysql   Base dedicada (--base, se recrea) en el servidor del .env
+    sqlite  Motor SQLite embebido sobre un archivo de cache/ (sin servidor)
+    auto    MySQL si hay servidor, si no SQLite
+
+Uso:
+    python benchmarks/bench_suite.py --escala 10k
+    python benchmarks/bench_suite.py --escala 100k --motor sqlite --salida base.json
+    python benchmarks/bench_suite.py --escala 100k --comparar base.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from benchmarks import datos_sinteticos  # noqa: E402
+from model.conexion import db  # noqa: E402
+from model.auto_model import AutoModel  # noqa: E402
+from model.cliente_model import ClienteModel  # noqa: E402
+from model.venta_model import VentaModel  # noqa: E402
+from utils.paths import path_manager  # noqa: E402
+
+RESULTADOS_DIR = Path(__file__).resolve().parent / "resultados"
+
+# Consultas puntuales por repetición (obtener_por_id, ventas por cliente)
+CONSULTAS_POR_REPETICION = 200
+
+# Lado del JPEG sintético y tamaño de miniatura de las tablas
+TAMANO_IMAGEN = (1600, 1200)
+TAMANO_MINIATURA = (50, 50)
+
+
+def percentil(valores, p):
+    """Percentil p (0-100) de una lista de valores"""
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+
+def commit_actual():
+    """Hash corto del commit (con -dirty si hay cambios sin confirmar) o None fuera de git"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        cambios = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        return f"{commit}-dirty" if cambios else commit
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def verificar(resultado):
+    """Convierte un (success, result) fallido en excepción para cortar la medición"""
+    success, result = resultado
+    if not success:
+        raise RuntimeError(result)
+    return result
+
+
+class Suite:
+    """Ejecuta los benchmarks y acumula los resultados"""
+
+    def __init__(self, repeticiones=5, calentamiento=1, filtro=None):
+        self.repeticiones = repeticiones
+        self.calentamiento = calentamiento
+        self.filtro = filtro
+        self.resultados = []
+
+    def medir(self, nombre, categoria, funcion, repeticiones=None):
+        """
+        Ejecuta funcion varias veces y guarda mediana, p95, mínimo y máximo en ms
+        funcion puede retornar la cantidad de filas procesadas o un dict con datos
+        adicionales (filas, objetos de Tk...) que se guardan en el resultado
+        """
+        if self.filtro and self.filtro not in nombre:
+            return
+        repeticiones = repeticiones or self.repeticiones
+        try:
+            for _ in range(self.calentamiento):
+                funcion()
+            tiempos = []
+            filas = None
+            for _ in range(repeticiones):
+                inicio = time.perf_counter()
+                filas = funcion()
+                tiempos.append((time.perf_counter() - inicio) * 1000)
+        except Exception as e:
+            self.omitir(nombre, categoria, f"error: {e}")
+            return
+
+        resultado = {
+            "nombre": nombre,
+            "categoria": categoria,
+            "repeticiones": repeticiones,
+            "mediana_ms": round(statistics.median(tiempos), 3),
+            "p95_ms": round(percentil(tiempos, 95), 3),
+            "min_ms": round(min(tiempos), 3),
+            "max_ms": round(max(tiempos), 3),
+        }
+        if isinstance(filas, int):
+            resultado["filas"] = filas
+        elif isinstance(filas, dict):
+            resultado.update(filas)
+        self.resultados.append(resultado)
+        print(f"  {nombre:<40} {resultado['mediana_ms']:>10.2f} ms")
+
+    def omitir(self, nombre, categoria, motivo):
+        """Registra un benchmark que no se pudo ejecutar"""
+        if self.filtro and self.filtro not in nombre:
+            return
+        self.resultados.append({"nombre": nombre, "categoria": categoria, "omitido": motivo})
+        print(f"  {nombre:<40} omitido ({motivo})")
+
+
+# --- Motores de datos ---
+
+def preparar_sqlite(autos, clientes, ventas, semilla, regenerar=False):
+    """
+    Conecta db al motor SQLite sobre un archivo sintético de cache/ y lo genera
+    si no existe o no tiene las filas pedidas
+
+    Returns:
+        tuple: (success, message)
+    """
+    from model.migraciones import GestorMigraciones
+    from model.motores import MotorSQLite
+
+    ruta = Path(path_manager.get_cache_path(f"bench_{autos}_{clientes}_{ventas}_s{semilla}.sqlite3"))
+    if ruta.exists() and not regenerar:
+        db.usar_motor(MotorSQLite(ruta))
+        success, message = db.connect()
+        if not success:
+            return False, message
+        success, conteo = db.fetch_one(
+            "SELECT (SELECT COUNT(*) FROM autos) AS autos, (SELECT COUNT(*) FROM clientes) AS clientes, "
+            "(SELECT COUNT(*) FROM ventas) AS ventas"
+        )
+        if success and conteo == {"autos": autos, "clientes": clientes, "ventas": ventas}:
+            # Las migraciones nuevas también se aplican a las bases ya generadas
+            success, result = GestorMigraciones.aplicar_pendientes()
+            if not success:
+                return False, result
+            return True, "Base SQLite reutilizada"
+        db.disconnect()
+
+    for archivo in (ruta, Path(f"{ruta}-wal"), Path(f"{ruta}-shm")):
+        archivo.unlink(missing_ok=True)
+    db.usar_motor(MotorSQLite(ruta))
+    success, message = db.connect()
+    if not success:
+        return False, message
+    success, result = GestorMigraciones.aplicar_pendientes()
+    if not success:
+        return False, result
+
+    print(f"⏳ Generando {autos} autos, {clientes} clientes y {ventas} ventas en {ruta}")
+    datos_sinteticos.cargar(db, autos, clientes, ventas, semilla)
+    return True, "Base SQLite generada"
+
+
+def preparar_mysql(base, autos, clientes, ventas, semilla):
+    """
+    Recrea la base dedicada del benchmark, aplica el esquema y carga los datos
+
+    Returns:
+        tuple: (success, message)
+    """
+    from model.migraciones import GestorMigraciones
+    from model.motores import MotorMySQL
+
+    db.load_config()
+    db.usar_motor(MotorMySQL())
+    if base == db.database:
+        return False, f"La base del benchmark no puede ser la de la aplicación ({base})"
+
+    db.database = None
+    try:
+        servidor = db._crear_conexion()
+    except Exception as e:
+        return False, f"Sin servidor MySQL: {e}"
+    cursor = servidor.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS `{base}`")
+    cursor.execute(f"CREATE DATABASE `{base}`")
+    cursor.close()
+    servidor.close()
+
+    db.database = base
+    success, message = db.connect()
+    if not success:
+        return False, message
+
+    script = (ROOT_DIR / "database" / "venta_autos_db.sql").read_text(encoding="utf-8")
+    for sentencia in GestorMigraciones.dividir_sentencias(script):
+        if sentencia.upper().startswith("CREATE TABLE"):
+            success, result = db.execute_query(sentencia)
+            if not success:
+                return False, result
+    success, result = GestorMigraciones.aplicar_pendientes()
+    if not success:
+        return False, result
+
+    print(f"⏳ Cargando {autos} autos, {clientes} clientes y {ventas} ventas en {base}")
+    datos_sinteticos.cargar(db, autos, clientes, ventas, semilla)
+    return True, "Base de benchmark lista"
+
+
+# --- Benchmarks ---
+
+def bench_consultas(suite, autos, clientes, ventas, semilla):
+    """Listados, lecturas puntuales, búsquedas y estadísticas de los modelos"""
+    rng = random.Random(semilla)
+    ids_autos = [rng.randint(1, autos) for _ in range(CONSULTAS_POR_REPETICION)]
+    ids_clientes = [rng.randint(1, clientes) for _ in range(CONSULTAS_POR_REPETICION)]
+    ids_ventas = [rng.randint(1, ventas) for _ in range(CONSULTAS_POR_REPETICION)]
+
+    def listado(funcion, **kwargs):
+        return lambda: len(verificar(funcion(**kwargs)))
+
+    def puntuales(funcion, ids):
+        def ejecutar():
+            for id_ in ids:
+                verificar(funcion(id_))
+            return len(ids)
+        return ejecutar
+
+    suite.medir("autos.obtener_todos", "consultas", listado(AutoModel.obtener_todos))
+    suite.medir("autos.obtener_todos[compacto]", "consultas", listado(AutoModel.obtener_todos, compacto=True))
+    suite.medir("clientes.obtener_todos[compacto]", "consultas", listado(ClienteModel.obtener_todos, compacto=True))
+    suite.medir("ventas.obtener_todas[compacto]", "consultas", listado(VentaModel.obtener_todas, compacto=True))
+    suite.medir(f"autos.obtener_por_id x{len(ids_autos)}", "consultas", puntuales(AutoModel.obtener_por_id, ids_autos))
+    suite.medir(f"ventas.obtener_por_id x{len(ids_ventas)}", "consultas", puntuales(VentaModel.obtener_por_id, ids_ventas))
+    suite.medir(
+        f"ventas.por_cliente x{len(ids_clientes)}", "consultas",
+        puntuales(VentaModel.obtener_ventas_por_cliente, ids_clientes)
+    )
+
+    suite.medir("autos.buscar[Toyota]", "busqueda", listado(AutoModel.buscar_autos, criterio="Toyota", compacto=True))
+    suite.medir("autos.buscar[ro]", "busqueda", listado(AutoModel.buscar_autos, criterio="ro", compacto=True))
+    suite.medir("clientes.buscar[García]", "busqueda", listado(ClienteModel.buscar_clientes, criterio="García", compacto=True))
+
+    suite.medir("ventas.estadisticas", "estadisticas", lambda: verificar(VentaModel.obtener_estadisticas()) and 1)
+
+
+def bench_pdf(suite, filas_pdf):
+    """Reporte de clientes (primeras filas_pdf filas), ficha de auto y comprobante de venta"""
+    try:
+        from utils.printer import pdf_generator
+    except ImportError as e:
+        for nombre in ("pdf.clientes", "pdf.auto", "pdf.venta"):
+            suite.omitir(nombre, "pdf", f"falta {e.name}")
+        return
+
+    clientes = verificar(ClienteModel.obtener_todos())[:filas_pdf]
+    auto = verificar(AutoModel.obtener_por_id(1))
+    venta = verificar(VentaModel.obtener_por_id(1))
+    generados = []
+
+    def generar(metodo, *args):
+        def ejecutar():
+            generados.append(metodo(*args))
+        return ejecutar
+
+    try:
+        suite.medir(
+            f"pdf.clientes[{len(clientes)}]", "pdf",
+            generar(pdf_generator.generate_cliente_report, "bench_clientes.pdf", clientes),
+            repeticiones=3
+        )
+        suite.medir("pdf.auto", "pdf", generar(pdf_generator.generate_auto_report, auto, "bench_auto.pdf"))
+        suite.medir("pdf.venta", "pdf", generar(pdf_generator.generate_venta_report, venta, "bench_venta.pdf"))
+    finally:
+        for ruta in set(generados):
+            if ruta:
+                Path(ruta).unlink(missing_ok=True)
+
+
+def bench_imagenes(suite):
+    """
+    Decodificación a miniatura: la de utils/image_decoder.py (draft + reduce),
+    la decodificación completa que hacía antes la vista previa y la miniatura
+    ya en caché que devuelve ImageLoader.load_from_path
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        suite.omitir("imagen.jpeg_a_miniatura", "imagenes", "falta PIL")
+        return
+    from utils.image_decoder import ImageDecoder
+    from utils.image_loader import ImageLoader
+
+    ancho, alto = TAMANO_IMAGEN
+    # Degradados con ruido: se comprime como una foto y no como un color plano
+    degradado = Image.linear_gradient("L").resize(TAMANO_IMAGEN)
+    imagen = Image.merge("RGB", (
+        degradado,
+        degradado.transpose(Image.Transpose.ROTATE_90).resize(TAMANO_IMAGEN),
+        Image.effect_noise(TAMANO_IMAGEN, 64),
+    ))
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "auto.jpg")
+        imagen.save(ruta, "JPEG", quality=85)
+
+        def decodificar():
+            ImageDecoder.decode(ruta, TAMANO_MINIATURA)
+
+        def decodificar_completa():
+            # Lo que hacía AutoView.update_image_preview en el hilo de Tk
+            with Image.open(ruta) as img:
+                img.resize(TAMANO_MINIATURA, Image.Resampling.LANCZOS)
+
+        def cargar():
+            if ImageLoader.load_from_path(ruta, TAMANO_MINIATURA) is None:
+                raise RuntimeError("no se pudo decodificar la imagen")
+
+        suite.medir(f"imagen.jpeg_a_miniatura[{ancho}x{alto}]", "imagenes", decodificar, repeticiones=10)
+        suite.medir(f"imagen.jpeg_a_miniatura[{ancho}x{alto},completa]", "imagenes",
+                    decodificar_completa, repeticiones=10)
+        suite.medir(f"imagen.jpeg_a_miniatura[{ancho}x{alto},cache]", "imagenes", cargar, repeticiones=10)
+
+
+def bench_miniaturas(suite, cantidad):
+    """
+    Lectura de las miniaturas de una página de la tabla de autos (cantidad
+    miniaturas codificadas) hasta PIL.Image: un archivo por miniatura, el pack
+    de utils/thumbnail_pack.py abierto desde cero (arranque de la aplicación)
+    y el pack ya abierto y mapeado
+    """
+    nombres = (f"imagen.miniaturas[{cantidad},archivos]", f"imagen.miniaturas[{cantidad},pack_frio]",
+               f"imagen.miniaturas[{cantidad},pack_caliente]")
+    try:
+        from PIL import Image
+    except ImportError:
+        for nombre in nombres:
+            suite.omitir(nombre, "imagenes", "falta PIL")
+        return
+    from utils.image_loader import ImageLoader
+    from utils.thumbnail_pack import ThumbnailPack
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        claves = []
+        pack = ThumbnailPack(carpeta)
+        for i in range(cantidad):
+            clave = ImageLoader._get_cache_key(f"https://bench.invalid/auto_{i}.jpg", TAMANO_MINIATURA)
+            data = ImageLoader._encode(Image.effect_noise(TAMANO_MINIATURA, 32 + i % 64).convert("RGB"))
+            pack.put(clave, data)
+            with open(os.path.join(carpeta, f"{clave}.jpg"), "wb") as archivo:
+                archivo.write(data)
+            claves.append(clave)
+        pack.close()
+
+        def desde_archivos():
+            for clave in claves:
+                with open(os.path.join(carpeta, f"{clave}.jpg"), "rb") as archivo:
+                    ImageLoader.decode(archivo.read())
+            return cantidad
+
+        def desde_pack(abierto=None):
+            def ejecutar():
+                actual = abierto or ThumbnailPack(carpeta)
+                for clave in claves:
+                    ImageLoader.decode(actual.get(clave))
+                if abierto is None:
+                    actual.close()
+                return cantidad
+            return ejecutar
+
+        caliente = ThumbnailPack(carpeta)
+        caliente.open()
+        try:
+            suite.medir(nombres[0], "imagenes", desde_archivos, repeticiones=5)
+            suite.medir(nombres[1], "imagenes", desde_pack(), repeticiones=5)
+            suite.medir(nombres[2], "imagenes", desde_pack(caliente), repeticiones=5)
+        finally:
+            caliente.close()
+
+
+def bench_vistas(suite, filas_vista, semilla):
+    """
+    Construcción de AutoView, ClienteView y VentaView sin mostrar la ventana (con
+    el perfil completo y el de rendimiento), y recorrido completo de la tabla de
+    autos dibujada con TablaCanvas
+    Usa siempre una base SQLite sintética de filas_vista filas: se mide el costo
+    de los widgets, no el de la consulta. Cambia la base de db, por eso va al final
+    """
+    nombres = ("vista.AutoView", "vista.ClienteView", "vista.VentaView")
+    try:
+        import customtkinter as ctk
+        root = ctk.CTk()
+        root.withdraw()
+    except Exception as e:
+        for nombre in nombres:
+            suite.omitir(nombre, "vistas", f"sin Tk: {e}")
+        return
+
+    from view.auto_view import AutoView
+    from view.cliente_view import ClienteView
+    from view.venta_view import VentaView
+    from view import tema
+    from view.formularios import pool_formularios
+
+    success, message = preparar_sqlite(filas_vista, filas_vista, filas_vista, semilla)
+    if not success:
+        for nombre in nombres:
+            suite.omitir(nombre, "vistas", message)
+        root.destroy()
+        return
+
+    def construir(clase):
+        def ejecutar():
+            vista = clase(root)
+            vista.pack(fill="both", expand=True)
+            root.update_idletasks()
+            widgets, fuentes = contar_objetos_tk(root, vista)
+            vista.destroy()
+            return {"filas": filas_vista, "widgets": widgets, "fuentes_tk": fuentes}
+        return ejecutar
+
+    def desplazar_tabla_canvas():
+        # AutoView con TablaCanvas (AUTOGEST_TABLA=canvas) recorrida página a página
+        with entorno(AUTOGEST_TABLA="canvas"):
+            vista = AutoView(root)
+        vista.pack(fill="both", expand=True)
+        vista.tabla.canvas.configure(width=1200, height=700)
+        vista.tabla._al_redimensionar()
+        while vista.tabla.offset < vista.tabla._max_offset():
+            vista.tabla._yview("scroll", 1, "pages")
+            root.update_idletasks()
+        vista.destroy()
+        return filas_vista
+
+    def abrir_formulario(clase, nombre, reutilizar):
+        # Apertura de "Nuevo" construyendo la ventana o tomándola del pool (view/formularios.py)
+        def ejecutar():
+            vista = clase(root)
+            if not reutilizar:
+                pool_formularios.descartar(nombre)
+            inicio = time.perf_counter()
+            vista.show_form_nuevo()
+            root.update_idletasks()
+            transcurrido = time.perf_counter() - inicio
+            pool_formularios.obtener(nombre, vista, clase.crear_formulario).ocultar()
+            vista.destroy()
+            return {"abrir_ms": round(transcurrido * 1000, 2)}
+        return ejecutar
+
+    try:
+        # Filas de widgets con ambos perfiles de dibujo (view/tema.py)
+        with entorno(AUTOGEST_TABLA="widgets"):
+            for perfil in (tema.PERFIL_COMPLETO, tema.PERFIL_RENDIMIENTO):
+                tema.usar_perfil(perfil)
+                sufijo = "" if perfil == tema.PERFIL_COMPLETO else f".{perfil}"
+                for nombre, clase in zip(nombres, (AutoView, ClienteView, VentaView)):
+                    suite.medir(f"{nombre}{sufijo}[{filas_vista}]", "vistas", construir(clase), repeticiones=3)
+        tema.usar_perfil(tema.PERFIL_COMPLETO)
+        suite.medir(
+            f"vista.TablaCanvas.desplazamiento[{filas_vista}]", "vistas", desplazar_tabla_canvas, repeticiones=3
+        )
+        for nombre, clase in (("auto", AutoView), ("cliente", ClienteView), ("venta", VentaView)):
+            for reutilizar in (False, True):
+                modo = "reutilizado" if reutilizar else "construido"
+                suite.medir(f"vista.formulario.{nombre}[{modo}]", "vistas", abrir_formulario(clase, nombre, reutilizar))
+    finally:
+        root.destroy()
+
+
+@contextmanager
+def entorno(**valores):
+    """Define variables de entorno durante el bloque y restaura las anteriores"""
+    anteriores = {clave: os.environ.get(clave) for clave in valores}
+    os.environ.update(valores)
+    try:
+        yield
+    finally:
+        for clave, valor in anteriores.items():
+            if valor is None:
+                os.environ.pop(clave, None)
+            else:
+                os.environ[clave] = valor
+
+
+def contar_objetos_tk(root, widget):
+    """Widgets de Tk bajo widget (incluido) y fuentes con nombre registradas en el intérprete"""
+    widgets = 0
+    pendientes = [widget]
+    while pendientes:
+        actual = pendientes.pop()
+        widgets += 1
+        pendientes.extend(actual.winfo_children())
+    fuentes = len(root.tk.splitlist(root.tk.call("font", "names")))
+    return widgets, fuentes
+
+
+# --- Resultados ---
+
+def comparar(base, actual):
+    """Imprime la variación de la mediana respecto de un JSON anterior"""
+    anteriores = {r["nombre"]: r for r in base["resultados"] if "mediana_ms" in r}
+    print(f"\nComparación con {base.get('commit') or '?'} ({base.get('motor')}, {base.get('filas')})")
+    print(f"  {'benchmark':<40} {'antes':>10} {'ahora':>10} {'cambio':>8}")
+    for r in actual["resultados"]:
+        anterior = anteriores.get(r["nombre"])
+        if anterior is None or "mediana_ms" not in r:
+            continue
+        cambio = (r["mediana_ms"] / anterior["mediana_ms"] - 1) * 100 if anterior["mediana_ms"] else 0.0
+        print(
+            f"  {r['nombre']:<40} {anterior['mediana_ms']:>8.2f}ms {r['mediana_ms']:>8.2f}ms {cambio:>+7.1f}%"
+        )
+        for clave in ("widgets", "fuentes_tk"):
+            if clave in r and clave in anterior:
+                print(f"    {clave:<38} {anterior[clave]:>10} {r[clave]:>10}")
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Suite de benchmarks con datos sintéticos")
+    parser.add_argument("--escala", choices=list(datos_sinteticos.ESCALAS), default="10k")
+    parser.add_argument("--autos", type=int, help="Cantidad de autos (reemplaza la escala)")
+    parser.add_argument("--clientes", type=int, help="Cantidad de clientes (reemplaza la escala)")
+    parser.add_argument("--ventas", type=int, help="Cantidad de ventas (reemplaza la escala)")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--motor", choices=("auto", "mysql", "sqlite"), default="auto")
+    parser.add_argument("--base", default="autogest_bench", help="Base MySQL dedicada (se recrea)")
+    parser.add_argument("--regenerar", action="store_true", help="Volver a generar el SQLite sintético")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--filas-pdf", type=int, default=2000, help="Clientes del reporte PDF")
+    parser.add_argument("--filas-vista", type=int, default=200, help="Filas por vista al construirlas")
+    parser.add_argument("--solo", help="Ejecutar solo los benchmarks cuyo nombre contiene este texto")
+    parser.add_argument("--salida", help="Archivo JSON (por defecto benchmarks/resultados/<commit>_<motor>_<autos>.json)")
+    parser.add_argument("--comparar", help="JSON de una ejecución anterior para comparar")
+    args = parser.parse_args(argv)
+
+    autos, clientes, ventas = datos_sinteticos.escala(args.escala, args.autos, args.clientes, args.ventas)
+
+    inicio_carga = time.perf_counter()
+    motor = args.motor
+    if motor in ("auto", "mysql"):
+        success, message = preparar_mysql(args.base, autos, clientes, ventas, args.semilla)
+        if success:
+            motor = "mysql"
+        elif motor == "mysql":
+            print(f"❌ {message}")
+            return 1
+        else:
+            print(f"⚠️ {message}; se usa SQLite")
+    if motor in ("auto", "sqlite"):
+        motor = "sqlite"
+        success, message = preparar_sqlite(autos, clientes, ventas, args.semilla, args.regenerar)
+        if not success:
+            print(f"❌ {message}")
+            return 1
+    carga_s = time.perf_counter() - inicio_carga
+
+    print(f"📊 Motor {motor}: {autos} autos, {clientes} clientes, {ventas} ventas (carga {carga_s:.1f} s)")
+    suite = Suite(repeticiones=args.repeticiones, filtro=args.solo)
+    try:
+        bench_consultas(suite, autos, clientes, ventas, args.semilla)
+        bench_pdf(suite, args.filas_pdf)
+        bench_imagenes(suite)
+        bench_miniaturas(suite, args.filas_vista)
+        bench_vistas(suite, args.filas_vista, args.semilla)
+    finally:
+        db.disconnect()
+
+    commit = commit_actual()
+    informe = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "motor": motor,
+        "escala": args.escala,
+        "semilla": args.semilla,
+        "filas": {"autos": autos, "clientes": clientes, "ventas": ventas},
+        "carga_s": round(carga_s, 2),
+        "resultados": suite.resultados,
+    }
+
+    salida = Path(args.salida) if args.salida else (
+        RESULTADOS_DIR / f"{commit or 'sin_git'}_{motor}_{autos}.json"
+    )
+    salida.parent.mkdir(parents=True, exist_ok=True)
+    salida.write_text(json.dumps(informe, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"💾 Resultados en {salida}")
+
+    if args.comparar:
+        comparar(json.loads(Path(args.comparar).read_text(encoding="utf-8")), informe)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Generador de datos sintéticos para los benchmarks
+Produce autos, clientes y ventas reproducibles a partir de una semilla y los
+carga en la base conectada: MySQL (una base dedicada) o el motor SQLite
+embebido (ver model/motores.py).
+
+Las ventas usan autos distintos (un auto se vende una sola vez), por eso
+nunca hay más ventas que autos.
+"""
+import random
+import sys
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from itertools import islice
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from model.replica import TABLAS  # noqa: E402
+
+# Tamaños predefinidos: (autos, clientes, ventas)
+ESCALAS = {
+    "10k": (10_000, 10_000, 5_000),
+    "100k": (100_000, 100_000, 50_000),
+    "1m": (1_000_000, 1_000_000, 500_000),
+}
+
+# Filas por INSERT en la carga masiva
+TAMANO_LOTE = 5000
+
+MODELOS = {
+    "Toyota": ["Corolla", "Camry", "RAV4", "Hilux", "Yaris", "Prius"],
+    "Honda": ["Civic", "Accord", "CR-V", "Fit", "HR-V"],
+    "Ford": ["Mustang", "Focus", "Ranger", "Explorer", "F-150"],
+    "Chevrolet": ["Spark", "Cruze", "Onix", "Tahoe", "Silverado"],
+    "Nissan": ["Sentra", "Versa", "Altima", "Frontier", "Kicks"],
+    "Tesla": ["Model 3", "Model S", "Model X", "Model Y"],
+    "Volkswagen": ["Golf", "Jetta", "Polo", "Tiguan", "Amarok"],
+    "Hyundai": ["Elantra", "Tucson", "Accent", "Santa Fe"],
+    "Kia": ["Rio", "Sportage", "Sorento", "Picanto"],
+    "Mazda": ["Mazda3", "CX-5", "CX-30", "MX-5"],
+}
+COLORES = ["Blanco", "Negro", "Gris", "Rojo", "Azul", "Plata", "Verde", "Amarillo"]
+TRANSMISIONES = ["Manual", "Automática"]
+COMBUSTIBLES = ["Gasolina", "Diésel", "Eléctrico", "Híbrido"]
+METODOS_PAGO = ["Efectivo", "Tarjeta", "Transferencia"]
+NOMBRES = [
+    "Juan", "María", "Carlos", "Ana", "Luis", "Sofía", "Jorge", "Lucía",
+    "Pedro", "Valentina", "Diego", "Camila", "Andrés", "Gabriela", "Miguel", "Daniela",
+]
+APELLIDOS = [
+    "Pérez", "García", "López", "Martínez", "Rodríguez", "González", "Hernández",
+    "Sánchez", "Ramírez", "Torres", "Flores", "Rivera", "Gómez", "Díaz", "Vargas",
+]
+CALLES = ["Calle Principal", "Avenida Central", "Boulevard Norte", "Calle del Sol", "Avenida Libertad"]
+
+FECHA_BASE = datetime(2020, 1, 1)
+
+
+def columnas(tabla):
+    """Columnas de la tabla en el orden de las tuplas generadas (las de la réplica local, comunes a ambos motores)"""
+    return [nombre for nombre, _ in TABLAS[tabla]['columnas']]
+
+
+def escala(nombre=None, autos=None, clientes=None, ventas=None):
+    """
+    Resuelve la cantidad de filas a generar
+
+    Args:
+        nombre: Clave de ESCALAS (10k, 100k, 1m)
+        autos, clientes, ventas: Cantidades explícitas (tienen prioridad)
+
+    Returns:
+        tuple: (autos, clientes, ventas)
+    """
+    base_autos, base_clientes, base_ventas = ESCALAS[nombre or "10k"]
+    autos = autos or base_autos
+    clientes = clientes or base_clientes
+    ventas = min(ventas or base_ventas, autos)
+    return autos, clientes, ventas
+
+
+def autos_vendidos(cantidad, autos, semilla):
+    """Ids de los autos con venta (los mismos que elige filas_ventas)"""
+    return random.Random(f"{semilla}-ventas").sample(range(1, autos + 1), cantidad)
+
+
+def filas_autos(cantidad, semilla, vendidos=()):
+    """Genera tuplas de autos con ids 1..cantidad (estado 'vendido' para los de vendidos)"""
+    rng = random.Random(f"{semilla}-autos")
+    vendidos = set(vendidos)
+    marcas = list(MODELOS)
+    for id_auto in range(1, cantidad + 1):
+        marca = rng.choice(marcas)
+        registro = FECHA_BASE + timedelta(seconds=rng.randrange(5 * 365 * 86400))
+        yield (
+            id_auto,
+            marca,
+            rng.choice(MODELOS[marca]),
+            rng.randint(2005, 2025),
+            Decimal(rng.randrange(800_000, 9_000_000)) / 100,
+            rng.choice(COLORES),
+            rng.choice(TRANSMISIONES),
+            rng.choice(COMBUSTIBLES),
+            None,
+            None,
+            registro,
+            'vendido' if id_auto in vendidos else 'disponible',
+            registro,
+        )
+
+
+def filas_clientes(cantidad, semilla):
+    """Genera tuplas de clientes con ids 1..cantidad"""
+    rng = random.Random(f"{semilla}-clientes")
+    for id_cliente in range(1, cantidad + 1):
+        nombre = rng.choice(NOMBRES)
+        apellido = rng.choice(APELLIDOS)
+        yield (
+            id_cliente,
+            f"{nombre} {apellido} {id_cliente}",
+            f"555-{rng.randrange(10000):04d}",
+            f"{nombre.lower()}.{id_cliente}@email.com",
+            f"{rng.choice(CALLES)} {rng.randint(1, 9999)}",
+            FECHA_BASE,
+        )
+
+
+def filas_ventas(cantidad, autos, clientes, semilla):
+    """Genera tuplas de ventas sobre autos distintos y clientes al azar"""
+    rng = random.Random(f"{semilla}-ventas")
+    vendidos = rng.sample(range(1, autos + 1), cantidad)
+    for id_venta, id_auto in enumerate(vendidos, start=1):
+        fecha = date(2021, 1, 1) + timedelta(days=rng.randrange(4 * 365))
+        yield (
+            id_venta,
+            id_auto,
+            rng.randint(1, clientes),
+            fecha,
+            Decimal(rng.randrange(800_000, 9_000_000)) / 100,
+            rng.choice(METODOS_PAGO),
+            datetime.combine(fecha, datetime.min.time()),
+        )
+
+
+def generar(autos, clientes, ventas, semilla):
+    """Generadores por tabla, en el orden de carga (las ventas al final por las claves foráneas)"""
+    return {
+        'autos': filas_autos(autos, semilla, autos_vendidos(ventas, autos, semilla)),
+        'clientes': filas_clientes(clientes, semilla),
+        'ventas': filas_ventas(ventas, autos, clientes, semilla),
+    }
+
+
+def lotes(filas, tamano=TAMANO_LOTE):
+    """Agrupa un iterable en listas de hasta tamano elementos"""
+    filas = iter(filas)
+    while True:
+        lote = list(islice(filas, tamano))
+        if not lote:
+            return
+        yield lote
+
+
+def cargar(conexion_db, autos, clientes, ventas, semilla):
+    """
+    Inserta los datos generados en las tablas vacías de la base conectada
+    (MySQL o SQLite, según el motor de conexion_db)
+
+    Args:
+        conexion_db: DatabaseConnection ya conectada y con el esquema aplicado
+    """
+    motor = conexion_db.motor
+    connection = conexion_db.connection
+    cursor = motor.cursor(connection)
+    try:
+        for tabla, filas in generar(autos, clientes, ventas, semilla).items():
+            nombres = columnas(tabla)
+            query = motor.traducir(
+                f"INSERT INTO {tabla} ({', '.join(nombres)}) "
+                f"VALUES ({', '.join('%s' for _ in nombres)})"
+            )
+            for lote in lotes(filas):
+                cursor.executemany(query, lote)
+                connection.commit()
+        if motor.nombre == "mysql":
+            # Que la carga no cuente como cambios hechos desde otro equipo
+            cursor.execute("DELETE FROM cambios")
+        else:
+            cursor.execute("ANALYZE")
+        connection.commit()
+    finally:
+        cursor.close()
@@ -4,7 +4,6 @@ Intermediario entre la vista y el modelo
 """
 from model.auto_model import AutoModel
 from utils.validators import Validator
-from utils.cloudinary_service import CloudinaryService
 from pathlib import Path
 
 class AutoController:
@@ -55,6 +54,9 @@ class AutoController:
         if not source_path:
             return None, None
         
+        # cloudinary se importa solo al subir imágenes para acelerar el arranque
+        from utils.cloudinary_service import CloudinaryService
+        
         try:
             source = Path(source_path)
             if not source.exists():
@@ -124,6 +126,7 @@ class AutoController:
             
             # Si hay una imagen anterior en Cloudinary, eliminarla
             if success_get and auto_actual.get('cloudinary_id'):
+                from utils.cloudinary_service import CloudinaryService
                 CloudinaryService.delete_image(auto_actual['cloudinary_id'])
             
             # Subir nueva imagen
@@ -135,21 +138,52 @@ class AutoController:
         )
     
     @staticmethod
-    def obtener_todos():
+    def obtener_todos(compacto=False):
         """Obtiene todos los autos"""
-        return AutoModel.obtener_todos()
+        return AutoModel.obtener_todos(compacto)
+    
+    @staticmethod
+    def obtener_disponibles(compacto=False):
+        """Obtiene los autos sin vender"""
+        return AutoModel.obtener_disponibles(compacto)
+    
+    @staticmethod
+    def iterar_todos(row_format='dict'):
+        """Recorre todos los autos por lotes (exportaciones)"""
+        return AutoModel.iterar_todos(row_format)
+    
+    @staticmethod
+    def exportar_csv(output_filename="autos.csv"):
+        """
+        Exporta todos los autos a un CSV de la carpeta output (fila a fila, sin cargar la tabla)
+        
+        Returns:
+            tuple: (success, (ruta, filas_escritas)/error_message)
+        """
+        from utils.exportador import exportar_tabla
+        return exportar_tabla(AutoModel.iterar_todos, AutoModel.COLUMNAS_LISTA, output_filename)
     
     @staticmethod
     def obtener_por_id(id_auto):
         """Obtiene un auto por ID"""
         return AutoModel.obtener_por_id(id_auto)
     
+    @staticmethod
+    def obtener_fila(id_auto):
+        """Obtiene la fila de lista de un auto"""
+        return AutoModel.obtener_fila(id_auto)
+    
     @staticmethod
     def eliminar_auto(id_auto):
         """Elimina un auto"""
         return AutoModel.eliminar_auto(id_auto)
     
     @staticmethod
-    def buscar_autos(criterio):
+    def buscar_autos(criterio, compacto=False):
         """Busca autos por criterio"""
-        return AutoModel.buscar_autos(criterio)
+        return AutoModel.buscar_autos(criterio, compacto)
+    
+    @staticmethod
+    def sugerir_autos(texto, limite=10):
+        """Primeros autos disponibles que coinciden con lo escrito (selector con sugerencias)"""
+        return AutoModel.sugerir_autos(texto, limite)
@@ -68,21 +68,47 @@ class ClienteController:
         return ClienteModel.actualizar_cliente(id_cliente, nombre, telefono, correo, direccion)
     
     @staticmethod
-    def obtener_todos():
+    def obtener_todos(compacto=False):
         """Obtiene todos los clientes"""
-        return ClienteModel.obtener_todos()
+        return ClienteModel.obtener_todos(compacto)
+    
+    @staticmethod
+    def iterar_todos(row_format='dict'):
+        """Recorre todos los clientes por lotes (exportaciones y reportes)"""
+        return ClienteModel.iterar_todos(row_format)
+    
+    @staticmethod
+    def exportar_csv(output_filename="clientes.csv"):
+        """
+        Exporta todos los clientes a un CSV de la carpeta output (fila a fila, sin cargar la tabla)
+        
+        Returns:
+            tuple: (success, (ruta, filas_escritas)/error_message)
+        """
+        from utils.exportador import exportar_tabla
+        return exportar_tabla(ClienteModel.iterar_todos, ClienteModel.COLUMNAS_LISTA, output_filename)
     
     @staticmethod
     def obtener_por_id(id_cliente):
         """Obtiene un cliente por ID"""
         return ClienteModel.obtener_por_id(id_cliente)
     
+    @staticmethod
+    def obtener_fila(id_cliente):
+        """Obtiene la fila de lista de un cliente"""
+        return ClienteModel.obtener_fila(id_cliente)
+    
     @staticmethod
     def eliminar_cliente(id_cliente):
         """Elimina un cliente"""
         return ClienteModel.eliminar_cliente(id_cliente)
     
     @staticmethod
-    def buscar_clientes(criterio):
+    def buscar_clientes(criterio, compacto=False):
         """Busca clientes por criterio"""
-        return ClienteModel.buscar_clientes(criterio)
+        return ClienteModel.buscar_clientes(criterio, compacto)
+    
+    @staticmethod
+    def sugerir_clientes(texto, limite=10):
+        """Primeros clientes que coinciden con lo escrito (selector con sugerencias)"""
+        return ClienteModel.sugerir_clientes(texto, limite)
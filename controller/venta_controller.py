@@ -69,15 +69,36 @@ class VentaController:
         return VentaModel.actualizar_venta(id_venta, id_auto, id_cliente, monto, metodo_pago, fecha_venta)
     
     @staticmethod
-    def obtener_todas():
+    def obtener_todas(compacto=False):
         """Obtiene todas las ventas"""
-        return VentaModel.obtener_todas()
+        return VentaModel.obtener_todas(compacto)
+    
+    @staticmethod
+    def iterar_todas(row_format='dict'):
+        """Recorre todas las ventas por lotes (exportaciones)"""
+        return VentaModel.iterar_todas(row_format)
+    
+    @staticmethod
+    def exportar_csv(output_filename="ventas.csv"):
+        """
+        Exporta todas las ventas a un CSV de la carpeta output (fila a fila, sin cargar la tabla)
+        
+        Returns:
+            tuple: (success, (ruta, filas_escritas)/error_message)
+        """
+        from utils.exportador import exportar_tabla
+        return exportar_tabla(VentaModel.iterar_todas, VentaModel.COLUMNAS_LISTA, output_filename)
     
     @staticmethod
     def obtener_por_id(id_venta):
         """Obtiene una venta por ID"""
         return VentaModel.obtener_por_id(id_venta)
     
+    @staticmethod
+    def obtener_fila(id_venta):
+        """Obtiene la fila de lista de una venta"""
+        return VentaModel.obtener_fila(id_venta)
+    
     @staticmethod
     def eliminar_venta(id_venta):
         """Elimina una venta"""
@@ -0,0 +1,20 @@
+-- Migración 001: índices para las consultas de listado y búsqueda
+-- Compatible con MySQL 5.7+ y MariaDB 10.2+ (formato de fila DYNAMIC)
+
+-- AutoModel.obtener_todos: ORDER BY fecha_registro DESC
+-- Índice cubriente con las columnas de AutoModel.COLUMNAS_LISTA
+CREATE INDEX idx_autos_lista
+    ON autos (fecha_registro, marca, modelo, anio, color, transmision, combustible, precio, imagen);
+
+-- ClienteModel.obtener_todos: ORDER BY nombre
+-- Índice cubriente con las columnas de ClienteModel.COLUMNAS_LISTA
+CREATE INDEX idx_clientes_lista
+    ON clientes (nombre, telefono, correo, direccion);
+
+-- VentaModel.obtener_todas: ORDER BY v.fecha_venta DESC
+CREATE INDEX idx_ventas_fecha
+    ON ventas (fecha_venta, id_auto, id_cliente, monto, metodo_pago);
+
+-- VentaModel.obtener_ventas_por_cliente: WHERE v.id_cliente = %s ORDER BY v.fecha_venta DESC
+CREATE INDEX idx_ventas_cliente_fecha
+    ON ventas (id_cliente, fecha_venta, id_auto, monto, metodo_pago);
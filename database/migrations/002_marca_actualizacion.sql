@@ -0,0 +1,18 @@
+-- Migración 002: marca de última modificación por fila
+-- La réplica local (model/replica.py) sincroniza de forma incremental las filas
+-- con actualizado_en posterior a la última marca que ya copió
+
+ALTER TABLE autos
+    ADD COLUMN actualizado_en TIMESTAMP NOT NULL
+        DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP;
+CREATE INDEX idx_autos_actualizado ON autos (actualizado_en);
+
+ALTER TABLE clientes
+    ADD COLUMN actualizado_en TIMESTAMP NOT NULL
+        DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP;
+CREATE INDEX idx_clientes_actualizado ON clientes (actualizado_en);
+
+ALTER TABLE ventas
+    ADD COLUMN actualizado_en TIMESTAMP NOT NULL
+        DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP;
+CREATE INDEX idx_ventas_actualizado ON ventas (actualizado_en);
@@ -0,0 +1,50 @@
+-- Migración 003: registro de cambios para notificar a los demás equipos
+-- Cada alta, modificación o baja en autos, clientes y ventas deja una fila en
+-- cambios; model/cambios.py la lee por id_cambio y avisa a las vistas abiertas.
+-- Crear triggers con el binlog activo requiere SUPER o log_bin_trust_function_creators=1
+
+CREATE TABLE IF NOT EXISTS cambios (
+    id_cambio BIGINT AUTO_INCREMENT PRIMARY KEY,
+    tabla VARCHAR(20) NOT NULL,
+    id_registro INT NOT NULL,
+    operacion ENUM('INSERT','UPDATE','DELETE') NOT NULL,
+    fecha TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_cambios_fecha (fecha)
+);
+
+-- autos
+CREATE TRIGGER trg_autos_insert AFTER INSERT ON autos FOR EACH ROW
+    INSERT INTO cambios (tabla, id_registro, operacion) VALUES ('autos', NEW.id_auto, 'INSERT');
+
+CREATE TRIGGER trg_autos_update AFTER UPDATE ON autos FOR EACH ROW
+    INSERT INTO cambios (tabla, id_registro, operacion) VALUES ('autos', NEW.id_auto, 'UPDATE');
+
+-- Los borrados en cascada de ventas no disparan triggers: se registran aquí
+CREATE TRIGGER trg_autos_delete BEFORE DELETE ON autos FOR EACH ROW
+    INSERT INTO cambios (tabla, id_registro, operacion)
+    SELECT 'ventas', id_venta, 'DELETE' FROM ventas WHERE id_auto = OLD.id_auto
+    UNION ALL
+    SELECT 'autos', OLD.id_auto, 'DELETE';
+
+-- clientes
+CREATE TRIGGER trg_clientes_insert AFTER INSERT ON clientes FOR EACH ROW
+    INSERT INTO cambios (tabla, id_registro, operacion) VALUES ('clientes', NEW.id_cliente, 'INSERT');
+
+CREATE TRIGGER trg_clientes_update AFTER UPDATE ON clientes FOR EACH ROW
+    INSERT INTO cambios (tabla, id_registro, operacion) VALUES ('clientes', NEW.id_cliente, 'UPDATE');
+
+CREATE TRIGGER trg_clientes_delete BEFORE DELETE ON clientes FOR EACH ROW
+    INSERT INTO cambios (tabla, id_registro, operacion)
+    SELECT 'ventas', id_venta, 'DELETE' FROM ventas WHERE id_cliente = OLD.id_cliente
+    UNION ALL
+    SELECT 'clientes', OLD.id_cliente, 'DELETE';
+
+-- ventas
+CREATE TRIGGER trg_ventas_insert AFTER INSERT ON ventas FOR EACH ROW
+    INSERT INTO cambios (tabla, id_registro, operacion) VALUES ('ventas', NEW.id_venta, 'INSERT');
+
+CREATE TRIGGER trg_ventas_update AFTER UPDATE ON ventas FOR EACH ROW
+    INSERT INTO cambios (tabla, id_registro, operacion) VALUES ('ventas', NEW.id_venta, 'UPDATE');
+
+CREATE TRIGGER trg_ventas_delete AFTER DELETE ON ventas FOR EACH ROW
+    INSERT INTO cambios (tabla, id_registro, operacion) VALUES ('ventas', OLD.id_venta, 'DELETE');
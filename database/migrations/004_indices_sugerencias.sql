@@ -0,0 +1,6 @@
+-- Migración 004: índice para el selector de autos del formulario de ventas
+-- AutoModel.sugerir_autos: ORDER BY marca, modelo, anio LIMIT N
+-- Índice cubriente con AutoModel.COLUMNAS_SUGERENCIA (id_auto va en la clave primaria)
+-- ClienteModel.sugerir_clientes usa idx_clientes_lista (nombre primero) de la migración 001
+CREATE INDEX idx_autos_sugerencias
+    ON autos (marca, modelo, anio, precio);
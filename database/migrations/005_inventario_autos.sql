@@ -0,0 +1,17 @@
+-- Migración 005: estado de inventario de los autos
+-- VentaModel.crear_venta marca el auto como vendido en la misma transacción que
+-- inserta la venta (UPDATE condicional: un auto vendido no se vuelve a vender);
+-- eliminar_venta lo devuelve a disponible. El formulario de ventas solo ofrece
+-- autos disponibles (AutoModel.obtener_disponibles y sugerir_autos)
+
+ALTER TABLE autos
+    ADD COLUMN estado ENUM('disponible','vendido') NOT NULL DEFAULT 'disponible';
+
+-- Autos con ventas registradas antes de esta migración
+UPDATE autos SET estado = 'vendido'
+WHERE id_auto IN (SELECT id_auto FROM ventas);
+
+-- Disponibles por marca y modelo (reemplaza al índice de la migración 004)
+CREATE INDEX idx_autos_disponibles
+    ON autos (estado, marca, modelo, anio, precio);
+DROP INDEX idx_autos_sugerencias ON autos;
@@ -0,0 +1,62 @@
+-- Migración 001 (SQLite): esquema de autos, clientes y ventas
+-- Equivale a database/venta_autos_db.sql más las migraciones 001 y 002 de MySQL.
+-- actualizado_en va en la definición de la tabla porque SQLite no permite
+-- agregar con ALTER TABLE una columna con valor por defecto no constante.
+-- Los ENUM de MySQL se representan con TEXT y CHECK; las fechas se guardan en
+-- hora local como en el servidor.
+
+CREATE TABLE IF NOT EXISTS autos (
+    id_auto INTEGER PRIMARY KEY AUTOINCREMENT,
+    marca VARCHAR(50) NOT NULL,
+    modelo VARCHAR(50) NOT NULL,
+    anio INTEGER NOT NULL,
+    precio DECIMAL(10,2) NOT NULL,
+    color VARCHAR(30),
+    transmision TEXT DEFAULT 'Manual'
+        CHECK (transmision IN ('Manual','Automática')),
+    combustible TEXT DEFAULT 'Gasolina'
+        CHECK (combustible IN ('Gasolina','Diésel','Eléctrico','Híbrido')),
+    imagen VARCHAR(255),
+    cloudinary_id VARCHAR(255),
+    fecha_registro TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    actualizado_en TIMESTAMP NOT NULL DEFAULT (datetime('now', 'localtime'))
+);
+
+CREATE TABLE IF NOT EXISTS clientes (
+    id_cliente INTEGER PRIMARY KEY AUTOINCREMENT,
+    nombre VARCHAR(100) NOT NULL,
+    telefono VARCHAR(20),
+    correo VARCHAR(100),
+    direccion VARCHAR(150),
+    actualizado_en TIMESTAMP NOT NULL DEFAULT (datetime('now', 'localtime'))
+);
+
+CREATE TABLE IF NOT EXISTS ventas (
+    id_venta INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_auto INTEGER NOT NULL,
+    id_cliente INTEGER NOT NULL,
+    fecha_venta DATE DEFAULT (date('now', 'localtime')),
+    monto DECIMAL(10,2) NOT NULL,
+    metodo_pago TEXT DEFAULT 'Efectivo'
+        CHECK (metodo_pago IN ('Efectivo','Tarjeta','Transferencia')),
+    actualizado_en TIMESTAMP NOT NULL DEFAULT (datetime('now', 'localtime')),
+    FOREIGN KEY (id_auto) REFERENCES autos(id_auto) ON DELETE CASCADE,
+    FOREIGN KEY (id_cliente) REFERENCES clientes(id_cliente) ON DELETE CASCADE
+);
+
+-- Índices de listados y búsquedas (los mismos de la migración 001 de MySQL)
+CREATE INDEX idx_autos_lista
+    ON autos (fecha_registro, marca, modelo, anio, color, transmision, combustible, precio, imagen);
+
+CREATE INDEX idx_clientes_lista
+    ON clientes (nombre, telefono, correo, direccion);
+
+CREATE INDEX idx_ventas_fecha
+    ON ventas (fecha_venta, id_auto, id_cliente, monto, metodo_pago);
+
+CREATE INDEX idx_ventas_cliente_fecha
+    ON ventas (id_cliente, fecha_venta, id_auto, monto, metodo_pago);
+
+-- MySQL indexa las claves foráneas automáticamente; SQLite lo necesita para
+-- el borrado en cascada de las ventas de un auto
+CREATE INDEX idx_ventas_auto ON ventas (id_auto);
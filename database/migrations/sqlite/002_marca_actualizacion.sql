@@ -0,0 +1,25 @@
+-- Migración 002 (SQLite): mantener actualizado_en al modificar una fila
+-- SQLite no tiene ON UPDATE CURRENT_TIMESTAMP: lo reemplaza un trigger por tabla
+-- (la columna se crea en la migración 001)
+
+CREATE INDEX idx_autos_actualizado ON autos (actualizado_en);
+CREATE INDEX idx_clientes_actualizado ON clientes (actualizado_en);
+CREATE INDEX idx_ventas_actualizado ON ventas (actualizado_en);
+
+CREATE TRIGGER trg_autos_actualizado AFTER UPDATE ON autos FOR EACH ROW
+WHEN NEW.actualizado_en = OLD.actualizado_en
+BEGIN
+    UPDATE autos SET actualizado_en = datetime('now', 'localtime') WHERE id_auto = NEW.id_auto;
+END;
+
+CREATE TRIGGER trg_clientes_actualizado AFTER UPDATE ON clientes FOR EACH ROW
+WHEN NEW.actualizado_en = OLD.actualizado_en
+BEGIN
+    UPDATE clientes SET actualizado_en = datetime('now', 'localtime') WHERE id_cliente = NEW.id_cliente;
+END;
+
+CREATE TRIGGER trg_ventas_actualizado AFTER UPDATE ON ventas FOR EACH ROW
+WHEN NEW.actualizado_en = OLD.actualizado_en
+BEGIN
+    UPDATE ventas SET actualizado_en = datetime('now', 'localtime') WHERE id_venta = NEW.id_venta;
+END;
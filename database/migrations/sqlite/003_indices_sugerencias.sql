@@ -0,0 +1,11 @@
+-- Migración 003 (SQLite): índices del selector de clientes y autos de ventas
+-- Equivale a la migración 004 de MySQL.
+
+-- ClienteModel.sugerir_clientes: nombre LIKE 'texto%'
+-- LIKE no distingue mayúsculas en SQLite: solo busca por rango con un índice NOCASE
+CREATE INDEX idx_clientes_nombre_nocase
+    ON clientes (nombre COLLATE NOCASE);
+
+-- AutoModel.sugerir_autos: ORDER BY marca, modelo, anio LIMIT N
+CREATE INDEX idx_autos_sugerencias
+    ON autos (marca, modelo, anio, precio);
@@ -0,0 +1,15 @@
+-- Migración 004 (SQLite): estado de inventario de los autos
+-- Equivale a la migración 005 de MySQL (el ENUM se representa con TEXT y CHECK).
+
+ALTER TABLE autos
+    ADD COLUMN estado TEXT NOT NULL DEFAULT 'disponible'
+        CHECK (estado IN ('disponible','vendido'));
+
+-- Autos con ventas registradas antes de esta migración
+UPDATE autos SET estado = 'vendido'
+WHERE id_auto IN (SELECT id_auto FROM ventas);
+
+-- Disponibles por marca y modelo (reemplaza al índice de la migración 003)
+CREATE INDEX idx_autos_disponibles
+    ON autos (estado, marca, modelo, anio, precio);
+DROP INDEX idx_autos_sugerencias;
@@ -41,6 +41,9 @@ CREATE TABLE IF NOT EXISTS ventas (
     FOREIGN KEY (id_cliente) REFERENCES clientes(id_cliente) ON DELETE CASCADE
 );
 
+-- Los índices y cambios posteriores del esquema están en database/migrations/
+-- La aplicación los aplica al iniciar, o manualmente con: python -m model.migraciones
+
 -- Datos de ejemplo (opcional)
 INSERT INTO autos (marca, modelo, anio, precio, color, transmision, combustible) VALUES
 ('Toyota', 'Corolla', 2022, 18500.00, 'Gris', 'Automática', 'Gasolina'),
@@ -3,6 +3,12 @@ Sistema de Gestión de Venta de Autos
 Punto de entrada principal de la aplicación
 Compatible con Windows y Linux
 """
+import time
+
+# Marca de tiempo lo más temprano posible para medir el tiempo al primer pintado
+START_TIME = time.perf_counter()
+
+import os
 import sys
 from pathlib import Path
 
@@ -10,12 +16,36 @@ from pathlib import Path
 ROOT_DIR = Path(__file__).parent
 sys.path.insert(0, str(ROOT_DIR))
 
-from view.main_view import MainApplication
+def report_first_paint(app):
+    """
+    Imprime el tiempo hasta el primer pintado y cierra la aplicación
+    Lo usa benchmarks/bench_startup.py con AUTOGEST_BENCH_FIRST_PAINT=1
+    """
+    elapsed_ms = (time.perf_counter() - START_TIME) * 1000
+    print(f"FIRST_PAINT_MS={elapsed_ms:.1f}", flush=True)
+    app.destroy()
 
 def main():
     """Función principal que inicia la aplicación"""
+    # Importación diferida: customtkinter y las vistas se cargan aquí y no al importar main
+    from view.main_view import MainApplication
+    
     app = MainApplication()
-    app.mainloop()
+    if os.getenv('AUTOGEST_BENCH_FIRST_PAINT'):
+        app.after_idle(lambda: report_first_paint(app))
+    
+    # AUTOGEST_PERFILAR_UI=1 mide bloqueos del ciclo de eventos y escribe un informe al cerrar
+    profiler = None
+    if os.getenv('AUTOGEST_PERFILAR_UI') == '1':
+        from utils.ui_profiler import UIProfiler
+        profiler = UIProfiler(app, umbral_ms=int(os.getenv('AUTOGEST_UMBRAL_BLOQUEO_MS', '100')))
+        profiler.start()
+    
+    try:
+        app.mainloop()
+    finally:
+        if profiler is not None:
+            profiler.stop()
 
 if __name__ == "__main__":
     main()
@@ -2,11 +2,38 @@
 Modelo de datos para la tabla de autos
 Implementa todas las operaciones CRUD
 """
-from model.conexion import db
+from model.conexion import db, patron_prefijo
+from model.registros import Auto
 
 class AutoModel:
     """Clase para gestionar operaciones CRUD de autos"""
     
+    # Columnas que necesitan las tablas y búsquedas (fila de lista)
+    COLUMNAS_LISTA = "id_auto, marca, modelo, anio, color, transmision, combustible, precio, imagen"
+    
+    # Opciones del selector de autos del formulario de ventas
+    COLUMNAS_SUGERENCIA = "id_auto, marca, modelo, anio, precio"
+    
+    # Registro completo para edición, eliminación y PDFs (fila de detalle)
+    COLUMNAS_DETALLE = (
+        "id_auto, marca, modelo, anio, precio, color, transmision, combustible, "
+        "imagen, cloudinary_id, fecha_registro"
+    )
+    
+    # Consultas de los listados (también las verifica model/migraciones.py con EXPLAIN)
+    CONSULTA_LISTA = f"SELECT {COLUMNAS_LISTA} FROM autos ORDER BY fecha_registro DESC"
+    
+    CONSULTA_DISPONIBLES = f"""
+        SELECT {COLUMNAS_LISTA} FROM autos
+        WHERE estado = 'disponible'
+        ORDER BY marca, modelo, anio
+    """
+    
+    # Condición de sugerir_autos por cada palabra escrita
+    CONDICION_SUGERENCIA = (
+        "(marca LIKE %s ESCAPE '!' OR modelo LIKE %s ESCAPE '!' OR CAST(anio AS CHAR) LIKE %s ESCAPE '!')"
+    )
+    
     @staticmethod
     def crear_auto(marca, modelo, anio, precio, color, transmision, combustible, imagen_url=None, cloudinary_id=None):
         """
@@ -27,26 +54,66 @@ class AutoModel:
         return db.execute_query(query, params)
     
     @staticmethod
-    def obtener_todos():
+    def obtener_todos(compacto=False):
+        """
+        Obtiene todos los autos registrados (solo columnas de lista)
+        
+        Args:
+            compacto: Retornar registros Auto en lugar de dicts (menos memoria por fila)
+        
+        Returns:
+            tuple: (success, list_of_autos/error_message)
+        """
+        return db.fetch_all(AutoModel.CONSULTA_LISTA, record_cls=Auto if compacto else None)
+    
+    @staticmethod
+    def obtener_disponibles(compacto=False):
         """
-        Obtiene todos los autos registrados
+        Obtiene los autos sin vender (estado 'disponible', ver VentaModel.crear_venta)
+        Lectura por el índice (estado, marca, modelo, anio): no recorre los vendidos
+        
+        Args:
+            compacto: Retornar registros Auto en lugar de dicts
         
         Returns:
             tuple: (success, list_of_autos/error_message)
         """
-        query = "SELECT * FROM autos ORDER BY fecha_registro DESC"
-        return db.fetch_all(query)
+        return db.fetch_all(AutoModel.CONSULTA_DISPONIBLES, record_cls=Auto if compacto else None)
+    
+    @staticmethod
+    def iterar_todos(row_format='dict', batch_size=500):
+        """
+        Recorre todos los autos sin cargarlos en memoria (exportaciones y reportes)
+        
+        Returns:
+            tuple: (success, generator_of_autos/error_message)
+        """
+        return db.stream(AutoModel.CONSULTA_LISTA, batch_size=batch_size, row_format=row_format)
     
     @staticmethod
     def obtener_por_id(id_auto):
         """
-        Obtiene un auto por su ID
+        Obtiene el registro completo de un auto por su ID
         
         Returns:
             tuple: (success, auto_data/error_message)
         """
-        query = "SELECT * FROM autos WHERE id_auto = %s"
-        return db.fetch_one(query, (id_auto,))
+        query = f"SELECT {AutoModel.COLUMNAS_DETALLE} FROM autos WHERE id_auto = %s"
+        return db.fetch_preparada(query, (id_auto,), una=True)
+    
+    @staticmethod
+    def obtener_fila(id_auto):
+        """
+        Obtiene la fila de lista de un auto (para actualizar una sola fila de la tabla)
+        
+        Returns:
+            tuple: (success, Auto/None/error_message)
+        """
+        query = f"SELECT {AutoModel.COLUMNAS_LISTA} FROM autos WHERE id_auto = %s"
+        success, result = db.fetch_all(query, (id_auto,), Auto)
+        if not success:
+            return False, result
+        return True, result[0] if result else None
     
     @staticmethod
     def actualizar_auto(id_auto, marca, modelo, anio, precio, color, transmision, combustible, imagen_url=None, cloudinary_id=None):
@@ -91,17 +158,55 @@ class AutoModel:
         return db.execute_query(query, (id_auto,))
     
     @staticmethod
-    def buscar_autos(criterio):
+    def buscar_autos(criterio, compacto=False):
         """
-        Busca autos por marca, modelo o color
+        Busca autos por marca, modelo o color (solo columnas de lista)
+        
+        Args:
+            compacto: Retornar registros Auto en lugar de dicts
         
         Returns:
             tuple: (success, list_of_autos/error_message)
         """
-        query = """
-            SELECT * FROM autos 
+        query = f"""
+            SELECT {AutoModel.COLUMNAS_LISTA} FROM autos 
             WHERE marca LIKE %s OR modelo LIKE %s OR color LIKE %s
             ORDER BY fecha_registro DESC
         """
         search_term = f"%{criterio}%"
-        return db.fetch_all(query, (search_term, search_term, search_term))
+        return db.fetch_all(query, (search_term, search_term, search_term), Auto if compacto else None)
+    
+    @staticmethod
+    def sugerir_autos(texto, limite=10):
+        """
+        Primeros autos disponibles en los que cada palabra del texto es el comienzo
+        de la marca, el modelo o el año ("toy cor 20" -> Toyota Corolla 2020)
+        Se recorre en orden el índice de disponibles y se corta en el límite
+        
+        Args:
+            texto: Lo escrito hasta ahora (vacío = los primeros por marca)
+            limite: Máximo de autos a retornar
+        
+        Returns:
+            tuple: (success, list_of_autos/error_message)
+        """
+        palabras = texto.split()
+        params = [patron for palabra in palabras for patron in [patron_prefijo(palabra)] * 3]
+        params.append(limite)
+        return db.fetch_all(AutoModel.consulta_sugerencias(len(palabras)), tuple(params))
+    
+    @staticmethod
+    def consulta_sugerencias(palabras):
+        """
+        Consulta de sugerir_autos para una cantidad de palabras
+        
+        Returns:
+            str: Consulta con 3 parámetros por palabra y el límite
+        """
+        condiciones = ["estado = 'disponible'"] + [AutoModel.CONDICION_SUGERENCIA] * palabras
+        return f"""
+            SELECT {AutoModel.COLUMNAS_SUGERENCIA} FROM autos
+            WHERE {' AND '.join(condiciones)}
+            ORDER BY marca, modelo, anio
+            LIMIT %s
+        """
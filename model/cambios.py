@@ -0,0 +1,236 @@
+"""
+Notificación de cambios entre equipos
+Lee la tabla cambios (migración 003, llenada por triggers) y entrega a las
+vistas suscritas los ids modificados por tabla, para que actualicen solo esas
+filas en lugar de recargar la tabla completa
+"""
+import threading
+
+from model.conexion import db
+
+OPERACIONES = ('INSERT', 'UPDATE', 'DELETE')
+
+# Triggers de la migración 003 (alta, modificación y baja de autos, clientes y ventas)
+TRIGGERS_ESPERADOS = 9
+
+
+def agrupar_cambios(filas):
+    """
+    Agrupa las filas de la tabla cambios por tabla y id, conservando la
+    operación que importa para la vista (un INSERT seguido de UPDATE sigue
+    siendo INSERT; cualquier secuencia que termina en DELETE es DELETE)
+
+    Args:
+        filas: Tuplas (id_cambio, tabla, id_registro, operacion) en orden de id_cambio
+
+    Returns:
+        dict: {tabla: {id_registro: operacion}}
+    """
+    agrupados = {}
+    for _, tabla, id_registro, operacion in filas:
+        cambios = agrupados.setdefault(tabla, {})
+        anterior = cambios.get(id_registro)
+        if anterior == 'INSERT' and operacion == 'UPDATE':
+            continue
+        cambios[id_registro] = operacion
+    return agrupados
+
+
+class NotificadorCambios:
+    """Consulta periódicamente la tabla cambios y avisa a los suscriptores"""
+
+    def __init__(self, intervalo=3.0, lote=500, dias_retencion=7, purgar_cada=1200):
+        """
+        Args:
+            intervalo (float): Segundos entre consultas
+            lote (int): Máximo de cambios leídos por consulta
+            dias_retencion (int): Días que se conservan las filas de cambios
+            purgar_cada (int): Cada cuántas consultas se borran las filas antiguas
+        """
+        self.intervalo = intervalo
+        self.lote = lote
+        self.dias_retencion = dias_retencion
+        self.purgar_cada = purgar_cada
+        self.ultimo_id = None
+        self._suscriptores = {}
+        self._despachar = None
+        self._mysql = None
+        self._consultas = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def suscribir(self, tabla, callback):
+        """
+        Registra callback(cambios) para una tabla; cambios es {id_registro: operacion}
+        El callback se ejecuta a través de la función de despacho (hilo de Tk)
+        """
+        with self._lock:
+            self._suscriptores.setdefault(tabla, []).append(callback)
+
+    def desuscribir(self, tabla, callback):
+        """Elimina un callback registrado"""
+        with self._lock:
+            callbacks = self._suscriptores.get(tabla, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    @staticmethod
+    def verificar_triggers():
+        """
+        Comprueba que existan los triggers que llenan la tabla cambios
+        Sin permiso SUPER la migración 003 no los pudo crear (ver model/migraciones.py)
+
+        Returns:
+            tuple: (success, message/None); success False si no hay ninguno
+        """
+        success, fila = db.fetch_one(
+            """
+                SELECT COUNT(*) AS total FROM information_schema.TRIGGERS
+                WHERE TRIGGER_SCHEMA = DATABASE() AND TRIGGER_NAME LIKE 'trg\\_%'
+            """
+        )
+        if not success:
+            return False, fila
+        total = fila['total'] if fila else 0
+        if not total:
+            return False, "No están los triggers de la tabla cambios (requieren SUPER o log_bin_trust_function_creators=1)"
+        if total < TRIGGERS_ESPERADOS:
+            return True, f"Faltan {TRIGGERS_ESPERADOS - total} triggers de la tabla cambios: algunos cambios no se notificarán"
+        return True, None
+
+    def iniciar(self, despachar=None):
+        """
+        Inicia la consulta periódica en segundo plano
+
+        Args:
+            despachar: Función despachar(func, *args) que ejecuta en el hilo de Tk
+                (UIDispatcher.post); sin ella los callbacks corren en el hilo de fondo
+        """
+        self._despachar = despachar
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def detener(self):
+        """Detiene la consulta periódica"""
+        self._stop.set()
+
+    def _conexion_mysql(self):
+        """Conexión propia del hilo de fondo (mysql.connector no es seguro entre hilos)"""
+        if self._mysql is None or not self._mysql.is_connected():
+            self._cerrar_mysql()
+            self._mysql = db._crear_conexion()
+        return self._mysql
+
+    def _cerrar_mysql(self):
+        if self._mysql is not None:
+            try:
+                self._mysql.close()
+            except Exception:
+                pass
+            self._mysql = None
+
+    def revisar(self):
+        """
+        Lee los cambios posteriores al último id entregado
+
+        Returns:
+            dict: {tabla: {id_registro: operacion}} (vacío si no hay cambios)
+        """
+        mysql = self._conexion_mysql()
+        cursor = mysql.cursor()
+        try:
+            if self.ultimo_id is None:
+                # Al iniciar solo interesan los cambios futuros
+                cursor.execute("SELECT COALESCE(MAX(id_cambio), 0) FROM cambios")
+                self.ultimo_id = cursor.fetchone()[0]
+                return {}
+
+            cursor.execute(
+                """
+                    SELECT id_cambio, tabla, id_registro, operacion
+                    FROM cambios
+                    WHERE id_cambio > %s
+                    ORDER BY id_cambio
+                    LIMIT %s
+                """,
+                (self.ultimo_id, self.lote)
+            )
+            filas = cursor.fetchall()
+
+            self._consultas += 1
+            if self._consultas % self.purgar_cada == 0:
+                cursor.execute(
+                    "DELETE FROM cambios WHERE fecha < NOW() - INTERVAL %s DAY",
+                    (self.dias_retencion,)
+                )
+        finally:
+            cursor.close()
+            # Cerrar la transacción para ver las filas nuevas en la próxima consulta
+            mysql.commit()
+
+        if filas:
+            self.ultimo_id = filas[-1][0]
+        return agrupar_cambios(filas)
+
+    def _entregar(self, agrupados):
+        """Sincroniza la réplica local (si existe) y avisa a los suscriptores"""
+        if db.replica is not None:
+            # Solo las tablas con cambios; las bajas se borran por id (sin comparar todos los ids)
+            bajas = [
+                (tabla, id_registro)
+                for tabla, cambios in agrupados.items()
+                for id_registro, operacion in cambios.items()
+                if operacion == 'DELETE'
+            ]
+            if bajas:
+                db.replica.borrar_locales(bajas)
+            db.replica.sincronizar(tablas=set(agrupados))
+
+        with self._lock:
+            pendientes = [
+                (callback, cambios)
+                for tabla, cambios in agrupados.items()
+                for callback in self._suscriptores.get(tabla, [])
+            ]
+
+        for callback, cambios in pendientes:
+            if self._despachar is not None:
+                self._despachar(callback, cambios)
+                continue
+            # Sin despacho el callback corre en este hilo: un suscriptor que
+            # falla no deja sin cambios a los demás
+            try:
+                callback(cambios)
+            except Exception as e:
+                print(f"⚠️ Error en un suscriptor de cambios: {e}")
+
+    def _loop(self):
+        """Ciclo de consulta en segundo plano"""
+        error_anterior = None
+        while not self._stop.wait(self.intervalo):
+            try:
+                agrupados = self.revisar()
+            except Exception as e:
+                self._cerrar_mysql()
+                if str(e) != error_anterior:
+                    print(f"⚠️ Error al leer el registro de cambios: {e}")
+                error_anterior = str(e)
+                continue
+
+            error_anterior = None
+            if agrupados:
+                # Un error al entregar no debe terminar el hilo (las vistas dejarían de actualizarse)
+                try:
+                    self._entregar(agrupados)
+                except Exception as e:
+                    print(f"⚠️ Error al entregar el registro de cambios: {e}")
+
+        self._cerrar_mysql()
+
+
+# Instancia global del notificador
+notificador_cambios = NotificadorCambios()
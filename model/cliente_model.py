@@ -2,11 +2,31 @@
 Modelo de datos para la tabla de clientes
 Implementa todas las operaciones CRUD
 """
-from model.conexion import db
+from model.conexion import db, patron_prefijo
+from model.registros import Cliente
 
 class ClienteModel:
     """Clase para gestionar operaciones CRUD de clientes"""
     
+    # Columnas que necesitan la tabla y la búsqueda (fila de lista)
+    COLUMNAS_LISTA = "id_cliente, nombre, telefono, correo, direccion"
+    
+    # Opciones del selector de clientes del formulario de ventas
+    COLUMNAS_SUGERENCIA = "id_cliente, nombre, telefono"
+    
+    # Registro completo (fila de detalle)
+    COLUMNAS_DETALLE = "id_cliente, nombre, telefono, correo, direccion"
+    
+    # Consultas del listado y del selector (también las verifica model/migraciones.py con EXPLAIN)
+    CONSULTA_LISTA = f"SELECT {COLUMNAS_LISTA} FROM clientes ORDER BY nombre"
+    
+    CONSULTA_SUGERENCIAS = f"""
+        SELECT {COLUMNAS_SUGERENCIA} FROM clientes
+        WHERE nombre LIKE %s ESCAPE '!'
+        ORDER BY nombre
+        LIMIT %s
+    """
+    
     @staticmethod
     def crear_cliente(nombre, telefono, correo, direccion):
         """
@@ -23,15 +43,27 @@ class ClienteModel:
         return db.execute_query(query, params)
     
     @staticmethod
-    def obtener_todos():
+    def obtener_todos(compacto=False):
         """
         Obtiene todos los clientes registrados
         
+        Args:
+            compacto: Retornar registros Cliente en lugar de dicts (menos memoria por fila)
+        
         Returns:
             tuple: (success, list_of_clientes/error_message)
         """
-        query = "SELECT * FROM clientes ORDER BY nombre"
-        return db.fetch_all(query)
+        return db.fetch_all(ClienteModel.CONSULTA_LISTA, record_cls=Cliente if compacto else None)
+    
+    @staticmethod
+    def iterar_todos(row_format='dict', batch_size=500):
+        """
+        Recorre todos los clientes sin cargarlos en memoria (exportaciones y reportes)
+        
+        Returns:
+            tuple: (success, generator_of_clientes/error_message)
+        """
+        return db.stream(ClienteModel.CONSULTA_LISTA, batch_size=batch_size, row_format=row_format)
     
     @staticmethod
     def obtener_por_id(id_cliente):
@@ -41,8 +73,22 @@ class ClienteModel:
         Returns:
             tuple: (success, cliente_data/error_message)
         """
-        query = "SELECT * FROM clientes WHERE id_cliente = %s"
-        return db.fetch_one(query, (id_cliente,))
+        query = f"SELECT {ClienteModel.COLUMNAS_DETALLE} FROM clientes WHERE id_cliente = %s"
+        return db.fetch_preparada(query, (id_cliente,), una=True)
+    
+    @staticmethod
+    def obtener_fila(id_cliente):
+        """
+        Obtiene la fila de lista de un cliente (para actualizar una sola fila de la tabla)
+        
+        Returns:
+            tuple: (success, Cliente/None/error_message)
+        """
+        query = f"SELECT {ClienteModel.COLUMNAS_LISTA} FROM clientes WHERE id_cliente = %s"
+        success, result = db.fetch_all(query, (id_cliente,), Cliente)
+        if not success:
+            return False, result
+        return True, result[0] if result else None
     
     @staticmethod
     def actualizar_cliente(id_cliente, nombre, telefono, correo, direccion):
@@ -72,17 +118,35 @@ class ClienteModel:
         return db.execute_query(query, (id_cliente,))
     
     @staticmethod
-    def buscar_clientes(criterio):
+    def buscar_clientes(criterio, compacto=False):
         """
         Busca clientes por nombre, teléfono o correo
         
+        Args:
+            compacto: Retornar registros Cliente en lugar de dicts
+        
         Returns:
             tuple: (success, list_of_clientes/error_message)
         """
-        query = """
-            SELECT * FROM clientes 
+        query = f"""
+            SELECT {ClienteModel.COLUMNAS_LISTA} FROM clientes 
             WHERE nombre LIKE %s OR telefono LIKE %s OR correo LIKE %s
             ORDER BY nombre
         """
         search_term = f"%{criterio}%"
-        return db.fetch_all(query, (search_term, search_term, search_term))
+        return db.fetch_all(query, (search_term, search_term, search_term), Cliente if compacto else None)
+    
+    @staticmethod
+    def sugerir_clientes(texto, limite=10):
+        """
+        Primeros clientes cuyo nombre empieza con texto (selector con sugerencias)
+        Búsqueda por rango sobre el índice del nombre: no recorre la tabla
+        
+        Args:
+            texto: Lo escrito hasta ahora (vacío = los primeros por nombre)
+            limite: Máximo de clientes a retornar
+        
+        Returns:
+            tuple: (success, list_of_clientes/error_message)
+        """
+        return db.fetch_all(ClienteModel.CONSULTA_SUGERENCIAS, (patron_prefijo(texto.strip()), limite))
@@ -1,46 +1,320 @@
 """
-Gestión de conexión a la base de datos MySQL
+Gestión de conexión a la base de datos (MySQL o SQLite, ver model/motores.py)
 Compatible con Windows y Linux
 """
-import mysql.connector
-from mysql.connector import Error
+from collections import namedtuple, OrderedDict
+import functools
 import os
-from dotenv import load_dotenv
+import threading
+import time
+
+# Formatos de fila que acepta DatabaseConnection.stream
+FORMATOS_FILA = ('dict', 'tuple', 'named')
+
+# Sentencias preparadas que se mantienen abiertas por conexión
+MAX_SENTENCIAS_PREPARADAS = 32
+
+
+def patron_prefijo(texto):
+    """
+    Patrón LIKE que coincide con los valores que empiezan con texto
+    Los comodines del texto se escapan con '!' (usar ESCAPE '!' en la consulta:
+    la barra invertida no sirve en ambos motores)
+    """
+    escapado = texto.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+    return f"{escapado}%"
+
+
+def instrumentado(metodo):
+    """
+    Mide la llamada y la registra en db.instrumentacion (si está activa)
+    Solo se registra la llamada externa: fetch_all que delega en fetch_records
+    cuenta una sola vez
+    """
+    @functools.wraps(metodo)
+    def envoltura(self, query, *args, **kwargs):
+        if self.instrumentacion is None or getattr(self._local, "midiendo", False):
+            return metodo(self, query, *args, **kwargs)
+        
+        self._local.midiendo = True
+        self._local.filas_afectadas = None
+        inicio = time.perf_counter()
+        try:
+            success, result = metodo(self, query, *args, **kwargs)
+        finally:
+            self._local.midiendo = False
+        duracion = time.perf_counter() - inicio
+        
+        try:
+            self.instrumentacion.registrar(
+                query, duracion, success, result,
+                origen="replica" if self._leer_de_replica(query) else self.motor.nombre,
+                filas=self._local.filas_afectadas
+            )
+        except Exception as e:
+            print(f"⚠️ Error en la instrumentación de consultas: {e}")
+        return success, result
+    return envoltura
+
+class TransaccionCancelada(Exception):
+    """
+    La lanza el cuerpo de DatabaseConnection.en_transaccion para deshacer la
+    transacción; su mensaje se retorna como error (p. ej. "el auto ya fue vendido")
+    """
+
+
+class Transaccion:
+    """Sentencias de una transacción abierta por DatabaseConnection.en_transaccion"""
+    
+    def __init__(self, connection, motor):
+        self._connection = connection
+        self._motor = motor
+        self.lastrowid = None
+        # Escrituras ejecutadas, (query, params) (para sincronizar la réplica local al confirmar)
+        self.consultas = []
+    
+    def ejecutar(self, query, params=None):
+        """
+        Ejecuta una escritura dentro de la transacción
+        
+        Returns:
+            int: Filas modificadas por la sentencia
+        """
+        cursor = self._motor.cursor(self._connection)
+        try:
+            if params:
+                cursor.execute(self._motor.traducir(query), params)
+            else:
+                cursor.execute(query)
+            self.lastrowid = cursor.lastrowid
+            self.consultas.append((query, params))
+            return cursor.rowcount
+        finally:
+            cursor.close()
+    
+    def consultar_uno(self, query, params=None):
+        """Lee una fila (dict o None) dentro de la transacción"""
+        cursor = self._motor.cursor(self._connection, dictionary=True)
+        try:
+            if params:
+                cursor.execute(self._motor.traducir(query), params)
+            else:
+                cursor.execute(query)
+            fila = cursor.fetchone()
+            # mysql.connector exige leer todo el resultado antes de la siguiente sentencia
+            cursor.fetchall()
+            return fila
+        finally:
+            cursor.close()
 
-# Cargar variables de entorno
-load_dotenv()
 
 class DatabaseConnection:
-    """Clase para gestionar la conexión a MySQL"""
+    """Clase para gestionar la conexión a la base de datos"""
+    
+    def __init__(self, host=None, user=None, password=None, database=None, motor=None):
+        # Los valores explícitos tienen prioridad; el resto se lee del .env al conectar
+        self.host = host
+        self.user = user
+        self.password = password
+        self.database = database
+        # Conexión propia de algunos hilos de fondo (ver usar_conexion_del_hilo)
+        self._local = threading.local()
+        # Motor (MotorMySQL o MotorSQLite); si es None se elige con DB_MOTOR al conectar
+        self.motor = motor
+        self.connection = None
+        self.connect_timeout = 10
+        self._config_loaded = False
+        # Réplica local opcional para las lecturas (ver model/replica.py)
+        self.replica = None
+        # Cursores preparados por texto de consulta (se descartan al reconectar)
+        self._preparadas = OrderedDict()
+        # Métricas de consultas opcionales (ver model/instrumentacion.py)
+        self.instrumentacion = None
     
-    def __init__(self, host=None, user=None, password=None, database=None):
+    @property
+    def connection(self):
+        """Conexión del hilo actual: la propia del hilo si la tiene, si no la compartida"""
+        propia = getattr(self._local, "connection", None)
+        return propia if propia is not None else self._connection
+    
+    @connection.setter
+    def connection(self, value):
+        self._connection = value
+    
+    @property
+    def _preparadas(self):
+        """Cursores preparados de la conexión del hilo actual"""
+        propias = getattr(self._local, "preparadas", None)
+        return propias if propias is not None else self._preparadas_compartidas
+    
+    @_preparadas.setter
+    def _preparadas(self, value):
+        self._preparadas_compartidas = value
+    
+    def usar_conexion_del_hilo(self, conexion):
+        """
+        Hace que las consultas del hilo actual usen su propia conexión
+        mysql.connector no es seguro entre hilos: un hilo de fondo que consulta
+        a través de los modelos (p. ej. los selectores con sugerencias) abre la
+        suya con _crear_conexion y la registra aquí; None vuelve a la compartida
+        """
+        self._local.connection = conexion
+        self._local.preparadas = OrderedDict() if conexion is not None else None
+    
+    def load_config(self):
+        """
+        Carga la configuración desde el archivo .env y variables de entorno
+        Se ejecuta al conectar y no al importar el módulo para acelerar el arranque
+        """
+        if self._config_loaded:
+            return
+        
+        from dotenv import load_dotenv
+        load_dotenv()
+        
         # Intentar cargar desde variables de entorno, sino usar valores por defecto
-        self.host = host or os.getenv('DB_HOST', 'localhost')
-        self.user = user or os.getenv('DB_USER', 'root')
-        self.password = password or os.getenv('DB_PASSWORD', '')
-        self.database = database or os.getenv('DB_NAME', 'venta_autos_db')
+        self.host = self.host or os.getenv('DB_HOST', 'localhost')
+        self.user = self.user or os.getenv('DB_USER', 'root')
+        self.password = self.password or os.getenv('DB_PASSWORD', '')
+        self.database = self.database or os.getenv('DB_NAME', 'venta_autos_db')
+        self.connect_timeout = int(os.getenv('DB_CONNECT_TIMEOUT', '10'))
+        if self.motor is None:
+            from model.motores import crear_motor
+            self.motor = crear_motor(os.getenv('DB_MOTOR', 'mysql'), os.getenv('DB_RUTA_SQLITE') or None)
+        self._config_loaded = True
+    
+    def usar_motor(self, motor):
+        """
+        Cambia el motor de base de datos (cierra la conexión actual)
+        
+        Args:
+            motor: MotorMySQL o MotorSQLite (ver model/motores.py)
+        """
+        self.disconnect()
         self.connection = None
+        self.motor = motor
     
     def connect(self):
         """Establece la conexión con la base de datos"""
+        self.load_config()
+        self._cerrar_preparadas()
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                database=self.database
-            )
-            if self.connection.is_connected():
+            self.connection = self._crear_conexion()
+            if self.motor.esta_conectada(self.connection):
                 return True, "Conexión exitosa"
-        except Error as e:
+        except self.motor.Error as e:
             return False, f"Error al conectar: {str(e)}"
         return False, "No se pudo establecer la conexión"
     
+    def _crear_conexion(self):
+        """Abre una conexión nueva con la configuración cargada"""
+        return self.motor.conectar(self)
+    
     def disconnect(self):
         """Cierra la conexión con la base de datos"""
-        if self.connection and self.connection.is_connected():
+        self._cerrar_preparadas()
+        if self.motor is not None and self.motor.esta_conectada(self.connection):
             self.connection.close()
     
+    def _cursor_preparado(self, query):
+        """
+        Retorna el cursor preparado de la consulta, creándolo la primera vez
+        mysql.connector prepara la sentencia en el servidor en el primer execute y
+        la reutiliza mientras el cursor reciba el mismo texto, así que un cursor por
+        consulta equivale a una caché de sentencias de la conexión (en SQLite la
+        caché es la del propio módulo sqlite3)
+        """
+        cursor = self._preparadas.get(query)
+        if cursor is not None:
+            self._preparadas.move_to_end(query)
+            return cursor
+        
+        if len(self._preparadas) >= MAX_SENTENCIAS_PREPARADAS:
+            _, antiguo = self._preparadas.popitem(last=False)
+            self._cerrar_cursor(antiguo)
+        
+        cursor = self.motor.cursor_preparado(self.connection)
+        self._preparadas[query] = cursor
+        return cursor
+    
+    def _descartar_preparado(self, query):
+        """Cierra el cursor preparado de una consulta que falló"""
+        cursor = self._preparadas.pop(query, None)
+        if cursor is not None:
+            self._cerrar_cursor(cursor)
+    
+    def _cerrar_preparadas(self):
+        """Cierra todos los cursores preparados (libera las sentencias del servidor)"""
+        while self._preparadas:
+            _, cursor = self._preparadas.popitem()
+            self._cerrar_cursor(cursor)
+    
+    @staticmethod
+    def _cerrar_cursor(cursor):
+        try:
+            cursor.close()
+        except Exception:
+            pass
+    
+    @instrumentado
+    def fetch_preparada(self, query, params=None, una=False):
+        """
+        Ejecuta un SELECT con una sentencia preparada reutilizable
+        Pensado para lecturas puntuales frecuentes (obtener_por_id): el servidor no
+        vuelve a analizar la consulta y los valores viajan en protocolo binario
+        
+        Args:
+            query: Consulta SQL SELECT
+            params: Parámetros para la consulta (tupla)
+            una: Retornar solo la primera fila (como fetch_one)
+        
+        Returns:
+            tuple: (success, results/result/error_message)
+        """
+        if self._leer_de_replica(query):
+            if una:
+                return self.replica.fetch_one(query, params)
+            return self.replica.fetch_all(query, params)
+        
+        try:
+            cursor = self._cursor_preparado(query)
+            cursor.execute(self.motor.traducir(query), params or ())
+            # Leer todo el resultado para dejar el cursor listo para la siguiente ejecución
+            filas = cursor.fetchall()
+            columnas = [descripcion[0] for descripcion in cursor.description]
+        except self.motor.Error as e:
+            self._descartar_preparado(query)
+            return False, f"Error al obtener datos: {str(e)}"
+        
+        # Algunas versiones del conector entregan el texto como bytearray en protocolo binario
+        results = [
+            {
+                columna: valor.decode('utf-8') if isinstance(valor, (bytes, bytearray)) else valor
+                for columna, valor in zip(columnas, fila)
+            }
+            for fila in filas
+        ]
+        if una:
+            return True, results[0] if results else None
+        return True, results
+    
+    def usar_replica(self, replica):
+        """Responde las lecturas de autos, clientes y ventas desde una réplica local"""
+        self.replica = replica
+    
+    def usar_instrumentacion(self, metricas):
+        """Registra latencia, filas y bytes de cada consulta en metricas (None = desactivar)"""
+        self.instrumentacion = metricas
+    
+    def en_modo_local(self):
+        """Indica si se navega solo con la réplica local (sin conexión con el servidor)"""
+        return self.connection is None and self.replica is not None
+    
+    def _leer_de_replica(self, query):
+        """Indica si la consulta se responde desde la réplica local"""
+        return self.replica is not None and self.replica.puede_responder(query)
+    
+    @instrumentado
     def execute_query(self, query, params=None):
         """
         Ejecuta una consulta SQL (INSERT, UPDATE, DELETE)
@@ -52,42 +326,100 @@ class DatabaseConnection:
         Returns:
             tuple: (success, message/lastrowid)
         """
+        if self.connection is None:
+            # Sin conexión al iniciar (modo réplica local): reintentar antes de escribir
+            success, message = self.connect()
+            if not success:
+                return False, f"Sin conexión con la base de datos central: {message}"
+        
         try:
-            cursor = self.connection.cursor()
+            cursor = self.motor.cursor(self.connection)
             if params:
-                cursor.execute(query, params)
+                cursor.execute(self.motor.traducir(query), params)
             else:
                 cursor.execute(query)
             self.connection.commit()
+            self._local.filas_afectadas = cursor.rowcount
             lastrowid = cursor.lastrowid
             cursor.close()
+            if self.replica is not None:
+                # Solo encola: la réplica copia el cambio en su hilo de fondo
+                self.replica.sincronizar_tras_escritura([(query, params)])
             return True, lastrowid
-        except Error as e:
+        except self.motor.Error as e:
             return False, f"Error en la consulta: {str(e)}"
     
-    def fetch_all(self, query, params=None):
+    def en_transaccion(self, cuerpo):
+        """
+        Ejecuta varias escrituras en una sola transacción
+        Confirma si cuerpo termina bien; si lanza cualquier excepción
+        (TransaccionCancelada, una sentencia que falla o un error del propio
+        cuerpo) se deshace todo: la conexión es compartida y una transacción
+        abierta la confirmaría la siguiente escritura
+        
+        Args:
+            cuerpo: Función Transaccion -> resultado
+        
+        Returns:
+            tuple: (success, resultado de cuerpo/error_message)
+        """
+        if self.connection is None:
+            # Sin conexión al iniciar (modo réplica local): reintentar antes de escribir
+            success, message = self.connect()
+            if not success:
+                return False, f"Sin conexión con la base de datos central: {message}"
+        
+        transaccion = Transaccion(self.connection, self.motor)
+        try:
+            resultado = cuerpo(transaccion)
+            self.connection.commit()
+        except Exception as e:
+            try:
+                self.connection.rollback()
+            except self.motor.Error:
+                pass
+            if isinstance(e, TransaccionCancelada):
+                return False, str(e)
+            if isinstance(e, self.motor.Error):
+                return False, f"Error en la consulta: {str(e)}"
+            return False, f"Error en la transacción: {str(e)}"
+        
+        if self.replica is not None and transaccion.consultas:
+            # Solo encola: la réplica copia los cambios en su hilo de fondo
+            self.replica.sincronizar_tras_escritura(transaccion.consultas)
+        return True, resultado
+    
+    @instrumentado
+    def fetch_all(self, query, params=None, record_cls=None):
         """
         Ejecuta una consulta SELECT y retorna todos los resultados
         
         Args:
             query: Consulta SQL SELECT
             params: Parámetros para la consulta (tupla)
+            record_cls: Tipo de registro compacto (opcional); por defecto cada fila es un dict
         
         Returns:
             tuple: (success, results/error_message)
         """
+        if self._leer_de_replica(query):
+            return self.replica.fetch_all(query, params, record_cls)
+        if record_cls is not None:
+            return self.fetch_records(query, params, record_cls)
+        
         try:
-            cursor = self.connection.cursor(dictionary=True)
+            cursor = self.motor.cursor(self.connection, dictionary=True)
             if params:
-                cursor.execute(query, params)
+                cursor.execute(self.motor.traducir(query), params)
             else:
                 cursor.execute(query)
             results = cursor.fetchall()
             cursor.close()
             return True, results
-        except Error as e:
+        except self.motor.Error as e:
             return False, f"Error al obtener datos: {str(e)}"
     
+    @instrumentado
     def fetch_one(self, query, params=None):
         """
         Ejecuta una consulta SELECT y retorna un solo resultado
@@ -99,17 +431,127 @@ class DatabaseConnection:
         Returns:
             tuple: (success, result/error_message)
         """
+        if self._leer_de_replica(query):
+            return self.replica.fetch_one(query, params)
+        
         try:
-            cursor = self.connection.cursor(dictionary=True)
+            cursor = self.motor.cursor(self.connection, dictionary=True)
             if params:
-                cursor.execute(query, params)
+                cursor.execute(self.motor.traducir(query), params)
             else:
                 cursor.execute(query)
             result = cursor.fetchone()
             cursor.close()
             return True, result
-        except Error as e:
+        except self.motor.Error as e:
+            return False, f"Error al obtener datos: {str(e)}"
+    
+    @instrumentado
+    def fetch_records(self, query, params=None, record_cls=None, batch_size=1000):
+        """
+        Ejecuta una consulta SELECT y retorna los resultados como registros compactos
+        Lee tuplas por lotes (sin crear un dict por fila) y las convierte en
+        instancias de record_cls (ver model/registros.py)
+        
+        Args:
+            query: Consulta SQL SELECT
+            params: Parámetros para la consulta (tupla)
+            record_cls: Subclase de Registro (Auto, Cliente, Venta)
+            batch_size: Filas leídas en cada fetchmany
+        
+        Returns:
+            tuple: (success, list_of_records/error_message)
+        """
+        if self._leer_de_replica(query):
+            return self.replica.fetch_all(query, params, record_cls)
+        
+        try:
+            cursor = self.motor.cursor(self.connection)
+            if params:
+                cursor.execute(self.motor.traducir(query), params)
+            else:
+                cursor.execute(query)
+            crear = record_cls.fabrica(d[0] for d in cursor.description)
+            results = []
+            while True:
+                lote = cursor.fetchmany(batch_size)
+                if not lote:
+                    break
+                results.extend(crear(fila) for fila in lote)
+            cursor.close()
+            return True, results
+        except self.motor.Error as e:
+            return False, f"Error al obtener datos: {str(e)}"
+    
+    def stream(self, query, params=None, batch_size=500, row_format='dict'):
+        """
+        Ejecuta una consulta SELECT y entrega las filas por lotes sin cargarlas todas en memoria
+        Usa una conexión dedicada con cursor sin búfer (las filas se leen del servidor
+        con fetchmany a medida que se consumen), así la conexión principal queda libre
+        para las consultas de la interfaz mientras dura la exportación
+        
+        Args:
+            query: Consulta SQL SELECT
+            params: Parámetros para la consulta (tupla)
+            batch_size: Filas leídas del servidor en cada fetchmany
+            row_format: 'dict' (como fetch_all), 'tuple' o 'named' (namedtuple con
+                los nombres de columna)
+        
+        Returns:
+            tuple: (success, generator/error_message)
+        
+        El generador cierra el cursor y la conexión al agotarse o al descartarse;
+        un error de lectura a mitad del recorrido se propaga como el Error del motor
+        """
+        if row_format not in FORMATOS_FILA:
+            return False, f"Formato de fila no válido: {row_format}"
+        
+        self.load_config()
+        connection = None
+        try:
+            connection = self._crear_conexion()
+            cursor = self.motor.cursor_sin_bufer(connection)
+            if params:
+                cursor.execute(self.motor.traducir(query), params)
+            else:
+                cursor.execute(query)
+        except self.motor.Error as e:
+            if connection is not None:
+                connection.close()
             return False, f"Error al obtener datos: {str(e)}"
+        
+        return True, self._iterar_cursor(connection, cursor, batch_size, row_format)
+    
+    @staticmethod
+    def _iterar_cursor(connection, cursor, batch_size, row_format):
+        """Recorre un cursor sin búfer por lotes y convierte cada fila al formato pedido"""
+        columnas = [descripcion[0] for descripcion in cursor.description]
+        if row_format == 'named':
+            fila_cls = namedtuple('Fila', columnas, rename=True)
+        
+        try:
+            while True:
+                lote = cursor.fetchmany(batch_size)
+                if not lote:
+                    break
+                for fila in lote:
+                    if row_format == 'dict':
+                        yield dict(zip(columnas, fila))
+                    elif row_format == 'named':
+                        yield fila_cls._make(fila)
+                    else:
+                        yield fila
+        finally:
+            # Un cursor sin búfer de MySQL debe vaciarse antes de cerrarse si se abandonó a mitad
+            try:
+                connection.consume_results()
+            except Exception:
+                pass
+            try:
+                cursor.close()
+            except Exception:
+                pass
+            connection.close()
 
 # Instancia global de la conexión
 db = DatabaseConnection()
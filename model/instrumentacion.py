@@ -0,0 +1,231 @@
+"""
+Instrumentación de consultas
+Registra latencia, filas y bytes aproximados por consulta normalizada,
+mantiene un histograma de latencias y escribe un log de consultas lentas.
+DatabaseConnection la invoca en cada fetch_all, fetch_one, fetch_records,
+fetch_preparada y execute_query (ver usar_instrumentacion)
+"""
+import json
+import re
+import threading
+import time
+from datetime import datetime
+
+from utils.paths import path_manager
+
+# Límites superiores (ms) de los intervalos del histograma; el último es abierto
+LIMITES_HISTOGRAMA_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Filas que se inspeccionan para estimar los bytes de un resultado
+FILAS_MUESTRA_BYTES = 20
+
+_ESPACIOS_RE = re.compile(r"\s+")
+_CADENA_RE = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMERO_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_LISTA_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def normalizar_consulta(query):
+    """
+    Reduce una consulta a su forma genérica para agrupar las ejecuciones
+    (espacios colapsados, literales y parámetros reemplazados por ?)
+    """
+    texto = _ESPACIOS_RE.sub(" ", query).strip()
+    texto = texto.replace("%s", "?")
+    texto = _CADENA_RE.sub("?", texto)
+    texto = _NUMERO_RE.sub("?", texto)
+    return _LISTA_RE.sub("(?+)", texto)
+
+
+def _bytes_valor(valor):
+    if valor is None:
+        return 0
+    if isinstance(valor, (str, bytes, bytearray)):
+        return len(valor)
+    return 8
+
+
+def estimar_bytes(result):
+    """
+    Estima los bytes de datos de un resultado a partir de una muestra de filas
+
+    Args:
+        result: Lista de filas, una fila o None
+    """
+    if result is None:
+        return 0
+    filas = result if isinstance(result, list) else [result]
+    if not filas:
+        return 0
+    muestra = filas[:FILAS_MUESTRA_BYTES]
+    total = 0
+    for fila in muestra:
+        valores = fila.values() if hasattr(fila, "values") else fila
+        total += sum(_bytes_valor(v) for v in valores)
+    return int(total * len(filas) / len(muestra))
+
+
+class EstadisticaConsulta:
+    """Acumulados de una consulta normalizada"""
+
+    __slots__ = ("consulta", "llamadas", "errores", "total_ms", "max_ms", "filas", "bytes", "histograma")
+
+    def __init__(self, consulta):
+        self.consulta = consulta
+        self.llamadas = 0
+        self.errores = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.filas = 0
+        self.bytes = 0
+        self.histograma = [0] * (len(LIMITES_HISTOGRAMA_MS) + 1)
+
+    def to_dict(self):
+        return {
+            "consulta": self.consulta,
+            "llamadas": self.llamadas,
+            "errores": self.errores,
+            "total_ms": round(self.total_ms, 2),
+            "media_ms": round(self.total_ms / self.llamadas, 3) if self.llamadas else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "filas": self.filas,
+            "bytes": self.bytes,
+            "histograma": dict(zip(etiquetas_histograma(), self.histograma)),
+        }
+
+
+def etiquetas_histograma():
+    """Etiquetas legibles de los intervalos del histograma"""
+    etiquetas = [f"<={limite}ms" for limite in LIMITES_HISTOGRAMA_MS]
+    etiquetas.append(f">{LIMITES_HISTOGRAMA_MS[-1]}ms")
+    return etiquetas
+
+
+def _intervalo(ms):
+    for i, limite in enumerate(LIMITES_HISTOGRAMA_MS):
+        if ms <= limite:
+            return i
+    return len(LIMITES_HISTOGRAMA_MS)
+
+
+class MetricasConsultas:
+    """Acumula métricas por consulta normalizada (seguro entre hilos)"""
+
+    def __init__(self, umbral_lento_ms=200.0, log_lentas=None):
+        """
+        Args:
+            umbral_lento_ms (float): Consultas con esta latencia o mayor van al log de lentas
+            log_lentas: Archivo del log (por defecto cache/consultas_lentas.log)
+        """
+        self.umbral_lento_ms = umbral_lento_ms
+        self.log_lentas = log_lentas or path_manager.get_cache_path("consultas_lentas.log")
+        self.inicio = time.time()
+        self._estadisticas = {}
+        self._histograma = [0] * (len(LIMITES_HISTOGRAMA_MS) + 1)
+        self._lock = threading.Lock()
+
+    def registrar(self, query, segundos, success, result, origen="mysql", filas=None):
+        """
+        Registra una ejecución
+
+        Args:
+            query: Texto de la consulta
+            segundos (float): Duración de la llamada
+            success (bool): Resultado de la llamada
+            result: Filas o valor retornado (para contar filas y estimar bytes)
+            origen: Motor que respondió ('mysql', 'sqlite') o 'replica'
+            filas: Filas afectadas (escrituras); si es None se cuentan las de result
+        """
+        ms = segundos * 1000
+        normalizada = normalizar_consulta(query)
+        if filas is None:
+            if not success or result is None:
+                filas = 0
+            else:
+                filas = len(result) if isinstance(result, list) else 1
+        bytes_ = estimar_bytes(result) if success and not isinstance(result, (int, str)) else 0
+
+        with self._lock:
+            clave = (origen, normalizada)
+            estadistica = self._estadisticas.get(clave)
+            if estadistica is None:
+                estadistica = self._estadisticas[clave] = EstadisticaConsulta(normalizada)
+            estadistica.llamadas += 1
+            estadistica.errores += 0 if success else 1
+            estadistica.total_ms += ms
+            estadistica.max_ms = max(estadistica.max_ms, ms)
+            estadistica.filas += filas
+            estadistica.bytes += bytes_
+            intervalo = _intervalo(ms)
+            estadistica.histograma[intervalo] += 1
+            self._histograma[intervalo] += 1
+
+        if ms >= self.umbral_lento_ms:
+            self._escribir_lenta(normalizada, ms, filas, origen, success)
+
+    def _escribir_lenta(self, normalizada, ms, filas, origen, success):
+        """Agrega una línea al log de consultas lentas (sin valores de parámetros)"""
+        linea = (
+            f"{datetime.now().isoformat(timespec='seconds')}\t{ms:.1f}ms\t{filas} filas\t"
+            f"{origen}\t{'ok' if success else 'error'}\t{normalizada}\n"
+        )
+        try:
+            with open(self.log_lentas, "a", encoding="utf-8") as archivo:
+                archivo.write(linea)
+        except OSError as e:
+            print(f"⚠️ No se pudo escribir el log de consultas lentas: {e}")
+
+    def resumen(self, top=None, orden="total_ms"):
+        """
+        Retorna las métricas acumuladas
+
+        Args:
+            top (int): Máximo de consultas a incluir (None = todas)
+            orden: Campo por el que se ordenan las consultas (total_ms, llamadas, max_ms, filas, bytes)
+
+        Returns:
+            dict: {desde, umbral_lento_ms, histograma, consultas: [...]}
+        """
+        with self._lock:
+            consultas = []
+            for (origen, _), estadistica in self._estadisticas.items():
+                datos = estadistica.to_dict()
+                datos["origen"] = origen
+                consultas.append(datos)
+            histograma = dict(zip(etiquetas_histograma(), self._histograma))
+
+        consultas.sort(key=lambda c: c[orden], reverse=True)
+        if top is not None:
+            consultas = consultas[:top]
+
+        return {
+            "desde": datetime.fromtimestamp(self.inicio).isoformat(timespec="seconds"),
+            "umbral_lento_ms": self.umbral_lento_ms,
+            "histograma": histograma,
+            "consultas": consultas,
+        }
+
+    def exportar_json(self, ruta=None):
+        """
+        Guarda el resumen completo en JSON
+
+        Returns:
+            str: Ruta del archivo escrito
+        """
+        ruta = ruta or path_manager.get_output_path(
+            f"metricas_consultas_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(self.resumen(), archivo, indent=2, ensure_ascii=False)
+        return ruta
+
+    def reiniciar(self):
+        """Descarta las métricas acumuladas"""
+        with self._lock:
+            self._estadisticas.clear()
+            self._histograma = [0] * (len(LIMITES_HISTOGRAMA_MS) + 1)
+            self.inicio = time.time()
+
+
+# Instancia global de las métricas (se activa con DB_INSTRUMENTAR, ver main_view)
+metricas_consultas = MetricasConsultas()
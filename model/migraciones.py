@@ -0,0 +1,371 @@
+"""
+Migraciones versionadas del esquema de la base de datos
+Aplica en orden los archivos database/migrations/NNN_nombre.sql y registra
+las versiones aplicadas en la tabla schema_migrations. Con DB_MOTOR=sqlite se
+usan los de database/migrations/sqlite/ (mismo esquema en el dialecto de SQLite)
+
+El DDL de MySQL no es transaccional: cada sentencia aplicada se registra en
+schema_migraciones_pasos y, si una falla a mitad de archivo, la próxima vez se
+retoma desde esa sentencia en lugar de repetir las anteriores. Con MySQL un
+bloqueo con nombre (GET_LOCK) evita que dos equipos migren el servidor a la vez
+
+Crear triggers con el binlog activo requiere SUPER (o
+log_bin_trust_function_creators=1), que el usuario de la aplicación no suele
+tener. Un CREATE TRIGGER que falla no detiene la migración: se avisa, la
+sentencia queda sin registrar y se reintenta en cada arranque hasta que un
+administrador otorgue el permiso (mientras tanto no hay notificador de cambios)
+
+Uso desde la línea de comandos:
+    python -m model.migraciones              # aplica las migraciones pendientes
+    python -m model.migraciones --estado     # muestra versiones aplicadas y pendientes
+    python -m model.migraciones --verificar  # EXPLAIN de las consultas críticas
+"""
+import re
+import sys
+
+from model.conexion import db
+from model.auto_model import AutoModel
+from model.cliente_model import ClienteModel
+from model.venta_model import VentaModel
+
+ARCHIVO_RE = re.compile(r"^(\d+)_([\w-]+)\.sql$")
+TRIGGER_RE = re.compile(r"^\s*CREATE\s+TRIGGER\b", re.IGNORECASE)
+
+# Bloqueo con nombre de MySQL mientras se aplican migraciones (segundos de espera)
+NOMBRE_BLOQUEO = "autogest_migraciones"
+ESPERA_BLOQUEO = 30
+
+# Consultas críticas que no deben recorrer la tabla completa: (nombre, consulta, parámetros)
+# Son las mismas cadenas que ejecutan los modelos
+CONSULTAS_CRITICAS = [
+    ("AutoModel.obtener_todos", AutoModel.CONSULTA_LISTA, None),
+    ("ClienteModel.obtener_todos", ClienteModel.CONSULTA_LISTA, None),
+    ("VentaModel.obtener_todas", VentaModel.CONSULTA_LISTA, None),
+    ("VentaModel.obtener_ventas_por_cliente", VentaModel.CONSULTA_POR_CLIENTE, (1,)),
+    ("ClienteModel.sugerir_clientes", ClienteModel.CONSULTA_SUGERENCIAS, ("a%", 10)),
+    ("AutoModel.obtener_disponibles", AutoModel.CONSULTA_DISPONIBLES, None),
+    ("AutoModel.sugerir_autos", AutoModel.consulta_sugerencias(1), ("to%", "to%", "to%", 10)),
+]
+
+
+class GestorMigraciones:
+    """Clase para aplicar y verificar las migraciones del esquema"""
+
+    @staticmethod
+    def listar_migraciones():
+        """
+        Lista los archivos de migración disponibles ordenados por versión
+
+        Returns:
+            list: Tuplas (version, nombre, ruta)
+        """
+        db.load_config()
+        migraciones = []
+        for ruta in db.motor.directorio_migraciones.glob("*.sql"):
+            match = ARCHIVO_RE.match(ruta.name)
+            if match:
+                migraciones.append((int(match.group(1)), match.group(2), ruta))
+        return sorted(migraciones)
+
+    @staticmethod
+    def dividir_sentencias(sql):
+        """
+        Divide un script SQL en sentencias individuales según el dialecto del motor
+        (ver dividir_script en model/motores.py)
+
+        Returns:
+            list: Sentencias sin comentarios
+        """
+        db.load_config()
+        return db.motor.dividir_script(sql)
+
+    @staticmethod
+    def crear_tabla_control():
+        """
+        Crea las tablas schema_migrations y schema_migraciones_pasos si no existen
+
+        Returns:
+            tuple: (success, message)
+        """
+        success, result = db.execute_query("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INT PRIMARY KEY,
+                nombre VARCHAR(100) NOT NULL,
+                aplicada_en TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        if not success:
+            return False, result
+        # Sentencias ya aplicadas de una migración que quedó a medias
+        return db.execute_query("""
+            CREATE TABLE IF NOT EXISTS schema_migraciones_pasos (
+                version INT NOT NULL,
+                paso INT NOT NULL,
+                PRIMARY KEY (version, paso)
+            )
+        """)
+
+    @staticmethod
+    def versiones_aplicadas():
+        """
+        Obtiene las versiones ya aplicadas
+
+        Returns:
+            tuple: (success, set_of_versions/error_message)
+        """
+        success, result = GestorMigraciones.crear_tabla_control()
+        if not success:
+            return False, result
+
+        success, result = db.fetch_all("SELECT version FROM schema_migrations")
+        if not success:
+            return False, result
+        return True, {row['version'] for row in result}
+
+    @staticmethod
+    def pendientes():
+        """
+        Obtiene las migraciones que aún no se aplicaron
+
+        Returns:
+            tuple: (success, list_of_migrations/error_message)
+        """
+        success, aplicadas = GestorMigraciones.versiones_aplicadas()
+        if not success:
+            return False, aplicadas
+        return True, [m for m in GestorMigraciones.listar_migraciones() if m[0] not in aplicadas]
+
+    @staticmethod
+    def aplicar_pendientes():
+        """
+        Aplica en orden las migraciones pendientes
+        Se detiene en la primera sentencia que falle; las anteriores quedan
+        registradas (archivos completos y pasos del archivo a medias)
+
+        Returns:
+            tuple: (success, list_of_applied_versions/error_message)
+        """
+        success, result = GestorMigraciones._bloquear()
+        if not success:
+            return False, result
+        try:
+            # Con el bloqueo tomado: otro equipo pudo terminar mientras se esperaba
+            success, pendientes = GestorMigraciones.pendientes()
+            if not success:
+                return False, pendientes
+
+            # Migraciones aplicadas con triggers omitidos (falta de permisos): reintentarlos
+            success, incompletas = GestorMigraciones._incompletas()
+            if not success:
+                return False, incompletas
+            for version, nombre, ruta in incompletas:
+                success, result = GestorMigraciones._aplicar(version, nombre, ruta, registrada=True)
+                if not success:
+                    return False, result
+
+            aplicadas = []
+            for version, nombre, ruta in pendientes:
+                success, result = GestorMigraciones._aplicar(version, nombre, ruta)
+                if not success:
+                    return False, result
+                aplicadas.append(version)
+            return True, aplicadas
+        finally:
+            GestorMigraciones._desbloquear()
+
+    @staticmethod
+    def _incompletas():
+        """
+        Migraciones ya registradas que conservan pasos (triggers omitidos)
+
+        Returns:
+            tuple: (success, list_of_migrations/error_message)
+        """
+        success, aplicadas = GestorMigraciones.versiones_aplicadas()
+        if not success:
+            return False, aplicadas
+        success, filas = db.fetch_all("SELECT DISTINCT version FROM schema_migraciones_pasos")
+        if not success:
+            return False, filas
+        con_pasos = {fila['version'] for fila in filas} & aplicadas
+        return True, [m for m in GestorMigraciones.listar_migraciones() if m[0] in con_pasos]
+
+    @staticmethod
+    def _aplicar(version, nombre, ruta, registrada=False):
+        """
+        Aplica un archivo retomando desde la primera sentencia no registrada
+        Los CREATE TRIGGER que fallan se omiten con un aviso y quedan sin
+        registrar (la migración se registra igual y se reintentan después)
+
+        Args:
+            registrada (bool): La versión ya está en schema_migrations (reintento de triggers)
+
+        Returns:
+            tuple: (success, message)
+        """
+        success, filas = db.fetch_all(
+            "SELECT paso FROM schema_migraciones_pasos WHERE version = %s", (version,)
+        )
+        if not success:
+            return False, filas
+        hechos = {fila['paso'] for fila in filas}
+
+        sql = ruta.read_text(encoding="utf-8")
+        omitidos = 0
+        for paso, sentencia in enumerate(GestorMigraciones.dividir_sentencias(sql), start=1):
+            if paso in hechos:
+                continue
+            success, result = db.execute_query(sentencia)
+            if not success and TRIGGER_RE.match(sentencia):
+                omitidos += 1
+                continue
+            if not success:
+                return False, f"Migración {version:03d}_{nombre} falló en la sentencia {paso}: {result}"
+            success, result = db.execute_query(
+                "INSERT INTO schema_migraciones_pasos (version, paso) VALUES (%s, %s)", (version, paso)
+            )
+            if not success:
+                return False, result
+
+        if not registrada:
+            success, result = db.execute_query(
+                "INSERT INTO schema_migrations (version, nombre) VALUES (%s, %s)", (version, nombre)
+            )
+            if not success:
+                return False, result
+        if omitidos:
+            # Los pasos quedan registrados para reintentar solo los triggers
+            print(f"⚠️ Migración {version:03d}_{nombre}: {omitidos} trigger(s) sin crear "
+                  "(requieren SUPER o log_bin_trust_function_creators=1); se reintentará al iniciar")
+            return True, None
+        return db.execute_query("DELETE FROM schema_migraciones_pasos WHERE version = %s", (version,))
+
+    @staticmethod
+    def _bloquear():
+        """
+        Toma el bloqueo con nombre de MySQL (SQLite es de un solo equipo)
+
+        Returns:
+            tuple: (success, message)
+        """
+        if db.motor.nombre != "mysql":
+            return True, None
+        success, fila = db.fetch_one("SELECT GET_LOCK(%s, %s) AS bloqueo", (NOMBRE_BLOQUEO, ESPERA_BLOQUEO))
+        if not success:
+            return False, fila
+        if not fila or fila['bloqueo'] != 1:
+            return False, "Otro equipo está aplicando las migraciones; intente de nuevo en unos segundos"
+        return True, None
+
+    @staticmethod
+    def _desbloquear():
+        if db.motor.nombre == "mysql":
+            db.fetch_one("SELECT RELEASE_LOCK(%s) AS liberado", (NOMBRE_BLOQUEO,))
+
+    @staticmethod
+    def verificar_planes(min_filas=1000):
+        """
+        Ejecuta EXPLAIN sobre las consultas críticas y detecta recorridos completos
+        Un recorrido completo (type = ALL) en una tabla con al menos min_filas
+        filas estimadas se considera una regresión
+
+        Returns:
+            tuple: (success, list_of_problems/error_message)
+        """
+        if db.motor.nombre == "sqlite":
+            return GestorMigraciones._verificar_planes_sqlite()
+
+        problemas = []
+        for nombre, query, params in CONSULTAS_CRITICAS:
+            success, filas = db.fetch_all(f"EXPLAIN {query}", params)
+            if not success:
+                return False, f"{nombre}: {filas}"
+
+            for fila in filas:
+                tipo = (fila.get('type') or '').upper()
+                estimadas = int(fila.get('rows') or 0)
+                if tipo == 'ALL' and estimadas >= min_filas:
+                    problemas.append(
+                        f"{nombre}: recorrido completo de '{fila.get('table')}' "
+                        f"(~{estimadas} filas, extra: {fila.get('Extra') or '-'})"
+                    )
+
+        return True, problemas
+
+    @staticmethod
+    def _verificar_planes_sqlite():
+        """
+        Versión SQLite de verificar_planes con EXPLAIN QUERY PLAN
+        SQLite no estima filas: cualquier SCAN de una tabla sin índice es una regresión
+
+        Returns:
+            tuple: (success, list_of_problems/error_message)
+        """
+        problemas = []
+        for nombre, query, params in CONSULTAS_CRITICAS:
+            success, filas = db.fetch_all(f"EXPLAIN QUERY PLAN {query}", params)
+            if not success:
+                return False, f"{nombre}: {filas}"
+
+            for fila in filas:
+                detalle = fila.get('detail') or ''
+                if detalle.startswith("SCAN") and "USING" not in detalle:
+                    problemas.append(f"{nombre}: recorrido completo ({detalle})")
+
+        return True, problemas
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Migraciones del esquema de AutoGest")
+    parser.add_argument("--estado", action="store_true", help="Mostrar migraciones aplicadas y pendientes")
+    parser.add_argument("--verificar", action="store_true", help="Verificar planes de consultas críticas con EXPLAIN")
+    parser.add_argument("--min-filas", type=int, default=1000, help="Filas mínimas para considerar un recorrido completo")
+    args = parser.parse_args(argv)
+
+    success, message = db.connect()
+    if not success:
+        print(f"❌ {message}")
+        return 1
+
+    try:
+        if args.estado:
+            success, aplicadas = GestorMigraciones.versiones_aplicadas()
+            if not success:
+                print(f"❌ {aplicadas}")
+                return 1
+            for version, nombre, _ in GestorMigraciones.listar_migraciones():
+                estado = "aplicada " if version in aplicadas else "pendiente"
+                print(f"  [{estado}] {version:03d}_{nombre}")
+            return 0
+
+        if args.verificar:
+            success, problemas = GestorMigraciones.verificar_planes(args.min_filas)
+            if not success:
+                print(f"❌ {problemas}")
+                return 1
+            if problemas:
+                print("❌ Consultas críticas con recorrido completo:")
+                for problema in problemas:
+                    print(f"   - {problema}")
+                return 1
+            print(f"✅ {len(CONSULTAS_CRITICAS)} consultas críticas usan índices")
+            return 0
+
+        success, result = GestorMigraciones.aplicar_pendientes()
+        if not success:
+            print(f"❌ {result}")
+            return 1
+        if result:
+            print(f"✅ Migraciones aplicadas: {', '.join(f'{v:03d}' for v in result)}")
+        else:
+            print("✅ El esquema está actualizado")
+        return 0
+    finally:
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+Motores de base de datos
+DatabaseConnection delega en un motor todo lo que depende del servidor:
+abrir conexiones, crear cursores, el estilo de parámetros, los errores y el
+dialecto de las migraciones. Las consultas de los modelos se escriben una sola
+vez con parámetros %s y funcionan en ambos motores.
+
+    mysql   Servidor MySQL/MariaDB compartido entre equipos (por defecto)
+    sqlite  Archivo local embebido, sin red: instalaciones de un solo equipo,
+            pruebas y benchmarks
+
+Se elige con DB_MOTOR en el .env (DB_RUTA_SQLITE para la ubicación del archivo)
+"""
+import sqlite3
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+from utils.paths import path_manager
+
+MIGRACIONES_DIR = Path(__file__).parent.parent / "database" / "migrations"
+
+# SQLite: los DECIMAL, DATE y TIMESTAMP se guardan como texto y se leen con los
+# mismos tipos que entrega mysql.connector (las vistas no distinguen el motor)
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_adapter(datetime, lambda valor: valor.isoformat(" "))
+sqlite3.register_adapter(date, lambda valor: valor.isoformat())
+sqlite3.register_converter("DECIMAL", lambda valor: Decimal(valor.decode()))
+sqlite3.register_converter("TIMESTAMP", lambda valor: datetime.fromisoformat(valor.decode()))
+sqlite3.register_converter("DATE", lambda valor: date.fromisoformat(valor.decode()))
+
+
+def fila_dict(cursor, fila):
+    """row_factory de SQLite que produce dicts como el cursor dictionary de MySQL"""
+    return {descripcion[0]: valor for descripcion, valor in zip(cursor.description, fila)}
+
+
+class MotorMySQL:
+    """Servidor MySQL/MariaDB con mysql.connector"""
+
+    nombre = "mysql"
+    directorio_migraciones = MIGRACIONES_DIR
+
+    @property
+    def Error(self):
+        # mysql.connector se importa al conectar y no al importar el módulo
+        from mysql.connector import Error
+        return Error
+
+    def conectar(self, config):
+        """
+        Abre una conexión nueva
+
+        Args:
+            config: DatabaseConnection con host, user, password, database y connect_timeout
+        """
+        import mysql.connector
+
+        return mysql.connector.connect(
+            host=config.host,
+            user=config.user,
+            password=config.password,
+            database=config.database,
+            connection_timeout=config.connect_timeout
+        )
+
+    @staticmethod
+    def esta_conectada(connection):
+        return connection is not None and connection.is_connected()
+
+    @staticmethod
+    def cursor(connection, dictionary=False):
+        return connection.cursor(dictionary=dictionary)
+
+    @staticmethod
+    def cursor_preparado(connection):
+        """Cursor que prepara la sentencia en el servidor y la reutiliza (protocolo binario)"""
+        return connection.cursor(prepared=True)
+
+    @staticmethod
+    def cursor_sin_bufer(connection):
+        """Cursor que lee las filas del servidor a medida que se piden"""
+        return connection.cursor(buffered=False)
+
+    @staticmethod
+    def traducir(query):
+        return query
+
+    @staticmethod
+    def dividir_script(sql):
+        """
+        Divide un script SQL en sentencias individuales
+        Las migraciones no usan DELIMITER: cada sentencia termina en ';'
+        (los triggers deben tener un cuerpo de una sola sentencia)
+        """
+        lineas = [
+            linea for linea in sql.splitlines()
+            if not linea.strip().startswith("--")
+        ]
+        return [s.strip() for s in "\n".join(lineas).split(";") if s.strip()]
+
+
+class MotorSQLite:
+    """Archivo SQLite local (módulo sqlite3 de la biblioteca estándar)"""
+
+    nombre = "sqlite"
+    directorio_migraciones = MIGRACIONES_DIR / "sqlite"
+    Error = sqlite3.Error
+
+    def __init__(self, ruta=None):
+        """
+        Args:
+            ruta: Archivo de la base (por defecto database/autogest.sqlite3)
+        """
+        self.ruta = str(ruta or path_manager.database_dir / "autogest.sqlite3")
+
+    def conectar(self, config=None):
+        """
+        Abre una conexión nueva al archivo (lo crea si no existe)
+        Cada hilo de fondo abre la suya; WAL permite leer mientras otro escribe
+        """
+        connection = sqlite3.connect(
+            self.ruta,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,
+            timeout=config.connect_timeout if config is not None else 10
+        )
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    @staticmethod
+    def esta_conectada(connection):
+        if connection is None:
+            return False
+        try:
+            connection.execute("SELECT 1")
+            return True
+        except sqlite3.ProgrammingError:
+            return False
+
+    @staticmethod
+    def cursor(connection, dictionary=False):
+        cursor = connection.cursor()
+        if dictionary:
+            cursor.row_factory = fila_dict
+        return cursor
+
+    @staticmethod
+    def cursor_preparado(connection):
+        """sqlite3 ya guarda compiladas las sentencias de la conexión: basta un cursor por consulta"""
+        return connection.cursor()
+
+    @staticmethod
+    def cursor_sin_bufer(connection):
+        """Los cursores de sqlite3 ya avanzan fila a fila sin cargar el resultado"""
+        return connection.cursor()
+
+    @staticmethod
+    def traducir(query):
+        """Adapta el estilo de parámetros de mysql.connector (%s) al de sqlite3 (?)"""
+        return query.replace("%s", "?")
+
+    @staticmethod
+    def dividir_script(sql):
+        """
+        Divide un script SQL en sentencias individuales
+        Los triggers de SQLite llevan BEGIN ... END con ';' internos: se acumulan
+        líneas hasta que sqlite3.complete_statement indica una sentencia completa
+        """
+        sentencias = []
+        actual = []
+        for linea in sql.splitlines():
+            if not actual and (not linea.strip() or linea.strip().startswith("--")):
+                continue
+            actual.append(linea)
+            texto = "\n".join(actual)
+            if sqlite3.complete_statement(texto):
+                sentencias.append(texto.strip().rstrip(";").strip())
+                actual = []
+        if actual and "\n".join(actual).strip():
+            sentencias.append("\n".join(actual).strip().rstrip(";").strip())
+        return sentencias
+
+
+MOTORES = {
+    MotorMySQL.nombre: MotorMySQL,
+    MotorSQLite.nombre: MotorSQLite,
+}
+
+
+def crear_motor(nombre, ruta_sqlite=None):
+    """
+    Crea el motor por nombre
+
+    Args:
+        nombre: 'mysql' o 'sqlite'
+        ruta_sqlite: Archivo de la base cuando el motor es SQLite
+
+    Raises:
+        ValueError: Si el motor no existe
+    """
+    nombre = (nombre or MotorMySQL.nombre).strip().lower()
+    if nombre not in MOTORES:
+        raise ValueError(f"Motor de base de datos desconocido: {nombre} (use {' o '.join(MOTORES)})")
+    if nombre == MotorSQLite.nombre:
+        return MotorSQLite(ruta_sqlite)
+    return MotorMySQL()
@@ -0,0 +1,115 @@
+"""
+Registros compactos para los listados en memoria
+Cada fila de fetch_all es un dict con sus propias claves y tabla hash; estos tipos
+guardan solo los valores en __slots__ y comparten los nombres de campo a nivel de
+clase, lo que reduce la memoria por fila en listados grandes.
+Aceptan el mismo acceso que un dict (registro['marca'], registro.get('imagen'))
+para que el código existente de las vistas funcione sin cambios
+"""
+
+
+class Registro:
+    """Base de los registros compactos con acceso compatible con dict"""
+
+    __slots__ = ()
+
+    # Nombres de campo en el orden de las columnas de la consulta
+    CAMPOS = ()
+
+    def __init__(self, *valores):
+        # Los campos sin valor quedan en None
+        for i, campo in enumerate(self.CAMPOS):
+            setattr(self, campo, valores[i] if i < len(valores) else None)
+
+    @classmethod
+    def _make(cls, fila):
+        """Crea el registro a partir de una tupla en el orden de CAMPOS"""
+        return cls(*fila)
+
+    @classmethod
+    def desde_dict(cls, datos):
+        """Crea el registro a partir de un dict (las claves desconocidas se ignoran)"""
+        return cls(*(datos.get(campo) for campo in cls.CAMPOS))
+
+    @classmethod
+    def fabrica(cls, columnas):
+        """
+        Retorna la función que convierte una tupla del cursor en registro
+
+        Args:
+            columnas: Nombres de columna del cursor (cursor.description)
+        """
+        columnas = tuple(columnas)
+        if columnas == cls.CAMPOS:
+            return cls._make
+        return lambda fila: cls.desde_dict(dict(zip(columnas, fila)))
+
+    # --- Acceso compatible con dict ---
+
+    def __getitem__(self, campo):
+        if campo not in self.CAMPOS:
+            raise KeyError(campo)
+        return getattr(self, campo)
+
+    def get(self, campo, default=None):
+        if campo not in self.CAMPOS:
+            return default
+        return getattr(self, campo)
+
+    def __contains__(self, campo):
+        return campo in self.CAMPOS
+
+    def __iter__(self):
+        return iter(self.CAMPOS)
+
+    def __len__(self):
+        return len(self.CAMPOS)
+
+    def keys(self):
+        return self.CAMPOS
+
+    def values(self):
+        return [getattr(self, campo) for campo in self.CAMPOS]
+
+    def items(self):
+        return [(campo, getattr(self, campo)) for campo in self.CAMPOS]
+
+    def to_dict(self):
+        """Convierte el registro en dict (para código que necesita modificarlo)"""
+        return dict(self.items())
+
+    def __eq__(self, otro):
+        if isinstance(otro, Registro):
+            return type(self) is type(otro) and self.values() == otro.values()
+        if isinstance(otro, dict):
+            return self.to_dict() == otro
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        valores = ", ".join(f"{campo}={getattr(self, campo)!r}" for campo in self.CAMPOS)
+        return f"{type(self).__name__}({valores})"
+
+
+class Auto(Registro):
+    """Fila de lista de autos (AutoModel.COLUMNAS_LISTA)"""
+
+    CAMPOS = ('id_auto', 'marca', 'modelo', 'anio', 'color',
+              'transmision', 'combustible', 'precio', 'imagen')
+    __slots__ = CAMPOS
+
+
+class Cliente(Registro):
+    """Fila de lista de clientes (ClienteModel.COLUMNAS_LISTA)"""
+
+    CAMPOS = ('id_cliente', 'nombre', 'telefono', 'correo', 'direccion')
+    __slots__ = CAMPOS
+
+
+class Venta(Registro):
+    """Fila de lista de ventas (VentaModel.COLUMNAS_LISTA)"""
+
+    CAMPOS = ('id_venta', 'id_auto', 'id_cliente', 'fecha_venta', 'monto', 'metodo_pago',
+              'auto_marca', 'auto_modelo', 'auto_anio', 'cliente_nombre')
+    __slots__ = CAMPOS
@@ -0,0 +1,514 @@
+"""
+Réplica local de solo lectura en SQLite
+Copia autos, clientes y ventas desde MySQL a cache/replica.sqlite3 y responde
+los SELECT de listados, búsquedas y detalle sin ir a la red. Las escrituras
+siguen yendo a MySQL; después de cada escritura se copian los cambios.
+
+La sincronización es incremental: cada tabla guarda la mayor marca
+actualizado_en copiada (migración 002) y solo pide las filas posteriores.
+Las escrituras no sincronizan en el hilo que las hace (el de Tk): se encolan
+las tablas que tocaron y los ids borrados y se despierta al hilo de fondo, que
+copia solo esas tablas y replica un DELETE por clave borrando la fila local (y
+sus ventas, como el ON DELETE CASCADE de MySQL). Mientras una tabla tiene
+escrituras sin copiar, sus lecturas van a MySQL para que la vista vea el cambio
+al recargar. Comparar todos los ids para encontrar filas eliminadas queda para
+cada cierto número de ciclos o para un DELETE que no es por clave.
+
+Se activa con DB_REPLICA_LOCAL=1 en el .env
+"""
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+from model.conexion import db
+from model.motores import MotorSQLite, fila_dict
+from utils.paths import path_manager
+
+# Segundos que se vuelven a pedir antes de la última marca, para no perder filas
+# de transacciones que confirmaron tarde con una marca anterior
+SOLAPE_SEGUNDOS = 5
+
+# Esquema local: columnas con tipo SQLite (DECIMAL, DATE y TIMESTAMP usan los
+# conversores de model/motores.py para que las vistas reciban los mismos tipos que con MySQL)
+TABLAS = {
+    'autos': {
+        'clave': 'id_auto',
+        'columnas': [
+            ('id_auto', 'INTEGER PRIMARY KEY'),
+            ('marca', 'TEXT'),
+            ('modelo', 'TEXT'),
+            ('anio', 'INTEGER'),
+            ('precio', 'DECIMAL'),
+            ('color', 'TEXT'),
+            ('transmision', 'TEXT'),
+            ('combustible', 'TEXT'),
+            ('imagen', 'TEXT'),
+            ('cloudinary_id', 'TEXT'),
+            ('fecha_registro', 'TIMESTAMP'),
+            ('estado', 'TEXT'),
+            ('actualizado_en', 'TIMESTAMP'),
+        ],
+        'indices': ['fecha_registro', 'estado, marca, modelo, anio'],
+    },
+    'clientes': {
+        'clave': 'id_cliente',
+        'columnas': [
+            ('id_cliente', 'INTEGER PRIMARY KEY'),
+            ('nombre', 'TEXT'),
+            ('telefono', 'TEXT'),
+            ('correo', 'TEXT'),
+            ('direccion', 'TEXT'),
+            ('actualizado_en', 'TIMESTAMP'),
+        ],
+        'indices': ['nombre'],
+    },
+    'ventas': {
+        'clave': 'id_venta',
+        'columnas': [
+            ('id_venta', 'INTEGER PRIMARY KEY'),
+            ('id_auto', 'INTEGER'),
+            ('id_cliente', 'INTEGER'),
+            ('fecha_venta', 'DATE'),
+            ('monto', 'DECIMAL'),
+            ('metodo_pago', 'TEXT'),
+            ('actualizado_en', 'TIMESTAMP'),
+        ],
+        'indices': ['fecha_venta', 'id_cliente, fecha_venta'],
+    },
+}
+
+# Ventas que MySQL borra en cascada al eliminar un auto o un cliente
+CASCADAS = {
+    'autos': [('ventas', 'id_auto')],
+    'clientes': [('ventas', 'id_cliente')],
+}
+
+TABLA_RE = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)", re.IGNORECASE)
+ESCRITURA_RE = re.compile(r"^\s*(INSERT\s+INTO|UPDATE|DELETE\s+FROM)\s+(\w+)", re.IGNORECASE)
+BORRADO_POR_CLAVE_RE = re.compile(r"^\s*DELETE\s+FROM\s+(\w+)\s+WHERE\s+(\w+)\s*=\s*%s\s*$", re.IGNORECASE)
+
+
+class ReplicaLocal:
+    """Copia local en SQLite de las tablas principales"""
+
+    def __init__(self, ruta=None, intervalo=30.0, reconciliar_cada=10):
+        """
+        Args:
+            ruta: Archivo SQLite (por defecto cache/replica.sqlite3)
+            intervalo (float): Segundos entre sincronizaciones en segundo plano
+            reconciliar_cada (int): Cada cuántos ciclos se buscan filas eliminadas
+        """
+        self.ruta = ruta or path_manager.get_cache_path("replica.sqlite3")
+        self.intervalo = intervalo
+        self.reconciliar_cada = reconciliar_cada
+        self.ultima_sincronizacion = None
+        self.ultimo_error = None
+        self._conn = None
+        self._mysql = None
+        self._lista = False
+        self._ciclos = 0
+        # Escrituras encoladas por sincronizar_tras_escritura para el hilo de fondo
+        self._pendientes_lock = threading.Lock()
+        self._tablas_pendientes = set()
+        self._borradas_pendientes = []
+        self._reconciliar_pendientes = set()
+        # Tablas con escrituras aún sin copiar (se leen de MySQL)
+        self._sucias = set()
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._despertar = threading.Event()
+        self._thread = None
+
+    # --- Base local ---
+
+    def abrir(self):
+        """Abre (o crea) el archivo SQLite y su esquema"""
+        with self._lock:
+            if self._conn is not None:
+                return
+            self._conn = sqlite3.connect(
+                self.ruta,
+                detect_types=sqlite3.PARSE_DECLTYPES,
+                check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._crear_esquema()
+            self._lista = self.tiene_datos()
+
+    def cerrar(self):
+        """Detiene la sincronización y cierra las conexiones"""
+        self.detener()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        self._cerrar_mysql()
+
+    def _crear_esquema(self):
+        """Crea las tablas locales y la tabla de marcas de sincronización"""
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS replica_estado (
+                tabla TEXT PRIMARY KEY,
+                marca TIMESTAMP,
+                sincronizado_en TIMESTAMP
+            )
+        """)
+        for tabla, definicion in TABLAS.items():
+            # Tabla de una versión anterior (le faltan columnas): se vuelve a copiar completa
+            existentes = {fila[1] for fila in self._conn.execute(f"PRAGMA table_info({tabla})")}
+            if existentes and not {nombre for nombre, _ in definicion['columnas']} <= existentes:
+                self._conn.execute(f"DROP TABLE {tabla}")
+                self._conn.execute("DELETE FROM replica_estado WHERE tabla = ?", (tabla,))
+            
+            columnas = ", ".join(f"{nombre} {tipo}" for nombre, tipo in definicion['columnas'])
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS {tabla} ({columnas})")
+            for i, indice in enumerate(definicion['indices']):
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{tabla}_{i} ON {tabla} ({indice})"
+                )
+        self._conn.commit()
+
+    def tiene_datos(self):
+        """Indica si todas las tablas se copiaron al menos una vez"""
+        with self._lock:
+            if self._conn is None:
+                return False
+            filas = self._conn.execute(
+                "SELECT COUNT(*) FROM replica_estado WHERE sincronizado_en IS NOT NULL"
+            ).fetchone()
+            return filas[0] == len(TABLAS)
+
+    def _marca(self, tabla):
+        """Mayor actualizado_en copiado de la tabla (None si nunca se sincronizó)"""
+        fila = self._conn.execute(
+            "SELECT marca, sincronizado_en FROM replica_estado WHERE tabla = ?", (tabla,)
+        ).fetchone()
+        if fila is None or fila[1] is None:
+            return None
+        return fila[0]
+
+    # --- Lecturas ---
+
+    def puede_responder(self, query):
+        """
+        Indica si la consulta se puede responder localmente: un SELECT que solo
+        usa tablas replicadas, una vez completada la primera copia
+        """
+        if not self._lista or not query.lstrip()[:6].upper() == "SELECT":
+            return False
+        tablas = {t.lower() for t in TABLA_RE.findall(query)}
+        if not tablas or not tablas <= TABLAS.keys():
+            return False
+        with self._pendientes_lock:
+            return not tablas & self._sucias
+
+    @staticmethod
+    def _traducir(query):
+        """Adapta el estilo de parámetros de mysql.connector (%s) al de sqlite3 (?)"""
+        return MotorSQLite.traducir(query)
+
+    def fetch_all(self, query, params=None, record_cls=None):
+        """
+        Ejecuta un SELECT sobre la réplica
+
+        Returns:
+            tuple: (success, results/error_message)
+        """
+        try:
+            with self._lock:
+                cursor = self._conn.execute(self._traducir(query), params or ())
+                filas = cursor.fetchall()
+                columnas = [d[0] for d in cursor.description]
+            if record_cls is not None:
+                crear = record_cls.fabrica(columnas)
+                return True, [crear(fila) for fila in filas]
+            return True, [dict(zip(columnas, fila)) for fila in filas]
+        except sqlite3.Error as e:
+            return False, f"Error al obtener datos de la réplica local: {str(e)}"
+
+    def fetch_one(self, query, params=None):
+        """
+        Ejecuta un SELECT sobre la réplica y retorna la primera fila
+
+        Returns:
+            tuple: (success, result/error_message)
+        """
+        try:
+            with self._lock:
+                cursor = self._conn.execute(self._traducir(query), params or ())
+                fila = cursor.fetchone()
+                if fila is None:
+                    return True, None
+                return True, fila_dict(cursor, fila)
+        except sqlite3.Error as e:
+            return False, f"Error al obtener datos de la réplica local: {str(e)}"
+
+    # --- Sincronización ---
+
+    def _conexion_mysql(self):
+        """Conexión propia para sincronizar sin compartir la de la interfaz"""
+        if self._mysql is None or not self._mysql.is_connected():
+            self._cerrar_mysql()
+            self._mysql = db._crear_conexion()
+        return self._mysql
+
+    def _cerrar_mysql(self):
+        if self._mysql is not None:
+            try:
+                self._mysql.close()
+            except Exception:
+                pass
+            self._mysql = None
+
+    def sincronizar(self, detectar_eliminados=False, tablas=None):
+        """
+        Copia a la réplica las filas modificadas desde la última sincronización
+
+        Args:
+            detectar_eliminados (bool): Comparar también los ids para borrar las filas
+                eliminadas en MySQL (incluidas las borradas en cascada)
+            tablas: Tablas a sincronizar (por defecto todas)
+
+        Returns:
+            tuple: (success, dict {tabla: (copiadas, eliminadas)}/error_message)
+        """
+        if self._conn is None:
+            return False, "La réplica local no está abierta"
+
+        with self._sync_lock:
+            resumen = {}
+            try:
+                db.load_config()
+                mysql = self._conexion_mysql()
+                for tabla in TABLAS:
+                    if tablas is not None and tabla not in tablas:
+                        continue
+                    resumen[tabla] = self._sincronizar_tabla(mysql, tabla, detectar_eliminados)
+                # Cerrar la transacción de lectura para ver los cambios del siguiente ciclo
+                mysql.commit()
+            except Exception as e:
+                self._cerrar_mysql()
+                self.ultimo_error = str(e)
+                return False, f"Error al sincronizar la réplica local: {str(e)}"
+
+            self.ultima_sincronizacion = time.time()
+            self.ultimo_error = None
+            self._lista = True
+            return True, resumen
+
+    def _sincronizar_tabla(self, mysql, tabla, detectar_eliminados):
+        """Copia las filas nuevas o modificadas de una tabla y opcionalmente borra las eliminadas"""
+        definicion = TABLAS[tabla]
+        nombres = [nombre for nombre, _ in definicion['columnas']]
+        clave = definicion['clave']
+        posicion_marca = nombres.index('actualizado_en')
+
+        with self._lock:
+            marca = self._marca(tabla)
+
+        cursor = mysql.cursor()
+        query = f"SELECT {', '.join(nombres)} FROM {tabla}"
+        if marca is not None:
+            cursor.execute(
+                f"{query} WHERE actualizado_en >= %s",
+                (marca - timedelta(seconds=SOLAPE_SEGUNDOS),)
+            )
+        else:
+            cursor.execute(query)
+        filas = cursor.fetchall()
+        cursor.close()
+
+        eliminadas = 0
+        ids_remotos = None
+        if detectar_eliminados and marca is not None:
+            cursor = mysql.cursor()
+            cursor.execute(f"SELECT {clave} FROM {tabla}")
+            ids_remotos = {fila[0] for fila in cursor.fetchall()}
+            cursor.close()
+
+        marcadores = ", ".join("?" for _ in nombres)
+        with self._lock:
+            if marca is None:
+                # Primera copia: reemplazar el contenido completo
+                self._conn.execute(f"DELETE FROM {tabla}")
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {tabla} ({', '.join(nombres)}) VALUES ({marcadores})",
+                filas
+            )
+
+            if ids_remotos is not None:
+                ids_locales = {fila[0] for fila in self._conn.execute(f"SELECT {clave} FROM {tabla}")}
+                sobrantes = [(id_,) for id_ in ids_locales - ids_remotos]
+                self._conn.executemany(f"DELETE FROM {tabla} WHERE {clave} = ?", sobrantes)
+                eliminadas = len(sobrantes)
+
+            nueva_marca = max((fila[posicion_marca] for fila in filas), default=marca)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO replica_estado (tabla, marca, sincronizado_en) VALUES (?, ?, ?)",
+                (tabla, nueva_marca, datetime.now())
+            )
+            self._conn.commit()
+
+        return len(filas), eliminadas
+
+    def sincronizar_tras_escritura(self, escrituras):
+        """
+        Encola el efecto de escrituras confirmadas para el hilo de fondo
+        No hace consultas: se llama desde el hilo de Tk justo después del commit
+
+        Args:
+            escrituras: Lista de (query, params) ya confirmadas
+        """
+        if not self._lista:
+            return
+        tablas = set()
+        borradas = []
+        reconciliar = set()
+        for query, params in escrituras:
+            escritura = ESCRITURA_RE.match(query)
+            if escritura is None or escritura.group(2).lower() not in TABLAS:
+                continue
+            tabla = escritura.group(2).lower()
+            if not escritura.group(1).upper().startswith("DELETE"):
+                tablas.add(tabla)
+                continue
+            por_clave = BORRADO_POR_CLAVE_RE.match(query)
+            if por_clave and por_clave.group(2) == TABLAS[tabla]['clave'] and params and len(params) == 1:
+                borradas.append((tabla, params[0]))
+            else:
+                reconciliar.add(tabla)
+
+        if not (tablas or borradas or reconciliar):
+            return
+        with self._pendientes_lock:
+            self._tablas_pendientes |= tablas
+            self._borradas_pendientes.extend(borradas)
+            self._reconciliar_pendientes |= reconciliar
+            self._sucias |= tablas | reconciliar | self._afectadas(borradas)
+        self._despertar.set()
+
+    @staticmethod
+    def _afectadas(borradas):
+        """Tablas que cambian al borrar esos registros (incluidas las cascadas)"""
+        afectadas = set()
+        for tabla, _ in borradas:
+            afectadas.add(tabla)
+            afectadas.update(dependiente for dependiente, _ in CASCADAS.get(tabla, []))
+        return afectadas
+
+    def _procesar_pendientes(self):
+        """
+        Aplica las escrituras encoladas (en el hilo de fondo); si algo falla
+        vuelven a la cola y sus tablas siguen leyéndose de MySQL
+
+        Returns:
+            tuple: (success, message/None)
+        """
+        with self._pendientes_lock:
+            tablas = self._tablas_pendientes
+            borradas = self._borradas_pendientes
+            reconciliar = self._reconciliar_pendientes
+            self._tablas_pendientes = set()
+            self._borradas_pendientes = []
+            self._reconciliar_pendientes = set()
+        if not (tablas or borradas or reconciliar):
+            return True, None
+
+        success, result = True, None
+        if borradas and not self.borrar_locales(borradas):
+            success, result = False, "No se pudieron borrar filas de la réplica local"
+        if success and tablas - reconciliar:
+            success, result = self.sincronizar(tablas=tablas - reconciliar)
+        if success and reconciliar:
+            success, result = self.sincronizar(tablas=reconciliar, detectar_eliminados=True)
+
+        with self._pendientes_lock:
+            if not success:
+                self._tablas_pendientes |= tablas
+                self._borradas_pendientes[:0] = borradas
+                self._reconciliar_pendientes |= reconciliar
+                return False, result
+            # Las tablas con escrituras encoladas mientras tanto siguen sucias
+            encoladas = (self._tablas_pendientes | self._reconciliar_pendientes
+                         | self._afectadas(self._borradas_pendientes))
+            self._sucias -= (tablas | reconciliar | self._afectadas(borradas)) - encoladas
+        return True, None
+
+    def borrar_locales(self, borradas):
+        """
+        Borra filas de la réplica (y las ventas que MySQL borra en cascada)
+
+        Args:
+            borradas: Lista de (tabla, id)
+
+        Returns:
+            bool: True si se borraron (los errores de SQLite se informan y no se propagan)
+        """
+        if self._conn is None:
+            return False
+        with self._lock:
+            try:
+                for tabla, id_registro in borradas:
+                    if tabla not in TABLAS:
+                        continue
+                    self._conn.execute(f"DELETE FROM {tabla} WHERE {TABLAS[tabla]['clave']} = ?", (id_registro,))
+                    for dependiente, columna in CASCADAS.get(tabla, []):
+                        self._conn.execute(f"DELETE FROM {dependiente} WHERE {columna} = ?", (id_registro,))
+                self._conn.commit()
+                return True
+            except sqlite3.Error as e:
+                try:
+                    self._conn.rollback()
+                except sqlite3.Error:
+                    pass
+                print(f"⚠️ Error al borrar filas de la réplica local: {e}")
+                return False
+
+    def iniciar(self):
+        """Inicia la sincronización periódica en segundo plano"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def detener(self):
+        """Detiene la sincronización periódica"""
+        self._stop.set()
+        self._despertar.set()
+
+    def _loop(self):
+        """
+        Ciclo de sincronización en segundo plano: copia las escrituras encoladas
+        apenas se despierta y todas las tablas cada intervalo segundos
+        """
+        proximo_ciclo = time.monotonic() + self.intervalo
+        while not self._stop.is_set():
+            self._despertar.wait(max(0.0, proximo_ciclo - time.monotonic()))
+            self._despertar.clear()
+            if self._stop.is_set():
+                break
+
+            error_anterior = self.ultimo_error
+            success, result = self._procesar_pendientes()
+            if success and time.monotonic() >= proximo_ciclo:
+                proximo_ciclo = time.monotonic() + self.intervalo
+                self._ciclos += 1
+                success, result = self.sincronizar(
+                    detectar_eliminados=self._ciclos % self.reconciliar_cada == 0
+                )
+            elif not success:
+                # Sin conexión: reintentar con el ciclo periódico, no en cada escritura
+                proximo_ciclo = max(proximo_ciclo, time.monotonic() + self.intervalo)
+
+            # Avisar solo al cambiar de estado para no repetir el mismo error sin conexión
+            if not success and self.ultimo_error != error_anterior:
+                print(f"⚠️ {result}")
+            elif success and error_anterior:
+                print("✅ Réplica local sincronizada de nuevo con el servidor")
+
+# Instancia global de la réplica (se abre solo si DB_REPLICA_LOCAL=1)
+replica_local = ReplicaLocal()
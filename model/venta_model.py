@@ -2,15 +2,66 @@
 Modelo de datos para la tabla de ventas
 Implementa todas las operaciones CRUD
 """
-from model.conexion import db
+from model.conexion import db, TransaccionCancelada
+from model.registros import Venta
 
 class VentaModel:
     """Clase para gestionar operaciones CRUD de ventas"""
     
+    # Columnas que muestra la tabla de ventas (fila de lista)
+    COLUMNAS_LISTA = """
+        v.id_venta, v.id_auto, v.id_cliente, v.fecha_venta, v.monto, v.metodo_pago,
+        a.marca as auto_marca, a.modelo as auto_modelo, a.anio as auto_anio,
+        c.nombre as cliente_nombre
+    """
+    
+    # Registro completo para el comprobante PDF (fila de detalle)
+    COLUMNAS_DETALLE = """
+        v.id_venta, v.id_auto, v.id_cliente, v.fecha_venta, v.monto, v.metodo_pago,
+        a.marca as auto_marca, a.modelo as auto_modelo, 
+        a.anio as auto_anio, a.color as auto_color, a.imagen as auto_imagen,
+        a.precio as auto_precio, a.transmision as auto_transmision,
+        a.combustible as auto_combustible,
+        c.nombre as cliente_nombre, c.telefono as cliente_telefono,
+        c.correo as cliente_correo, c.direccion as cliente_direccion
+    """
+    
+    # Consultas de los listados (también las verifica model/migraciones.py con EXPLAIN)
+    CONSULTA_LISTA = f"""
+        SELECT {COLUMNAS_LISTA}
+        FROM ventas v
+        INNER JOIN autos a ON v.id_auto = a.id_auto
+        INNER JOIN clientes c ON v.id_cliente = c.id_cliente
+        ORDER BY v.fecha_venta DESC
+    """
+    
+    CONSULTA_POR_CLIENTE = """
+        SELECT v.id_venta, v.id_auto, v.id_cliente, v.fecha_venta, v.monto, v.metodo_pago,
+               a.marca as auto_marca, a.modelo as auto_modelo, 
+               a.anio as auto_anio, a.color as auto_color
+        FROM ventas v
+        INNER JOIN autos a ON v.id_auto = a.id_auto
+        WHERE v.id_cliente = %s
+        ORDER BY v.fecha_venta DESC
+    """
+    
+    # Estado de inventario del auto (columna autos.estado, migración 005)
+    # Reservar solo cambia una fila disponible: si dos equipos venden el mismo auto
+    # a la vez, el segundo UPDATE espera el bloqueo de esa fila y no modifica nada
+    MARCAR_VENDIDO = "UPDATE autos SET estado = 'vendido' WHERE id_auto = %s AND estado = 'disponible'"
+    
+    # Vuelve a disponible el auto de una venta si no tiene otras ventas
+    LIBERAR_AUTO = """
+        UPDATE autos SET estado = 'disponible'
+        WHERE id_auto = %s
+          AND NOT EXISTS (SELECT 1 FROM ventas WHERE ventas.id_auto = %s AND ventas.id_venta <> %s)
+    """
+    
     @staticmethod
     def crear_venta(id_auto, id_cliente, monto, metodo_pago, fecha_venta=None):
         """
-        Crea un nuevo registro de venta
+        Crea un nuevo registro de venta y marca el auto como vendido en la misma
+        transacción (un auto ya vendido no se puede volver a vender)
         
         Returns:
             tuple: (success, id_venta/error_message)
@@ -28,28 +79,37 @@ class VentaModel:
             """
             params = (id_auto, id_cliente, monto, metodo_pago)
         
-        return db.execute_query(query, params)
+        def registrar(transaccion):
+            if transaccion.ejecutar(VentaModel.MARCAR_VENDIDO, (id_auto,)) != 1:
+                raise TransaccionCancelada("El auto seleccionado ya fue vendido")
+            transaccion.ejecutar(query, params)
+            return transaccion.lastrowid
+        
+        return db.en_transaccion(registrar)
     
     @staticmethod
-    def obtener_todas():
+    def obtener_todas(compacto=False):
         """
-        Obtiene todas las ventas con información de autos y clientes
+        Obtiene todas las ventas con los datos de auto y cliente que muestra la tabla
+        El registro completo se obtiene con obtener_por_id
+        
+        Args:
+            compacto: Retornar registros Venta en lugar de dicts (menos memoria por fila)
         
         Returns:
             tuple: (success, list_of_ventas/error_message)
         """
-        query = """
-            SELECT v.*, 
-                   a.marca as auto_marca, a.modelo as auto_modelo, 
-                   a.anio as auto_anio, a.color as auto_color, a.imagen as auto_imagen,
-                   c.nombre as cliente_nombre, c.telefono as cliente_telefono,
-                   c.correo as cliente_correo, c.direccion as cliente_direccion
-            FROM ventas v
-            INNER JOIN autos a ON v.id_auto = a.id_auto
-            INNER JOIN clientes c ON v.id_cliente = c.id_cliente
-            ORDER BY v.fecha_venta DESC
+        return db.fetch_all(VentaModel.CONSULTA_LISTA, record_cls=Venta if compacto else None)
+    
+    @staticmethod
+    def iterar_todas(row_format='dict', batch_size=500):
         """
-        return db.fetch_all(query)
+        Recorre todas las ventas sin cargarlas en memoria (exportaciones y reportes)
+        
+        Returns:
+            tuple: (success, generator_of_ventas/error_message)
+        """
+        return db.stream(VentaModel.CONSULTA_LISTA, batch_size=batch_size, row_format=row_format)
     
     @staticmethod
     def obtener_por_id(id_venta):
@@ -59,25 +119,41 @@ class VentaModel:
         Returns:
             tuple: (success, venta_data/error_message)
         """
-        query = """
-            SELECT v.*, 
-                   a.marca as auto_marca, a.modelo as auto_modelo, 
-                   a.anio as auto_anio, a.color as auto_color, a.imagen as auto_imagen,
-                   a.precio as auto_precio, a.transmision as auto_transmision,
-                   a.combustible as auto_combustible,
-                   c.nombre as cliente_nombre, c.telefono as cliente_telefono,
-                   c.correo as cliente_correo, c.direccion as cliente_direccion
+        query = f"""
+            SELECT {VentaModel.COLUMNAS_DETALLE}
             FROM ventas v
             INNER JOIN autos a ON v.id_auto = a.id_auto
             INNER JOIN clientes c ON v.id_cliente = c.id_cliente
             WHERE v.id_venta = %s
         """
-        return db.fetch_one(query, (id_venta,))
+        return db.fetch_preparada(query, (id_venta,), una=True)
+    
+    @staticmethod
+    def obtener_fila(id_venta):
+        """
+        Obtiene la fila de lista de una venta (para actualizar una sola fila de la tabla)
+        
+        Returns:
+            tuple: (success, Venta/None/error_message)
+        """
+        query = f"""
+            SELECT {VentaModel.COLUMNAS_LISTA}
+            FROM ventas v
+            INNER JOIN autos a ON v.id_auto = a.id_auto
+            INNER JOIN clientes c ON v.id_cliente = c.id_cliente
+            WHERE v.id_venta = %s
+        """
+        success, result = db.fetch_all(query, (id_venta,), Venta)
+        if not success:
+            return False, result
+        return True, result[0] if result else None
     
     @staticmethod
     def actualizar_venta(id_venta, id_auto, id_cliente, monto, metodo_pago, fecha_venta):
         """
         Actualiza los datos de una venta existente
+        Si cambia el auto, el nuevo se marca como vendido y el anterior vuelve a
+        estar disponible en la misma transacción
         
         Returns:
             tuple: (success, message)
@@ -87,19 +163,43 @@ class VentaModel:
             SET id_auto=%s, id_cliente=%s, monto=%s, metodo_pago=%s, fecha_venta=%s
             WHERE id_venta=%s
         """
+        # Normalizar antes de abrir la transacción (se compara con el id guardado)
+        try:
+            id_auto = int(id_auto)
+        except (TypeError, ValueError):
+            return False, "El auto seleccionado no es válido"
         params = (id_auto, id_cliente, monto, metodo_pago, fecha_venta, id_venta)
-        return db.execute_query(query, params)
+        
+        def actualizar(transaccion):
+            anterior = transaccion.consultar_uno("SELECT id_auto FROM ventas WHERE id_venta = %s", (id_venta,))
+            if anterior is None:
+                raise TransaccionCancelada("La venta ya no existe")
+            if anterior['id_auto'] != id_auto:
+                if transaccion.ejecutar(VentaModel.MARCAR_VENDIDO, (id_auto,)) != 1:
+                    raise TransaccionCancelada("El auto seleccionado ya fue vendido")
+                transaccion.ejecutar(VentaModel.LIBERAR_AUTO, (anterior['id_auto'], anterior['id_auto'], id_venta))
+            transaccion.ejecutar(query, params)
+            return transaccion.lastrowid
+        
+        return db.en_transaccion(actualizar)
     
     @staticmethod
     def eliminar_venta(id_venta):
         """
-        Elimina una venta por su ID
+        Elimina una venta por su ID y devuelve el auto al inventario disponible
+        en la misma transacción
         
         Returns:
             tuple: (success, message)
         """
-        query = "DELETE FROM ventas WHERE id_venta = %s"
-        return db.execute_query(query, (id_venta,))
+        def eliminar(transaccion):
+            venta = transaccion.consultar_uno("SELECT id_auto FROM ventas WHERE id_venta = %s", (id_venta,))
+            if venta is not None:
+                transaccion.ejecutar(VentaModel.LIBERAR_AUTO, (venta['id_auto'], venta['id_auto'], id_venta))
+            transaccion.ejecutar("DELETE FROM ventas WHERE id_venta = %s", (id_venta,))
+            return transaccion.lastrowid
+        
+        return db.en_transaccion(eliminar)
     
     @staticmethod
     def obtener_ventas_por_cliente(id_cliente):
@@ -109,16 +209,7 @@ class VentaModel:
         Returns:
             tuple: (success, list_of_ventas/error_message)
         """
-        query = """
-            SELECT v.*, 
-                   a.marca as auto_marca, a.modelo as auto_modelo, 
-                   a.anio as auto_anio, a.color as auto_color
-            FROM ventas v
-            INNER JOIN autos a ON v.id_auto = a.id_auto
-            WHERE v.id_cliente = %s
-            ORDER BY v.fecha_venta DESC
-        """
-        return db.fetch_all(query, (id_cliente,))
+        return db.fetch_all(VentaModel.CONSULTA_POR_CLIENTE, (id_cliente,))
     
     @staticmethod
     def obtener_estadisticas():
@@ -0,0 +1,98 @@
+"""
+Exportación de listados a CSV
+Escribe las filas a medida que llegan del cursor (ver DatabaseConnection.stream),
+de modo que la memoria usada no depende del tamaño de la tabla
+"""
+import csv
+from utils.paths import path_manager
+
+# Encabezados legibles por columna; las columnas sin entrada usan su nombre
+ENCABEZADOS = {
+    'id_auto': 'ID Auto',
+    'id_cliente': 'ID Cliente',
+    'id_venta': 'ID Venta',
+    'marca': 'Marca',
+    'modelo': 'Modelo',
+    'anio': 'Año',
+    'color': 'Color',
+    'transmision': 'Transmisión',
+    'combustible': 'Combustible',
+    'precio': 'Precio',
+    'imagen': 'Imagen',
+    'nombre': 'Nombre',
+    'telefono': 'Teléfono',
+    'correo': 'Correo',
+    'direccion': 'Dirección',
+    'fecha_venta': 'Fecha',
+    'monto': 'Monto',
+    'metodo_pago': 'Método de pago',
+    'auto_marca': 'Marca',
+    'auto_modelo': 'Modelo',
+    'auto_anio': 'Año',
+    'cliente_nombre': 'Cliente',
+}
+
+
+def _valores(fila, columnas):
+    """Extrae los valores de una fila en el orden de columnas (dict, tupla o namedtuple)"""
+    if isinstance(fila, dict):
+        return [fila.get(columna) for columna in columnas]
+    return list(fila)
+
+
+def exportar_csv(filas, columnas, output_filename):
+    """
+    Escribe un listado en un archivo CSV de la carpeta output
+
+    Args:
+        filas: Iterable de filas (dict, tupla o namedtuple), idealmente un generador de stream
+        columnas: Nombres de columna en el orden de las filas
+        output_filename: Nombre del archivo de salida
+
+    Returns:
+        tuple: (ruta_del_archivo, filas_escritas)
+    """
+    output_path = path_manager.get_output_path(output_filename)
+    escritas = 0
+
+    # utf-8-sig para que Excel en Windows reconozca los acentos
+    with open(output_path, "w", newline="", encoding="utf-8-sig") as archivo:
+        writer = csv.writer(archivo)
+        writer.writerow([ENCABEZADOS.get(columna, columna) for columna in columnas])
+        for fila in filas:
+            writer.writerow(["" if valor is None else valor for valor in _valores(fila, columnas)])
+            escritas += 1
+
+    return output_path, escritas
+
+
+def exportar_tabla(iterar, columnas, output_filename):
+    """
+    Exporta el resultado de un método iterar_* de los controladores
+
+    Args:
+        iterar: Función que retorna (success, generator/error_message), p. ej.
+            ClienteController.iterar_todos
+        columnas: Cadena de columnas del modelo (COLUMNAS_LISTA) o lista de nombres
+        output_filename: Nombre del archivo de salida
+
+    Returns:
+        tuple: (success, (ruta, filas_escritas)/error_message)
+    """
+    if isinstance(columnas, str):
+        columnas = [_alias(columna) for columna in columnas.split(",") if columna.strip()]
+
+    success, filas = iterar('tuple')
+    if not success:
+        return False, filas
+
+    try:
+        return True, exportar_csv(filas, columnas, output_filename)
+    except Exception as e:
+        return False, f"Error al exportar: {str(e)}"
+
+
+def _alias(columna):
+    """Nombre con el que una expresión de SELECT llega al cursor ('a.marca auto_marca' -> 'auto_marca')"""
+    columna = columna.strip().split()[-1]
+    return columna.split(".")[-1]
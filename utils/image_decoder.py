@@ -0,0 +1,178 @@
+"""
+Decodificación de imágenes locales a miniaturas
+Las fotos de teléfono (4000 px, varios MB) se decodifican a la escala de la
+miniatura: en los JPEG draft() hace que el decodificador entregue la imagen
+a 1/2, 1/4 u 1/8 del tamaño (sin decodificar la resolución completa) y en los
+demás formatos reduce() la achica por bloques antes del redimensionado final.
+Las decodificaciones se hacen en un hilo de fondo y las miniaturas quedan en
+una caché por ruta, fecha de modificación y tamaño pedido
+"""
+import os
+import queue
+import threading
+from collections import OrderedDict
+
+
+class ImageDecoder:
+    """
+    Decodificador con un hilo trabajador y caché LRU de miniaturas
+
+    Los callbacks de decode_async se ejecutan en el hilo trabajador; la UI debe
+    reenviarlos al hilo de Tk (app.dispatcher.post) antes de tocar widgets.
+    """
+
+    def __init__(self, max_entries=64):
+        """
+        Args:
+            max_entries (int): Miniaturas que se mantienen en memoria
+        """
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._queue = queue.SimpleQueue()
+        # Clave -> callbacks que esperan esa decodificación (se decodifica una sola vez)
+        self._waiting = {}
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+    @staticmethod
+    def decode(path, size):
+        """
+        Decodifica una imagen a la escala de size (sin caché, en el hilo que llama)
+
+        Args:
+            path (str): Ruta local de la imagen
+            size (tuple): Tamaño final (ancho, alto)
+
+        Returns:
+            PIL.Image: Imagen RGB/RGBA de exactamente size
+        """
+        from PIL import Image, ImageOps
+
+        with Image.open(path) as img:
+            # JPEG: decodificar directamente a la menor escala que no baje de size
+            img.draft("RGB", size)
+            # Fotos de teléfono: aplicar la rotación de la cámara (EXIF)
+            img = ImageOps.exif_transpose(img)
+
+            factor = min(img.width // size[0], img.height // size[1])
+            if factor >= 2:
+                # Promedio por bloques: mucho más barato que LANCZOS sobre la imagen grande
+                img = img.reduce(factor)
+
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+            return img.resize(size, Image.Resampling.LANCZOS)
+
+    def get(self, path, size):
+        """
+        Miniatura en caché (None si no se decodificó o el archivo cambió)
+
+        Returns:
+            PIL.Image: Copia de la miniatura o None
+        """
+        key = self._key(path, size)
+        if key is None:
+            return None
+        with self._lock:
+            img = self._cache.get(key)
+            if img is None:
+                return None
+            self._cache.move_to_end(key)
+            return img.copy()
+
+    def load(self, path, size):
+        """
+        Miniatura desde la caché o decodificada en el hilo que llama
+
+        Raises:
+            OSError: Si el archivo no existe o no es una imagen
+        """
+        img = self.get(path, size)
+        if img is not None:
+            return img
+        key = self._key(path, size)
+        img = self.decode(path, size)
+        if key is not None:
+            self._store(key, img)
+        return img.copy()
+
+    def decode_async(self, path, size, callback):
+        """
+        Decodifica en el hilo trabajador y llama a callback(imagen o excepción)
+
+        Si la miniatura está en caché, callback se llama de inmediato en el hilo
+        que llama (sin pasar por el trabajador)
+        """
+        img = self.get(path, size)
+        if img is not None:
+            callback(img)
+            return
+
+        key = self._key(path, size) or (str(path), None, None, tuple(size))
+        with self._lock:
+            callbacks = self._waiting.get(key)
+            if callbacks is not None:
+                # La misma imagen ya está en la cola
+                callbacks.append(callback)
+                return
+            self._waiting[key] = [callback]
+            self._start()
+        self._queue.put((key, path, tuple(size)))
+
+    def clear(self):
+        """Vacía la caché de miniaturas"""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _key(path, size):
+        """(ruta, mtime, tamaño del archivo, tamaño pedido) o None si el archivo no existe"""
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError, ValueError):
+            return None
+        return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, tuple(size))
+
+    def _store(self, key, img):
+        with self._lock:
+            self._cache[key] = img
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def _start(self):
+        """Inicia el hilo trabajador la primera vez (con self._lock tomado)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._worker, name="ImageDecoder", daemon=True)
+            self._thread.start()
+
+    def _worker(self):
+        while True:
+            key, path, size = self._queue.get()
+            try:
+                result = self.decode(path, size)
+                if key[1] is not None:
+                    self._store(key, result)
+            except Exception as e:
+                result = e
+
+            with self._lock:
+                callbacks = self._waiting.pop(key, [])
+            for callback in callbacks:
+                try:
+                    callback(result.copy() if not isinstance(result, Exception) else result)
+                except Exception as e:
+                    print(f"⚠️ Error en el callback de la imagen: {e}")
+
+
+# Instancia global de la aplicación
+image_decoder = ImageDecoder()
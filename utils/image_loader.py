@@ -1,26 +1,106 @@
 """
 Utilidad para cargar imágenes desde URLs (Cloudinary)
 Con optimizaciones de rendimiento: caché, URLs optimizadas y carga asíncrona
+
+La caché guarda las miniaturas codificadas (JPEG o WebP de 1-3 KB) y no como
+PIL.Image (unos 7,5 KB por miniatura de 50x50 más el objeto): entran varias
+veces más miniaturas por MB. Las vistas no decodifican los bytes en cada
+recarga: toman el PhotoImage vivo de utils/photo_pool.py
+
+En disco las miniaturas quedan en un solo archivo leído con mmap
+(utils/thumbnail_pack.py, en cache/images): al volver a abrir la aplicación
+se muestran sin descargarlas otra vez. El pack se abre con open_pack en un
+hilo de fondo al iniciar; hasta entonces get_encoded (hilo de Tk) no lo
+consulta y las descargas en segundo plano esperan a que termine de abrirse
 """
-from PIL import Image
-import requests
 from io import BytesIO
-from pathlib import Path
+from collections import OrderedDict
 import hashlib
-from threading import Thread
-from queue import Queue
+from threading import Lock
 
 class ImageLoader:
     """Clase para cargar y procesar imágenes con caché"""
     
-    # Caché en memoria para imágenes
-    _cache = {}
-    _cache_dir = Path("cache/images")
+    # Caché en memoria: clave -> miniatura codificada (bytes), en orden LRU
+    _cache = OrderedDict()
+    _cache_bytes = 0
+    _cache_lock = Lock()
+    
+    # Pack de miniaturas en disco (ver open_pack; False si no se pudo abrir)
+    _pack = None
+    _pack_lock = Lock()
+    
+    # Tamaño máximo de la caché en memoria (bytes codificados)
+    MAX_CACHE_BYTES = 8 * 1024 * 1024
+    
+    # Formatos que se guardan tal como llegan si ya tienen el tamaño pedido
+    FORMATOS_COMPACTOS = ("JPEG", "WEBP", "PNG")
+    
+    # Descargas simultáneas: una tabla con cientos de filas sin miniatura en
+    # caché no abre un hilo (ni una conexión HTTP) por fila
+    MAX_DESCARGAS = 4
+    _executor = None
     
     @staticmethod
-    def _init_cache():
-        """Inicializa el directorio de caché"""
-        ImageLoader._cache_dir.mkdir(parents=True, exist_ok=True)
+    def _submit(func):
+        """Encola func en el grupo de hilos de descarga (se crea al primer uso)"""
+        with ImageLoader._cache_lock:
+            if ImageLoader._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                
+                ImageLoader._executor = ThreadPoolExecutor(
+                    max_workers=ImageLoader.MAX_DESCARGAS,
+                    thread_name_prefix="miniaturas"
+                )
+            executor = ImageLoader._executor
+        executor.submit(func)
+    
+    @staticmethod
+    def cancel_downloads():
+        """Descarta las descargas en cola (al cerrar: Python espera a los hilos del grupo)"""
+        with ImageLoader._cache_lock:
+            executor = ImageLoader._executor
+            ImageLoader._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    @staticmethod
+    def open_pack():
+        """
+        Abre el pack de miniaturas de cache/images (puede compactarlo)
+        Se llama en un hilo de fondo al iniciar; no toma _cache_lock, así que
+        la caché en memoria sigue respondiendo mientras tanto
+        
+        Returns:
+            ThumbnailPack: El pack o None si no está disponible
+        """
+        with ImageLoader._pack_lock:
+            if ImageLoader._pack is None:
+                from utils.paths import path_manager
+                from utils.thumbnail_pack import ThumbnailPack
+                
+                pack = ThumbnailPack(path_manager.get_cache_path("images"))
+                try:
+                    pack.open()
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ Caché de miniaturas en disco no disponible: {e}")
+                    pack = False
+                ImageLoader._pack = pack
+            return ImageLoader._pack or None
+    
+    @staticmethod
+    def _get_pack(wait=False):
+        """
+        Pack de miniaturas o None si no está disponible
+        
+        Args:
+            wait (bool): Abrirlo (o esperar a que se abra) si aún no está abierto;
+                sin wait no se bloquea (hilo de Tk)
+        """
+        pack = ImageLoader._pack
+        if pack is None and wait:
+            return ImageLoader.open_pack()
+        return pack or None
     
     @staticmethod
     def _get_cache_key(url, size):
@@ -50,27 +130,76 @@ class ImageLoader:
         return url
     
     @staticmethod
-    def load_from_url_async(url, size, callback):
+    def _encode(img):
         """
-        Carga una imagen de forma asíncrona y ejecuta un callback cuando termina
+        Codifica una miniatura: JPEG si es opaca, WebP (o PNG si PIL no tiene
+        WebP) si tiene transparencia
+        """
+        from PIL import features
+        
+        buffer = BytesIO()
+        if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+            if features.check("webp"):
+                img.save(buffer, "WEBP", quality=85)
+            else:
+                img.save(buffer, "PNG", optimize=True)
+        else:
+            img.convert("RGB").save(buffer, "JPEG", quality=85, optimize=True)
+        return buffer.getvalue()
+    
+    @staticmethod
+    def decode(data):
+        """Decodifica una miniatura codificada (bytes) a PIL.Image"""
+        from PIL import Image
+        
+        img = Image.open(BytesIO(data))
+        img.load()
+        return img
+    
+    @staticmethod
+    def get_encoded(url, size, wait_pack=False):
+        """
+        Miniatura codificada desde la caché en memoria o el pack en disco (no descarga)
         
         Args:
-            url (str): URL de la imagen
-            size (tuple): Tamaño deseado (ancho, alto)
-            callback (function): Función a llamar con la imagen cargada
+            wait_pack (bool): Esperar a que se abra el pack (solo en hilos de fondo)
+        
+        Returns:
+            bytes: Miniatura codificada o None si no está en caché (o el pack
+            aún no se abrió y no se pidió esperar)
         """
-        def _load():
-            img = ImageLoader.load_from_url(url, size, use_cache=True)
-            if callback:
-                callback(img)
+        cache_key = ImageLoader._get_cache_key(url, size)
+        with ImageLoader._cache_lock:
+            data = ImageLoader._cache.get(cache_key)
+            if data is not None:
+                ImageLoader._cache.move_to_end(cache_key)
+                return data
         
-        thread = Thread(target=_load, daemon=True)
-        thread.start()
+        pack = ImageLoader._get_pack(wait_pack)
+        if pack is None:
+            return None
+        try:
+            return pack.get(cache_key)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Error al leer la caché de miniaturas: {e}")
+            return None
     
     @staticmethod
-    def load_from_url(url, size=(50, 50), use_cache=True):
+    def _store_encoded(cache_key, data):
+        with ImageLoader._cache_lock:
+            anterior = ImageLoader._cache.pop(cache_key, None)
+            if anterior is not None:
+                ImageLoader._cache_bytes -= len(anterior)
+            ImageLoader._cache[cache_key] = data
+            ImageLoader._cache_bytes += len(data)
+            while ImageLoader._cache_bytes > ImageLoader.MAX_CACHE_BYTES and len(ImageLoader._cache) > 1:
+                _, descartada = ImageLoader._cache.popitem(last=False)
+                ImageLoader._cache_bytes -= len(descartada)
+    
+    @staticmethod
+    def fetch_encoded(url, size=(50, 50), use_cache=True):
         """
-        Carga una imagen desde una URL con caché y optimización
+        Miniatura codificada desde la caché o descargada
         
         Args:
             url (str): URL de la imagen
@@ -78,16 +207,20 @@ class ImageLoader:
             use_cache (bool): Usar caché de memoria
             
         Returns:
-            PIL.Image: Imagen cargada y redimensionada o None si hay error
+            bytes: Miniatura codificada o None si hay error
         """
         if not url:
             return None
         
         # Verificar caché en memoria
         if use_cache:
-            cache_key = ImageLoader._get_cache_key(url, size)
-            if cache_key in ImageLoader._cache:
-                return ImageLoader._cache[cache_key].copy()
+            data = ImageLoader.get_encoded(url, size, wait_pack=True)
+            if data is not None:
+                return data
+        
+        # PIL y requests se importan al primer uso para no retrasar el arranque
+        import requests
+        from PIL import Image
         
         try:
             # Optimizar URL de Cloudinary para descargar imagen más pequeña
@@ -100,15 +233,25 @@ class ImageLoader:
             # Cargar imagen
             img = Image.open(BytesIO(response.content))
             
-            # Redimensionar solo si es necesario (Cloudinary ya lo hace)
-            if img.size != size:
-                img = img.resize(size, Image.Resampling.LANCZOS)
+            if img.size == tuple(size) and img.format in ImageLoader.FORMATOS_COMPACTOS:
+                # Cloudinary ya la entregó redimensionada y comprimida
+                img.load()
+                data = response.content
+            else:
+                data = ImageLoader._encode(img.resize(size, Image.Resampling.LANCZOS))
             
-            # Guardar en caché
+            # Guardar en caché (memoria y pack en disco)
             if use_cache:
-                ImageLoader._cache[cache_key] = img.copy()
+                cache_key = ImageLoader._get_cache_key(url, size)
+                ImageLoader._store_encoded(cache_key, data)
+                pack = ImageLoader._get_pack(wait=True)
+                if pack is not None:
+                    try:
+                        pack.put(cache_key, data)
+                    except OSError as e:
+                        print(f"⚠️ No se pudo guardar la miniatura en disco: {e}")
             
-            return img
+            return data
             
         except requests.exceptions.Timeout:
             return None
@@ -117,10 +260,65 @@ class ImageLoader:
         except Exception:
             return None
     
+    @staticmethod
+    def fetch_encoded_async(url, size, callback):
+        """
+        Descarga la miniatura en segundo plano y llama a callback(bytes o None)
+        desde el hilo de fondo (reenviarlo al hilo de Tk antes de tocar widgets)
+        """
+        def _load():
+            data = ImageLoader.fetch_encoded(url, size, use_cache=True)
+            if callback:
+                callback(data)
+        
+        ImageLoader._submit(_load)
+    
+    @staticmethod
+    def load_from_url_async(url, size, callback):
+        """
+        Carga una imagen de forma asíncrona y ejecuta un callback cuando termina
+        
+        Args:
+            url (str): URL de la imagen
+            size (tuple): Tamaño deseado (ancho, alto)
+            callback (function): Función a llamar con la imagen cargada
+        """
+        def _load():
+            img = ImageLoader.load_from_url(url, size, use_cache=True)
+            if callback:
+                callback(img)
+        
+        ImageLoader._submit(_load)
+    
+    @staticmethod
+    def load_from_url(url, size=(50, 50), use_cache=True):
+        """
+        Carga una imagen desde una URL con caché y optimización
+        
+        Args:
+            url (str): URL de la imagen
+            size (tuple): Tamaño deseado (ancho, alto)
+            use_cache (bool): Usar caché de memoria
+            
+        Returns:
+            PIL.Image: Imagen cargada y redimensionada o None si hay error
+        """
+        data = ImageLoader.fetch_encoded(url, size, use_cache)
+        if data is None:
+            return None
+        
+        try:
+            return ImageLoader.decode(data)
+        except Exception:
+            return None
+    
     @staticmethod
     def load_from_path(path, size=(50, 50)):
         """
         Carga una imagen desde una ruta local
+        Decodifica a la escala pedida y guarda la miniatura en caché
+        (ver utils/image_decoder.py; para no bloquear la UI usar
+        image_decoder.decode_async)
         
         Args:
             path (str): Ruta local de la imagen
@@ -132,10 +330,10 @@ class ImageLoader:
         if not path:
             return None
         
+        from utils.image_decoder import image_decoder
+        
         try:
-            img = Image.open(path)
-            img = img.resize(size, Image.Resampling.LANCZOS)
-            return img
+            return image_decoder.load(path, size)
         except Exception as e:
             print(f"Error al cargar imagen desde ruta: {e}")
             return None
@@ -16,6 +16,7 @@ class PathManager:
         self.images_dir = self.root_dir / "view" / "img"
         self.output_dir = self.root_dir / "output"
         self.database_dir = self.root_dir / "database"
+        self.cache_dir = self.root_dir / "cache"
         
         # Crear directorios si no existen
         self._create_directories()
@@ -25,6 +26,7 @@ class PathManager:
         self.images_dir.mkdir(parents=True, exist_ok=True)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.database_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
     
     def get_image_path(self, filename):
         """Retorna la ruta completa para una imagen"""
@@ -36,6 +38,10 @@ class PathManager:
         """Retorna la ruta completa para un archivo de salida (PDF)"""
         return str(self.output_dir / filename)
     
+    def get_cache_path(self, filename):
+        """Retorna la ruta completa para un archivo de caché local"""
+        return str(self.cache_dir / filename)
+    
     def get_relative_image_path(self, absolute_path):
         """Convierte una ruta absoluta a relativa para guardar en BD"""
         if not absolute_path:
@@ -0,0 +1,95 @@
+"""
+PhotoImage vivos de las miniaturas en pantalla
+La caché de ImageLoader guarda las miniaturas codificadas (bytes); para
+mostrarlas Tk necesita un PhotoImage. Antes cada fila creaba el suyo en cada
+load_autos (decodificar y copiar a Tk en el hilo principal). El pool comparte
+un PhotoImage por miniatura entre las filas que la muestran y, cuando ninguna
+la usa, lo conserva un tiempo (LRU acotado): recargar la tabla vuelve a usar
+los mismos PhotoImage sin crear ninguno
+
+Solo se usa desde el hilo de Tk
+"""
+import tkinter
+from collections import OrderedDict
+
+from utils.image_loader import ImageLoader
+
+
+class PhotoPool:
+    """PhotoImage compartidos por clave (url, tamaño) con cuenta de usos"""
+
+    def __init__(self, max_idle=256):
+        """
+        Args:
+            max_idle (int): PhotoImage sin filas que los usen que se conservan
+        """
+        self.max_idle = max_idle
+        self._photos = {}
+        self._uses = {}
+        # Claves sin filas que las usen, en orden LRU
+        self._idle = OrderedDict()
+
+    def acquire(self, url, size):
+        """
+        PhotoImage de la miniatura para una fila (cuenta un uso)
+
+        Returns:
+            ImageTk.PhotoImage: None si la miniatura no está en la caché de
+            ImageLoader (la fila la pide con fetch_encoded_async)
+        """
+        key = (url, tuple(size))
+        photo = self._photos.get(key)
+        if photo is None:
+            data = ImageLoader.get_encoded(url, key[1])
+            if data is None:
+                return None
+            photo = self._create(data)
+            if photo is None:
+                return None
+            self._photos[key] = photo
+        self._idle.pop(key, None)
+        self._uses[key] = self._uses.get(key, 0) + 1
+        return photo
+
+    def release(self, url, size):
+        """Descuenta un uso; sin usos el PhotoImage pasa a la lista de reutilizables"""
+        key = (url, tuple(size))
+        usos = self._uses.get(key, 0) - 1
+        if usos > 0:
+            self._uses[key] = usos
+            return
+        self._uses.pop(key, None)
+        if key not in self._photos:
+            return
+        self._idle[key] = True
+        while len(self._idle) > self.max_idle:
+            descartada, _ = self._idle.popitem(last=False)
+            self._photos.pop(descartada, None)
+
+    def release_on_destroy(self, widget, url, size):
+        """Descuenta el uso de acquire() cuando se destruye el widget que muestra la imagen"""
+        # Misc.bind sobre el widget mismo: los de customtkinter reenvían bind a sus partes internas
+        tkinter.Misc.bind(widget, "<Destroy>", lambda e: self.release(url, size), "+")
+
+    def clear(self):
+        """Descarta todos los PhotoImage (p. ej. al cerrar la ventana principal)"""
+        self._photos.clear()
+        self._uses.clear()
+        self._idle.clear()
+
+    def __len__(self):
+        return len(self._photos)
+
+    @staticmethod
+    def _create(data):
+        from PIL import ImageTk
+
+        try:
+            return ImageTk.PhotoImage(ImageLoader.decode(data))
+        except Exception as e:
+            print(f"⚠️ No se pudo decodificar la miniatura: {e}")
+            return None
+
+
+# Instancia global de la aplicación
+photo_pool = PhotoPool()
@@ -7,6 +7,8 @@ import subprocess
 import os
 import tempfile
 from pathlib import Path
+from utils.print_spooler import print_spooler
+from utils.printer_registry import PrinterRegistry
 
 # Intentar importar win32 solo en Windows
 try:
@@ -27,7 +29,28 @@ class PrintManager:
     @staticmethod
     def get_available_printers():
         """
-        Obtiene la lista de impresoras disponibles en el sistema
+        Obtiene la lista de impresoras disponibles desde la caché
+        No ejecuta procesos externos: la consulta real se hace en segundo plano
+        
+        Returns:
+            list: Lista de nombres de impresoras (vacía si aún no se consultaron)
+        """
+        return printer_registry.get_printers()
+    
+    @staticmethod
+    def get_default_printer():
+        """
+        Obtiene el nombre de la impresora predeterminada desde la caché
+        
+        Returns:
+            str: Nombre de la impresora predeterminada
+        """
+        return printer_registry.get_default()
+    
+    @staticmethod
+    def _discover_printers():
+        """
+        Consulta al sistema operativo la lista de impresoras (lpstat / EnumPrinters)
         
         Returns:
             list: Lista de nombres de impresoras
@@ -48,7 +71,7 @@ class PrintManager:
             
             elif system == 'Darwin':  # macOS
                 # Obtener impresoras en macOS
-                result = subprocess.run(['lpstat', '-p'], capture_output=True, text=True)
+                result = subprocess.run(['lpstat', '-p'], capture_output=True, text=True, timeout=10)
                 printers = []
                 for line in result.stdout.split('\n'):
                     if line.startswith('printer'):
@@ -58,7 +81,7 @@ class PrintManager:
             
             else:  # Linux
                 # Obtener impresoras en Linux
-                result = subprocess.run(['lpstat', '-p'], capture_output=True, text=True)
+                result = subprocess.run(['lpstat', '-p'], capture_output=True, text=True, timeout=10)
                 printers = []
                 for line in result.stdout.split('\n'):
                     if line.startswith('printer'):
@@ -71,9 +94,9 @@ class PrintManager:
             return []
     
     @staticmethod
-    def get_default_printer():
+    def _discover_default_printer():
         """
-        Obtiene el nombre de la impresora predeterminada
+        Consulta al sistema operativo la impresora predeterminada
         
         Returns:
             str: Nombre de la impresora predeterminada
@@ -87,10 +110,10 @@ class PrintManager:
                 else:
                     return None
             elif system == 'Darwin':  # macOS
-                result = subprocess.run(['lpstat', '-d'], capture_output=True, text=True)
+                result = subprocess.run(['lpstat', '-d'], capture_output=True, text=True, timeout=10)
                 return result.stdout.split(':')[-1].strip()
             else:  # Linux
-                result = subprocess.run(['lpstat', '-d'], capture_output=True, text=True)
+                result = subprocess.run(['lpstat', '-d'], capture_output=True, text=True, timeout=10)
                 return result.stdout.split(':')[-1].strip()
                 
         except Exception as e:
@@ -130,19 +153,19 @@ class PrintManager:
                     return False
                 
             elif system == 'Darwin':  # macOS
-                # macOS: Abrir con Preview
-                subprocess.run(['open', '-a', 'Preview', str(pdf_path)])
+                # macOS: Abrir con Preview (sin esperar a que se cierre)
+                subprocess.Popen(['open', '-a', 'Preview', str(pdf_path)])
                 return True
                 
             else:  # Linux
-                # Linux: Abrir con visor PDF
+                # Linux: Abrir con visor PDF sin esperar a que el visor termine
                 try:
-                    subprocess.run(['evince', str(pdf_path)])
+                    subprocess.Popen(['evince', str(pdf_path)])
                 except FileNotFoundError:
                     try:
-                        subprocess.run(['okular', str(pdf_path)])
+                        subprocess.Popen(['okular', str(pdf_path)])
                     except FileNotFoundError:
-                        subprocess.run(['xdg-open', str(pdf_path)])
+                        subprocess.Popen(['xdg-open', str(pdf_path)])
                 return True
                 
         except Exception as e:
@@ -153,6 +176,7 @@ class PrintManager:
     def print_to_printer(pdf_path, printer_name=None, copies=1):
         """
         Envía un PDF directamente a una impresora sin mostrar el diálogo
+        En macOS y Linux el trabajo pasa por la cola de impresión y no bloquea
         
         Args:
             pdf_path (str): Ruta del archivo PDF
@@ -160,7 +184,8 @@ class PrintManager:
             copies (int): Número de copias
             
         Returns:
-            bool: True si se envió correctamente
+            bool: True si se envió (en macOS y Linux: si se encoló; los errores
+            de lpr se avisan por print_spooler.add_listener, ver MainApplication)
         """
         try:
             pdf_path = Path(pdf_path)
@@ -175,7 +200,8 @@ class PrintManager:
                     return False
                 
                 if printer_name is None:
-                    printer_name = PrintManager.get_default_printer()
+                    printer_name = (PrintManager.get_default_printer()
+                                    or PrintManager._discover_default_printer())
                 
                 # Usar win32api para imprimir
                 win32api.ShellExecute(
@@ -188,32 +214,40 @@ class PrintManager:
                 )
                 return True
                 
-            elif system == 'Darwin':  # macOS
-                cmd = ['lpr']
-                if printer_name:
-                    cmd.extend(['-P', printer_name])
-                if copies > 1:
-                    cmd.extend(['-#', str(copies)])
-                cmd.append(str(pdf_path))
-                
-                subprocess.run(cmd)
-                return True
-                
-            else:  # Linux
-                cmd = ['lpr']
-                if printer_name:
-                    cmd.extend(['-P', printer_name])
-                if copies > 1:
-                    cmd.extend(['-#', str(copies)])
-                cmd.append(str(pdf_path))
-                
-                subprocess.run(cmd)
+            else:  # macOS y Linux
+                # Se encola en el spooler; lpr se ejecuta en segundo plano
+                print_spooler.submit(pdf_path, printer_name, copies)
                 return True
                 
         except Exception as e:
             print(f"Error al imprimir directamente: {e}")
             return False
     
+    @staticmethod
+    def print_batch(pdf_paths, printer_name=None, copies=1):
+        """
+        Envía varios PDFs (por ejemplo, un lote de comprobantes) a la impresora
+        En macOS y Linux se imprimen con una sola llamada a lpr
+        
+        Args:
+            pdf_paths (list): Rutas de los archivos PDF
+            printer_name (str): Nombre de la impresora (None = predeterminada)
+            copies (int): Número de copias
+            
+        Returns:
+            list: Trabajos encolados (PrintJob); vacía en Windows
+        """
+        paths = [str(Path(p)) for p in pdf_paths if Path(p).exists()]
+        if not paths:
+            return []
+        
+        if platform.system() == 'Windows':
+            for path in paths:
+                PrintManager.print_to_printer(path, printer_name, copies)
+            return []
+        
+        return print_spooler.submit_batch(paths, printer_name, copies)
+    
     @staticmethod
     def show_print_preview_dialog(pdf_path):
         """
@@ -229,5 +263,11 @@ class PrintManager:
         return PrintManager.print_pdf_with_dialog(pdf_path)
 
 
+# Caché de impresoras (lpstat / EnumPrinters se ejecutan en segundo plano)
+printer_registry = PrinterRegistry(
+    PrintManager._discover_printers,
+    PrintManager._discover_default_printer
+)
+
 # Instancia global
 print_manager = PrintManager()
@@ -0,0 +1,386 @@
+"""
+Cola de impresión (spooler) de la aplicación
+Procesa los trabajos de impresión en un hilo de fondo para no bloquear la UI.
+La cola se guarda en disco, soporta reintentos y cancelación, y agrupa
+varios comprobantes dirigidos a la misma impresora en una sola llamada a lpr
+"""
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from utils.paths import path_manager
+
+
+class PrintJob:
+    """Trabajo de impresión dentro de la cola"""
+
+    PENDIENTE = "pendiente"
+    IMPRIMIENDO = "imprimiendo"
+    COMPLETADO = "completado"
+    ERROR = "error"
+    CANCELADO = "cancelado"
+
+    FINALIZADOS = (COMPLETADO, ERROR, CANCELADO)
+
+    def __init__(self, pdf_path, printer_name=None, copies=1, job_id=None,
+                 status=PENDIENTE, attempts=0, error=None, created_at=None,
+                 next_attempt_at=0.0):
+        self.job_id = job_id or uuid.uuid4().hex[:12]
+        self.pdf_path = str(pdf_path)
+        self.printer_name = printer_name
+        self.copies = max(1, int(copies))
+        self.status = status
+        self.attempts = attempts
+        self.error = error
+        self.created_at = created_at or time.time()
+        self.next_attempt_at = next_attempt_at
+
+    @property
+    def batch_key(self):
+        """Los trabajos con la misma clave se pueden enviar en un solo lpr"""
+        return (self.printer_name, self.copies)
+
+    @property
+    def finished(self):
+        """Indica si el trabajo ya no será procesado"""
+        return self.status in PrintJob.FINALIZADOS
+
+    def to_dict(self):
+        """Convierte el trabajo a diccionario para guardarlo en disco"""
+        return {
+            'job_id': self.job_id,
+            'pdf_path': self.pdf_path,
+            'printer_name': self.printer_name,
+            'copies': self.copies,
+            'status': self.status,
+            'attempts': self.attempts,
+            'error': self.error,
+            'created_at': self.created_at,
+        }
+
+    @staticmethod
+    def from_dict(data):
+        """Reconstruye un trabajo desde el diccionario guardado"""
+        return PrintJob(
+            data['pdf_path'],
+            printer_name=data.get('printer_name'),
+            copies=data.get('copies', 1),
+            job_id=data.get('job_id'),
+            status=data.get('status', PrintJob.PENDIENTE),
+            attempts=data.get('attempts', 0),
+            error=data.get('error'),
+            created_at=data.get('created_at'),
+        )
+
+    def __repr__(self):
+        return f"PrintJob({self.job_id}, {Path(self.pdf_path).name}, {self.status})"
+
+
+class PrintSpooler:
+    """
+    Cola de impresión persistente con un hilo trabajador
+
+    Los callbacks registrados con add_listener se ejecutan en el hilo
+    trabajador; la UI debe reenviarlos al hilo de Tk antes de tocar widgets.
+    """
+
+    def __init__(self, queue_file=None, lpr_command="lpr", max_attempts=3,
+                 retry_delay=2.0, batch_window=0.25, max_batch=20, keep_finished=50):
+        self.queue_file = Path(queue_file or path_manager.get_cache_path("print_queue.json"))
+        self.lpr_command = lpr_command
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.keep_finished = keep_finished
+
+        self._jobs = {}
+        self._order = []
+        self._listeners = []
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+        self._load()
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+    def start(self):
+        """Inicia el hilo trabajador si no está en ejecución"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._worker, name="PrintSpooler", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=2.0):
+        """Detiene el hilo trabajador; los trabajos pendientes quedan en disco"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, pdf_path, printer_name=None, copies=1):
+        """
+        Agrega un PDF a la cola de impresión
+
+        Returns:
+            PrintJob: Trabajo encolado
+        """
+        return self.submit_batch([pdf_path], printer_name, copies)[0]
+
+    def submit_batch(self, pdf_paths, printer_name=None, copies=1):
+        """
+        Agrega varios PDFs a la vez; se imprimen con una sola llamada a lpr
+
+        Returns:
+            list: Trabajos encolados
+        """
+        jobs = [PrintJob(path, printer_name, copies) for path in pdf_paths]
+        with self._condition:
+            for job in jobs:
+                self._jobs[job.job_id] = job
+                self._order.append(job.job_id)
+            self._persist()
+            self._condition.notify_all()
+
+        for job in jobs:
+            self._notify(job)
+        self.start()
+        return jobs
+
+    def cancel(self, job_id):
+        """
+        Cancela un trabajo que aún no se ha enviado a la impresora
+
+        Returns:
+            bool: True si se canceló
+        """
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if not job or job.status != PrintJob.PENDIENTE:
+                return False
+            job.status = PrintJob.CANCELADO
+            self._persist()
+        self._notify(job)
+        return True
+
+    def get_job(self, job_id):
+        """Obtiene un trabajo por su ID"""
+        with self._condition:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self, include_finished=True):
+        """Lista los trabajos en orden de llegada"""
+        with self._condition:
+            jobs = [self._jobs[job_id] for job_id in self._order]
+        if include_finished:
+            return jobs
+        return [job for job in jobs if not job.finished]
+
+    def wait(self, job_id, timeout=None):
+        """
+        Espera a que un trabajo termine (útil en scripts, nunca desde la UI)
+
+        Returns:
+            bool: True si el trabajo terminó antes del timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                job = self._jobs.get(job_id)
+                if job is None or job.finished:
+                    return True
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+
+    def add_listener(self, callback):
+        """Registra una función que recibe cada PrintJob cuando cambia de estado"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Elimina una función registrada con add_listener"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    # ------------------------------------------------------------------
+    # Hilo trabajador
+    # ------------------------------------------------------------------
+    def _worker(self):
+        """Bucle principal: toma lotes de trabajos listos y los imprime"""
+        while True:
+            with self._condition:
+                batch = self._next_batch()
+                while self._running and not batch:
+                    self._condition.wait(self._seconds_until_retry())
+                    batch = self._next_batch()
+                if not self._running:
+                    return
+
+            # Pequeña ventana para agrupar comprobantes que llegan seguidos
+            if self.batch_window and len(batch) < self.max_batch:
+                time.sleep(self.batch_window)
+                with self._condition:
+                    batch = self._next_batch()
+                    if not batch:
+                        continue
+
+            with self._condition:
+                for job in batch:
+                    job.status = PrintJob.IMPRIMIENDO
+                    job.attempts += 1
+                self._persist()
+            for job in batch:
+                self._notify(job)
+
+            success, error = self._send(batch)
+
+            with self._condition:
+                for job in batch:
+                    if success:
+                        job.status = PrintJob.COMPLETADO
+                        job.error = None
+                    elif job.attempts < self.max_attempts:
+                        job.status = PrintJob.PENDIENTE
+                        job.error = error
+                        job.next_attempt_at = time.monotonic() + self.retry_delay * job.attempts
+                    else:
+                        job.status = PrintJob.ERROR
+                        job.error = error
+                self._prune()
+                self._persist()
+                self._condition.notify_all()
+            for job in batch:
+                self._notify(job)
+
+    def _next_batch(self):
+        """Selecciona el siguiente lote de trabajos listos con la misma clave"""
+        now = time.monotonic()
+        batch = []
+        for job_id in self._order:
+            job = self._jobs[job_id]
+            if job.status != PrintJob.PENDIENTE or job.next_attempt_at > now:
+                continue
+            if batch and job.batch_key != batch[0].batch_key:
+                continue
+            batch.append(job)
+            if len(batch) >= self.max_batch:
+                break
+        return batch
+
+    def _seconds_until_retry(self):
+        """Tiempo hasta el próximo reintento programado (None = sin reintentos)"""
+        now = time.monotonic()
+        waits = [
+            job.next_attempt_at - now
+            for job in self._jobs.values()
+            if job.status == PrintJob.PENDIENTE and job.next_attempt_at > now
+        ]
+        return max(0.01, min(waits)) if waits else None
+
+    def build_command(self, jobs):
+        """
+        Construye la línea de comandos de lpr para un lote
+
+        Returns:
+            list: Comando o None si lpr no está disponible
+        """
+        lpr = shutil.which(self.lpr_command)
+        if lpr is None:
+            return None
+
+        first = jobs[0]
+        cmd = [lpr]
+        if first.printer_name:
+            cmd.extend(['-P', first.printer_name])
+        if first.copies > 1:
+            cmd.extend(['-#', str(first.copies)])
+        cmd.extend(job.pdf_path for job in jobs)
+        return cmd
+
+    def _send(self, jobs):
+        """
+        Envía un lote a lpr
+
+        Returns:
+            tuple: (success, error_message)
+        """
+        missing = [job.pdf_path for job in jobs if not os.path.exists(job.pdf_path)]
+        if missing:
+            return False, f"El archivo no existe: {missing[0]}"
+
+        cmd = self.build_command(jobs)
+        if cmd is None:
+            return False, f"No se encontró el comando '{self.lpr_command}'"
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            return False, f"Error al ejecutar lpr: {e}"
+
+        if result.returncode != 0:
+            return False, (result.stderr or result.stdout).strip() or f"lpr terminó con código {result.returncode}"
+        return True, None
+
+    # ------------------------------------------------------------------
+    # Persistencia
+    # ------------------------------------------------------------------
+    def _load(self):
+        """Carga la cola guardada; los trabajos interrumpidos vuelven a pendiente"""
+        try:
+            with open(self.queue_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        for item in data.get('jobs', []):
+            try:
+                job = PrintJob.from_dict(item)
+            except (KeyError, TypeError, ValueError):
+                continue
+            if job.status == PrintJob.IMPRIMIENDO:
+                job.status = PrintJob.PENDIENTE
+            self._jobs[job.job_id] = job
+            self._order.append(job.job_id)
+
+    def _persist(self):
+        """Guarda la cola en disco de forma atómica (llamar con el lock tomado)"""
+        data = {'jobs': [self._jobs[job_id].to_dict() for job_id in self._order]}
+        try:
+            self.queue_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.queue_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.queue_file)
+        except OSError as e:
+            print(f"Error al guardar la cola de impresión: {e}")
+
+    def _prune(self):
+        """Conserva solo los últimos trabajos finalizados"""
+        finished = [job_id for job_id in self._order if self._jobs[job_id].finished]
+        for job_id in finished[:-self.keep_finished or None]:
+            del self._jobs[job_id]
+            self._order.remove(job_id)
+
+    def _notify(self, job):
+        """Avisa a los listeners del cambio de estado de un trabajo"""
+        for callback in list(self._listeners):
+            try:
+                callback(job)
+            except Exception as e:
+                print(f"Error en listener de impresión: {e}")
+
+
+# Instancia global de la cola de impresión
+print_spooler = PrintSpooler()
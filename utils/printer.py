@@ -22,12 +22,52 @@ except ImportError:
     PRINT_MANAGER_AVAILABLE = False
     print("⚠️ Módulo de impresión avanzada no disponible")
 
+class _HistoriaPorTramos(list):
+    """
+    Story de doc.build que se completa a medida que se consume
+    
+    BaseDocTemplate.build saca los flowables del principio de la lista con del;
+    cuando quedan pocos se agrega el siguiente tramo del generador y, al
+    agotarse, los flowables de cierre (la función se llama recién entonces)
+    """
+    
+    def __init__(self, inicio, tramos, cierre):
+        super().__init__(inicio)
+        self._tramos = tramos
+        self._cierre = cierre
+        self._rellenar()
+    
+    def __delitem__(self, indice):
+        super().__delitem__(indice)
+        self._rellenar()
+    
+    def pop(self, *args):
+        flowable = super().pop(*args)
+        self._rellenar()
+        return flowable
+    
+    def _rellenar(self):
+        while self._tramos is not None and len(self) < 2:
+            tramo = next(self._tramos, None)
+            if tramo is None:
+                self._tramos = None
+                self.extend(self._cierre())
+            else:
+                self.append(tramo)
+
 class PDFGenerator:
     """Generador de documentos PDF para la aplicación"""
     
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._create_custom_styles()
+        self._styles = None
+    
+    @property
+    def styles(self):
+        """Hoja de estilos, construida en el primer PDF generado y no al importar"""
+        if self._styles is None:
+            self._styles = getSampleStyleSheet()
+            self._create_custom_styles()
+        return self._styles
     
     def _create_custom_styles(self):
         """Crea estilos personalizados para el PDF"""
@@ -132,13 +172,21 @@ class PDFGenerator:
         doc.build(story)
         return output_path
     
+    # Filas por tabla del reporte de clientes (ver generate_cliente_report)
+    FILAS_POR_TABLA = 500
+    
     def generate_cliente_report(self, output_filename, clientes_data=None):
         """
         Genera un reporte PDF con la lista de clientes
         
+        Los clientes se arman en tablas de FILAS_POR_TABLA filas que doc.build
+        pide a medida que las dibuja (ver _HistoriaPorTramos): con un generador
+        (p. ej. ClienteController.iterar_todos) en memoria solo hay una tabla a
+        la vez, y el total de clientes va al final del listado
+        
         Args:
             output_filename: Nombre del archivo de salida
-            clientes_data: Lista de clientes (opcional, si no se provee se obtiene del controlador)
+            clientes_data: Lista o generador de clientes (opcional, si no se provee el reporte queda vacío)
         """
         output_path = path_manager.get_output_path(output_filename)
         doc = SimpleDocTemplate(output_path, pagesize=letter)
@@ -153,71 +201,77 @@ class PDFGenerator:
         story.append(subtitle)
         story.append(Spacer(1, 0.3*inch))
         
-        # Usar clientes proporcionados o lista vacía
         clientes = clientes_data if clientes_data is not None else []
+        contador = {'total': 0}
         
-        if not clientes:
-            no_data = Paragraph("No hay clientes registrados", self.styles['Normal'])
-            story.append(no_data)
-        else:
-            # Información de clientes en tabla
-            heading = Paragraph(f"Total de clientes: {len(clientes)}", self.styles['CustomHeading'])
-            story.append(heading)
-            
-            # Encabezados de tabla
-            data = [['ID', 'Nombre', 'Teléfono', 'Correo', 'Dirección']]
-            
-            # Agregar datos de clientes
+        def tramos():
+            filas = []
             for cliente in clientes:
-                data.append([
+                filas.append([
                     str(cliente.get('id_cliente', '')),
                     f"{cliente.get('nombre', '')} {cliente.get('apellido', '')}",
                     cliente.get('telefono', 'N/A'),
                     cliente.get('correo', 'N/A'),
                     cliente.get('direccion', 'N/A')
                 ])
+                contador['total'] += 1
+                if len(filas) == self.FILAS_POR_TABLA:
+                    yield self._tabla_clientes(filas)
+                    filas = []
+            if filas:
+                yield self._tabla_clientes(filas)
+        
+        def cierre():
+            if not contador['total']:
+                final = [Paragraph("No hay clientes registrados", self.styles['Normal'])]
+            else:
+                final = [
+                    Spacer(1, 0.2*inch),
+                    Paragraph(f"Total de clientes: {contador['total']}", self.styles['CustomHeading'])
+                ]
             
-            # Crear tabla
-            table = Table(data, colWidths=[0.5*inch, 1.8*inch, 1.3*inch, 1.8*inch, 1.8*inch])
-            table.setStyle(TableStyle([
-                # Encabezado
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3B82F6')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('TOPPADDING', (0, 0), (-1, 0), 12),
-                
-                # Datos
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#1F2937')),
-                ('ALIGN', (0, 1), (0, -1), 'CENTER'),  # ID centrado
-                ('ALIGN', (1, 1), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-                ('TOPPADDING', (0, 1), (-1, -1), 8),
-                
-                # Bordes y rayas
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F9FAFB')])
-            ]))
+            final.append(Spacer(1, 0.5*inch))
             
-            story.append(table)
-        
-        story.append(Spacer(1, 0.5*inch))
-        
-        # Fecha de generación
-        fecha = Paragraph(
-            f"<i>Documento generado el {datetime.now().strftime('%d/%m/%Y a las %H:%M')}</i>",
-            self.styles['Normal']
-        )
-        story.append(fecha)
-        
-        doc.build(story)
+            # Fecha de generación
+            final.append(Paragraph(
+                f"<i>Documento generado el {datetime.now().strftime('%d/%m/%Y a las %H:%M')}</i>",
+                self.styles['Normal']
+            ))
+            return final
+        
+        doc.build(_HistoriaPorTramos(story, tramos(), cierre))
         return output_path
     
+    def _tabla_clientes(self, filas):
+        """Tabla de clientes con su encabezado (se repite si la tabla pasa de página)"""
+        data = [['ID', 'Nombre', 'Teléfono', 'Correo', 'Dirección']] + filas
+        table = Table(data, colWidths=[0.5*inch, 1.8*inch, 1.3*inch, 1.8*inch, 1.8*inch], repeatRows=1)
+        table.setStyle(TableStyle([
+            # Encabezado
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3B82F6')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('TOPPADDING', (0, 0), (-1, 0), 12),
+            
+            # Datos
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#1F2937')),
+            ('ALIGN', (0, 1), (0, -1), 'CENTER'),  # ID centrado
+            ('ALIGN', (1, 1), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+            ('TOPPADDING', (0, 1), (-1, -1), 8),
+            
+            # Bordes y rayas
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F9FAFB')])
+        ]))
+        return table
+    
     def generate_venta_report(self, venta_data, output_filename):
         """
         Genera un reporte PDF de una venta
@@ -359,9 +413,9 @@ class PDFGenerator:
             if system == 'Windows':
                 os.startfile(pdf_path)
             elif system == 'Darwin':  # macOS
-                subprocess.run(['open', pdf_path])
+                subprocess.Popen(['open', pdf_path])
             else:  # Linux y otros Unix
-                subprocess.run(['xdg-open', pdf_path])
+                subprocess.Popen(['xdg-open', pdf_path])
         except Exception as e:
             print(f"No se pudo abrir el PDF automáticamente: {str(e)}")
     
@@ -3,11 +3,12 @@ Diálogo de Selección de Impresora
 Simula el diálogo nativo de Windows para selección de impresora
 """
 import customtkinter as ctk
+from view import tema
 from tkinter import messagebox
 import platform
 
 try:
-    from utils.print_manager import print_manager
+    from utils.print_manager import print_manager, printer_registry
     PRINT_MANAGER_AVAILABLE = True
 except:
     PRINT_MANAGER_AVAILABLE = False
@@ -22,6 +23,7 @@ class PrinterDialog(ctk.CTkToplevel):
         self.pdf_path = pdf_path
         self.selected_printer = None
         self.result = None
+        self._registry_version = None
         
         # Configurar ventana
         self.title("Printer")
@@ -59,7 +61,7 @@ class PrinterDialog(ctk.CTkToplevel):
         printer_label = ctk.CTkLabel(
             header_frame,
             text="Printer",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=tema.fuente(11, "bold", familia=None),
             text_color="#000000",
             anchor="w"
         )
@@ -76,8 +78,8 @@ class PrinterDialog(ctk.CTkToplevel):
             button_color="#E1E1E1",
             button_hover_color="#D0D0D0",
             dropdown_fg_color="#FFFFFF",
-            font=ctk.CTkFont(size=11),
-            dropdown_font=ctk.CTkFont(size=11)
+            font=tema.fuente(11, familia=None),
+            dropdown_font=tema.fuente(11, familia=None)
         )
         self.printer_combo.pack(fill="x", pady=(0, 5))
         
@@ -85,7 +87,7 @@ class PrinterDialog(ctk.CTkToplevel):
         ready_label = ctk.CTkLabel(
             main_frame,
             text="Ready",
-            font=ctk.CTkFont(size=10),
+            font=tema.fuente(10, familia=None),
             text_color="#555555",
             anchor="w"
         )
@@ -95,7 +97,7 @@ class PrinterDialog(ctk.CTkToplevel):
         properties_label = ctk.CTkLabel(
             main_frame,
             text="Printer Properties",
-            font=ctk.CTkFont(size=10, underline=True),
+            font=tema.fuente(10, familia=None, underline=True),
             text_color="#0066CC",
             anchor="e",
             cursor="hand2"
@@ -115,8 +117,8 @@ class PrinterDialog(ctk.CTkToplevel):
             height=28,
             fg_color="#0078D4",
             hover_color="#006ABC",
-            corner_radius=4,
-            font=ctk.CTkFont(size=11),
+            corner_radius=tema.radio(4),
+            font=tema.fuente(11, familia=None),
             command=self.on_print
         )
         btn_print.pack(side="right", padx=(5, 0))
@@ -130,19 +132,20 @@ class PrinterDialog(ctk.CTkToplevel):
             fg_color="#E1E1E1",
             hover_color="#D0D0D0",
             text_color="#000000",
-            corner_radius=4,
-            font=ctk.CTkFont(size=11),
+            corner_radius=tema.radio(4),
+            font=tema.fuente(11, familia=None),
             command=self.on_cancel
         )
         btn_cancel.pack(side="right")
     
     def load_printers(self):
-        """Carga la lista de impresoras disponibles"""
+        """Carga la lista de impresoras disponibles desde la caché (sin ejecutar procesos)"""
         printers = []
         
         # Intentar obtener impresoras reales
         if PRINT_MANAGER_AVAILABLE:
             printers = print_manager.get_available_printers()
+            self._registry_version = printer_registry.version
         
         # Si no hay impresoras o no está disponible, usar impresoras por defecto
         if not printers:
@@ -153,13 +156,33 @@ class PrinterDialog(ctk.CTkToplevel):
                 "Microsoft XPS Document Writer"
             ]
         
+        # Mantener la selección actual si la impresora sigue disponible
+        current = self.printer_combo.get()
+        
         # Actualizar combo
         self.printer_combo.configure(values=printers)
         
-        # Seleccionar la primera impresora
-        if printers:
-            self.printer_combo.set(printers[0])
-            self.selected_printer = printers[0]
+        if current in printers:
+            self.printer_combo.set(current)
+            self.selected_printer = current
+        elif printers:
+            default = print_manager.get_default_printer() if PRINT_MANAGER_AVAILABLE else None
+            first = default if default in printers else printers[0]
+            self.printer_combo.set(first)
+            self.selected_printer = first
+        
+        # Revisar periódicamente si el refresco en segundo plano detectó cambios
+        if PRINT_MANAGER_AVAILABLE:
+            self.after(500, self._watch_printers)
+    
+    def _watch_printers(self):
+        """Recarga el combo cuando la caché de impresoras cambia"""
+        if not self.winfo_exists():
+            return
+        if printer_registry.version != self._registry_version:
+            self.load_printers()
+        else:
+            self.after(500, self._watch_printers)
     
     def show_properties(self):
         """Muestra las propiedades de la impresora (simulado)"""
@@ -174,6 +197,17 @@ class PrinterDialog(ctk.CTkToplevel):
         self.selected_printer = self.printer_combo.get()
         self.result = "print"
         
+        # Impresora real en macOS/Linux: enviar a la cola de impresión sin bloquear
+        if (PRINT_MANAGER_AVAILABLE and platform.system() != 'Windows'
+                and self.selected_printer in print_manager.get_available_printers()):
+            print_manager.print_to_printer(self.pdf_path, self.selected_printer)
+            messagebox.showinfo(
+                "Impresión",
+                f"Documento agregado a la cola de impresión de:\n{self.selected_printer}"
+            )
+            self.destroy()
+            return
+        
         # Mostrar mensaje de simulación
         messagebox.showinfo(
             "Impresión Simulada",
@@ -0,0 +1,163 @@
+"""
+Registro de impresoras con caché
+Evita ejecutar lpstat / EnumPrinters cada vez que se abre el diálogo de impresión:
+las impresoras se consultan en un hilo de fondo y se sirven desde memoria
+"""
+import threading
+import time
+
+
+class PrinterRegistry:
+    """
+    Caché de impresoras disponibles con TTL, refresco en segundo plano
+    y detección de cambios
+
+    Los listeners registrados con add_listener se ejecutan en el hilo de
+    refresco; la UI debe reenviarlos al hilo de Tk antes de tocar widgets.
+    Alternativamente, el atributo version se incrementa en cada cambio y
+    puede compararse desde el hilo de Tk con un sondeo periódico.
+    """
+
+    def __init__(self, discover_printers, discover_default, ttl=60.0, refresh_interval=30.0):
+        """
+        Args:
+            discover_printers (callable): Función que retorna la lista de impresoras
+            discover_default (callable): Función que retorna la impresora predeterminada
+            ttl (float): Segundos tras los cuales la caché se considera vencida
+            refresh_interval (float): Segundos entre refrescos automáticos (0 = sin hilo)
+        """
+        self._discover_printers = discover_printers
+        self._discover_default = discover_default
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval
+
+        self._printers = []
+        self._default = None
+        self._updated_at = None
+        self.version = 0
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._wake = threading.Event()
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # Lectura (nunca ejecuta procesos externos)
+    # ------------------------------------------------------------------
+    def get_printers(self):
+        """
+        Retorna las impresoras conocidas desde la caché
+        Si la caché está vencida o vacía, programa un refresco en segundo plano
+
+        Returns:
+            list: Lista de nombres de impresoras (copia)
+        """
+        self._refresh_if_stale()
+        with self._lock:
+            return list(self._printers)
+
+    def get_default(self):
+        """Retorna la impresora predeterminada desde la caché"""
+        self._refresh_if_stale()
+        with self._lock:
+            return self._default
+
+    @property
+    def is_loaded(self):
+        """Indica si ya se completó al menos una consulta de impresoras"""
+        return self._updated_at is not None
+
+    @property
+    def age(self):
+        """Segundos desde el último refresco (None si nunca se consultó)"""
+        if self._updated_at is None:
+            return None
+        return time.monotonic() - self._updated_at
+
+    # ------------------------------------------------------------------
+    # Refresco
+    # ------------------------------------------------------------------
+    def start(self):
+        """Inicia el hilo de refresco periódico y lanza una primera consulta"""
+        if self._thread and self._thread.is_alive():
+            return
+        if self.refresh_interval <= 0:
+            self.refresh_async()
+            return
+        self._thread = threading.Thread(target=self._run, name="PrinterRegistry", daemon=True)
+        self._thread.start()
+
+    def refresh_async(self):
+        """Solicita un refresco sin bloquear al llamador"""
+        if self._thread and self._thread.is_alive():
+            self._wake.set()
+            return
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._refresh_once, name="PrinterRegistryRefresh", daemon=True).start()
+
+    def refresh(self):
+        """
+        Consulta las impresoras de forma síncrona (solo para scripts o el hilo de fondo)
+
+        Returns:
+            bool: True si la lista o la predeterminada cambiaron
+        """
+        try:
+            printers = list(self._discover_printers() or [])
+            default = self._discover_default()
+        except Exception as e:
+            print(f"Error al actualizar impresoras: {e}")
+            return False
+
+        with self._lock:
+            changed = printers != self._printers or default != self._default
+            self._printers = printers
+            self._default = default
+            self._updated_at = time.monotonic()
+            if changed:
+                self.version += 1
+
+        if changed:
+            self._notify(printers, default)
+        return changed
+
+    def add_listener(self, callback):
+        """Registra callback(printers, default) que se ejecuta cuando cambian las impresoras"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Elimina un callback registrado con add_listener"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _refresh_if_stale(self):
+        """Programa un refresco si la caché está vacía o vencida"""
+        age = self.age
+        if age is None or age > self.ttl:
+            self.refresh_async()
+
+    def _refresh_once(self):
+        """Hilo auxiliar para un único refresco"""
+        try:
+            self.refresh()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _run(self):
+        """Bucle del hilo de refresco periódico"""
+        while True:
+            self.refresh()
+            self._wake.wait(self.refresh_interval)
+            self._wake.clear()
+
+    def _notify(self, printers, default):
+        """Avisa a los listeners que la lista de impresoras cambió"""
+        for callback in list(self._listeners):
+            try:
+                callback(list(printers), default)
+            except Exception as e:
+                print(f"Error en listener de impresoras: {e}")
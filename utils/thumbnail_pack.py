@@ -0,0 +1,247 @@
+"""
+Archivo de miniaturas en disco (pack)
+Las miniaturas descargadas se guardan una tras otra en un solo archivo que solo
+crece (miniaturas.pack) y un índice de texto (miniaturas.idx) con una línea
+"clave offset largo" por miniatura (la clave es la de ImageLoader._get_cache_key).
+Un archivo por miniatura eran miles de archivos chicos y un open() por cada una
+al arrancar; el pack se abre una vez y se lee con mmap: get() copia del mapa
+solo los bytes de esa miniatura (1-3 KB), sin open() ni read() por miniatura.
+Se entregan bytes y no un memoryview del mapa porque PIL los lee con BytesIO,
+que comparte un bytes pero copia cualquier otro búfer, y porque un memoryview
+vivo impide cerrar o reemplazar el mapa
+
+Abrir el pack puede compactarlo (reescribir el archivo): ImageLoader lo abre en
+un hilo de fondo al iniciar y no en el primer get() desde el hilo de Tk
+
+Las miniaturas que se descartan (por tamaño máximo o reemplazadas) solo se
+marcan en el índice con largo 0; al abrir, si lo descartado supera el umbral,
+se reescribe el pack solo con las vigentes (compactación)
+"""
+import mmap
+import os
+import threading
+
+
+class ThumbnailPack:
+    """Pack de miniaturas codificadas con índice en memoria y lectura por mmap"""
+
+    # Cabecera del pack y primera línea del índice: "AGPK" + generación
+    # (si no coinciden, el índice es de otro pack y ambos se descartan)
+    MAGIC = "AGPK"
+    HEADER_SIZE = 20
+
+    # Compactar al abrir si lo descartado supera estos bytes y esta fracción del pack
+    COMPACT_MIN_BYTES = 4 * 1024 * 1024
+    COMPACT_RATIO = 0.5
+
+    def __init__(self, directory, name="miniaturas", max_bytes=64 * 1024 * 1024):
+        """
+        Args:
+            directory (str): Carpeta del pack y su índice
+            name (str): Nombre de los archivos (<name>.pack y <name>.idx)
+            max_bytes (int): Bytes de miniaturas vigentes (se descartan las más antiguas)
+        """
+        self.directory = directory
+        self.pack_path = os.path.join(directory, f"{name}.pack")
+        self.index_path = os.path.join(directory, f"{name}.idx")
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # Clave -> (offset, largo) en orden de escritura (la primera es la más antigua)
+        self._index = {}
+        self._live_bytes = 0
+        self._pack_file = None
+        self._index_file = None
+        self._reader = None
+        self._map = None
+        self._mapped = 0
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+    def open(self):
+        """Lee el índice (compactando si corresponde) y abre el pack para agregar"""
+        with self._lock:
+            if self._pack_file is None:
+                self._open()
+
+    def get(self, key):
+        """
+        Miniatura codificada del pack
+
+        Returns:
+            bytes: Miniatura copiada del mapa o None si no está
+        """
+        with self._lock:
+            if self._pack_file is None:
+                self._open()
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            offset, length = entry
+            if offset + length > self._mapped:
+                # Se agregaron miniaturas después de mapear el pack
+                self._remap()
+            return self._map[offset:offset + length]
+
+    def put(self, key, data):
+        """Agrega una miniatura al final del pack (reemplaza la anterior con esa clave)"""
+        with self._lock:
+            if self._pack_file is None:
+                self._open()
+            # Siempre al final real del archivo (otra instancia pudo agregar)
+            offset = self._pack_file.seek(0, os.SEEK_END)
+            self._pack_file.write(data)
+            self._pack_file.flush()
+            # El índice se escribe después de los datos: nunca apunta a bytes que no existen
+            self._append_index(key, offset, len(data))
+
+            previous = self._index.pop(key, None)
+            if previous is not None:
+                self._live_bytes -= previous[1]
+            self._index[key] = (offset, len(data))
+            self._live_bytes += len(data)
+
+            while self._live_bytes > self.max_bytes and len(self._index) > 1:
+                self._evict(next(iter(self._index)))
+
+    def evict(self, key):
+        """Descarta una miniatura (el espacio se recupera al compactar)"""
+        with self._lock:
+            if self._pack_file is None:
+                self._open()
+            if key in self._index:
+                self._evict(key)
+
+    def close(self):
+        """Cierra el mapa y los archivos"""
+        with self._lock:
+            for handle in (self._pack_file, self._index_file, self._reader):
+                if handle is not None:
+                    handle.close()
+            self._pack_file = self._index_file = self._reader = None
+            if self._map is not None:
+                self._map.close()
+            self._map = None
+            self._mapped = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    @property
+    def dead_bytes(self):
+        """Bytes del pack ocupados por miniaturas descartadas"""
+        with self._lock:
+            size = os.path.getsize(self.pack_path) if os.path.exists(self.pack_path) else 0
+            return max(0, size - self.HEADER_SIZE - self._live_bytes)
+
+    # ------------------------------------------------------------------
+    # Internos (con self._lock tomado)
+    # ------------------------------------------------------------------
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        if self._read_generation() is None:
+            self._reset()
+
+        index, size = self._read_index()
+        live = sum(length for _, length in index.values())
+        dead = size - self.HEADER_SIZE - live
+        if dead > self.COMPACT_MIN_BYTES and dead > size * self.COMPACT_RATIO:
+            index = self._compact(index)
+            live = sum(length for _, length in index.values())
+
+        self._index = index
+        self._live_bytes = live
+        self._pack_file = open(self.pack_path, "ab")
+        self._index_file = open(self.index_path, "a", encoding="ascii")
+        self._reader = open(self.pack_path, "rb")
+        self._remap()
+
+    def _read_generation(self):
+        """Generación común del pack y el índice, o None si faltan o no coinciden"""
+        try:
+            with open(self.pack_path, "rb") as pack:
+                header = pack.read(self.HEADER_SIZE).decode("ascii")
+            with open(self.index_path, "r", encoding="ascii") as index:
+                first = index.readline().split()
+        except (OSError, UnicodeDecodeError):
+            return None
+        if len(header) != self.HEADER_SIZE or not header.startswith(self.MAGIC):
+            return None
+        if first != [self.MAGIC, header[len(self.MAGIC):]]:
+            return None
+        return header[len(self.MAGIC):]
+
+    def _reset(self):
+        """Crea un pack y un índice vacíos con una generación nueva"""
+        generation = os.urandom(8).hex()
+        with open(self.pack_path, "wb") as pack:
+            pack.write(f"{self.MAGIC}{generation}".encode("ascii"))
+        with open(self.index_path, "w", encoding="ascii") as index:
+            index.write(f"{self.MAGIC} {generation}\n")
+        return generation
+
+    def _read_index(self):
+        """Índice vigente (la última línea de cada clave manda) y tamaño del pack"""
+        size = os.path.getsize(self.pack_path)
+        index = {}
+        with open(self.index_path, "r", encoding="ascii", errors="replace") as index_file:
+            index_file.readline()
+            for line in index_file:
+                parts = line.split()
+                if len(parts) != 3:
+                    continue  # Línea cortada (cierre inesperado)
+                try:
+                    key, offset, length = parts[0], int(parts[1]), int(parts[2])
+                except ValueError:
+                    continue
+                index.pop(key, None)
+                if length > 0 and self.HEADER_SIZE <= offset and offset + length <= size:
+                    index[key] = (offset, length)
+        return index, size
+
+    def _compact(self, index):
+        """Reescribe el pack y el índice solo con las miniaturas vigentes"""
+        generation = os.urandom(8).hex()
+        pack_tmp = self.pack_path + ".tmp"
+        index_tmp = self.index_path + ".tmp"
+        compacted = {}
+        with open(self.pack_path, "rb") as source, open(pack_tmp, "wb") as pack, \
+                open(index_tmp, "w", encoding="ascii") as index_file:
+            pack.write(f"{self.MAGIC}{generation}".encode("ascii"))
+            index_file.write(f"{self.MAGIC} {generation}\n")
+            offset = self.HEADER_SIZE
+            for key, (old_offset, length) in index.items():
+                source.seek(old_offset)
+                data = source.read(length)
+                if len(data) != length:
+                    continue
+                pack.write(data)
+                index_file.write(f"{key} {offset} {length}\n")
+                compacted[key] = (offset, length)
+                offset += length
+        # Si se corta entre los dos reemplazos las generaciones no coinciden y se descarta
+        os.replace(pack_tmp, self.pack_path)
+        os.replace(index_tmp, self.index_path)
+        print(f"🗜️ Pack de miniaturas compactado: {len(compacted)} miniaturas")
+        return compacted
+
+    def _append_index(self, key, offset, length):
+        self._index_file.write(f"{key} {offset} {length}\n")
+        self._index_file.flush()
+
+    def _evict(self, key):
+        offset, length = self._index.pop(key)
+        self._live_bytes -= length
+        self._append_index(key, 0, 0)
+
+    def _remap(self):
+        """Vuelve a mapear el pack con su tamaño actual"""
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._reader.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mapped = len(self._map)
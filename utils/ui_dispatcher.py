@@ -0,0 +1,79 @@
+"""
+Despachador de tareas hacia el hilo de Tk
+Tkinter no es seguro entre hilos: los hilos de fondo publican funciones en una
+cola y el hilo principal las ejecuta en un ciclo periódico con after()
+"""
+import queue
+import threading
+
+
+class UIDispatcher:
+    """Ejecuta en el hilo de Tk las funciones publicadas desde otros hilos"""
+
+    def __init__(self, widget, interval=30, max_per_tick=50):
+        """
+        Args:
+            widget: Widget de Tk cuyo after() se usa para el ciclo (normalmente la ventana raíz)
+            interval (int): Milisegundos entre revisiones de la cola
+            max_per_tick (int): Máximo de funciones ejecutadas por ciclo para no congelar la UI
+        """
+        self.widget = widget
+        self.interval = interval
+        self.max_per_tick = max_per_tick
+        self._queue = queue.SimpleQueue()
+        self._after_id = None
+
+    def start(self):
+        """Inicia el ciclo de revisión de la cola"""
+        if self._after_id is None:
+            self._after_id = self.widget.after(self.interval, self._pump)
+
+    def stop(self):
+        """Detiene el ciclo de revisión de la cola"""
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def post(self, func, *args):
+        """Publica func(*args) para ejecutarse en el hilo de Tk (seguro desde cualquier hilo)"""
+        self._queue.put((func, args))
+
+    def run_in_background(self, func, callback=None, *args):
+        """
+        Ejecuta func(*args) en un hilo de fondo y luego callback(resultado) en el hilo de Tk
+
+        Returns:
+            threading.Thread: Hilo iniciado
+        """
+        def _worker():
+            try:
+                result = func(*args)
+            except Exception as e:
+                result = e
+            if callback:
+                self.post(callback, result)
+
+        thread = threading.Thread(target=_worker, daemon=True)
+        thread.start()
+        return thread
+
+    def _pump(self):
+        """Ejecuta las funciones pendientes y reprograma el ciclo"""
+        for _ in range(self.max_per_tick):
+            try:
+                func, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"Error en tarea de UI: {e}")
+
+        try:
+            self._after_id = self.widget.after(self.interval, self._pump)
+        except Exception:
+            # La ventana fue destruida
+            self._after_id = None
@@ -0,0 +1,237 @@
+"""
+Perfilador del ciclo de eventos de Tk
+Detecta bloqueos de la interfaz con un latido periódico (after) vigilado desde
+un hilo: si el latido no llega en el umbral, toma una muestra de la pila del
+hilo principal. También mide la duración de los manejadores de las vistas
+(load_*, search_*, save_*, generar_pdf) y escribe un informe JSON al cerrar.
+
+Se activa con AUTOGEST_PERFILAR_UI=1 (ver main.py)
+"""
+import fnmatch
+import functools
+import json
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime
+
+from utils.paths import path_manager
+
+# Métodos de las vistas que se miden
+PATRONES_MANEJADORES = ("load_*", "search_*", "save_*", "generar_pdf")
+
+# Vistas cuyos manejadores se miden: (módulo, clase)
+VISTAS = (
+    ("view.auto_view", "AutoView"),
+    ("view.cliente_view", "ClienteView"),
+    ("view.venta_view", "VentaView"),
+)
+
+# Límites (ms) del histograma de retraso del latido; el último es abierto
+LIMITES_RETRASO_MS = (5, 16, 33, 50, 100, 250, 500, 1000)
+
+# Máximo de bloqueos con pila que se guardan en el informe
+MAX_BLOQUEOS = 200
+
+
+def _percentil(valores, p):
+    ordenados = sorted(valores)
+    if not ordenados:
+        return 0.0
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+
+class UIProfiler:
+    """Mide bloqueos del hilo de Tk y la duración de los manejadores de las vistas"""
+
+    def __init__(self, root, umbral_ms=100, intervalo_ms=20, informe=None):
+        """
+        Args:
+            root: Ventana principal (su after() emite el latido)
+            umbral_ms (int): Tiempo sin latido a partir del cual se considera bloqueo
+            intervalo_ms (int): Periodo del latido
+            informe: Archivo JSON del informe (por defecto cache/perfil_ui_<fecha>.json)
+        """
+        self.root = root
+        self.umbral = umbral_ms / 1000
+        self.intervalo_ms = intervalo_ms
+        self.informe = informe or path_manager.get_cache_path(
+            f"perfil_ui_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        self.bloqueos = []
+        self.bloqueos_descartados = 0
+        self.manejadores = {}
+        self.retrasos = [0] * (len(LIMITES_RETRASO_MS) + 1)
+        self.latidos = 0
+        self._ultimo_latido = None
+        self._bloqueo_actual = None
+        self._activos = []
+        self._main_ident = threading.get_ident()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._after_id = None
+        self._thread = None
+        self._inicio = None
+
+    # --- Latido y vigilancia ---
+
+    def start(self):
+        """Instrumenta las vistas e inicia el latido y el hilo vigilante (llamar desde el hilo de Tk)"""
+        self._main_ident = threading.get_ident()
+        self._inicio = time.perf_counter()
+        self.instrumentar_vistas()
+        self._ultimo_latido = time.perf_counter()
+        self._after_id = self.root.after(self.intervalo_ms, self._latido)
+        self._thread = threading.Thread(target=self._vigilar, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Detiene la medición y escribe el informe"""
+        self._stop.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        return self.escribir_informe()
+
+    def _latido(self):
+        """Se ejecuta en el hilo de Tk; registra el retraso respecto del periodo esperado"""
+        ahora = time.perf_counter()
+        with self._lock:
+            retraso_ms = max(0.0, (ahora - self._ultimo_latido) * 1000 - self.intervalo_ms)
+            self._ultimo_latido = ahora
+            self.latidos += 1
+            self.retrasos[self._intervalo_retraso(retraso_ms)] += 1
+
+            if self._bloqueo_actual is not None:
+                self._bloqueo_actual["duracion_ms"] = round(
+                    (ahora - self._bloqueo_actual.pop("_inicio")) * 1000, 1
+                )
+                self._guardar_bloqueo(self._bloqueo_actual)
+                self._bloqueo_actual = None
+
+        if not self._stop.is_set():
+            try:
+                self._after_id = self.root.after(self.intervalo_ms, self._latido)
+            except Exception:
+                self._after_id = None
+
+    @staticmethod
+    def _intervalo_retraso(ms):
+        for i, limite in enumerate(LIMITES_RETRASO_MS):
+            if ms <= limite:
+                return i
+        return len(LIMITES_RETRASO_MS)
+
+    def _vigilar(self):
+        """Hilo vigilante: si el latido se atrasa más del umbral, toma la pila del hilo principal"""
+        while not self._stop.wait(self.umbral / 4):
+            with self._lock:
+                if self._bloqueo_actual is not None:
+                    continue
+                atraso = time.perf_counter() - self._ultimo_latido
+                if atraso < self.umbral:
+                    continue
+                frame = sys._current_frames().get(self._main_ident)
+                self._bloqueo_actual = {
+                    "_inicio": self._ultimo_latido,
+                    "inicio_s": round(self._ultimo_latido - self._inicio, 3),
+                    "manejador": self._activos[-1] if self._activos else None,
+                    "pila": traceback.format_stack(frame) if frame is not None else [],
+                }
+
+    def _guardar_bloqueo(self, bloqueo):
+        if len(self.bloqueos) < MAX_BLOQUEOS:
+            self.bloqueos.append(bloqueo)
+        else:
+            self.bloqueos_descartados += 1
+
+    # --- Manejadores de las vistas ---
+
+    def instrumentar_vistas(self):
+        """Envuelve los manejadores de AutoView, ClienteView y VentaView"""
+        import importlib
+
+        for modulo, clase in VISTAS:
+            self.instrumentar_clase(getattr(importlib.import_module(modulo), clase))
+
+    def instrumentar_clase(self, cls, patrones=PATRONES_MANEJADORES):
+        """Reemplaza los métodos de cls que coinciden con los patrones por versiones medidas"""
+        for nombre, metodo in list(vars(cls).items()):
+            if not callable(metodo) or getattr(metodo, "_perfilado", False):
+                continue
+            if any(fnmatch.fnmatch(nombre, patron) for patron in patrones):
+                setattr(cls, nombre, self._medir(f"{cls.__name__}.{nombre}", metodo))
+
+    def _medir(self, etiqueta, metodo):
+        profiler = self
+
+        @functools.wraps(metodo)
+        def envoltura(*args, **kwargs):
+            if threading.get_ident() != profiler._main_ident:
+                return metodo(*args, **kwargs)
+            profiler._activos.append(etiqueta)
+            inicio = time.perf_counter()
+            try:
+                return metodo(*args, **kwargs)
+            finally:
+                duracion_ms = (time.perf_counter() - inicio) * 1000
+                profiler._activos.pop()
+                with profiler._lock:
+                    profiler.manejadores.setdefault(etiqueta, []).append(duracion_ms)
+
+        envoltura._perfilado = True
+        return envoltura
+
+    # --- Informe ---
+
+    def resumen(self):
+        """
+        Retorna el informe como dict
+
+        Returns:
+            dict: {duracion_s, umbral_ms, latidos, retraso_latido, manejadores, bloqueos}
+        """
+        with self._lock:
+            manejadores = {
+                etiqueta: {
+                    "llamadas": len(duraciones),
+                    "total_ms": round(sum(duraciones), 1),
+                    "max_ms": round(max(duraciones), 1),
+                    "p50_ms": round(_percentil(duraciones, 50), 1),
+                    "p95_ms": round(_percentil(duraciones, 95), 1),
+                }
+                for etiqueta, duraciones in self.manejadores.items()
+            }
+            etiquetas = [f"<={limite}ms" for limite in LIMITES_RETRASO_MS] + [f">{LIMITES_RETRASO_MS[-1]}ms"]
+            return {
+                "fecha": datetime.now().isoformat(timespec="seconds"),
+                "duracion_s": round(time.perf_counter() - self._inicio, 1) if self._inicio else 0,
+                "umbral_ms": round(self.umbral * 1000),
+                "intervalo_latido_ms": self.intervalo_ms,
+                "latidos": self.latidos,
+                "retraso_latido": dict(zip(etiquetas, self.retrasos)),
+                "manejadores": dict(sorted(manejadores.items(), key=lambda kv: -kv[1]["total_ms"])),
+                "bloqueos": list(self.bloqueos),
+                "bloqueos_descartados": self.bloqueos_descartados,
+            }
+
+    def escribir_informe(self):
+        """
+        Escribe el informe JSON e imprime un resumen corto
+
+        Returns:
+            str: Ruta del informe
+        """
+        datos = self.resumen()
+        with open(self.informe, "w", encoding="utf-8") as archivo:
+            json.dump(datos, archivo, indent=2, ensure_ascii=False)
+
+        print(f"📊 Perfil de UI: {len(datos['bloqueos'])} bloqueos de más de {datos['umbral_ms']} ms")
+        for etiqueta, m in list(datos["manejadores"].items())[:5]:
+            print(f"   {etiqueta}: {m['llamadas']} llamadas, p95 {m['p95_ms']} ms, máx {m['max_ms']} ms")
+        print(f"   Informe: {self.informe}")
+        return self.informe
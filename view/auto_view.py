@@ -3,24 +3,36 @@ Vista para la gestión de autos
 Incluye tabla, formularios y operaciones CRUD
 """
 import customtkinter as ctk
+from view import tema
 from tkinter import filedialog, messagebox
 from controller.auto_controller import AutoController
+from model.cambios import notificador_cambios
+from view.filas_en_vivo import FilasEnVivo
+from view.formularios import VentanaFormulario, pool_formularios
+from view.tabla_canvas import TablaCanvas, Columna, Accion, usar_tabla_canvas
 from utils.paths import path_manager
-from utils.printer import pdf_generator
 from utils.image_loader import ImageLoader
-from PIL import Image, ImageTk
 from pathlib import Path
 import os
 
-class AutoView(ctk.CTkFrame):
+class AutoView(FilasEnVivo, ctk.CTkFrame):
     """Vista de gestión de autos"""
     
+    # Tamaño de la vista previa de imagen del formulario
+    PREVIEW_SIZE = (180, 180)
+    
+    # Tamaño de las miniaturas de la tabla
+    MINIATURA_SIZE = (50, 50)
+    
     def __init__(self, parent):
         super().__init__(parent, fg_color="#F5F7FA")
         
         self.selected_auto = None
         self.selected_image_path = None
-        self.selected_row_frame = None  # Para resaltar la fila seleccionada
+        self.preview_path = None  # Imagen que se está decodificando para la vista previa
+        self.al_seleccionar_fila = self.select_auto  # Clic en una fila (ver FilasEnVivo)
+        self.tabla = None  # TablaCanvas con AUTOGEST_TABLA=canvas
+        self.iniciar_filas()
         
         # Configurar grid
         self.grid_columnconfigure(0, weight=1)
@@ -33,10 +45,17 @@ class AutoView(ctk.CTkFrame):
         
         # Cargar datos
         self.load_autos()
+        
+        # Cambios hechos desde otros equipos
+        notificador_cambios.suscribir('autos', self.aplicar_cambios)
+    
+    def destroy(self):
+        notificador_cambios.desuscribir('autos', self.aplicar_cambios)
+        super().destroy()
     
     def create_header(self):
         """Crea el encabezado de la vista"""
-        header_frame = ctk.CTkFrame(self, fg_color="#FFFFFF", corner_radius=10)
+        header_frame = ctk.CTkFrame(self, fg_color=tema.BLANCO, corner_radius=tema.radio(10))
         header_frame.grid(row=0, column=0, sticky="ew", pady=(0, 20))
         header_frame.grid_columnconfigure(2, weight=1)
         
@@ -54,11 +73,8 @@ class AutoView(ctk.CTkFrame):
             placeholder_text="Buscar auto...",
             width=300,
             height=40,
-            border_width=1,
-            border_color="#E5E7EB",
-            fg_color="#F9FAFB",
-            corner_radius=8,
-            font=ctk.CTkFont(family="Inter", size=13)
+            **tema.entrada(),
+            font=tema.fuente(13)
         )
         self.search_entry.grid(row=0, column=0, padx=(0, 10))
         self.search_entry.bind("<KeyRelease>", self.search_autos)
@@ -69,36 +85,70 @@ class AutoView(ctk.CTkFrame):
         
         btn_nuevo = ctk.CTkButton(
             buttons_frame,
-            text="➕ Nuevo Auto",
+            text=tema.icono("nuevo", "Nuevo Auto"),
             command=self.show_form_nuevo,
             width=130,
             height=40,
-            fg_color="#10B981",
-            hover_color="#059669",
-            corner_radius=8
+            **tema.BOTON_EXITO,
+            corner_radius=tema.radio(8)
         )
         btn_nuevo.pack(side="left", padx=(0, 10))
         
         btn_imprimir = ctk.CTkButton(
             buttons_frame,
-            text="🖨️ Imprimir",
+            text=tema.icono("imprimir", "Imprimir"),
             command=self.generar_pdf,
             width=130,
             height=40,
-            fg_color="#6366F1",
-            hover_color="#4F46E5",
-            corner_radius=8
+            **tema.BOTON_PRIMARIO,
+            corner_radius=tema.radio(8)
         )
         btn_imprimir.pack(side="left", padx=(0, 10))
+        
+        self.btn_exportar = ctk.CTkButton(
+            buttons_frame,
+            text=tema.icono("exportar", "Exportar CSV"),
+            command=self.exportar_csv,
+            width=130,
+            height=40,
+            **tema.BOTON_PRIMARIO,
+            corner_radius=tema.radio(8)
+        )
+        self.btn_exportar.pack(side="left", padx=(0, 10))
     
     def create_table(self):
         """Crea la tabla de autos"""
-        table_frame = ctk.CTkFrame(self, fg_color="#FFFFFF", corner_radius=10)
+        table_frame = ctk.CTkFrame(self, fg_color=tema.BLANCO, corner_radius=tema.radio(10))
         table_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 20))
         table_frame.grid_columnconfigure(0, weight=1)
         table_frame.grid_rowconfigure(1, weight=1)
         
-        headers_frame = ctk.CTkFrame(table_frame, fg_color="#F9FAFB", corner_radius=0, height=45)
+        if usar_tabla_canvas():
+            self.tabla = TablaCanvas(
+                table_frame,
+                columnas=[
+                    Columna("Imagen", 2, lambda a: a.get('imagen'), tipo="imagen"),
+                    Columna("ID", 1, lambda a: a['id_auto']),
+                    Columna("Marca", 2, lambda a: a['marca']),
+                    Columna("Modelo", 2, lambda a: a['modelo']),
+                    Columna("Año", 1, lambda a: a['anio']),
+                    Columna("Color", 2, lambda a: a['color']),
+                    Columna("Transmisión", 2, lambda a: a['transmision']),
+                    Columna("Precio", 2, lambda a: f"${a['precio']:,.2f}"),
+                    Columna("Acciones", 1, tipo="acciones"),
+                ],
+                acciones=[
+                    Accion(tema.icono("editar"), "#6366F1", "#4F46E5", lambda a: self.show_form(mode="editar", auto=a)),
+                    Accion(tema.icono("eliminar"), "#EF4444", "#DC2626", self.eliminar_auto),
+                ],
+                clave='id_auto',
+                alto_fila=70,
+                al_seleccionar=self.select_auto
+            )
+            self.tabla.grid(row=0, column=0, rowspan=2, sticky="nsew")
+            return
+        
+        headers_frame = ctk.CTkFrame(table_frame, fg_color=tema.GRIS_50, corner_radius=0, height=45)
         headers_frame.grid(row=0, column=0, sticky="ew")
         headers_frame.grid_propagate(False)
         
@@ -106,8 +156,7 @@ class AutoView(ctk.CTkFrame):
         weights = [2, 1, 2, 2, 1, 2, 2, 2, 1]
         
         # Configurar columnas del header
-        for i, weight in enumerate(weights):
-            headers_frame.grid_columnconfigure(i, weight=weight)
+        self.configurar_columnas(headers_frame, weights)
         
         # Crear encabezados con celdas para alineación perfecta
         for i, header in enumerate(headers):
@@ -118,14 +167,14 @@ class AutoView(ctk.CTkFrame):
             label = ctk.CTkLabel(
                 header_cell,
                 text=header,
-                font=ctk.CTkFont(family="Inter", size=13, weight="bold"),
-                text_color="#1F2937",
+                font=tema.fuente(13, "bold"),
+                text_color=tema.GRIS_800,
                 anchor="center"
             )
             label.place(relx=0.5, rely=0.5, anchor="center")
         
         # Contenedor con scroll
-        self.table_scroll = ctk.CTkScrollableFrame(table_frame, fg_color="#FFFFFF")
+        self.table_scroll = ctk.CTkScrollableFrame(table_frame, fg_color=tema.BLANCO)
         self.table_scroll.grid(row=1, column=0, sticky="nsew")
         self.table_scroll.grid_columnconfigure(0, weight=1)
     
@@ -137,213 +186,153 @@ class AutoView(ctk.CTkFrame):
     def load_autos(self):
         """Carga los autos en la tabla"""
         # Limpiar tabla
-        for widget in self.table_scroll.winfo_children():
-            widget.destroy()
+        if self.tabla is None:
+            for widget in self.table_scroll.winfo_children():
+                widget.destroy()
+        self.iniciar_filas()
         
         # Obtener autos
-        success, result = AutoController.obtener_todos()
+        success, result = AutoController.obtener_todos(compacto=True)
         
         if not success:
             messagebox.showerror("Error", result)
             return
         
+        if self.tabla is not None:
+            self.tabla.cargar(result)
+            return
+        
         # Mostrar autos
         for i, auto in enumerate(result):
-            row_frame = ctk.CTkFrame(
-                self.table_scroll,
-                fg_color="#FFFFFF" if i % 2 == 0 else "#F9FAFB",
-                corner_radius=0,
-                height=70
-            )
-            row_frame.grid(row=i, column=0, sticky="ew", pady=1)
-            row_frame.grid_propagate(False)
-            row_frame.grid_columnconfigure(0, weight=1)
-            
-            # Configurar cursor para toda la fila
-            row_frame.configure(cursor="hand2")
-            
-            # Aplicar eventos de clic a toda la fila y sus hijos
-            self.bind_click_recursive(row_frame, auto, row_frame)
-            
-            # Eventos hover
-            row_frame.bind("<Enter>", lambda e, rf=row_frame: rf.configure(fg_color="#DBEAFE") if rf != self.selected_row_frame else None)
-            row_frame.bind("<Leave>", lambda e, rf=row_frame, idx=i: rf.configure(
-                fg_color="#BFDBFE" if rf == self.selected_row_frame else ("#FFFFFF" if idx % 2 == 0 else "#F9FAFB")
-            ))
-            
-            # Contenedor principal de la fila
-            data_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-            data_frame.pack(fill="both", expand=True, padx=10, pady=5)
-            
-            weights = [2, 1, 2, 2, 1, 2, 2, 2, 1]
-            
-            # Configurar columnas del data_frame
-            for col, weight in enumerate(weights):
-                data_frame.grid_columnconfigure(col, weight=weight)
-            
-            # Celda para imagen
-            img_cell = ctk.CTkFrame(data_frame, fg_color="transparent", height=60)
-            img_cell.grid(row=0, column=0, sticky="nsew", padx=5)
-            img_cell.grid_propagate(False)
-            
-            # Imagen del auto centrada
-            img_frame = ctk.CTkFrame(img_cell, fg_color="#F3F4F6", width=60, height=60, corner_radius=8)
-            img_frame.place(relx=0.5, rely=0.5, anchor="center")
-            img_frame.pack_propagate(False)
-            
-            # Mostrar placeholder mientras carga
-            placeholder = ctk.CTkLabel(img_frame, text="🚗", font=ctk.CTkFont(size=20))
-            placeholder.pack(expand=True)
-            
-            # Cargar imagen de forma asíncrona si existe
-            if auto.get('imagen'):
-                # Primero intentar obtener del caché (rápido, no bloquea)
-                imagen_cargada = ImageLoader.load_from_url(auto['imagen'], size=(50, 50), use_cache=True)
-                
-                if imagen_cargada:
-                    # Si está en caché, mostrarla inmediatamente
-                    try:
-                        placeholder.destroy()
-                        photo = ImageTk.PhotoImage(imagen_cargada)
-                        img_label = ctk.CTkLabel(img_frame, image=photo, text="")
-                        img_label.image = photo
-                        img_label.pack(expand=True)
-                    except Exception:
-                        pass
-                else:
-                    # Si no está en caché, cargar en segundo plano
-                    def update_image(img):
-                        if img and img_frame.winfo_exists():
-                            try:
-                                placeholder.destroy()
-                                photo = ImageTk.PhotoImage(img)
-                                img_label = ctk.CTkLabel(img_frame, image=photo, text="")
-                                img_label.image = photo
-                                img_label.pack(expand=True)
-                            except Exception:
-                                pass
-                    
-                    ImageLoader.load_from_url_async(auto['imagen'], (50, 50), update_image)
-            
-            # Resto de datos
-            values = [
-                auto['id_auto'],
-                auto['marca'],
-                auto['modelo'],
-                auto['anio'],
-                auto['color'],
-                auto['transmision'],
-                f"${auto['precio']:,.2f}"
-            ]
-            
-            # Crear celdas centradas para los datos
-            for j, value in enumerate(values):
-                cell_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=60)
-                cell_frame.grid(row=0, column=j+1, sticky="nsew", padx=5)
-                cell_frame.grid_propagate(False)
-                
-                label = ctk.CTkLabel(
-                    cell_frame,
-                    text=str(value),
-                    font=ctk.CTkFont(family="Inter", size=12),
-                    text_color="#374151",
-                    anchor="center"
-                )
-                label.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Frame para botones de acción con diseño profesional
-            actions_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=60)
-            actions_frame.grid(row=0, column=len(values)+1, sticky="nsew", padx=5)
-            actions_frame.grid_propagate(False)
-            
-            buttons_container = ctk.CTkFrame(actions_frame, fg_color="transparent")
-            buttons_container.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Botón Editar con diseño moderno
-            btn_editar = ctk.CTkButton(
-                buttons_container,
-                text="",
-                width=40,
-                height=40,
-                fg_color="#6366F1",
-                hover_color="#4F46E5",
-                corner_radius=10,
-                border_width=0,
-                command=lambda a=auto: self.show_form(mode="editar", auto=a)
-            )
-            btn_editar.pack(side="left", padx=4)
-            
-            # Ícono de editar (lápiz) con mejor diseño
-            icon_edit_label = ctk.CTkLabel(
-                btn_editar,
-                text="✎",
-                font=ctk.CTkFont(family="Segoe UI Symbol", size=18, weight="bold"),
-                text_color="#FFFFFF"
-            )
-            icon_edit_label.place(relx=0.5, rely=0.5, anchor="center")
-            icon_edit_label.configure(cursor="hand2")
-            icon_edit_label.bind("<Button-1>", lambda e, a=auto: self.show_form(mode="editar", auto=a))
-            
-            # Botón Eliminar con diseño moderno
-            btn_eliminar = ctk.CTkButton(
-                buttons_container,
-                text="",
-                width=40,
-                height=40,
-                fg_color="#EF4444",
-                hover_color="#DC2626",
-                corner_radius=10,
-                border_width=0,
-                command=lambda a=auto: self.eliminar_auto(a)
-            )
-            btn_eliminar.pack(side="left", padx=4)
-            
-            # Ícono de eliminar (papelera) con mejor diseño
-            icon_delete_label = ctk.CTkLabel(
-                btn_eliminar,
-                text="🗑",
-                font=ctk.CTkFont(family="Segoe UI Emoji", size=18),
-                text_color="#FFFFFF"
-            )
-            icon_delete_label.place(relx=0.5, rely=0.5, anchor="center")
-            icon_delete_label.configure(cursor="hand2")
-            icon_delete_label.bind("<Button-1>", lambda e, a=auto: self.eliminar_auto(a))
+            self.crear_fila(i, auto)
     
-    def bind_click_recursive(self, widget, auto, row_frame):
-        """Vincula eventos de clic a un widget y todos sus hijos recursivamente"""
-        # Excluir botones de acción del binding recursivo
-        widget_class = widget.winfo_class()
-        if 'Button' in widget_class:
-            return
+    def crear_fila(self, i, auto):
+        """Crea la fila de la tabla para un registro y la guarda en el índice de filas"""
+        row_frame = ctk.CTkFrame(
+            self.table_scroll,
+            fg_color=tema.COLORES_FILA[i % 2],
+            corner_radius=0,
+            height=70
+        )
+        row_frame.grid(row=i, column=0, sticky="ew", pady=1)
+        row_frame.grid_propagate(False)
+        row_frame.grid_columnconfigure(0, weight=1)
+        
+        # Configurar cursor para toda la fila
+        row_frame.configure(cursor="hand2")
+        
+        # Los clics y el hover de la fila se delegan al registrarla (ver FilasEnVivo)
+        
+        # Contenedor principal de la fila
+        data_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
+        data_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        weights = [2, 1, 2, 2, 1, 2, 2, 2, 1]
+        
+        # Configurar columnas del data_frame
+        self.configurar_columnas(data_frame, weights)
+        
+        # Celda para imagen
+        img_cell = ctk.CTkFrame(data_frame, fg_color="transparent", height=60)
+        img_cell.grid(row=0, column=0, sticky="nsew", padx=5)
+        img_cell.grid_propagate(False)
+        
+        # Imagen del auto centrada
+        img_frame = ctk.CTkFrame(img_cell, fg_color=tema.GRIS_100, width=60, height=60, corner_radius=tema.radio(8))
+        img_frame.place(relx=0.5, rely=0.5, anchor="center")
+        img_frame.pack_propagate(False)
+        
+        # Mostrar placeholder mientras carga
+        placeholder = ctk.CTkLabel(img_frame, text=tema.icono("auto"), font=tema.fuente(20, familia=None))
+        placeholder.pack(expand=True)
+        
+        # Miniatura desde el pool (o descargada en segundo plano si no está en caché)
+        url = auto.get('imagen')
+        if url and not self.mostrar_miniatura(img_frame, placeholder, url):
+            # Sin ventana principal (benchmarks) queda el placeholder
+            dispatcher = getattr(self._root(), "dispatcher", None)
+            if dispatcher is not None:
+                def al_descargar(data):
+                    # En el hilo de fondo: la celda se actualiza en el hilo de Tk
+                    if data is not None:
+                        dispatcher.post(self.mostrar_miniatura, img_frame, placeholder, url)
+                
+                ImageLoader.fetch_encoded_async(url, self.MINIATURA_SIZE, al_descargar)
+        
+        # Resto de datos
+        values = [
+            auto['id_auto'],
+            auto['marca'],
+            auto['modelo'],
+            auto['anio'],
+            auto['color'],
+            auto['transmision'],
+            f"${auto['precio']:,.2f}"
+        ]
         
-        # Vincular el evento de clic
-        widget.bind("<Button-1>", lambda e: self.select_auto(auto, row_frame))
+        # Crear celdas centradas para los datos
+        for j, value in enumerate(values):
+            self.crear_celda(data_frame, j+1, str(value), 60)
         
-        # Aplicar recursivamente a todos los hijos
-        for child in widget.winfo_children():
-            self.bind_click_recursive(child, auto, row_frame)
+        # Botones de acción
+        self.crear_acciones(data_frame, len(values)+1, 60, [
+            ("editar", tema.BOTON_PRIMARIO, tema.fuente(18, "bold", familia="Segoe UI Symbol"), lambda a=auto: self.show_form(mode="editar", auto=a)),
+            ("eliminar", tema.BOTON_PELIGRO, tema.fuente_iconos(18), lambda a=auto: self.eliminar_auto(a)),
+        ])
+        
+        self.registrar_fila(auto['id_auto'], auto, row_frame, i)
+        return row_frame
+    
+    def mostrar_miniatura(self, img_frame, placeholder, url):
+        """
+        Muestra la miniatura en la celda con el PhotoImage compartido de
+        utils/photo_pool.py (en el hilo de Tk)
+        
+        Returns:
+            bool: False si la miniatura todavía no está en caché
+        """
+        from utils.photo_pool import photo_pool
+        
+        if not img_frame.winfo_exists():
+            return True  # Se recargó la tabla: no volver a pedirla
+        photo = photo_pool.acquire(url, self.MINIATURA_SIZE)
+        if photo is None:
+            return False
+        
+        placeholder.destroy()
+        img_label = ctk.CTkLabel(img_frame, image=photo, text="")
+        img_label.pack(expand=True)
+        # La fila libera el PhotoImage al destruirse (recarga, eliminación, navegación)
+        photo_pool.release_on_destroy(img_label, url, self.MINIATURA_SIZE)
+        return True
     
     def select_auto(self, auto, row_frame=None):
         """Selecciona un auto de la tabla con resaltado visual"""
-        # Restaurar color de la fila previamente seleccionada
-        if self.selected_row_frame:
-            # Obtener el índice de la fila para saber qué color usar
-            try:
-                idx = list(self.table_scroll.winfo_children()).index(self.selected_row_frame)
-                self.selected_row_frame.configure(fg_color="#FFFFFF" if idx % 2 == 0 else "#F9FAFB")
-            except:
-                pass
-        
-        # Seleccionar el nuevo auto
+        self.marcar_seleccion(auto['id_auto'], row_frame)
         self.selected_auto = auto
-        self.selected_row_frame = row_frame
-        
-        # Resaltar la nueva fila seleccionada
-        if row_frame:
-            row_frame.configure(fg_color="#BFDBFE")  # Azul claro persistente
         
         print(f"✓ Auto seleccionado: {auto['marca']} {auto['modelo']} (ID: {auto['id_auto']})")
     
+    def obtener_fila(self, id_auto):
+        """Fila de lista de un auto para actualizarla en la tabla"""
+        return AutoController.obtener_fila(id_auto)
+    
+    def clave_orden(self, auto):
+        """Más recientes primero, como AutoModel.obtener_todos (los ids crecen con fecha_registro)"""
+        return -auto['id_auto']
+    
+    def filtro_activo(self):
+        """Indica si la tabla muestra resultados de búsqueda"""
+        return bool(self.search_entry.get().strip())
+    
+    def recargar(self):
+        """Recarga la tabla respetando la búsqueda actual"""
+        self.search_autos()
+    
+    def limpiar_seleccion(self):
+        """Olvida el auto seleccionado"""
+        self.selected_auto = None
+    
     def search_autos(self, event=None):
         """Busca autos por criterio"""
         criterio = self.search_entry.get().strip()
@@ -353,32 +342,32 @@ class AutoView(ctk.CTkFrame):
             return
         
         # Limpiar tabla
-        for widget in self.table_scroll.winfo_children():
-            widget.destroy()
+        if self.tabla is None:
+            for widget in self.table_scroll.winfo_children():
+                widget.destroy()
+        self.iniciar_filas()
         
         # Buscar autos
-        success, result = AutoController.buscar_autos(criterio)
+        success, result = AutoController.buscar_autos(criterio, compacto=True)
         
         if not success:
             messagebox.showerror("Error", result)
             return
         
+        if self.tabla is not None:
+            self.tabla.cargar(result, al_inicio=True)
+            return
+        
         # Mostrar resultados
         for i, auto in enumerate(result):
             row_frame = ctk.CTkFrame(
                 self.table_scroll,
-                fg_color="#FFFFFF" if i % 2 == 0 else "#F9FAFB",
+                fg_color=tema.COLORES_FILA[i % 2],
                 corner_radius=0
             )
             row_frame.grid(row=i, column=0, sticky="ew", pady=1)
             row_frame.grid_columnconfigure(0, weight=1)
             
-            row_frame.bind("<Button-1>", lambda e, a=auto: self.select_auto(a))
-            row_frame.bind("<Enter>", lambda e, rf=row_frame: rf.configure(fg_color="#DBEAFE"))
-            row_frame.bind("<Leave>", lambda e, rf=row_frame, idx=i: rf.configure(
-                fg_color="#FFFFFF" if idx % 2 == 0 else "#F9FAFB"
-            ))
-            
             data_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
             data_frame.pack(fill="x", padx=5, pady=8)
             
@@ -398,11 +387,12 @@ class AutoView(ctk.CTkFrame):
                 label = ctk.CTkLabel(
                     data_frame,
                     text=str(value),
-                    font=ctk.CTkFont(family="Inter", size=12),
-                    text_color="#1F2937"
+                    font=tema.fuente(12),
+                    text_color=tema.GRIS_800
                 )
                 label.grid(row=0, column=j, padx=10, sticky="w")
-                label.bind("<Button-1>", lambda e, a=auto: self.select_auto(a))
+            
+            self.registrar_fila(auto['id_auto'], auto, row_frame, i)
     
     def show_form_nuevo(self):
         """Muestra el formulario para crear un nuevo auto"""
@@ -417,57 +407,66 @@ class AutoView(ctk.CTkFrame):
         self.show_form(mode="editar", auto=self.selected_auto)
     
     def show_form(self, mode="nuevo", auto=None):
-        """Muestra el formulario de auto"""
-        form_window = ctk.CTkToplevel(self)
-        form_window.title("Nuevo Auto" if mode == "nuevo" else "Editar Auto")
-        
-        # Calcular tamaño dinámico (80% de la altura de pantalla, máx 750px)
-        screen_height = form_window.winfo_screenheight()
-        window_height = min(int(screen_height * 0.8), 750)
-        window_width = 650
-        
-        form_window.geometry(f"{window_width}x{window_height}")
-        form_window.resizable(True, True)  # Permitir redimensionar
-        form_window.minsize(600, 500)  # Tamaño mínimo
-        
-        if mode == "editar" and auto and auto.get('imagen_path'):
-            self.selected_image_path = auto['imagen_path']
-            if os.path.exists(self.selected_image_path):
-                # Cargar la imagen existente después de que se cree el formulario
-                form_window.after(100, lambda: self.update_image_preview(self.selected_image_path))
-        
-        # Centrar ventana
-        form_window.transient(self)
-        
-        # Centrar en la pantalla
-        form_window.update_idletasks()
-        form_window.grab_set()
-
-        screen_width = form_window.winfo_screenwidth()
-        x = (screen_width // 2) - (window_width // 2)
-        y = (screen_height // 2) - (window_height // 2)
-        form_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        """Muestra el formulario de auto (se construye una vez y se reutiliza)"""
+        ventana = pool_formularios.obtener("auto", self, AutoView.crear_formulario)
+        campos = ventana.campos
+        titulo = "Nuevo Auto" if mode == "nuevo" else "Editar Auto"
+        campos['titulo'].configure(text=titulo)
+        
+        # Llenar los campos (vacíos si es un auto nuevo)
+        for field_name, entry in campos['entries'].items():
+            entry.delete(0, "end")
+            if mode == "editar" and auto:
+                entry.insert(0, str(auto[field_name]))
+        
+        campos['transmision'].set("Manual" if mode == "nuevo" else auto['transmision'])
+        campos['combustible'].set("Gasolina" if mode == "nuevo" else auto['combustible'])
+        
+        # La vista previa es de esta vista mientras el formulario está abierto
+        self.preview_frame = campos['preview_frame']
+        self.selected_image_path = None
+        self.preview_path = None
+        self.limpiar_vista_previa()
+        
+        if mode == "editar" and auto and auto.get('imagen_path') and os.path.exists(auto['imagen_path']):
+            # La imagen existente se decodifica en segundo plano
+            self.update_image_preview(auto['imagen_path'])
+        
+        ventana.conectar(
+            guardar=lambda: self.save_auto(
+                mode, campos['entries'], campos['transmision'], campos['combustible'], ventana, auto
+            ),
+            imagen=lambda: self.select_image(ventana)
+        )
+        ventana.mostrar(titulo, enfocar=campos['entries']['marca'])
+    
+    @staticmethod
+    def crear_formulario(parent):
+        """Construye la ventana del formulario de autos (una vez por aplicación, ver view/formularios.py)"""
+        # Tamaño dinámico (80% de la altura de pantalla, máx 750px)
+        ventana = VentanaFormulario(parent, ancho=650, alto_maximo=750, proporcion=0.8, minimo=(600, 500))
         
         # Contenedor principal
-        main_frame = ctk.CTkFrame(form_window, fg_color="#F5F7FA")
+        main_frame = ctk.CTkFrame(ventana, fg_color="#F5F7FA", corner_radius=tema.radio(6))
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         # Título
         title = ctk.CTkLabel(
             main_frame,
-            text="Nuevo Auto" if mode == "nuevo" else "Editar Auto",
-            font=ctk.CTkFont(family="Inter", size=22, weight="bold"),
-            text_color="#1F2937"
+            text="Nuevo Auto",
+            font=tema.fuente(22, "bold"),
+            text_color=tema.GRIS_800
         )
         title.pack(pady=(0, 20))
         
         # Formulario
-        form_frame = ctk.CTkFrame(main_frame, fg_color="#FFFFFF", corner_radius=10)
+        form_frame = ctk.CTkFrame(main_frame, fg_color=tema.BLANCO, corner_radius=tema.radio(10))
         form_frame.pack(fill="both", expand=True)
         
         # Scroll para el formulario
         scroll_frame = ctk.CTkScrollableFrame(form_frame, fg_color="transparent")
         scroll_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        ventana.scroll_frame = scroll_frame
         
         # Campos
         fields = [
@@ -484,8 +483,8 @@ class AutoView(ctk.CTkFrame):
             label = ctk.CTkLabel(
                 scroll_frame,
                 text=label_text,
-                font=ctk.CTkFont(family="Inter", size=12, weight="bold"),
-                text_color="#6B7280",
+                font=tema.fuente(12, "bold"),
+                text_color=tema.GRIS_500,
                 anchor="w"
             )
             label.pack(anchor="w", pady=(15 if i == 0 else 10, 5))
@@ -493,46 +492,35 @@ class AutoView(ctk.CTkFrame):
             entry = ctk.CTkEntry(
                 scroll_frame,
                 height=40,
-                border_width=1,
-                border_color="#E5E7EB",
-                fg_color="#F9FAFB",
-                corner_radius=8,
-                font=ctk.CTkFont(family="Inter", size=13)
+                **tema.entrada(),
+                font=tema.fuente(13)
             )
             entry.pack(fill="x")
             entries[field_name] = entry
-            
-            # Prellenar si es edición
-            if mode == "editar" and auto:
-                entry.insert(0, str(auto[field_name]))
-            
-            # Enfoque automático en el primer campo
-            if i == 0:
-                entry.focus()
         
         # Transmisión
         label_trans = ctk.CTkLabel(
             scroll_frame,
             text="Transmisión:",
-            font=ctk.CTkFont(family="Inter", size=12, weight="bold"),
-            text_color="#6B7280",
+            font=tema.fuente(12, "bold"),
+            text_color=tema.GRIS_500,
             anchor="w"
         )
         label_trans.pack(anchor="w", pady=(10, 5))
         
-        transmision_var = ctk.StringVar(value="Manual" if mode == "nuevo" else auto['transmision'])
+        transmision_var = ctk.StringVar(master=ventana, value="Manual")
         transmision_combo = ctk.CTkComboBox(
             scroll_frame,
             values=["Manual", "Automática"],
             variable=transmision_var,
             height=40,
             border_width=1,
-            border_color="#E5E7EB",
-            fg_color="#F9FAFB",
+            border_color=tema.GRIS_200,
+            fg_color=tema.GRIS_50,
             button_color="#3B82F6",
             button_hover_color="#2563EB",
-            corner_radius=8,
-            font=ctk.CTkFont(family="Inter", size=13)
+            corner_radius=tema.radio(8),
+            font=tema.fuente(13)
         )
         transmision_combo.pack(fill="x")
         
@@ -540,25 +528,25 @@ class AutoView(ctk.CTkFrame):
         label_comb = ctk.CTkLabel(
             scroll_frame,
             text="Combustible:",
-            font=ctk.CTkFont(family="Inter", size=12, weight="bold"),
-            text_color="#6B7280",
+            font=tema.fuente(12, "bold"),
+            text_color=tema.GRIS_500,
             anchor="w"
         )
         label_comb.pack(anchor="w", pady=(10, 5))
         
-        combustible_var = ctk.StringVar(value="Gasolina" if mode == "nuevo" else auto['combustible'])
+        combustible_var = ctk.StringVar(master=ventana, value="Gasolina")
         combustible_combo = ctk.CTkComboBox(
             scroll_frame,
             values=["Gasolina", "Diésel", "Eléctrico", "Híbrido"],
             variable=combustible_var,
             height=40,
             border_width=1,
-            border_color="#E5E7EB",
-            fg_color="#F9FAFB",
+            border_color=tema.GRIS_200,
+            fg_color=tema.GRIS_50,
             button_color="#3B82F6",
             button_hover_color="#2563EB",
-            corner_radius=8,
-            font=ctk.CTkFont(family="Inter", size=13)
+            corner_radius=tema.radio(8),
+            font=tema.fuente(13)
         )
         combustible_combo.pack(fill="x")
         
@@ -566,24 +554,16 @@ class AutoView(ctk.CTkFrame):
         image_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
         image_frame.pack(fill="x", pady=(20, 10))
         
-        # Preview de imagen
-        self.preview_frame = ctk.CTkFrame(
+        # Preview de imagen (el contenido lo pone limpiar_vista_previa / update_image_preview)
+        preview_frame = ctk.CTkFrame(
             image_frame, 
-            fg_color="#F3F4F6",
+            fg_color=tema.GRIS_100,
             width=200,
             height=200,
-            corner_radius=10
-        )
-        self.preview_frame.pack(side="left", padx=10)
-        self.preview_frame.pack_propagate(False)
-        
-        self.preview_label = ctk.CTkLabel(
-            self.preview_frame,
-            text="Vista previa\nde imagen",
-            font=ctk.CTkFont(family="Inter", size=12),
-            text_color="#9CA3AF"
+            corner_radius=tema.radio(10)
         )
-        self.preview_label.place(relx=0.5, rely=0.5, anchor="center")
+        preview_frame.pack(side="left", padx=10)
+        preview_frame.pack_propagate(False)
         
         # Controles de imagen
         controls_frame = ctk.CTkFrame(image_frame, fg_color="transparent")
@@ -592,23 +572,20 @@ class AutoView(ctk.CTkFrame):
         label_img = ctk.CTkLabel(
             controls_frame,
             text="Imagen del Vehículo:",
-            font=ctk.CTkFont(family="Inter", size=12, weight="bold"),
-            text_color="#6B7280",
+            font=tema.fuente(12, "bold"),
+            text_color=tema.GRIS_500,
             anchor="w"
         )
         label_img.pack(anchor="w", pady=(0, 10))
         
-        self.selected_image_path = None
-        
         btn_imagen = ctk.CTkButton(
             controls_frame,
-            text="📸 Seleccionar Imagen",
-            command=lambda: self.select_image(form_window),
+            text=tema.icono("imagen", "Seleccionar Imagen"),
+            command=lambda: ventana.ejecutar('imagen'),
             height=40,
-            fg_color="#6366F1",
-            hover_color="#4F46E5",
-            corner_radius=8,
-            font=ctk.CTkFont(family="Inter", size=13)
+            **tema.BOTON_PRIMARIO,
+            corner_radius=tema.radio(8),
+            font=tema.fuente(13)
         )
         btn_imagen.pack(fill="x")
         
@@ -619,28 +596,48 @@ class AutoView(ctk.CTkFrame):
         btn_guardar = ctk.CTkButton(
             buttons_frame,
             text="  Guardar",
-            command=lambda: self.save_auto(mode, entries, transmision_var, combustible_var, form_window, auto),
-            font=ctk.CTkFont(family="Inter", size=14, weight="bold"),
+            command=lambda: ventana.ejecutar('guardar'),
+            font=tema.fuente(14, "bold"),
             height=45,
             width=140,
-            fg_color="#10B981",
-            hover_color="#059669",
-            corner_radius=10
+            **tema.BOTON_EXITO,
+            corner_radius=tema.radio(10)
         )
         btn_guardar.pack(side="left", padx=10)
         
         btn_cancelar = ctk.CTkButton(
             buttons_frame,
             text="  Cancelar",
-            command=form_window.destroy,
-            font=ctk.CTkFont(family="Inter", size=14),
+            command=ventana.ocultar,
+            font=tema.fuente(14),
             height=45,
             width=140,
-            fg_color="#6B7280",
-            hover_color="#4B5563",
-            corner_radius=10
+            **tema.BOTON_SECUNDARIO,
+            corner_radius=tema.radio(10)
         )
         btn_cancelar.pack(side="left", padx=10)
+        
+        ventana.campos = {
+            'titulo': title,
+            'entries': entries,
+            'transmision': transmision_var,
+            'combustible': combustible_var,
+            'preview_frame': preview_frame,
+        }
+        return ventana
+    
+    def limpiar_vista_previa(self, texto="Vista previa\nde imagen"):
+        """Deja la vista previa de imagen con el texto de ayuda"""
+        for widget in self.preview_frame.winfo_children():
+            widget.destroy()
+        
+        self.preview_label = ctk.CTkLabel(
+            self.preview_frame,
+            text=texto,
+            font=tema.fuente(12),
+            text_color="#9CA3AF"
+        )
+        self.preview_label.place(relx=0.5, rely=0.5, anchor="center")
     
     def select_image(self, parent):
         """Abre el diálogo para seleccionar una imagen"""
@@ -660,23 +657,52 @@ class AutoView(ctk.CTkFrame):
             self.update_image_preview(filename)
     
     def update_image_preview(self, image_path):
-        """Actualiza la vista previa de la imagen"""
-        try:
-            # Limpiar preview anterior
-            for widget in self.preview_frame.winfo_children():
-                widget.destroy()
-                
-            # Cargar y mostrar nueva imagen
-            img = Image.open(image_path)
-            img = img.resize((180, 180), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
-            
-            preview = ctk.CTkLabel(self.preview_frame, image=photo, text="")
-            preview.image = photo
-            preview.place(relx=0.5, rely=0.5, anchor="center")
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudo cargar la imagen: {str(e)}")
+        """
+        Actualiza la vista previa de la imagen
+        La foto se decodifica en segundo plano (utils/image_decoder.py): el
+        formulario no se congela con fotos de teléfono de varios MB
+        """
+        from utils.image_decoder import image_decoder
+        
+        self.preview_path = image_path
+        self.limpiar_vista_previa("Cargando...")
+        
+        dispatcher = getattr(self._root(), "dispatcher", None)
+        if dispatcher is None:
+            # Sin ventana principal: decodificar en el hilo de Tk
+            try:
+                resultado = image_decoder.load(image_path, self.PREVIEW_SIZE)
+            except Exception as e:
+                resultado = e
+            self.mostrar_vista_previa(image_path, resultado)
+            return
+        
+        image_decoder.decode_async(
+            image_path,
+            self.PREVIEW_SIZE,
+            lambda resultado: dispatcher.post(self.mostrar_vista_previa, image_path, resultado)
+        )
+    
+    def mostrar_vista_previa(self, image_path, resultado):
+        """Muestra la imagen decodificada (en el hilo de Tk)"""
+        if image_path != self.preview_path or not self.preview_frame.winfo_exists():
+            return  # Se eligió otra imagen o se cerró el formulario
+        
+        if isinstance(resultado, Exception):
+            self.limpiar_vista_previa()
+            messagebox.showerror("Error", f"No se pudo cargar la imagen: {str(resultado)}")
             self.selected_image_path = None
+            return
+        
+        from PIL import ImageTk
+        
+        for widget in self.preview_frame.winfo_children():
+            widget.destroy()
+        
+        photo = ImageTk.PhotoImage(resultado)
+        preview = ctk.CTkLabel(self.preview_frame, image=photo, text="")
+        preview.image = photo
+        preview.place(relx=0.5, rely=0.5, anchor="center")
     
     def save_auto(self, mode, entries, transmision_var, combustible_var, window, auto=None):
         """Guarda el auto (crear o actualizar)"""
@@ -699,8 +725,8 @@ class AutoView(ctk.CTkFrame):
             )
         
         if success:
-            # Destruir ventana primero para evitar que se sobreponga
-            window.destroy()
+            # Ocultar la ventana primero para evitar que se sobreponga
+            window.ocultar()
             # Recargar datos
             self.load_autos()
             # Mostrar mensaje después
@@ -720,10 +746,13 @@ class AutoView(ctk.CTkFrame):
         if not confirm:
             return
         
+        # La fila de la tabla no incluye cloudinary_id: se consulta el registro completo
+        success_detalle, detalle = AutoController.obtener_por_id(auto['id_auto'])
+        
         # Eliminar imagen de Cloudinary si existe
-        if auto.get('cloudinary_id'):
+        if success_detalle and detalle and detalle.get('cloudinary_id'):
             from utils.cloudinary_service import CloudinaryService
-            CloudinaryService.delete_image(auto['cloudinary_id'])
+            CloudinaryService.delete_image(detalle['cloudinary_id'])
         
         success, result = AutoController.eliminar_auto(auto['id_auto'])
         
@@ -734,15 +763,49 @@ class AutoView(ctk.CTkFrame):
         else:
             messagebox.showerror("Error", result)
     
+    def exportar_csv(self):
+        """
+        Exporta la lista de autos a CSV en segundo plano
+        db.stream lee con su propia conexión, así que la ventana sigue respondiendo
+        """
+        dispatcher = getattr(self.winfo_toplevel(), "dispatcher", None)
+        if dispatcher is None:
+            self.al_exportar_csv(AutoController.exportar_csv())
+            return
+        self.btn_exportar.configure(state="disabled")
+        dispatcher.run_in_background(AutoController.exportar_csv, self.al_exportar_csv)
+    
+    def al_exportar_csv(self, resultado):
+        """Resultado de la exportación (en el hilo de Tk)"""
+        if self.winfo_exists():
+            self.btn_exportar.configure(state="normal")
+        if isinstance(resultado, Exception):
+            resultado = (False, str(resultado))
+        success, result = resultado
+        if not success:
+            messagebox.showerror("Error", f"No se pudo exportar: {result}")
+            return
+        
+        output_path, filas = result
+        messagebox.showinfo("CSV Generado", f"Se exportaron {filas} autos a:\n{output_path}")
+    
     def generar_pdf(self):
         """Genera un PDF del auto seleccionado e invoca el diálogo de impresión"""
         if not self.selected_auto:
             messagebox.showwarning("Advertencia", "Debe seleccionar un auto para generar el PDF")
             return
         
+        from utils.printer import pdf_generator
+        
         try:
-            filename = f"auto_{self.selected_auto['id_auto']}_{self.selected_auto['marca']}_{self.selected_auto['modelo']}.pdf"
-            output_path = pdf_generator.generate_auto_report(self.selected_auto, filename)
+            # El PDF usa el registro completo, no la fila de la tabla
+            success, auto = AutoController.obtener_por_id(self.selected_auto['id_auto'])
+            if not success or not auto:
+                messagebox.showerror("Error", auto or "El auto ya no existe")
+                return
+            
+            filename = f"auto_{auto['id_auto']}_{auto['marca']}_{auto['modelo']}.pdf"
+            output_path = pdf_generator.generate_auto_report(auto, filename)
             
             # Preguntar qué acción desea realizar
             respuesta = messagebox.askyesnocancel(
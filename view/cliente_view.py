@@ -3,18 +3,24 @@ Vista para la gestión de clientes
 Incluye tabla, formularios y operaciones CRUD
 """
 import customtkinter as ctk
+from view import tema
 from tkinter import messagebox
 from controller.cliente_controller import ClienteController
-from utils.printer import pdf_generator
+from model.cambios import notificador_cambios
+from view.filas_en_vivo import FilasEnVivo
+from view.formularios import VentanaFormulario, pool_formularios
+from view.tabla_canvas import TablaCanvas, Columna, Accion, usar_tabla_canvas
 
-class ClienteView(ctk.CTkFrame):
+class ClienteView(FilasEnVivo, ctk.CTkFrame):
     """Vista de gestión de clientes"""
     
     def __init__(self, parent):
         super().__init__(parent, fg_color="#F4F6F7")
         
         self.selected_cliente = None
-        self.selected_row_frame = None  # Para resaltar la fila seleccionada
+        self.al_seleccionar_fila = self.select_cliente  # Clic en una fila (ver FilasEnVivo)
+        self.tabla = None  # TablaCanvas con AUTOGEST_TABLA=canvas
+        self.iniciar_filas()
         
         # Configurar grid
         self.grid_columnconfigure(0, weight=1)
@@ -27,10 +33,17 @@ class ClienteView(ctk.CTkFrame):
         
         # Cargar datos
         self.load_clientes()
+        
+        # Cambios hechos desde otros equipos
+        notificador_cambios.suscribir('clientes', self.aplicar_cambios)
+    
+    def destroy(self):
+        notificador_cambios.desuscribir('clientes', self.aplicar_cambios)
+        super().destroy()
     
     def create_header(self):
         """Crea el encabezado de la vista"""
-        header_frame = ctk.CTkFrame(self, fg_color="#FFFFFF", corner_radius=10)
+        header_frame = ctk.CTkFrame(self, fg_color=tema.BLANCO, corner_radius=tema.radio(10))
         header_frame.grid(row=0, column=0, sticky="ew", pady=(0, 20))
         header_frame.grid_columnconfigure(2, weight=1)
         
@@ -45,11 +58,8 @@ class ClienteView(ctk.CTkFrame):
             placeholder_text="Buscar cliente...",
             width=300,
             height=40,
-            border_width=1,
-            border_color="#E5E7EB",
-            fg_color="#F9FAFB",
-            corner_radius=8,
-            font=ctk.CTkFont(family="Inter", size=13)
+            **tema.entrada(),
+            font=tema.fuente(13)
         )
         self.search_entry.grid(row=0, column=0, padx=(0, 10))
         self.search_entry.bind("<KeyRelease>", self.search_clientes)
@@ -60,36 +70,67 @@ class ClienteView(ctk.CTkFrame):
         
         btn_nuevo = ctk.CTkButton(
             buttons_frame,
-            text="➕ Nuevo Cliente",
+            text=tema.icono("nuevo", "Nuevo Cliente"),
             command=self.show_form_nuevo,
             width=130,
             height=40,
-            fg_color="#10B981",
-            hover_color="#059669",
-            corner_radius=8
+            **tema.BOTON_EXITO,
+            corner_radius=tema.radio(8)
         )
         btn_nuevo.pack(side="left", padx=(0, 10))
         
         btn_imprimir = ctk.CTkButton(
             buttons_frame,
-            text="🖨️ Imprimir",
+            text=tema.icono("imprimir", "Imprimir"),
             command=self.generar_pdf,
             width=130,
             height=40,
-            fg_color="#6366F1",
-            hover_color="#4F46E5",
-            corner_radius=8
+            **tema.BOTON_PRIMARIO,
+            corner_radius=tema.radio(8)
         )
         btn_imprimir.pack(side="left", padx=(0, 10))
+        
+        self.btn_exportar = ctk.CTkButton(
+            buttons_frame,
+            text=tema.icono("exportar", "Exportar CSV"),
+            command=self.exportar_csv,
+            width=130,
+            height=40,
+            **tema.BOTON_PRIMARIO,
+            corner_radius=tema.radio(8)
+        )
+        self.btn_exportar.pack(side="left", padx=(0, 10))
     
     def create_table(self):
         """Crea la tabla de clientes"""
-        table_frame = ctk.CTkFrame(self, fg_color="#FFFFFF", corner_radius=10)
+        table_frame = ctk.CTkFrame(self, fg_color=tema.BLANCO, corner_radius=tema.radio(10))
         table_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 20))
         table_frame.grid_columnconfigure(0, weight=1)
         table_frame.grid_rowconfigure(1, weight=1)
         
-        headers_frame = ctk.CTkFrame(table_frame, fg_color="#F9FAFB", corner_radius=0, height=45)
+        if usar_tabla_canvas():
+            self.tabla = TablaCanvas(
+                table_frame,
+                columnas=[
+                    Columna("ID", 1, lambda c: c['id_cliente']),
+                    Columna("Nombre", 3, lambda c: c['nombre']),
+                    Columna("Teléfono", 2, lambda c: c['telefono'] or "N/A"),
+                    Columna("Correo", 3, lambda c: c['correo'] or "N/A"),
+                    Columna("Dirección", 3, lambda c: c['direccion'] or "N/A"),
+                    Columna("Acciones", 1, tipo="acciones"),
+                ],
+                acciones=[
+                    Accion(tema.icono("editar"), "#6366F1", "#4F46E5", lambda c: self.show_form(mode="editar", cliente=c)),
+                    Accion(tema.icono("eliminar"), "#EF4444", "#DC2626", self.eliminar_cliente),
+                ],
+                clave='id_cliente',
+                alto_fila=50,
+                al_seleccionar=self.select_cliente
+            )
+            self.tabla.grid(row=0, column=0, rowspan=2, sticky="nsew")
+            return
+        
+        headers_frame = ctk.CTkFrame(table_frame, fg_color=tema.GRIS_50, corner_radius=0, height=45)
         headers_frame.grid(row=0, column=0, sticky="ew")
         headers_frame.grid_propagate(False)
         
@@ -97,8 +138,7 @@ class ClienteView(ctk.CTkFrame):
         weights = [1, 3, 2, 3, 3, 1]
         
         # Configurar columnas del header
-        for i, weight in enumerate(weights):
-            headers_frame.grid_columnconfigure(i, weight=weight)
+        self.configurar_columnas(headers_frame, weights)
         
         # Crear encabezados con celdas para alineación perfecta
         for i, header in enumerate(headers):
@@ -109,13 +149,13 @@ class ClienteView(ctk.CTkFrame):
             label = ctk.CTkLabel(
                 header_cell,
                 text=header,
-                font=ctk.CTkFont(family="Inter", size=13, weight="bold"),
-                text_color="#1F2937",
+                font=tema.fuente(13, "bold"),
+                text_color=tema.GRIS_800,
                 anchor="center"
             )
             label.place(relx=0.5, rely=0.5, anchor="center")
         
-        self.table_scroll = ctk.CTkScrollableFrame(table_frame, fg_color="#FFFFFF")
+        self.table_scroll = ctk.CTkScrollableFrame(table_frame, fg_color=tema.BLANCO)
         self.table_scroll.grid(row=1, column=0, sticky="nsew")
         self.table_scroll.grid_columnconfigure(0, weight=1)
     
@@ -126,161 +166,96 @@ class ClienteView(ctk.CTkFrame):
     
     def load_clientes(self):
         """Carga los clientes en la tabla"""
-        for widget in self.table_scroll.winfo_children():
-            widget.destroy()
+        if self.tabla is None:
+            for widget in self.table_scroll.winfo_children():
+                widget.destroy()
+        self.iniciar_filas()
         
-        success, result = ClienteController.obtener_todos()
+        success, result = ClienteController.obtener_todos(compacto=True)
         
         if not success:
             messagebox.showerror("Error", result)
             return
         
+        if self.tabla is not None:
+            self.tabla.cargar(result)
+            return
+        
         for i, cliente in enumerate(result):
-            row_frame = ctk.CTkFrame(
-                self.table_scroll,
-                fg_color="#FFFFFF" if i % 2 == 0 else "#F9FAFB",
-                corner_radius=0,
-                height=50
-            )
-            row_frame.grid(row=i, column=0, sticky="ew", pady=1)
-            row_frame.grid_propagate(False)
-            row_frame.grid_columnconfigure(0, weight=1)
-            
-            # Configurar cursor para toda la fila
-            row_frame.configure(cursor="hand2")
-            
-            # Aplicar eventos de clic a toda la fila y sus hijos
-            self.bind_click_recursive(row_frame, cliente, row_frame)
-            
-            # Eventos hover
-            row_frame.bind("<Enter>", lambda e, rf=row_frame: rf.configure(fg_color="#DBEAFE") if rf != self.selected_row_frame else None)
-            row_frame.bind("<Leave>", lambda e, rf=row_frame, idx=i: rf.configure(
-                fg_color="#BFDBFE" if rf == self.selected_row_frame else ("#FFFFFF" if idx % 2 == 0 else "#F9FAFB")
-            ))
-            
-            data_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-            data_frame.pack(fill="both", expand=True, padx=10, pady=5)
-            
-            weights = [1, 3, 2, 3, 3, 1]
-            values = [
-                cliente['id_cliente'],
-                cliente['nombre'],
-                cliente['telefono'] or "N/A",
-                cliente['correo'] or "N/A",
-                cliente['direccion'] or "N/A"
-            ]
-            
-            # Configurar columnas
-            for col, weight in enumerate(weights):
-                data_frame.grid_columnconfigure(col, weight=weight)
-            
-            # Crear celdas centradas para los datos
-            for j, value in enumerate(values):
-                cell_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=40)
-                cell_frame.grid(row=0, column=j, sticky="nsew", padx=5)
-                cell_frame.grid_propagate(False)
-                
-                label = ctk.CTkLabel(
-                    cell_frame,
-                    text=str(value),
-                    font=ctk.CTkFont(family="Inter", size=12),
-                    text_color="#374151",
-                    anchor="center"
-                )
-                label.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Frame para botones de acción con diseño profesional
-            actions_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=40)
-            actions_frame.grid(row=0, column=len(values), sticky="nsew", padx=5)
-            actions_frame.grid_propagate(False)
-            
-            buttons_container = ctk.CTkFrame(actions_frame, fg_color="transparent")
-            buttons_container.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Botón Editar con diseño moderno
-            btn_editar = ctk.CTkButton(
-                buttons_container,
-                text="",
-                width=40,
-                height=40,
-                fg_color="#6366F1",
-                hover_color="#4F46E5",
-                corner_radius=10,
-                border_width=0,
-                command=lambda c=cliente: self.show_form(mode="editar", cliente=c)
-            )
-            btn_editar.pack(side="left", padx=4)
-            
-            # Ícono de editar (lápiz) con mejor diseño
-            icon_edit_label = ctk.CTkLabel(
-                btn_editar,
-                text="✎",
-                font=ctk.CTkFont(family="Segoe UI Symbol", size=18, weight="bold"),
-                text_color="#FFFFFF"
-            )
-            icon_edit_label.place(relx=0.5, rely=0.5, anchor="center")
-            icon_edit_label.configure(cursor="hand2")
-            icon_edit_label.bind("<Button-1>", lambda e, c=cliente: self.show_form(mode="editar", cliente=c))
-            
-            # Botón Eliminar con diseño moderno
-            btn_eliminar = ctk.CTkButton(
-                buttons_container,
-                text="",
-                width=40,
-                height=40,
-                fg_color="#EF4444",
-                hover_color="#DC2626",
-                corner_radius=10,
-                border_width=0,
-                command=lambda c=cliente: self.eliminar_cliente(c)
-            )
-            btn_eliminar.pack(side="left", padx=4)
-            
-            # Ícono de eliminar (papelera) con mejor diseño
-            icon_delete_label = ctk.CTkLabel(
-                btn_eliminar,
-                text="🗑",
-                font=ctk.CTkFont(family="Segoe UI Emoji", size=18),
-                text_color="#FFFFFF"
-            )
-            icon_delete_label.place(relx=0.5, rely=0.5, anchor="center")
-            icon_delete_label.configure(cursor="hand2")
-            icon_delete_label.bind("<Button-1>", lambda e, c=cliente: self.eliminar_cliente(c))
+            self.crear_fila(i, cliente)
     
-    def bind_click_recursive(self, widget, cliente, row_frame):
-        """Vincula eventos de clic a un widget y todos sus hijos recursivamente"""
-        # Excluir botones de acción del binding recursivo
-        widget_class = widget.winfo_class()
-        if 'Button' in widget_class:
-            return
+    def crear_fila(self, i, cliente):
+        """Crea la fila de la tabla para un registro y la guarda en el índice de filas"""
+        row_frame = ctk.CTkFrame(
+            self.table_scroll,
+            fg_color=tema.COLORES_FILA[i % 2],
+            corner_radius=0,
+            height=50
+        )
+        row_frame.grid(row=i, column=0, sticky="ew", pady=1)
+        row_frame.grid_propagate(False)
+        row_frame.grid_columnconfigure(0, weight=1)
+        
+        # Configurar cursor para toda la fila
+        row_frame.configure(cursor="hand2")
         
-        # Vincular el evento de clic
-        widget.bind("<Button-1>", lambda e: self.select_cliente(cliente, row_frame))
+        # Los clics y el hover de la fila se delegan al registrarla (ver FilasEnVivo)
         
-        # Aplicar recursivamente a todos los hijos
-        for child in widget.winfo_children():
-            self.bind_click_recursive(child, cliente, row_frame)
+        data_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
+        data_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        weights = [1, 3, 2, 3, 3, 1]
+        values = [
+            cliente['id_cliente'],
+            cliente['nombre'],
+            cliente['telefono'] or "N/A",
+            cliente['correo'] or "N/A",
+            cliente['direccion'] or "N/A"
+        ]
+        
+        # Configurar columnas
+        self.configurar_columnas(data_frame, weights)
+        
+        # Crear celdas centradas para los datos
+        for j, value in enumerate(values):
+            self.crear_celda(data_frame, j, str(value), 40)
+        
+        # Botones de acción
+        self.crear_acciones(data_frame, len(values), 40, [
+            ("editar", tema.BOTON_PRIMARIO, tema.fuente(18, "bold", familia="Segoe UI Symbol"), lambda c=cliente: self.show_form(mode="editar", cliente=c)),
+            ("eliminar", tema.BOTON_PELIGRO, tema.fuente_iconos(18), lambda c=cliente: self.eliminar_cliente(c)),
+        ])
+        
+        self.registrar_fila(cliente['id_cliente'], cliente, row_frame, i)
+        return row_frame
     
     def select_cliente(self, cliente, row_frame=None):
         """Selecciona un cliente de la tabla con resaltado visual"""
-        # Restaurar color de la fila previamente seleccionada
-        if self.selected_row_frame:
-            try:
-                idx = list(self.table_scroll.winfo_children()).index(self.selected_row_frame)
-                self.selected_row_frame.configure(fg_color="#FFFFFF" if idx % 2 == 0 else "#F9FAFB")
-            except:
-                pass
-        
-        # Seleccionar el nuevo cliente
+        self.marcar_seleccion(cliente['id_cliente'], row_frame)
         self.selected_cliente = cliente
-        self.selected_row_frame = row_frame
-        
-        # Resaltar la nueva fila seleccionada
-        if row_frame:
-            row_frame.configure(fg_color="#BFDBFE")
         
         print(f"✓ Cliente seleccionado: {cliente['nombre']} (ID: {cliente['id_cliente']})")
     
+    def obtener_fila(self, id_cliente):
+        """Fila de lista de un cliente para actualizarla en la tabla"""
+        return ClienteController.obtener_fila(id_cliente)
+    
+    def clave_orden(self, cliente):
+        """Orden alfabético, como ClienteModel.obtener_todos"""
+        return (cliente['nombre'] or "").lower()
+    
+    def filtro_activo(self):
+        """Indica si la tabla muestra resultados de búsqueda"""
+        return bool(self.search_entry.get().strip())
+    
+    def recargar(self):
+        """Recarga la tabla respetando la búsqueda actual"""
+        self.search_clientes()
+    
+    def limpiar_seleccion(self):
+        """Olvida el cliente seleccionado"""
+        self.selected_cliente = None
+    
     def search_clientes(self, event=None):
         """Busca clientes por criterio"""
         criterio = self.search_entry.get().strip()
@@ -290,11 +265,17 @@ class ClienteView(ctk.CTkFrame):
             return
         
         # Limpiar tabla
-        for widget in self.table_scroll.winfo_children():
-            widget.destroy()
+        if self.tabla is None:
+            for widget in self.table_scroll.winfo_children():
+                widget.destroy()
+        self.iniciar_filas()
         
         # Buscar clientes
-        success, result = ClienteController.buscar_clientes(criterio)
+        success, result = ClienteController.buscar_clientes(criterio, compacto=True)
+        
+        if success and self.tabla is not None:
+            self.tabla.cargar(result, al_inicio=True)
+            return
         
         if not success:
             messagebox.showerror("Error", result)
@@ -304,7 +285,7 @@ class ClienteView(ctk.CTkFrame):
             for i, cliente in enumerate(result):
                 row_frame = ctk.CTkFrame(
                     self.table_scroll,
-                    fg_color="#FFFFFF" if i % 2 == 0 else "#F9FAFB",
+                    fg_color=tema.COLORES_FILA[i % 2],
                     corner_radius=0,
                     height=50
                 )
@@ -337,8 +318,8 @@ class ClienteView(ctk.CTkFrame):
                     label = ctk.CTkLabel(
                         cell_frame,
                         text=str(value),
-                        font=ctk.CTkFont(family="Inter", size=12),
-                        text_color="#374151",
+                        font=tema.fuente(12),
+                        text_color=tema.GRIS_700,
                         anchor="center"
                     )
                     label.place(relx=0.5, rely=0.5, anchor="center")
@@ -357,9 +338,8 @@ class ClienteView(ctk.CTkFrame):
                     text="",
                     width=40,
                     height=40,
-                    fg_color="#6366F1",
-                    hover_color="#4F46E5",
-                    corner_radius=10,
+                    **tema.BOTON_PRIMARIO,
+                    corner_radius=tema.radio(10),
                     border_width=0,
                     command=lambda c=cliente: self.show_form(mode="editar", cliente=c)
                 )
@@ -369,8 +349,8 @@ class ClienteView(ctk.CTkFrame):
                 icon_edit_label = ctk.CTkLabel(
                     btn_editar,
                     text="✎",
-                    font=ctk.CTkFont(family="Segoe UI Symbol", size=18, weight="bold"),
-                    text_color="#FFFFFF"
+                    font=tema.fuente(18, "bold", familia="Segoe UI Symbol"),
+                    text_color=tema.BLANCO
                 )
                 icon_edit_label.place(relx=0.5, rely=0.5, anchor="center")
                 icon_edit_label.configure(cursor="hand2")
@@ -382,9 +362,8 @@ class ClienteView(ctk.CTkFrame):
                     text="",
                     width=40,
                     height=40,
-                    fg_color="#EF4444",
-                    hover_color="#DC2626",
-                    corner_radius=10,
+                    **tema.BOTON_PELIGRO,
+                    corner_radius=tema.radio(10),
                     border_width=0,
                     command=lambda c=cliente: self.eliminar_cliente(c)
                 )
@@ -394,8 +373,8 @@ class ClienteView(ctk.CTkFrame):
                 icon_delete_label = ctk.CTkLabel(
                     btn_eliminar,
                     text="🗑",
-                    font=ctk.CTkFont(family="Segoe UI Emoji", size=18),
-                    text_color="#FFFFFF"
+                    font=tema.fuente_iconos(18),
+                    text_color=tema.BLANCO
                 )
                 icon_delete_label.place(relx=0.5, rely=0.5, anchor="center")
                 icon_delete_label.configure(cursor="hand2")
@@ -414,47 +393,45 @@ class ClienteView(ctk.CTkFrame):
         self.show_form(mode="editar", cliente=self.selected_cliente)
     
     def show_form(self, mode="nuevo", cliente=None):
-        """Muestra el formulario de cliente"""
-        form_window = ctk.CTkToplevel(self)
-        form_window.title("Nuevo Cliente" if mode == "nuevo" else "Editar Cliente")
-        
-        # Calcular tamaño dinámico (70% de la altura de pantalla, máx 600px)
-        screen_height = form_window.winfo_screenheight()
-        window_height = min(int(screen_height * 0.7), 600)
-        window_width = 550
-        
-        form_window.geometry(f"{window_width}x{window_height}")
-        form_window.resizable(True, True)  # Permitir redimensionar
-        form_window.minsize(450, 400)  # Tamaño mínimo
-        
-        # Centrar ventana
-        form_window.transient(self)
-        
-        # Centrar en la pantalla
-        form_window.update_idletasks()
-        form_window.grab_set()
+        """Muestra el formulario de cliente (se construye una vez y se reutiliza)"""
+        ventana = pool_formularios.obtener("cliente", self, ClienteView.crear_formulario)
+        campos = ventana.campos
+        titulo = "Nuevo Cliente" if mode == "nuevo" else "Editar Cliente"
+        campos['titulo'].configure(text=titulo)
+        
+        # Llenar los campos (vacíos si es un cliente nuevo)
+        for field_name, entry in campos['entries'].items():
+            entry.delete(0, "end")
+            if mode == "editar" and cliente:
+                value = cliente[field_name] or ""
+                entry.insert(0, str(value))
         
-        screen_width = form_window.winfo_screenwidth()
-        x = (screen_width // 2) - (window_width // 2)
-        y = (screen_height // 2) - (window_height // 2)
-        form_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        ventana.conectar(guardar=lambda: self.save_cliente(mode, campos['entries'], ventana, cliente))
+        ventana.mostrar(titulo, enfocar=campos['entries']['nombre'])
+    
+    @staticmethod
+    def crear_formulario(parent):
+        """Construye la ventana del formulario de clientes (una vez por aplicación, ver view/formularios.py)"""
+        # Tamaño dinámico (70% de la altura de pantalla, máx 600px)
+        ventana = VentanaFormulario(parent, ancho=550, alto_maximo=600, proporcion=0.7, minimo=(450, 400))
         
-        main_frame = ctk.CTkFrame(form_window, fg_color="#F5F7FA")
+        main_frame = ctk.CTkFrame(ventana, fg_color="#F5F7FA", corner_radius=tema.radio(6))
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         title = ctk.CTkLabel(
             main_frame,
-            text="Nuevo Cliente" if mode == "nuevo" else "Editar Cliente",
-            font=ctk.CTkFont(family="Inter", size=22, weight="bold"),
-            text_color="#1F2937"
+            text="Nuevo Cliente",
+            font=tema.fuente(22, "bold"),
+            text_color=tema.GRIS_800
         )
         title.pack(pady=(0, 20))
         
-        form_frame = ctk.CTkFrame(main_frame, fg_color="#FFFFFF", corner_radius=10)
+        form_frame = ctk.CTkFrame(main_frame, fg_color=tema.BLANCO, corner_radius=tema.radio(10))
         form_frame.pack(fill="both", expand=True, padx=0, pady=0)
         
         scroll_frame = ctk.CTkScrollableFrame(form_frame, fg_color="transparent")
         scroll_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        ventana.scroll_frame = scroll_frame
         
         fields = [
             ("Nombre:", "nombre"),
@@ -469,8 +446,8 @@ class ClienteView(ctk.CTkFrame):
             label = ctk.CTkLabel(
                 scroll_frame,
                 text=label_text,
-                font=ctk.CTkFont(family="Inter", size=12, weight="bold"),
-                text_color="#6B7280",
+                font=tema.fuente(12, "bold"),
+                text_color=tema.GRIS_500,
                 anchor="w"
             )
             label.pack(anchor="w", pady=(15 if i == 0 else 10, 5))
@@ -478,21 +455,11 @@ class ClienteView(ctk.CTkFrame):
             entry = ctk.CTkEntry(
                 scroll_frame,
                 height=40,
-                border_width=1,
-                border_color="#E5E7EB",
-                fg_color="#F9FAFB",
-                corner_radius=8,
-                font=ctk.CTkFont(family="Inter", size=13)
+                **tema.entrada(),
+                font=tema.fuente(13)
             )
             entry.pack(fill="x")
             entries[field_name] = entry
-            
-            if mode == "editar" and cliente:
-                value = cliente[field_name] or ""
-                entry.insert(0, str(value))
-            
-            if i == 0:
-                entry.focus()
         
         buttons_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
         buttons_frame.pack(pady=20)
@@ -500,28 +467,29 @@ class ClienteView(ctk.CTkFrame):
         btn_guardar = ctk.CTkButton(
             buttons_frame,
             text="  Guardar",
-            command=lambda: self.save_cliente(mode, entries, form_window, cliente),
-            font=ctk.CTkFont(family="Inter", size=14, weight="bold"),
+            command=lambda: ventana.ejecutar('guardar'),
+            font=tema.fuente(14, "bold"),
             height=45,
             width=140,
-            fg_color="#10B981",
-            hover_color="#059669",
-            corner_radius=10
+            **tema.BOTON_EXITO,
+            corner_radius=tema.radio(10)
         )
         btn_guardar.pack(side="left", padx=10)
         
         btn_cancelar = ctk.CTkButton(
             buttons_frame,
             text="  Cancelar",
-            command=form_window.destroy,
-            font=ctk.CTkFont(family="Inter", size=14),
+            command=ventana.ocultar,
+            font=tema.fuente(14),
             height=45,
             width=140,
-            fg_color="#6B7280",
-            hover_color="#4B5563",
-            corner_radius=10
+            **tema.BOTON_SECUNDARIO,
+            corner_radius=tema.radio(10)
         )
         btn_cancelar.pack(side="left", padx=10)
+        
+        ventana.campos = {'titulo': title, 'entries': entries}
+        return ventana
     
     def save_cliente(self, mode, entries, window, cliente=None):
         """Guarda el cliente (crear o actualizar)"""
@@ -539,8 +507,8 @@ class ClienteView(ctk.CTkFrame):
             )
         
         if success:
-            # Destruir ventana primero para evitar que se sobreponga
-            window.destroy()
+            # Ocultar la ventana primero para evitar que se sobreponga
+            window.ocultar()
             # Recargar datos
             self.load_clientes()
             # Mostrar mensaje después
@@ -567,11 +535,39 @@ class ClienteView(ctk.CTkFrame):
         else:
             messagebox.showerror("Error", result)
     
+    def exportar_csv(self):
+        """
+        Exporta la lista de clientes a CSV en segundo plano
+        db.stream lee con su propia conexión, así que la ventana sigue respondiendo
+        """
+        dispatcher = getattr(self.winfo_toplevel(), "dispatcher", None)
+        if dispatcher is None:
+            self.al_exportar_csv(ClienteController.exportar_csv())
+            return
+        self.btn_exportar.configure(state="disabled")
+        dispatcher.run_in_background(ClienteController.exportar_csv, self.al_exportar_csv)
+    
+    def al_exportar_csv(self, resultado):
+        """Resultado de la exportación (en el hilo de Tk)"""
+        if self.winfo_exists():
+            self.btn_exportar.configure(state="normal")
+        if isinstance(resultado, Exception):
+            resultado = (False, str(resultado))
+        success, result = resultado
+        if not success:
+            messagebox.showerror("Error", f"No se pudo exportar: {result}")
+            return
+        
+        output_path, filas = result
+        messagebox.showinfo("CSV Generado", f"Se exportaron {filas} clientes a:\n{output_path}")
+    
     def generar_pdf(self):
         """Genera un PDF con la lista de clientes e invoca el diálogo de impresión"""
+        from utils.printer import pdf_generator
+        
         try:
-            # Obtener todos los clientes
-            success, result = ClienteController.obtener_todos()
+            # Recorrer los clientes por lotes sin cargar la tabla completa
+            success, result = ClienteController.iterar_todos()
             
             if not success:
                 messagebox.showerror("Error", f"No se pudieron obtener los clientes: {result}")
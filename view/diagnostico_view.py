@@ -0,0 +1,110 @@
+"""
+Panel de diagnóstico de consultas
+Muestra las métricas de model/instrumentacion.py: histograma de latencias y
+las consultas con más tiempo acumulado. Se abre con Ctrl+Shift+D
+"""
+import customtkinter as ctk
+from view import tema
+from tkinter import messagebox
+from model.instrumentacion import metricas_consultas
+
+ORDENES = {
+    "Tiempo total": "total_ms",
+    "Llamadas": "llamadas",
+    "Máximo": "max_ms",
+    "Filas": "filas",
+    "Bytes": "bytes",
+}
+
+
+class DiagnosticoDialog(ctk.CTkToplevel):
+    """Ventana con las métricas de consultas de la sesión"""
+
+    def __init__(self, parent, metricas=None, top=20):
+        super().__init__(parent)
+
+        self.metricas = metricas or metricas_consultas
+        self.top = top
+
+        self.title("Diagnóstico de consultas")
+        self.geometry("1000x600")
+        self.transient(parent)
+
+        self.create_widgets()
+        self.refrescar()
+
+    def create_widgets(self):
+        """Crea los controles y el área de texto"""
+        toolbar = ctk.CTkFrame(self, fg_color=tema.BLANCO, corner_radius=0)
+        toolbar.pack(fill="x")
+
+        self.orden_var = ctk.StringVar(value="Tiempo total")
+        orden_menu = ctk.CTkOptionMenu(
+            toolbar,
+            values=list(ORDENES),
+            variable=self.orden_var,
+            command=lambda _: self.refrescar(),
+            width=150,
+            corner_radius=tema.radio(6)
+        )
+        orden_menu.pack(side="left", padx=10, pady=10)
+
+        for texto, comando, color in (
+            ("Actualizar", self.refrescar, "#6366F1"),
+            ("Exportar JSON", self.exportar, "#10B981"),
+            ("Reiniciar", self.reiniciar, "#EF4444"),
+        ):
+            ctk.CTkButton(
+                toolbar, text=texto, command=comando, width=120, fg_color=color,
+                corner_radius=tema.radio(6)
+            ).pack(
+                side="left", padx=5, pady=10
+            )
+
+        self.texto = ctk.CTkTextbox(
+            self, font=tema.fuente(12, familia="Courier"), wrap="none", corner_radius=tema.radio(6)
+        )
+        self.texto.pack(fill="both", expand=True, padx=10, pady=10)
+
+    def refrescar(self):
+        """Vuelve a leer las métricas y las muestra"""
+        resumen = self.metricas.resumen(top=self.top, orden=ORDENES[self.orden_var.get()])
+
+        lineas = [
+            f"Desde: {resumen['desde']}    Umbral de consulta lenta: {resumen['umbral_lento_ms']:.0f} ms",
+            f"Log de consultas lentas: {self.metricas.log_lentas}",
+            "",
+            "Histograma de latencias (todas las consultas)",
+        ]
+        maximo = max(resumen['histograma'].values(), default=0) or 1
+        for etiqueta, cantidad in resumen['histograma'].items():
+            barra = "█" * int(40 * cantidad / maximo)
+            lineas.append(f"  {etiqueta:>10} {cantidad:>7}  {barra}")
+
+        lineas += [
+            "",
+            f"{'llamadas':>8} {'total ms':>10} {'media ms':>9} {'máx ms':>8} {'filas':>9} {'bytes':>11} {'origen':>7}  consulta",
+        ]
+        for c in resumen['consultas']:
+            lineas.append(
+                f"{c['llamadas']:>8} {c['total_ms']:>10.1f} {c['media_ms']:>9.2f} {c['max_ms']:>8.1f} "
+                f"{c['filas']:>9} {c['bytes']:>11} {c['origen']:>7}  {c['consulta'][:160]}"
+            )
+
+        self.texto.configure(state="normal")
+        self.texto.delete("1.0", "end")
+        self.texto.insert("1.0", "\n".join(lineas))
+        self.texto.configure(state="disabled")
+
+    def exportar(self):
+        """Guarda todas las métricas en un JSON de la carpeta output"""
+        try:
+            ruta = self.metricas.exportar_json()
+            messagebox.showinfo("Métricas exportadas", f"Archivo guardado en:\n{ruta}", parent=self)
+        except OSError as e:
+            messagebox.showerror("Error", f"No se pudo exportar: {e}", parent=self)
+
+    def reiniciar(self):
+        """Descarta las métricas acumuladas"""
+        self.metricas.reiniciar()
+        self.refrescar()
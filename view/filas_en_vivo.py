@@ -0,0 +1,360 @@
+"""
+Actualización puntual de las filas de una tabla
+Las vistas de autos, clientes y ventas guardan un índice id -> fila y, al
+recibir cambios de otros equipos (model/cambios.py), reconstruyen solo las
+filas afectadas en lugar de recargar la tabla completa (o, con TablaCanvas,
+actualizan solo esos registros)
+
+Los clics y el resaltado de las filas se resuelven con una sola etiqueta de
+eventos (bindtag) compartida por todas las tablas: cada widget de una fila
+recibe la etiqueta y el manejador sube por los padres hasta la fila y la
+vista, así que no se crea un lambda por widget ni se recorre la tabla al
+seleccionar
+
+Las filas se arman con crear_celda y crear_acciones, que con el perfil de
+rendimiento (view/tema.py) ponen las etiquetas directo en la fila y el ícono
+como texto del botón, sin frames intermedios
+"""
+import customtkinter as ctk
+
+from view import tema
+
+# Etiqueta de eventos de los widgets de las filas (una sola para toda la aplicación)
+ETIQUETA_FILA = "FilaTabla"
+
+
+class Seleccion:
+    """Registro seleccionado de una tabla: su id y la posición de su fila"""
+
+    __slots__ = ("id", "indice")
+
+    def __init__(self):
+        self.limpiar()
+
+    def fijar(self, id_registro, indice=None):
+        self.id = id_registro
+        self.indice = indice
+
+    def limpiar(self):
+        self.id = None
+        self.indice = None
+
+    def __bool__(self):
+        return self.id is not None
+
+
+class FilasEnVivo:
+    """
+    Mezcla para vistas con tabla de filas CTkFrame
+
+    La vista debe definir:
+        tabla: TablaCanvas de la vista (o None si usa filas de widgets)
+        table_scroll: Contenedor de las filas
+        al_seleccionar_fila(registro, row_frame): Se llama al hacer clic en una fila
+        crear_fila(i, registro): Crea y retorna el frame de la fila
+        obtener_fila(id_registro): (success, registro/None) con las columnas de lista
+        clave_orden(registro): Clave con la que se ordena la tabla
+        filtro_activo(): True si la tabla muestra una búsqueda
+        recargar(): Vuelve a cargar la tabla completa
+        limpiar_seleccion(): Olvida el registro seleccionado
+    """
+
+    # Con más cambios que estos en una sola entrega es más barato recargar
+    MAX_CAMBIOS_EN_SITIO = 50
+
+    COLORES_FILA = tema.COLORES_FILA
+    COLOR_SELECCION = tema.COLOR_SELECCION
+
+    def iniciar_filas(self):
+        """Olvida el índice de filas (llamar al limpiar la tabla)"""
+        self.filas = {}
+        self._fila_hover = None
+        if not hasattr(self, "seleccion"):
+            self.seleccion = Seleccion()
+        registrar_eventos_fila(self)
+
+    def configurar_columnas(self, frame, pesos):
+        """
+        Pesos de las columnas de una fila o del encabezado
+        Con el perfil de rendimiento las columnas son exactamente proporcionales
+        (grupo uniforme) porque las celdas no tienen frames de ancho fijo
+        """
+        uniforme = "columnas" if tema.perfil_rendimiento() else None
+        for col, peso in enumerate(pesos):
+            frame.grid_columnconfigure(col, weight=peso, uniform=uniforme)
+
+    def crear_celda(self, data_frame, columna, texto, alto):
+        """Celda de texto centrada de una fila"""
+        if tema.perfil_rendimiento():
+            label = ctk.CTkLabel(
+                data_frame,
+                text=texto,
+                font=tema.fuente(12),
+                text_color=tema.COLOR_TEXTO,
+                height=alto,
+                anchor="center"
+            )
+            label.grid(row=0, column=columna, sticky="nsew", padx=5)
+            return label
+
+        cell_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=alto)
+        cell_frame.grid(row=0, column=columna, sticky="nsew", padx=5)
+        cell_frame.grid_propagate(False)
+
+        label = ctk.CTkLabel(
+            cell_frame,
+            text=texto,
+            font=tema.fuente(12),
+            text_color=tema.COLOR_TEXTO,
+            anchor="center"
+        )
+        label.place(relx=0.5, rely=0.5, anchor="center")
+        return label
+
+    def crear_acciones(self, data_frame, columna, alto, acciones):
+        """
+        Botones de acción de una fila
+
+        Args:
+            acciones: Lista de (clave del ícono, estilo de tema, fuente del ícono, comando)
+        """
+        rendimiento = tema.perfil_rendimiento()
+        if rendimiento:
+            buttons_container = ctk.CTkFrame(data_frame, fg_color="transparent")
+            buttons_container.grid(row=0, column=columna, padx=5)
+        else:
+            actions_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=alto)
+            actions_frame.grid(row=0, column=columna, sticky="nsew", padx=5)
+            actions_frame.grid_propagate(False)
+
+            buttons_container = ctk.CTkFrame(actions_frame, fg_color="transparent")
+            buttons_container.place(relx=0.5, rely=0.5, anchor="center")
+
+        for clave, estilo, fuente, comando in acciones:
+            boton = ctk.CTkButton(
+                buttons_container,
+                text=tema.icono(clave) if rendimiento else "",
+                font=tema.fuente_iconos() if rendimiento else None,
+                width=40,
+                height=40,
+                **estilo,
+                corner_radius=tema.radio(10),
+                border_width=0,
+                command=comando
+            )
+            boton.pack(side="left", padx=4)
+            if rendimiento:
+                continue
+
+            # Ícono centrado sobre el botón (el texto del botón no centra bien los emoji)
+            icono = ctk.CTkLabel(boton, text=tema.icono(clave), font=fuente, text_color=tema.BLANCO)
+            icono.place(relx=0.5, rely=0.5, anchor="center")
+            icono.configure(cursor="hand2")
+            icono.bind("<Button-1>", lambda e, c=comando: c())
+
+    def registrar_fila(self, id_registro, registro, row_frame, indice):
+        """Guarda la fila en el índice junto con su registro y posición, y le delega los eventos"""
+        row_frame.id_registro = id_registro
+        row_frame.registro = registro
+        row_frame.indice = indice
+        self.filas[id_registro] = row_frame
+        delegar_eventos(row_frame)
+        if self.seleccion.id == id_registro:
+            # La fila del registro seleccionado se volvió a crear (recarga o cambio)
+            self.seleccion.indice = indice
+            row_frame.configure(fg_color=self.COLOR_SELECCION)
+
+    @property
+    def selected_row_frame(self):
+        """Fila seleccionada (o None)"""
+        return self.filas.get(self.seleccion.id)
+
+    def marcar_seleccion(self, id_registro, row_frame=None):
+        """
+        Selecciona el registro y resalta su fila (O(1): solo se repintan la fila
+        anterior y la nueva)
+        """
+        anterior = self.selected_row_frame
+        self.seleccion.fijar(id_registro, getattr(row_frame, "indice", None))
+        if anterior is not None and anterior is not row_frame:
+            try:
+                anterior.configure(fg_color=self.color_fila(anterior))
+            except Exception:
+                pass
+        if row_frame is not None:
+            row_frame.configure(fg_color=self.COLOR_SELECCION)
+
+    def color_fila(self, row_frame):
+        """Color de fondo que corresponde a la fila según su posición y selección"""
+        if self.seleccion and getattr(row_frame, "id_registro", None) == self.seleccion.id:
+            return self.COLOR_SELECCION
+        return self.COLORES_FILA[getattr(row_frame, "indice", 0) % 2]
+
+    def aplicar_cambios(self, cambios):
+        """
+        Aplica en la tabla los cambios recibidos del notificador
+
+        Args:
+            cambios: dict {id_registro: 'INSERT' | 'UPDATE' | 'DELETE'}
+        """
+        if not self.winfo_exists():
+            return
+
+        if self.filtro_activo() or len(cambios) > self.MAX_CAMBIOS_EN_SITIO:
+            self.recargar()
+            return
+
+        if self.tabla is not None:
+            self.aplicar_cambios_tabla(cambios)
+            return
+
+        seleccionado = None
+        for id_registro, operacion in cambios.items():
+            registro = None
+            if operacion != 'DELETE':
+                success, registro = self.obtener_fila(id_registro)
+                if not success:
+                    self.recargar()
+                    return
+
+            anterior = self.filas.pop(id_registro, None)
+            if anterior is not None:
+                if anterior is self._fila_hover:
+                    self._fila_hover = None
+                anterior.destroy()
+
+            if registro is not None:
+                self.crear_fila(len(self.filas), registro)
+                if self.seleccion.id == id_registro:
+                    seleccionado = registro
+
+        self.reordenar_filas()
+        self.reconciliar_seleccion(seleccionado, self.seleccion.id in self.filas)
+
+    def aplicar_cambios_tabla(self, cambios):
+        """Aplica los cambios sobre los registros de la TablaCanvas"""
+        seleccionado = None
+        for id_registro, operacion in cambios.items():
+            registro = None
+            if operacion != 'DELETE':
+                success, registro = self.obtener_fila(id_registro)
+                if not success:
+                    self.recargar()
+                    return
+
+            if registro is not None:
+                self.tabla.reemplazar(id_registro, registro)
+                if self.seleccion.id == id_registro:
+                    seleccionado = registro
+            else:
+                self.tabla.quitar(id_registro)
+
+        self.tabla.ordenar(self.clave_orden)
+        self.reconciliar_seleccion(seleccionado, self.tabla.registro(self.seleccion.id) is not None)
+
+    def reconciliar_seleccion(self, seleccionado, sigue_en_tabla):
+        """
+        Ajusta la selección después de aplicar cambios: si el registro
+        seleccionado ya no está en la tabla se olvida; si cambió, la vista
+        recibe el registro nuevo (para editar o imprimir con los datos actuales)
+
+        Args:
+            seleccionado: Registro nuevo de la fila seleccionada (None si no cambió)
+            sigue_en_tabla (bool): El id seleccionado sigue teniendo fila
+        """
+        if not self.seleccion:
+            return
+        if not sigue_en_tabla:
+            self.seleccion.limpiar()
+            if self.tabla is not None:
+                self.tabla.seleccionar(None)
+            self.limpiar_seleccion()
+        elif seleccionado is not None:
+            self.al_seleccionar_fila(seleccionado, self.selected_row_frame)
+
+    def reordenar_filas(self):
+        """Vuelve a ubicar las filas según clave_orden y restablece la alternancia de colores"""
+        ordenadas = sorted(self.filas.values(), key=lambda rf: self.clave_orden(rf.registro))
+        for i, row_frame in enumerate(ordenadas):
+            row_frame.indice = i
+            row_frame.grid_configure(row=i)
+            row_frame.configure(fg_color=self.color_fila(row_frame))
+        fila = self.selected_row_frame
+        if fila is not None:
+            self.seleccion.indice = fila.indice
+
+
+# --- Delegación de eventos ---
+
+def registrar_eventos_fila(widget):
+    """Vincula una sola vez (por intérprete de Tk) los manejadores de ETIQUETA_FILA"""
+    raiz = widget._root()
+    if getattr(raiz, "_eventos_fila", False):
+        return
+    widget.bind_class(ETIQUETA_FILA, "<Button-1>", _al_clic_fila)
+    widget.bind_class(ETIQUETA_FILA, "<Enter>", _al_entrar_fila)
+    widget.bind_class(ETIQUETA_FILA, "<Leave>", _al_salir_fila)
+    raiz._eventos_fila = True
+
+
+def delegar_eventos(widget):
+    """Agrega ETIQUETA_FILA al widget y sus hijos (los botones de acción manejan sus propios clics)"""
+    if isinstance(widget, ctk.CTkButton) or 'Button' in widget.winfo_class():
+        return
+    etiquetas = widget.bindtags()
+    if ETIQUETA_FILA not in etiquetas:
+        widget.bindtags((ETIQUETA_FILA,) + etiquetas)
+    for child in widget.winfo_children():
+        delegar_eventos(child)
+
+
+def _ubicar(widget):
+    """
+    Sube por los padres del widget hasta la fila (frame con id_registro) y la vista
+
+    Returns:
+        tuple: (vista, row_frame) o (None, None)
+    """
+    fila = None
+    while widget is not None and not isinstance(widget, str):
+        if fila is None and hasattr(widget, "id_registro"):
+            fila = widget
+        if isinstance(widget, FilasEnVivo):
+            return (widget, fila) if fila is not None else (None, None)
+        widget = widget.master
+    return None, None
+
+
+def _al_clic_fila(event):
+    vista, fila = _ubicar(event.widget)
+    if fila is not None:
+        vista.al_seleccionar_fila(fila.registro, fila)
+
+
+def _al_entrar_fila(event):
+    if tema.perfil_rendimiento():
+        return
+    vista, fila = _ubicar(event.widget)
+    if fila is None or fila is vista._fila_hover:
+        return
+    anterior = vista._fila_hover
+    vista._fila_hover = fila
+    if anterior is not None and anterior.winfo_exists():
+        anterior.configure(fg_color=vista.color_fila(anterior))
+    if fila.id_registro != vista.seleccion.id:
+        fila.configure(fg_color=tema.COLOR_HOVER)
+
+
+def _al_salir_fila(event):
+    vista, fila = _ubicar(event.widget)
+    if fila is None or fila is not vista._fila_hover:
+        return
+    # Pasar de la fila a uno de sus propios widgets no es salir de la fila
+    try:
+        destino = event.widget.winfo_containing(event.x_root, event.y_root)
+    except (KeyError, RuntimeError):
+        destino = None
+    if destino is not None and _ubicar(destino)[1] is fila:
+        return
+    vista._fila_hover = None
+    fila.configure(fg_color=vista.color_fila(fila))
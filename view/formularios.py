@@ -0,0 +1,191 @@
+"""
+Ventanas de formulario reutilizables
+Los formularios de alta y edición (autos, clientes, ventas) se construyen una
+sola vez: al cerrar se ocultan con withdraw() y la siguiente vez que se abren
+solo se vuelven a llenar los campos. Crear el CTkToplevel con su frame con
+scroll y una docena de entradas costaba cientos de milisegundos en máquinas
+virtuales o con X11 remoto; mostrar una ventana ya construida es inmediato
+
+Las ventanas pertenecen a la ventana principal y no a la vista que las abre
+(las vistas se destruyen al navegar), así que no guardan referencias a la
+vista: los botones llaman a los comandos que la vista conecta al abrirlas
+"""
+import tkinter
+
+import customtkinter as ctk
+
+from view import tema
+
+
+class VentanaFormulario(ctk.CTkToplevel):
+    """
+    CTkToplevel modal que se oculta al cerrar en lugar de destruirse
+
+    La vista que construye el formulario guarda sus widgets en campos y conecta
+    los comandos de los botones en cada apertura (ver conectar y ejecutar)
+    """
+
+    def __init__(self, parent, ancho, alto_maximo, proporcion, minimo):
+        """
+        Args:
+            parent: Ventana principal
+            ancho (int): Ancho de la ventana
+            alto_maximo (int): Alto máximo de la ventana
+            proporcion (float): Fracción del alto de la pantalla que ocupa la ventana
+            minimo (tuple): (ancho, alto) mínimos
+        """
+        super().__init__(parent)
+        self.withdraw()
+
+        self.ancho = ancho
+        self.alto = min(int(self.winfo_screenheight() * proporcion), alto_maximo)
+        self.resizable(True, True)
+        self.minsize(*minimo)
+        self.transient(parent)
+
+        # Perfil de dibujo con el que se construyeron los widgets
+        self.perfil_rendimiento = tema.perfil_rendimiento()
+
+        # Widgets que la vista vuelve a llenar en cada apertura
+        self.campos = {}
+        self.scroll_frame = None
+        self._comandos = {}
+        self._centrada = False
+
+        # Cerrar con la X de la ventana solo la oculta
+        self.protocol("WM_DELETE_WINDOW", self.ocultar)
+
+    def conectar(self, **comandos):
+        """Comandos de los botones para esta apertura (reemplazan a los anteriores)"""
+        self._comandos = comandos
+
+    def ejecutar(self, nombre):
+        """Ejecuta el comando conectado con ese nombre (para los command de los botones)"""
+        comando = self._comandos.get(nombre)
+        if comando is not None:
+            comando()
+
+    def mostrar(self, titulo, enfocar=None):
+        """
+        Muestra la ventana (centrada la primera vez) y toma el foco de la aplicación
+
+        Args:
+            titulo (str): Título de la ventana
+            enfocar: Widget que recibe el foco del teclado
+        """
+        self.title(titulo)
+        if not self._centrada:
+            x = (self.winfo_screenwidth() // 2) - (self.ancho // 2)
+            y = (self.winfo_screenheight() // 2) - (self.alto // 2)
+            self.geometry(f"{self.ancho}x{self.alto}+{x}+{y}")
+            self._centrada = True
+
+        # Cada apertura empieza desde el primer campo
+        canvas = getattr(self.scroll_frame, "_parent_canvas", None)
+        if canvas is not None:
+            canvas.yview_moveto(0)
+
+        self.deiconify()
+        self.lift()
+        self.update_idletasks()
+        try:
+            self.grab_set()
+        except tkinter.TclError:
+            # El gestor de ventanas todavía no la mapeó
+            self.after(50, self._tomar_foco)
+        if enfocar is not None:
+            enfocar.focus_set()
+
+    def _tomar_foco(self):
+        if self.winfo_exists() and self.winfo_viewable():
+            self.grab_set()
+
+    def ocultar(self):
+        """Oculta la ventana para reutilizarla y devuelve el foco a la principal"""
+        try:
+            self.grab_release()
+        except tkinter.TclError:
+            pass
+        self.withdraw()
+        self._comandos = {}
+        self.master.focus_set()
+
+
+class PoolFormularios:
+    """Formularios ya construidos de la aplicación, por nombre"""
+
+    def __init__(self):
+        self._ventanas = {}
+
+    def obtener(self, nombre, widget, construir):
+        """
+        Retorna el formulario, construyéndolo si es la primera vez
+
+        Se vuelve a construir si la ventana se destruyó, si es de otra ventana
+        principal o si cambió el perfil de dibujo (view/tema.py)
+
+        Args:
+            nombre (str): Nombre del formulario
+            widget: Cualquier widget de la aplicación (la ventana es de su ventana principal)
+            construir: Función ventana_principal -> VentanaFormulario
+
+        Returns:
+            VentanaFormulario: Oculta; la vista llena los campos y llama a mostrar()
+        """
+        raiz = widget.winfo_toplevel()
+        ventana = self._ventanas.get(nombre)
+        if ventana is not None and not self._vigente(ventana, raiz):
+            self.descartar(nombre)
+            ventana = None
+
+        if ventana is None:
+            ventana = construir(raiz)
+            self._ventanas[nombre] = ventana
+        return ventana
+
+    def precargar(self, widget, formularios, intervalo_ms=300):
+        """
+        Construye los formularios ocultos de a uno por vuelta del ciclo de eventos
+        para que incluso la primera apertura sea inmediata
+
+        Args:
+            widget: Widget de la aplicación (su after() reparte las construcciones)
+            formularios: Lista de (nombre, construir) como en obtener()
+        """
+        pendientes = list(formularios)
+
+        def siguiente():
+            if not pendientes or not widget.winfo_exists():
+                return
+            nombre, construir = pendientes.pop(0)
+            self.obtener(nombre, widget, construir)
+            widget.after(intervalo_ms, siguiente)
+
+        widget.after(intervalo_ms, siguiente)
+
+    def _vigente(self, ventana, raiz):
+        try:
+            if not ventana.winfo_exists():
+                return False
+        except tkinter.TclError:
+            return False
+        return ventana.master is raiz and ventana.perfil_rendimiento == tema.perfil_rendimiento()
+
+    def descartar(self, nombre=None):
+        """Destruye un formulario (o todos) para que se construya de nuevo"""
+        nombres = [nombre] if nombre is not None else list(self._ventanas)
+        for clave in nombres:
+            ventana = self._ventanas.pop(clave, None)
+            if ventana is None:
+                continue
+            try:
+                ventana.destroy()
+            except tkinter.TclError:
+                pass
+
+    def __len__(self):
+        return len(self._ventanas)
+
+
+# Instancia global de la aplicación
+pool_formularios = PoolFormularios()
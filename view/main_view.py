@@ -2,11 +2,14 @@
 Vista principal de la aplicación
 Contiene el sidebar de navegación y el contenedor principal
 """
+import os
 import customtkinter as ctk
-from view.auto_view import AutoView
-from view.cliente_view import ClienteView
-from view.venta_view import VentaView
+from view import tema
+from view.formularios import pool_formularios
 from model.conexion import db
+from utils.ui_dispatcher import UIDispatcher
+
+# Las vistas se importan al mostrarse por primera vez (ver show_*_view)
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
@@ -17,17 +20,16 @@ class MainApplication(ctk.CTk):
     def __init__(self):
         super().__init__()
         
+        # Perfil de dibujo (AUTOGEST_PERFIL o detección de VM / sesión remota)
+        motivo = tema.detectar_perfil()
+        if motivo:
+            print(f"🐢 Perfil de rendimiento: {motivo}")
+        
         # Configuración de la ventana
         self.title("AutoGest - Sistema de Gestión de Venta de Autos")
         self.geometry("1400x800")
         self.minsize(1200, 700)
         
-        # Conectar a la base de datos
-        success, message = db.connect()
-        if not success:
-            self.show_error_and_exit(message)
-            return
-        
         # Configurar grid
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -42,9 +44,154 @@ class MainApplication(ctk.CTk):
         
         # Vista actual
         self.current_view = None
+        self.connected = False
+        self.migration_warning = None
+        
+        # Tareas de hilos de fondo que deben ejecutarse en el hilo de Tk
+        self.dispatcher = UIDispatcher(self)
+        self.dispatcher.start()
+        
+        # Panel de diagnóstico de consultas
+        self.bind("<Control-Shift-D>", self.show_diagnostico)
+        
+        # Pintar la estructura de inmediato y conectar en segundo plano
+        self.show_skeleton_view()
+        self.boot()
+    
+    def on_fps_medidos(self, fps):
+        """Pasa al perfil de rendimiento si la ventana dibuja pocos cuadros por segundo"""
+        if fps >= tema.FPS_MINIMO or tema.perfil_rendimiento():
+            return
+        tema.usar_perfil(tema.PERFIL_RENDIMIENTO)
+        print(f"🐢 Perfil de rendimiento: {fps:.0f} cuadros por segundo")
+        
+        # Los formularios ya construidos usan el perfil anterior
+        pool_formularios.descartar()
+        
+        # Reconstruir la vista abierta con el nuevo perfil
+        vistas = {
+            'AutoView': self.show_autos_view,
+            'ClienteView': self.show_clientes_view,
+            'VentaView': self.show_ventas_view,
+        }
+        mostrar = vistas.get(type(self.current_view).__name__)
+        if mostrar is not None:
+            mostrar()
+    
+    def boot(self):
+        """Conecta a la base de datos en segundo plano sin bloquear la ventana"""
+        self.set_navigation_enabled(False)
+        self.dispatcher.run_in_background(self.connect_database, self.on_db_connected)
+        # Abrir (y compactar si hace falta) el pack de miniaturas sin bloquear el hilo de Tk
+        from utils.image_loader import ImageLoader
+        self.dispatcher.run_in_background(ImageLoader.open_pack)
+    
+    def connect_database(self):
+        """
+        Conecta y aplica las migraciones pendientes (se ejecuta en un hilo de fondo)
+        
+        Returns:
+            tuple: (success, message)
+        """
+        db.load_config()
+        
+        # Métricas de consultas (DB_INSTRUMENTAR=0 las desactiva)
+        if os.getenv('DB_INSTRUMENTAR', '1') == '1':
+            from model.instrumentacion import metricas_consultas
+            metricas_consultas.umbral_lento_ms = float(os.getenv('DB_CONSULTA_LENTA_MS', '200'))
+            db.usar_instrumentacion(metricas_consultas)
+        
+        # DB_REPLICA_LOCAL=1 sirve las lecturas desde una copia local en SQLite
+        # (solo con el servidor MySQL: con DB_MOTOR=sqlite la base ya es local)
+        replica = None
+        if os.getenv('DB_REPLICA_LOCAL', '0') == '1' and db.motor.nombre == 'mysql':
+            from model.replica import replica_local
+            replica = replica_local
+            replica.abrir()
+            db.usar_replica(replica)
+        
+        success, message = db.connect()
+        if not success:
+            db.connection = None
+            # Sin servidor central se sigue navegando con la última copia local
+            if replica is not None and replica.tiene_datos():
+                replica.iniciar()
+                return True, message
+            return success, message
+        
+        # DB_AUTO_MIGRAR=0 desactiva las migraciones al iniciar (usar python -m model.migraciones)
+        # Si fallan se abre igual con el esquema actual y se avisa (on_db_connected)
+        self.migration_warning = None
+        if os.getenv('DB_AUTO_MIGRAR', '1') == '1':
+            from model.migraciones import GestorMigraciones
+            migrated, result = GestorMigraciones.aplicar_pendientes()
+            if not migrated:
+                print(f"⚠️ {result}")
+                self.migration_warning = result
+        
+        if replica is not None:
+            synced, result = replica.sincronizar(detectar_eliminados=True)
+            if not synced:
+                print(f"⚠️ {result}")
+            replica.iniciar()
+        
+        return True, message
+    
+    def on_db_connected(self, result):
+        """Recibe el resultado de la conexión en el hilo de Tk"""
+        if isinstance(result, Exception):
+            success, message = False, f"Error al conectar: {result}"
+        else:
+            success, message = result
+        
+        if not success:
+            self.show_connection_error(message)
+            return
+        
+        self.connected = True
+        self.set_navigation_enabled(True)
+        
+        # El .env se leyó al conectar: puede definir AUTOGEST_PERFIL
+        rendimiento = tema.perfil_rendimiento()
+        motivo = tema.detectar_perfil()
+        if motivo and not rendimiento:
+            print(f"🐢 Perfil de rendimiento: {motivo}")
+        
+        if db.en_modo_local():
+            self.title("AutoGest - Sin conexión (mostrando la copia local, no se pueden guardar cambios)")
+        elif db.motor.nombre == 'mysql':
+            # Avisar a las vistas de los cambios hechos desde otros equipos
+            from model.cambios import notificador_cambios
+            available, message = notificador_cambios.verificar_triggers()
+            if message:
+                print(f"⚠️ {message}")
+            if available:
+                notificador_cambios.iniciar(self.dispatcher.post)
+            else:
+                print("⚠️ Sin notificación de cambios: las vistas se actualizan al recargarlas")
         
         # Mostrar vista de autos por defecto
         self.show_autos_view()
+        
+        if self.migration_warning:
+            from tkinter import messagebox
+            messagebox.showwarning(
+                "Migraciones pendientes",
+                f"No se pudo actualizar el esquema de la base de datos:\n{self.migration_warning}\n\n"
+                "La aplicación sigue con el esquema actual; algunas funciones pueden fallar. "
+                "El administrador puede aplicar las migraciones con: python -m model.migraciones"
+            )
+        
+        # Con el perfil automático, pocos cuadros por segundo también activan el de rendimiento
+        # (se mide con la vista ya construida, cuando el arranque no ocupa el ciclo de eventos)
+        if tema.perfil_configurado() == tema.PERFIL_AUTO and not tema.perfil_rendimiento():
+            self.after(1000, lambda: tema.medir_fps(self, self.on_fps_medidos))
+        
+        # Consultar impresoras en segundo plano para que el diálogo abra al instante
+        self.after(1500, self.start_printer_discovery)
+        
+        # Construir los formularios ocultos cuando el arranque ya terminó
+        self.after(2500, self.precargar_formularios)
     
     def create_sidebar(self):
         """Crea el sidebar de navegación"""
@@ -52,22 +199,22 @@ class MainApplication(ctk.CTk):
             self, 
             width=250, 
             corner_radius=0, 
-            fg_color="#FFFFFF",
+            fg_color=tema.BLANCO,
             border_width=0
         )
         self.sidebar.grid(row=0, column=0, sticky="nsew")
         self.sidebar.grid_rowconfigure(4, weight=1)
         
         # Logo y título
-        header_frame = ctk.CTkFrame(self.sidebar, fg_color="#6366F1", height=120, corner_radius=0)
+        header_frame = ctk.CTkFrame(self.sidebar, fg_color=tema.PRIMARIO, height=120, corner_radius=0)
         header_frame.grid(row=0, column=0, sticky="ew")
         header_frame.grid_propagate(False)
         
         self.logo_label = ctk.CTkLabel(
             header_frame,
             text="AutoGest",
-            font=ctk.CTkFont(family="Inter", size=28, weight="bold"),
-            text_color="#FFFFFF"
+            font=tema.fuente(28, "bold"),
+            text_color=tema.BLANCO
         )
         self.logo_label.place(relx=0.5, rely=0.5, anchor="center")
         
@@ -77,62 +224,62 @@ class MainApplication(ctk.CTk):
         
         self.btn_autos = ctk.CTkButton(
             nav_frame,
-            text="🚗  Autos",
+            text=tema.icono("autos", "Autos", "  "),
             command=self.show_autos_view,
-            font=ctk.CTkFont(family="Inter", size=14),
+            font=tema.fuente(14),
             height=45,
             fg_color="transparent",
-            hover_color="#F3F4F6",
+            hover_color=tema.GRIS_100,
             border_width=0,
-            corner_radius=8,
+            corner_radius=tema.radio(8),
             anchor="w",
-            text_color="#374151"
+            text_color=tema.GRIS_700
         )
         self.btn_autos.pack(fill="x", padx=10, pady=5)
         
         self.btn_clientes = ctk.CTkButton(
             nav_frame,
-            text="👥  Clientes",
+            text=tema.icono("clientes", "Clientes", "  "),
             command=self.show_clientes_view,
-            font=ctk.CTkFont(family="Inter", size=14),
+            font=tema.fuente(14),
             height=45,
             fg_color="transparent",
-            hover_color="#F3F4F6",
+            hover_color=tema.GRIS_100,
             border_width=0,
-            corner_radius=8,
+            corner_radius=tema.radio(8),
             anchor="w",
-            text_color="#374151"
+            text_color=tema.GRIS_700
         )
         self.btn_clientes.pack(fill="x", padx=10, pady=5)
         
         self.btn_ventas = ctk.CTkButton(
             nav_frame,
-            text="💰  Ventas",
+            text=tema.icono("ventas", "Ventas", "  "),
             command=self.show_ventas_view,
-            font=ctk.CTkFont(family="Inter", size=14),
+            font=tema.fuente(14),
             height=45,
             fg_color="transparent",
-            hover_color="#F3F4F6",
+            hover_color=tema.GRIS_100,
             border_width=0,
-            corner_radius=8,
+            corner_radius=tema.radio(8),
             anchor="w",
-            text_color="#374151"
+            text_color=tema.GRIS_700
         )
         self.btn_ventas.pack(fill="x", padx=10, pady=5)
         
         # Botón de salir en la parte inferior
         self.btn_salir = ctk.CTkButton(
             self.sidebar,
-            text="⬅️  Cerrar Sesión",
+            text=tema.icono("salir", "Cerrar Sesión", "  "),
             command=self.quit_app,
-            font=ctk.CTkFont(family="Inter", size=14),
+            font=tema.fuente(14),
             height=45,
             fg_color="transparent",
             hover_color="#FEE2E2",
-            text_color="#DC2626",
+            text_color=tema.PELIGRO_HOVER,
             border_width=1,
-            border_color="#DC2626",
-            corner_radius=8
+            border_color=tema.PELIGRO_HOVER,
+            corner_radius=tema.radio(8)
         )
         self.btn_salir.grid(row=3, column=0, padx=15, pady=20, sticky="ew")
     
@@ -144,6 +291,8 @@ class MainApplication(ctk.CTk):
     
     def show_autos_view(self):
         """Muestra la vista de autos"""
+        from view.auto_view import AutoView
+        
         self.clear_main_container()
         self.current_view = AutoView(self.main_container)
         self.current_view.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
@@ -151,6 +300,8 @@ class MainApplication(ctk.CTk):
     
     def show_clientes_view(self):
         """Muestra la vista de clientes"""
+        from view.cliente_view import ClienteView
+        
         self.clear_main_container()
         self.current_view = ClienteView(self.main_container)
         self.current_view.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
@@ -158,39 +309,176 @@ class MainApplication(ctk.CTk):
     
     def show_ventas_view(self):
         """Muestra la vista de ventas"""
+        from view.venta_view import VentaView
+        
         self.clear_main_container()
         self.current_view = VentaView(self.main_container)
         self.current_view.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
         self.highlight_button(self.btn_ventas)
     
+    def show_diagnostico(self, event=None):
+        """Abre el panel con las métricas de consultas de la sesión"""
+        if db.instrumentacion is None:
+            return
+        from view.diagnostico_view import DiagnosticoDialog
+        DiagnosticoDialog(self, db.instrumentacion)
+    
+    def precargar_formularios(self):
+        """Deja construidos (ocultos) los formularios de alta y edición"""
+        from view.auto_view import AutoView
+        from view.cliente_view import ClienteView
+        from view.venta_view import VentaView
+        
+        pool_formularios.precargar(self, [
+            ("auto", AutoView.crear_formulario),
+            ("cliente", ClienteView.crear_formulario),
+            ("venta", VentaView.crear_formulario),
+        ])
+    
+    def start_printer_discovery(self):
+        """
+        Inicia el refresco en segundo plano de la caché de impresoras y la cola
+        de impresión (procesa los trabajos que quedaron pendientes en disco)
+        """
+        try:
+            from utils.print_manager import printer_registry
+            from utils.print_spooler import print_spooler
+        except ImportError:
+            return
+        printer_registry.start()
+        
+        # Los trabajos que fallan se avisan en el hilo de Tk
+        print_spooler.add_listener(self.on_print_job_changed)
+        print_spooler.start()
+    
+    def on_print_job_changed(self, job):
+        """Recibe los cambios de estado de la cola de impresión (en el hilo del spooler)"""
+        from utils.print_spooler import PrintJob
+        
+        if job.status == PrintJob.ERROR:
+            self.dispatcher.post(self.show_print_error, job)
+    
+    def show_print_error(self, job):
+        """Avisa que un trabajo de impresión no se pudo imprimir"""
+        from pathlib import Path
+        from tkinter import messagebox
+        
+        messagebox.showerror(
+            "Error de impresión",
+            f"No se pudo imprimir {Path(job.pdf_path).name}:\n{job.error}\n\n"
+            "El PDF quedó guardado; puede abrirlo e imprimirlo manualmente."
+        )
+    
     def highlight_button(self, active_button):
         """Resalta el botón activo en el sidebar"""
         buttons = [self.btn_autos, self.btn_clientes, self.btn_ventas]
         for btn in buttons:
             if btn == active_button:
-                btn.configure(fg_color="#6366F1", text_color="#FFFFFF")
+                btn.configure(fg_color=tema.PRIMARIO, text_color=tema.BLANCO)
             else:
-                btn.configure(fg_color="transparent", text_color="#374151")
+                btn.configure(fg_color="transparent", text_color=tema.GRIS_700)
+    
+    def set_navigation_enabled(self, enabled):
+        """Habilita o deshabilita la navegación mientras no hay conexión"""
+        state = "normal" if enabled else "disabled"
+        for btn in (self.btn_autos, self.btn_clientes, self.btn_ventas):
+            btn.configure(state=state)
     
-    def show_error_and_exit(self, message):
-        """Muestra un error y cierra la aplicación"""
+    def show_skeleton_view(self):
+        """Muestra una tabla esqueleto mientras se conecta a la base de datos"""
+        self.clear_main_container()
+        
+        skeleton = ctk.CTkFrame(self.main_container, fg_color="#F5F7FA", corner_radius=tema.radio(6))
+        skeleton.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
+        skeleton.grid_columnconfigure(0, weight=1)
+        skeleton.grid_rowconfigure(1, weight=1)
+        
+        header = ctk.CTkFrame(skeleton, fg_color=tema.BLANCO, corner_radius=tema.radio(10), height=70)
+        header.grid(row=0, column=0, sticky="ew", pady=(0, 20))
+        header.grid_propagate(False)
+        
+        self.boot_status_label = ctk.CTkLabel(
+            header,
+            text="Conectando a la base de datos...",
+            font=tema.fuente(13),
+            text_color=tema.GRIS_500
+        )
+        self.boot_status_label.place(x=20, rely=0.5, anchor="w")
+        
+        table = ctk.CTkFrame(skeleton, fg_color=tema.BLANCO, corner_radius=tema.radio(10))
+        table.grid(row=1, column=0, sticky="nsew", pady=(0, 20))
+        
+        # Filas de relleno con el mismo alto y alternancia de color que la tabla real
+        for i in range(10):
+            row = ctk.CTkFrame(
+                table,
+                fg_color=tema.GRIS_100 if i == 0 else ("#FFFFFF" if i % 2 else "#F9FAFB"),
+                corner_radius=0,
+                height=45 if i == 0 else 70
+            )
+            row.pack(fill="x", pady=1)
+            
+            bar = ctk.CTkFrame(row, fg_color=tema.GRIS_200, corner_radius=tema.radio(6), height=14)
+            bar.place(relx=0.03, rely=0.5, relwidth=0.94 if i == 0 else 0.6 + (i % 3) * 0.1, anchor="w")
+        
+        self.current_view = skeleton
+    
+    def show_connection_error(self, message):
+        """Muestra el error de conexión dentro de la ventana con opción de reintentar"""
+        self.clear_main_container()
+        
+        panel = ctk.CTkFrame(self.main_container, fg_color=tema.BLANCO, corner_radius=tema.radio(10))
+        panel.grid(row=0, column=0, padx=20, pady=20)
+        
         error_label = ctk.CTkLabel(
-            self,
+            panel,
             text=f"Error de conexión:\n{message}\n\nVerifique que MySQL esté instalado y en ejecución.",
-            font=ctk.CTkFont(size=14),
-            text_color="#DC2626"
+            font=tema.fuente(14, familia=None),
+            text_color=tema.PELIGRO_HOVER,
+            justify="center"
+        )
+        error_label.pack(padx=40, pady=(30, 20))
+        
+        buttons_frame = ctk.CTkFrame(panel, fg_color="transparent")
+        buttons_frame.pack(pady=(0, 30))
+        
+        retry_btn = ctk.CTkButton(
+            buttons_frame,
+            text="Reintentar",
+            command=self.retry_connection,
+            **tema.BOTON_PRIMARIO,
+            corner_radius=tema.radio(6)
         )
-        error_label.pack(expand=True)
+        retry_btn.pack(side="left", padx=10)
         
         close_btn = ctk.CTkButton(
-            self,
+            buttons_frame,
             text="Cerrar",
             command=self.quit,
-            fg_color="#DC2626"
+            fg_color=tema.PELIGRO_HOVER,
+            corner_radius=tema.radio(6)
         )
-        close_btn.pack(pady=20)
+        close_btn.pack(side="left", padx=10)
+        
+        self.current_view = panel
+    
+    def retry_connection(self):
+        """Vuelve a mostrar el esqueleto e intenta conectar otra vez"""
+        self.show_skeleton_view()
+        self.boot()
     
     def quit_app(self):
         """Cierra la aplicación y desconecta la base de datos"""
+        self.dispatcher.stop()
+        # Los trabajos de impresión pendientes quedan en disco para el próximo inicio
+        from utils.print_spooler import print_spooler
+        print_spooler.remove_listener(self.on_print_job_changed)
+        print_spooler.stop()
+        from model.cambios import notificador_cambios
+        notificador_cambios.detener()
+        from utils.image_loader import ImageLoader
+        ImageLoader.cancel_downloads()
+        if db.replica is not None:
+            db.replica.cerrar()
         db.disconnect()
         self.quit()
@@ -2,6 +2,7 @@
 Vista para reportes y estadísticas
 """
 import customtkinter as ctk
+from view import tema
 from tkinter import messagebox
 from controller.venta_controller import VentaController
 
@@ -21,7 +22,7 @@ class ReportView(ctk.CTkFrame):
     
     def create_header(self):
         """Crea el encabezado de la vista"""
-        header_frame = ctk.CTkFrame(self, fg_color="#FFFFFF", corner_radius=10)
+        header_frame = ctk.CTkFrame(self, fg_color=tema.BLANCO, corner_radius=tema.radio(10))
         header_frame.grid(row=0, column=0, sticky="ew", pady=(0, 20))
         
         content_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
@@ -30,8 +31,8 @@ class ReportView(ctk.CTkFrame):
         title = ctk.CTkLabel(
             content_frame,
             text="Reportes y Estadísticas",
-            font=ctk.CTkFont(family="Inter", size=24, weight="bold"),
-            text_color="#1F2937"
+            font=tema.fuente(24, "bold"),
+            text_color=tema.GRIS_800
         )
         title.pack(side="left")
     
@@ -89,7 +90,7 @@ class ReportView(ctk.CTkFrame):
     
     def create_stat_card(self, parent, title, value, color):
         """Crea una tarjeta de estadística"""
-        card = ctk.CTkFrame(parent, fg_color="#FFFFFF", corner_radius=10)
+        card = ctk.CTkFrame(parent, fg_color=tema.BLANCO, corner_radius=tema.radio(10))
         
         color_bar = ctk.CTkFrame(card, fg_color=color, height=6, corner_radius=0)
         color_bar.pack(fill="x")
@@ -100,16 +101,16 @@ class ReportView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             content_frame,
             text=title,
-            font=ctk.CTkFont(family="Inter", size=13),
-            text_color="#6B7280"
+            font=tema.fuente(13),
+            text_color=tema.GRIS_500
         )
         title_label.pack(pady=(0, 12))
         
         value_label = ctk.CTkLabel(
             content_frame,
             text=value,
-            font=ctk.CTkFont(family="Inter", size=36, weight="bold"),
-            text_color="#1F2937"
+            font=tema.fuente(36, "bold"),
+            text_color=tema.GRIS_800
         )
         value_label.pack()
         
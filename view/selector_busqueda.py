@@ -0,0 +1,279 @@
+"""
+Selector con sugerencias (autocompletado)
+Reemplaza a los CTkComboBox que cargaban todos los clientes o autos: mientras
+se escribe se consultan en segundo plano solo las primeras coincidencias
+(ClienteModel.sugerir_clientes, AutoModel.sugerir_autos) y se muestran debajo
+de la entrada. Las consultas esperan una pausa al escribir, las respuestas de
+un texto que ya cambió se descartan y los últimos resultados quedan en caché
+(borrar una letra no vuelve a consultar)
+
+Las consultas corren en un solo hilo de fondo con su propia conexión
+(HiloConsultas): mysql.connector no es seguro entre hilos y la conexión
+compartida es la del hilo de Tk
+"""
+import queue
+import threading
+from collections import OrderedDict
+
+import customtkinter as ctk
+
+from model.conexion import db
+from view import tema
+
+
+class HiloConsultas:
+    """Hilo de fondo único, con conexión propia, para las consultas de los selectores"""
+
+    def __init__(self):
+        self._cola = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._conexion = None
+
+    def pedir(self, consulta, al_terminar, despachar):
+        """
+        Encola consulta() y luego despachar(al_terminar, resultado)
+
+        Args:
+            consulta: Función sin argumentos que consulta a través de los modelos
+            al_terminar: Función resultado -> None (en el hilo de Tk)
+            despachar: Función despachar(func, *args) (UIDispatcher.post)
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, daemon=True)
+                self._thread.start()
+        self._cola.put((consulta, al_terminar, despachar))
+
+    def _loop(self):
+        while True:
+            consulta, al_terminar, despachar = self._cola.get()
+            try:
+                self._preparar_conexion()
+                resultado = consulta()
+                if isinstance(resultado, tuple) and not resultado[0]:
+                    # Posible conexión caída: abrir otra en la próxima consulta
+                    self._cerrar_conexion()
+            except Exception as e:
+                self._cerrar_conexion()
+                resultado = e
+            despachar(al_terminar, resultado)
+
+    def _preparar_conexion(self):
+        """Abre la conexión del hilo (sin conexión con el servidor se lee de la réplica)"""
+        if self._conexion is not None or db.en_modo_local():
+            return
+        db.load_config()
+        self._conexion = db._crear_conexion()
+        db.usar_conexion_del_hilo(self._conexion)
+
+    def _cerrar_conexion(self):
+        db.usar_conexion_del_hilo(None)
+        if self._conexion is not None:
+            try:
+                self._conexion.close()
+            except Exception:
+                pass
+            self._conexion = None
+
+
+# Instancia global de la aplicación
+hilo_consultas = HiloConsultas()
+
+
+class SelectorBusqueda(ctk.CTkFrame):
+    """Entrada de texto con una lista de sugerencias para elegir un registro"""
+
+    # Sugerencias visibles (y filas pedidas a la base)
+    MAX_SUGERENCIAS = 8
+
+    # Pausa al escribir antes de consultar
+    ESPERA_MS = 150
+
+    # Textos con resultados en caché
+    MAX_CACHE = 64
+
+    def __init__(self, parent, buscar, etiqueta, clave, placeholder="", height=35, limite=MAX_SUGERENCIAS):
+        """
+        Args:
+            parent: Contenedor
+            buscar: Función (texto, limite) -> (success, registros)
+            etiqueta: Función registro -> texto de la sugerencia
+            clave: Función registro -> id del registro
+            placeholder (str): Texto de ayuda de la entrada
+            limite (int): Máximo de sugerencias
+        """
+        super().__init__(parent, fg_color="transparent")
+        self.buscar = buscar
+        self.etiqueta = etiqueta
+        self.clave = clave
+        self.limite = limite
+
+        self.seleccionado = None  # Registro elegido (o None)
+        self._sugerencias = []
+        self._resaltada = None
+        self._cache = OrderedDict()
+        self._consulta = 0  # Número de la última consulta pedida
+        self._espera_id = None
+
+        self.entry = ctk.CTkEntry(self, height=height, placeholder_text=placeholder, corner_radius=tema.radio(6))
+        self.entry.pack(fill="x")
+        self.entry.bind("<KeyRelease>", self._al_escribir)
+        self.entry.bind("<FocusIn>", lambda e: self._programar())
+        self.entry.bind("<Down>", lambda e: self._mover(1))
+        self.entry.bind("<Up>", lambda e: self._mover(-1))
+        self.entry.bind("<Return>", lambda e: self._elegir_resaltada())
+        self.entry.bind("<Escape>", lambda e: self._ocultar_lista())
+
+        # Filas de la lista: se crean una vez y se reutilizan en cada búsqueda
+        self.lista = ctk.CTkFrame(
+            self, fg_color=tema.BLANCO, border_width=1, border_color=tema.GRIS_200,
+            corner_radius=tema.radio(6)
+        )
+        self._botones = []
+        for i in range(limite):
+            boton = ctk.CTkButton(
+                self.lista,
+                text="",
+                anchor="w",
+                height=28,
+                fg_color="transparent",
+                hover_color=tema.COLOR_HOVER,
+                text_color=tema.COLOR_TEXTO,
+                font=tema.fuente(12, familia=None),
+                corner_radius=0,
+                command=lambda i=i: self._elegir(i)
+            )
+            self._botones.append(boton)
+        self._mensaje = ctk.CTkLabel(
+            self.lista,
+            text="",
+            font=tema.fuente(12, familia=None),
+            text_color=tema.GRIS_500
+        )
+
+    # --- API ---
+
+    def get(self):
+        """Id del registro elegido (o None si no se eligió de la lista)"""
+        return self.clave(self.seleccionado) if self.seleccionado is not None else None
+
+    def limpiar(self):
+        """Vacía la entrada y la selección (al reutilizar el formulario)"""
+        self._consulta += 1
+        self._cancelar_espera()
+        self.seleccionado = None
+        self.entry.delete(0, "end")
+        self._cache.clear()
+        self._ocultar_lista()
+
+    # --- Búsqueda ---
+
+    def _al_escribir(self, event):
+        if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        texto = self.entry.get()
+        if self.seleccionado is not None and texto != self.etiqueta(self.seleccionado):
+            # Se editó el texto de una opción elegida: ya no vale
+            self.seleccionado = None
+        self._programar()
+
+    def _programar(self):
+        """Consulta después de ESPERA_MS sin teclear (una sola consulta por ráfaga)"""
+        if self.seleccionado is not None:
+            return
+        self._cancelar_espera()
+        self._espera_id = self.after(self.ESPERA_MS, self._consultar)
+
+    def _cancelar_espera(self):
+        if self._espera_id is not None:
+            self.after_cancel(self._espera_id)
+            self._espera_id = None
+
+    def _consultar(self):
+        self._espera_id = None
+        texto = self.entry.get().strip()
+        clave = texto.lower()
+        if clave in self._cache:
+            self._cache.move_to_end(clave)
+            self._mostrar(self._cache[clave])
+            return
+
+        self._consulta += 1
+        numero = self._consulta
+        # El formulario es un Toplevel: el despachador es de la ventana raíz
+        dispatcher = getattr(self._root(), "dispatcher", None)
+        if dispatcher is None:
+            # Sin ventana principal (benchmarks): consulta en el hilo de Tk
+            self._recibir(numero, clave, self.buscar(texto, self.limite))
+            return
+        hilo_consultas.pedir(
+            lambda: self.buscar(texto, self.limite),
+            lambda resultado: self._recibir(numero, clave, resultado),
+            dispatcher.post
+        )
+
+    def _recibir(self, numero, clave, resultado):
+        """Respuesta de una consulta (en el hilo de Tk)"""
+        if numero != self._consulta or not self.winfo_exists():
+            return  # Se escribió algo más o se cerró el formulario
+        if isinstance(resultado, Exception):
+            resultado = (False, str(resultado))
+        success, registros = resultado
+        if not success:
+            self._mostrar([], f"Error al buscar: {registros}")
+            return
+        self._cache[clave] = registros
+        if len(self._cache) > self.MAX_CACHE:
+            self._cache.popitem(last=False)
+        self._mostrar(registros)
+
+    # --- Lista ---
+
+    def _mostrar(self, registros, mensaje="Sin coincidencias"):
+        self._sugerencias = list(registros)[:self.limite]
+        self._resaltada = None
+        for i, boton in enumerate(self._botones):
+            if i < len(self._sugerencias):
+                boton.configure(text=self.etiqueta(self._sugerencias[i]), fg_color="transparent")
+                boton.pack(fill="x", padx=1)
+            else:
+                boton.pack_forget()
+
+        if self._sugerencias:
+            self._mensaje.pack_forget()
+        else:
+            self._mensaje.configure(text=mensaje)
+            self._mensaje.pack(fill="x", pady=4)
+        self.lista.pack(fill="x", pady=(2, 0))
+
+    def _ocultar_lista(self):
+        self.lista.pack_forget()
+        self._sugerencias = []
+        self._resaltada = None
+
+    def _mover(self, paso):
+        """Resalta la sugerencia siguiente o anterior (flechas)"""
+        if not self._sugerencias:
+            return
+        if self._resaltada is not None:
+            self._botones[self._resaltada].configure(fg_color="transparent")
+        if self._resaltada is None:
+            self._resaltada = 0 if paso > 0 else len(self._sugerencias) - 1
+        else:
+            self._resaltada = (self._resaltada + paso) % len(self._sugerencias)
+        self._botones[self._resaltada].configure(fg_color=tema.COLOR_SELECCION)
+
+    def _elegir_resaltada(self):
+        if self._sugerencias:
+            self._elegir(self._resaltada or 0)
+
+    def _elegir(self, indice):
+        if indice >= len(self._sugerencias):
+            return
+        self._cancelar_espera()
+        self._consulta += 1
+        self.seleccionado = self._sugerencias[indice]
+        self.entry.delete(0, "end")
+        self.entry.insert(0, self.etiqueta(self.seleccionado))
+        self._ocultar_lista()
@@ -0,0 +1,505 @@
+"""
+Tabla dibujada en un solo tk.Canvas
+Alternativa a las filas de CTkFrame/CTkLabel de las vistas: cada widget de
+customtkinter es a su vez un canvas con esquinas redondeadas, así que una
+tabla de miles de filas crea decenas de miles de widgets. TablaCanvas dibuja
+solo las filas visibles (reutiliza los mismos ítems al desplazarse) con
+franjas alternas, resaltado al pasar el mouse, selección, texto, miniaturas y
+botones de acción, y resuelve los clics por coordenadas.
+
+Las vistas la usan con AUTOGEST_TABLA=canvas en el .env (o con el perfil de
+rendimiento si AUTOGEST_TABLA no está definida)
+"""
+import os
+import tkinter as tk
+
+import customtkinter as ctk
+
+from utils.image_loader import ImageLoader
+from utils.photo_pool import photo_pool
+from view import tema
+
+COLOR_FONDO_IMAGEN = tema.GRIS_100
+
+ALTO_ENCABEZADO = 45
+MARGEN = 10
+LADO_BOTON = 36
+SEPARACION_BOTONES = 8
+TAMANO_MINIATURA = (50, 50)
+
+# Filas que avanza cada paso de la rueda del mouse
+FILAS_POR_PASO = 3
+
+
+def usar_tabla_canvas():
+    """
+    Indica si las vistas dibujan la tabla con TablaCanvas: AUTOGEST_TABLA=canvas,
+    o AUTOGEST_TABLA sin definir y el perfil de rendimiento activo (view/tema.py)
+    """
+    modo = os.getenv("AUTOGEST_TABLA", "").strip().lower()
+    if modo:
+        return modo == "canvas"
+    return tema.perfil_rendimiento()
+
+
+class Columna:
+    """
+    Columna de TablaCanvas
+
+    Args:
+        titulo: Texto del encabezado
+        peso: Ancho relativo de la columna
+        valor: Función registro -> texto (o URL de la imagen en columnas 'imagen')
+        tipo: 'texto', 'imagen' o 'acciones'
+    """
+
+    __slots__ = ("titulo", "peso", "valor", "tipo")
+
+    def __init__(self, titulo, peso=1, valor=None, tipo="texto"):
+        self.titulo = titulo
+        self.peso = peso
+        self.valor = valor
+        self.tipo = tipo
+
+
+class Accion:
+    """
+    Botón dibujado en la columna de acciones
+
+    Args:
+        icono: Texto del botón
+        color, color_hover: Relleno normal y con el mouse encima
+        funcion: Se llama con el registro de la fila
+    """
+
+    __slots__ = ("icono", "color", "color_hover", "funcion")
+
+    def __init__(self, icono, color, color_hover, funcion):
+        self.icono = icono
+        self.color = color
+        self.color_hover = color_hover
+        self.funcion = funcion
+
+
+class _Ranura:
+    """Ítems del canvas de una fila visible (se reutilizan al desplazarse)"""
+
+    __slots__ = ("fondo", "textos", "marco_imagen", "placeholder", "imagen", "botones", "url", "foto")
+
+    def __init__(self):
+        self.fondo = None
+        self.textos = []
+        self.marco_imagen = None
+        self.placeholder = None
+        self.imagen = None
+        self.botones = []
+        # Miniatura que muestra (tomada de photo_pool)
+        self.url = None
+        self.foto = None
+
+
+class TablaCanvas(ctk.CTkFrame):
+    """Tabla virtualizada: un encabezado y un cuerpo tk.Canvas con barra de desplazamiento"""
+
+    def __init__(self, parent, columnas, clave, acciones=(), alto_fila=50,
+                 al_seleccionar=None, **kwargs):
+        """
+        Args:
+            columnas: Lista de Columna
+            clave: Campo con el id del registro (p. ej. 'id_auto')
+            acciones: Lista de Accion para la columna de tipo 'acciones'
+            alto_fila (int): Alto de cada fila en píxeles
+            al_seleccionar: Función registro -> None al hacer clic en una fila
+        """
+        kwargs.setdefault("fg_color", tema.COLORES_FILA[0])
+        kwargs.setdefault("corner_radius", 0)
+        super().__init__(parent, **kwargs)
+
+        self.columnas = list(columnas)
+        self.clave = clave
+        self.acciones = list(acciones)
+        self.alto_fila = alto_fila
+        self.al_seleccionar = al_seleccionar
+
+        self.registros = []
+        self._posiciones = {}
+        self.seleccion = None
+        self._hover = None
+        self._hover_boton = None
+        self.offset = 0
+        self._limites = []
+        self._ranuras = []
+
+        # URLs pedidas a ImageLoader (las que fallan no se vuelven a pedir)
+        self._cargando = set()
+        # El despachador de la ventana principal lleva las miniaturas al hilo de Tk
+        self._dispatcher = getattr(self.winfo_toplevel(), "dispatcher", None)
+
+        self.fuente = tema.fuente(12)
+        self.fuente_encabezado = tema.fuente(13, "bold")
+        self.fuente_iconos = tema.fuente_iconos(14)
+        self._ancho_caracter = max(1, self.fuente.measure("n"))
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        self.encabezado = tk.Canvas(
+            self, height=ALTO_ENCABEZADO, bg=tema.COLOR_ENCABEZADO, highlightthickness=0, bd=0
+        )
+        self.encabezado.grid(row=0, column=0, columnspan=2, sticky="ew")
+
+        self.canvas = tk.Canvas(self, bg=tema.COLORES_FILA[0], highlightthickness=0, bd=0, cursor="hand2")
+        self.canvas.grid(row=1, column=0, sticky="nsew")
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._yview)
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+
+        self.canvas.bind("<Configure>", self._al_redimensionar)
+        self.canvas.bind("<Motion>", self._al_mover)
+        self.canvas.bind("<Leave>", self._al_salir)
+        self.canvas.bind("<Button-1>", self._al_clic)
+        self.canvas.bind("<MouseWheel>", self._al_rueda)
+        self.canvas.bind("<Button-4>", lambda e: self._yview("scroll", -FILAS_POR_PASO, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self._yview("scroll", FILAS_POR_PASO, "units"))
+        # En Windows la rueda llega al widget con el foco
+        self.canvas.bind("<Enter>", lambda e: self.canvas.focus_set())
+
+    # --- Datos ---
+
+    def cargar(self, registros, al_inicio=False):
+        """
+        Reemplaza los registros de la tabla
+
+        Args:
+            registros: Lista de registros (dict o model/registros.py)
+            al_inicio (bool): Volver al principio (si no, se conserva la posición)
+        """
+        self.registros = list(registros)
+        self._indexar()
+        if self.seleccion not in self._posiciones:
+            self.seleccion = None
+        if al_inicio:
+            self.offset = 0
+        self._hover = None
+        self.redibujar()
+
+    def reemplazar(self, id_registro, registro):
+        """Actualiza la fila de un registro o la agrega al final si no estaba"""
+        posicion = self._posiciones.get(id_registro)
+        if posicion is None:
+            self._posiciones[id_registro] = len(self.registros)
+            self.registros.append(registro)
+        else:
+            self.registros[posicion] = registro
+        self.redibujar()
+
+    def quitar(self, id_registro):
+        """Quita la fila de un registro"""
+        posicion = self._posiciones.pop(id_registro, None)
+        if posicion is None:
+            return
+        del self.registros[posicion]
+        self._indexar()
+        if self.seleccion == id_registro:
+            self.seleccion = None
+        self.redibujar()
+
+    def ordenar(self, clave_orden):
+        """Ordena las filas con clave_orden(registro)"""
+        self.registros.sort(key=clave_orden)
+        self._indexar()
+        self.redibujar()
+
+    def registro(self, id_registro):
+        """Registro de la tabla con ese id (o None)"""
+        posicion = self._posiciones.get(id_registro)
+        return None if posicion is None else self.registros[posicion]
+
+    def seleccionar(self, id_registro):
+        """Marca la fila del registro como seleccionada (None para quitar la selección)"""
+        self.seleccion = id_registro if id_registro in self._posiciones else None
+        self.redibujar()
+
+    def __len__(self):
+        return len(self.registros)
+
+    def _indexar(self):
+        self._posiciones = {registro[self.clave]: i for i, registro in enumerate(self.registros)}
+
+    # --- Geometría ---
+
+    def _al_redimensionar(self, event=None):
+        """Recalcula las columnas y la cantidad de filas visibles"""
+        ancho = self._ancho()
+        total = sum(c.peso for c in self.columnas) or 1
+        x = MARGEN
+        util = max(0, ancho - 2 * MARGEN)
+        self._limites = []
+        for columna in self.columnas:
+            siguiente = x + util * columna.peso / total
+            self._limites.append((x, siguiente))
+            x = siguiente
+
+        visibles = self._alto() // self.alto_fila + 2
+        while len(self._ranuras) < visibles:
+            self._ranuras.append(self._crear_ranura())
+        while len(self._ranuras) > visibles:
+            self._borrar_ranura(self._ranuras.pop())
+
+        self._dibujar_encabezado()
+        self.redibujar()
+
+    def _dibujar_encabezado(self):
+        self.encabezado.delete("all")
+        for columna, (x0, x1) in zip(self.columnas, self._limites):
+            self.encabezado.create_text(
+                (x0 + x1) / 2, ALTO_ENCABEZADO / 2,
+                text=self._recortar(columna.titulo, x1 - x0),
+                font=self.fuente_encabezado, fill=tema.COLOR_TITULO
+            )
+
+    def _ancho(self):
+        # Antes de mostrarse el canvas mide 1px: se usa el tamaño pedido
+        ancho = self.canvas.winfo_width()
+        return ancho if ancho > 1 else self.canvas.winfo_reqwidth()
+
+    def _alto(self):
+        alto = self.canvas.winfo_height()
+        return alto if alto > 1 else self.canvas.winfo_reqheight()
+
+    def _alto_total(self):
+        return len(self.registros) * self.alto_fila
+
+    def _max_offset(self):
+        return max(0, self._alto_total() - self._alto())
+
+    def _fila_en(self, y):
+        """Índice del registro bajo la coordenada y del canvas (o None)"""
+        indice = int((y + self.offset) // self.alto_fila)
+        return indice if 0 <= indice < len(self.registros) else None
+
+    def _cajas_botones(self, y):
+        """Rectángulos de los botones de acción de una fila que empieza en y"""
+        for columna, (x0, x1) in zip(self.columnas, self._limites):
+            if columna.tipo != "acciones":
+                continue
+            total = len(self.acciones) * LADO_BOTON + (len(self.acciones) - 1) * SEPARACION_BOTONES
+            x = (x0 + x1 - total) / 2
+            top = y + (self.alto_fila - LADO_BOTON) / 2
+            cajas = []
+            for _ in self.acciones:
+                cajas.append((x, top, x + LADO_BOTON, top + LADO_BOTON))
+                x += LADO_BOTON + SEPARACION_BOTONES
+            return cajas
+        return []
+
+    def _recortar(self, texto, ancho):
+        """Acorta el texto con … para que entre en el ancho de la columna (estimado)"""
+        maximo = int((ancho - 10) // self._ancho_caracter)
+        if maximo <= 1:
+            return ""
+        return texto if len(texto) <= maximo else texto[:maximo - 1] + "…"
+
+    # --- Dibujo ---
+
+    def _crear_ranura(self):
+        """Crea (ocultos) los ítems de una fila visible"""
+        c = self.canvas
+        ranura = _Ranura()
+        ranura.fondo = c.create_rectangle(0, 0, 0, 0, width=0, state="hidden")
+        for columna in self.columnas:
+            if columna.tipo == "texto":
+                ranura.textos.append(
+                    c.create_text(0, 0, font=self.fuente, fill=tema.COLOR_TEXTO, state="hidden")
+                )
+            elif columna.tipo == "imagen":
+                ranura.marco_imagen = c.create_rectangle(
+                    0, 0, 0, 0, width=0, fill=COLOR_FONDO_IMAGEN, state="hidden"
+                )
+                ranura.placeholder = c.create_text(0, 0, text=tema.icono("auto"), font=self.fuente_iconos, state="hidden")
+                ranura.imagen = c.create_image(0, 0, state="hidden")
+        for accion in self.acciones:
+            ranura.botones.append((
+                c.create_rectangle(0, 0, 0, 0, width=0, fill=accion.color, state="hidden"),
+                c.create_text(0, 0, text=accion.icono, font=self.fuente_iconos, fill=tema.BLANCO, state="hidden"),
+            ))
+        return ranura
+
+    def _borrar_ranura(self, ranura):
+        self._soltar_miniatura(ranura)
+        items = [ranura.fondo, ranura.marco_imagen, ranura.placeholder, ranura.imagen, *ranura.textos]
+        for rect, texto in ranura.botones:
+            items += [rect, texto]
+        self.canvas.delete(*[item for item in items if item is not None])
+
+    def redibujar(self):
+        """Actualiza los ítems de las filas visibles según la posición de desplazamiento"""
+        if not self._limites:
+            return
+        self.offset = min(max(0, self.offset), self._max_offset())
+        primera = int(self.offset // self.alto_fila)
+        desfase = -(self.offset % self.alto_fila)
+
+        for k, ranura in enumerate(self._ranuras):
+            indice = primera + k
+            if indice < len(self.registros):
+                self._dibujar_fila(ranura, indice, desfase + k * self.alto_fila)
+            else:
+                self._ocultar(ranura)
+
+        total = self._alto_total()
+        if total <= 0:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.offset / total, min(1, (self.offset + self._alto()) / total))
+
+    def _color_fondo(self, indice, registro):
+        if registro[self.clave] == self.seleccion:
+            return tema.COLOR_SELECCION
+        if indice == self._hover and not tema.perfil_rendimiento():
+            return tema.COLOR_HOVER
+        return tema.COLORES_FILA[indice % 2]
+
+    def _dibujar_fila(self, ranura, indice, y):
+        c = self.canvas
+        registro = self.registros[indice]
+        ancho = self._ancho()
+        centro_y = y + self.alto_fila / 2
+
+        c.coords(ranura.fondo, 0, y, ancho, y + self.alto_fila - 1)
+        c.itemconfigure(ranura.fondo, fill=self._color_fondo(indice, registro), state="normal")
+
+        textos = iter(ranura.textos)
+        for columna, (x0, x1) in zip(self.columnas, self._limites):
+            centro_x = (x0 + x1) / 2
+            if columna.tipo == "texto":
+                item = next(textos)
+                c.coords(item, centro_x, centro_y)
+                c.itemconfigure(item, text=self._recortar(str(columna.valor(registro)), x1 - x0), state="normal")
+            elif columna.tipo == "imagen":
+                self._dibujar_miniatura(ranura, columna.valor(registro), centro_x, centro_y)
+
+        for (rect, texto), caja, (i, accion) in zip(ranura.botones, self._cajas_botones(y), enumerate(self.acciones)):
+            sobre = self._hover_boton == (indice, i)
+            c.coords(rect, *caja)
+            c.itemconfigure(rect, fill=accion.color_hover if sobre else accion.color, state="normal")
+            c.coords(texto, (caja[0] + caja[2]) / 2, (caja[1] + caja[3]) / 2)
+            c.itemconfigure(texto, state="normal")
+
+    def _dibujar_miniatura(self, ranura, url, x, y):
+        c = self.canvas
+        medio = TAMANO_MINIATURA[0] / 2 + 5
+        c.coords(ranura.marco_imagen, x - medio, y - medio, x + medio, y + medio)
+        c.itemconfigure(ranura.marco_imagen, state="normal")
+        foto = self._miniatura(ranura, url)
+        c.coords(ranura.placeholder, x, y)
+        c.itemconfigure(ranura.placeholder, state="hidden" if foto else "normal")
+        c.coords(ranura.imagen, x, y)
+        c.itemconfigure(ranura.imagen, image=foto or "", state="normal" if foto else "hidden")
+
+    def _ocultar(self, ranura):
+        c = self.canvas
+        self._soltar_miniatura(ranura)
+        for item in (ranura.fondo, ranura.marco_imagen, ranura.placeholder, ranura.imagen, *ranura.textos):
+            if item is not None:
+                c.itemconfigure(item, state="hidden")
+        for rect, texto in ranura.botones:
+            c.itemconfigure(rect, state="hidden")
+            c.itemconfigure(texto, state="hidden")
+
+    # --- Miniaturas ---
+
+    def _miniatura(self, ranura, url):
+        """
+        PhotoImage de la miniatura para la ranura o None (la pide en segundo
+        plano si no está). Cada ranura cuenta un uso en photo_pool mientras la muestra
+        """
+        if ranura.url != url:
+            self._soltar_miniatura(ranura)
+            ranura.url = url
+        if ranura.foto is None and url:
+            ranura.foto = photo_pool.acquire(url, TAMANO_MINIATURA)
+            if ranura.foto is None and url not in self._cargando:
+                self._cargando.add(url)
+                ImageLoader.fetch_encoded_async(
+                    url, TAMANO_MINIATURA, lambda data, u=url: self._en_hilo_tk(self._miniatura_lista, u, data)
+                )
+        return ranura.foto
+
+    def _soltar_miniatura(self, ranura):
+        if ranura.foto is not None:
+            photo_pool.release(ranura.url, TAMANO_MINIATURA)
+            ranura.foto = None
+        ranura.url = None
+
+    def _en_hilo_tk(self, funcion, *args):
+        if self._dispatcher is not None:
+            self._dispatcher.post(funcion, *args)
+        else:
+            self.after(0, funcion, *args)
+
+    def _miniatura_lista(self, url, data):
+        """Recibe en el hilo de Tk la miniatura descargada y redibuja"""
+        if data is None or not self.winfo_exists():
+            # Sin imagen queda el placeholder (no se vuelve a pedir)
+            return
+        self._cargando.discard(url)
+        self.redibujar()
+
+    def destroy(self):
+        """Devuelve al pool los PhotoImage de las ranuras"""
+        for ranura in self._ranuras:
+            self._soltar_miniatura(ranura)
+        super().destroy()
+
+    # --- Eventos ---
+
+    def _yview(self, *args):
+        """Comando de la barra de desplazamiento: ('moveto', f) o ('scroll', n, 'units'|'pages')"""
+        if args[0] == "moveto":
+            self.offset = float(args[1]) * self._alto_total()
+        elif args[0] == "scroll":
+            paso = self.alto_fila if args[2] == "units" else self._alto()
+            self.offset += int(args[1]) * paso
+        self.redibujar()
+
+    def _al_rueda(self, event):
+        self._yview("scroll", -FILAS_POR_PASO if event.delta > 0 else FILAS_POR_PASO, "units")
+
+    def _accion_en(self, indice, x, y):
+        """Índice del botón de acción bajo (x, y) en la fila indice (o None)"""
+        fila_y = indice * self.alto_fila - self.offset
+        for i, (x0, y0, x1, y1) in enumerate(self._cajas_botones(fila_y)):
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                return i
+        return None
+
+    def _al_mover(self, event):
+        indice = self._fila_en(event.y)
+        boton = None
+        if indice is not None:
+            accion = self._accion_en(indice, event.x, event.y)
+            boton = None if accion is None else (indice, accion)
+        if indice != self._hover or boton != self._hover_boton:
+            self._hover = indice
+            self._hover_boton = boton
+            self.redibujar()
+
+    def _al_salir(self, event):
+        if self._hover is not None or self._hover_boton is not None:
+            self._hover = None
+            self._hover_boton = None
+            self.redibujar()
+
+    def _al_clic(self, event):
+        indice = self._fila_en(event.y)
+        if indice is None:
+            return
+        registro = self.registros[indice]
+        accion = self._accion_en(indice, event.x, event.y)
+        if accion is not None:
+            self.acciones[accion].funcion(registro)
+            return
+        self.seleccionar(registro[self.clave])
+        if self.al_seleccionar is not None:
+            self.al_seleccionar(registro)
@@ -0,0 +1,262 @@
+"""
+Tema de la interfaz
+Registro central de fuentes, colores y estilos de widgets de las vistas.
+
+Las fuentes se crean una sola vez por combinación (familia, tamaño, peso) y se
+comparten entre todos los widgets: antes cada celda de las tablas creaba su
+propio CTkFont y Tk registraba una fuente con nombre por cada uno (miles por
+tabla). Los colores y estilos son constantes para pasar como argumentos:
+
+    ctk.CTkButton(parent, text="Guardar", font=tema.fuente(13), **tema.BOTON_EXITO)
+
+Perfiles de dibujo (AUTOGEST_PERFIL):
+    completo     Esquinas redondeadas, hover en las filas, íconos emoji (por defecto)
+    rendimiento  Widgets planos, sin hover en las filas, íconos de texto y menos
+                 frames anidados: para máquinas virtuales, X11 remoto o escritorio
+                 remoto, donde cada redibujado es caro
+    auto         completo, salvo que se detecte renderizado por software, una
+                 máquina virtual, una sesión remota o pocos cuadros por segundo
+"""
+import os
+import sys
+import time
+import tkinter
+
+import customtkinter as ctk
+
+FAMILIA = "Inter"
+FAMILIA_ICONOS = "Segoe UI Emoji"
+
+# --- Colores ---
+
+BLANCO = "#FFFFFF"
+GRIS_50 = "#F9FAFB"
+GRIS_100 = "#F3F4F6"
+GRIS_200 = "#E5E7EB"
+GRIS_500 = "#6B7280"
+GRIS_600 = "#4B5563"
+GRIS_700 = "#374151"
+GRIS_800 = "#1F2937"
+
+PRIMARIO = "#6366F1"
+PRIMARIO_HOVER = "#4F46E5"
+EXITO = "#10B981"
+EXITO_HOVER = "#059669"
+PELIGRO = "#EF4444"
+PELIGRO_HOVER = "#DC2626"
+
+# Tablas
+COLORES_FILA = (BLANCO, GRIS_50)
+COLOR_HOVER = "#DBEAFE"
+COLOR_SELECCION = "#BFDBFE"
+COLOR_TEXTO = GRIS_700
+COLOR_TITULO = GRIS_800
+COLOR_ENCABEZADO = GRIS_50
+
+# --- Estilos ---
+
+BOTON_PRIMARIO = {"fg_color": PRIMARIO, "hover_color": PRIMARIO_HOVER}
+BOTON_EXITO = {"fg_color": EXITO, "hover_color": EXITO_HOVER}
+BOTON_PELIGRO = {"fg_color": PELIGRO, "hover_color": PELIGRO_HOVER}
+BOTON_SECUNDARIO = {"fg_color": GRIS_500, "hover_color": GRIS_600}
+
+
+# --- Fuentes ---
+
+_fuentes = {}
+_raiz = None
+
+
+def fuente(tamano=12, peso="normal", familia=FAMILIA, **opciones):
+    """
+    Fuente compartida (se crea la primera vez que se pide)
+
+    Args:
+        tamano (int): Tamaño en puntos
+        peso (str): 'normal' o 'bold'
+        familia (str): Familia tipográfica (None = la del tema de customtkinter)
+        **opciones: Otras opciones de CTkFont (underline, slant...)
+
+    Returns:
+        CTkFont: La misma instancia para los mismos argumentos
+    """
+    global _raiz
+    # Las fuentes pertenecen a la ventana raíz: si se creó otra, se descartan
+    if tkinter._default_root is not _raiz:
+        _fuentes.clear()
+        _raiz = tkinter._default_root
+
+    clave = (familia, tamano, peso, tuple(sorted(opciones.items())))
+    resultado = _fuentes.get(clave)
+    if resultado is None:
+        resultado = ctk.CTkFont(family=familia, size=tamano, weight=peso, **opciones)
+        _fuentes[clave] = resultado
+    return resultado
+
+
+def fuente_iconos(tamano=18, peso="normal"):
+    """Fuente de los íconos emoji de los botones (la de texto en el perfil de rendimiento)"""
+    if perfil_rendimiento():
+        return fuente(tamano - 4, "bold")
+    return fuente(tamano, peso, familia=FAMILIA_ICONOS)
+
+
+def fuentes_creadas():
+    """Cantidad de fuentes del registro (para los benchmarks)"""
+    return len(_fuentes)
+
+
+# --- Perfiles de dibujo ---
+
+PERFIL_COMPLETO = "completo"
+PERFIL_RENDIMIENTO = "rendimiento"
+PERFIL_AUTO = "auto"
+
+# Por debajo de estos cuadros por segundo el perfil auto pasa a rendimiento
+FPS_MINIMO = 30
+
+# Fabricantes y productos de /sys/class/dmi/id de los hipervisores comunes
+MARCAS_VM = ("VirtualBox", "VMware", "QEMU", "KVM", "Xen", "Bochs", "Parallels", "Virtual Machine")
+
+_perfil = PERFIL_COMPLETO
+
+ICONOS = {
+    "autos": "🚗",
+    "clientes": "👥",
+    "ventas": "💰",
+    "salir": "⬅️",
+    "nuevo": "➕",
+    "imprimir": "🖨️",
+    "exportar": "📄",
+    "imagen": "📸",
+    "editar": "✎",
+    "eliminar": "🗑",
+    "auto": "🚗",
+}
+
+# Equivalentes de texto del perfil de rendimiento (para los íconos sin texto)
+ICONOS_TEXTO = {
+    "editar": "E",
+    "eliminar": "X",
+}
+
+
+def perfil_rendimiento():
+    """Indica si se dibuja con el perfil de rendimiento"""
+    return _perfil == PERFIL_RENDIMIENTO
+
+
+def usar_perfil(nombre):
+    """
+    Cambia el perfil de dibujo (se aplica a los widgets que se creen después)
+
+    Raises:
+        ValueError: Si el perfil no existe
+    """
+    global _perfil
+    if nombre not in (PERFIL_COMPLETO, PERFIL_RENDIMIENTO):
+        raise ValueError(f"Perfil de dibujo desconocido: {nombre}")
+    _perfil = nombre
+
+
+def perfil_configurado():
+    """Perfil pedido en AUTOGEST_PERFIL: completo, rendimiento o auto"""
+    nombre = os.getenv("AUTOGEST_PERFIL", PERFIL_AUTO).strip().lower()
+    return nombre if nombre in (PERFIL_COMPLETO, PERFIL_RENDIMIENTO) else PERFIL_AUTO
+
+
+def motivo_rendimiento():
+    """Razón para preferir el perfil de rendimiento en este equipo (o None)"""
+    if os.getenv("LIBGL_ALWAYS_SOFTWARE") == "1":
+        return "renderizado por software (LIBGL_ALWAYS_SOFTWARE=1)"
+
+    if sys.platform.startswith("linux"):
+        for archivo in ("sys_vendor", "product_name"):
+            try:
+                valor = open(f"/sys/class/dmi/id/{archivo}", encoding="utf-8").read().strip()
+            except OSError:
+                continue
+            if any(marca.lower() in valor.lower() for marca in MARCAS_VM):
+                return f"máquina virtual ({valor})"
+
+    # DISPLAY con nombre de host (p. ej. localhost:10.0): X11 reenviado por SSH
+    display = os.getenv("DISPLAY", "")
+    if display and not display.startswith(":") and not display.startswith("/") and not display.startswith("unix"):
+        return f"X11 remoto (DISPLAY={display})"
+
+    if os.getenv("SESSIONNAME", "").upper().startswith("RDP-"):
+        return "escritorio remoto"
+
+    return None
+
+
+def detectar_perfil():
+    """
+    Aplica el perfil de AUTOGEST_PERFIL; en auto elige el de rendimiento si hay
+    motivo_rendimiento() (nunca vuelve de rendimiento a completo: lo puede haber
+    elegido medir_fps)
+
+    Returns:
+        str: Motivo del perfil de rendimiento o None
+    """
+    configurado = perfil_configurado()
+    if configurado != PERFIL_AUTO:
+        usar_perfil(configurado)
+        return "AUTOGEST_PERFIL=rendimiento" if configurado == PERFIL_RENDIMIENTO else None
+
+    motivo = motivo_rendimiento()
+    if motivo:
+        usar_perfil(PERFIL_RENDIMIENTO)
+    return motivo
+
+
+def medir_fps(widget, al_terminar, duracion_ms=600, intervalo_ms=10):
+    """
+    Mide los cuadros por segundo que alcanza el ciclo de eventos de Tk
+    Encadena after(intervalo_ms) durante duracion_ms: con un servidor X lento
+    o sin aceleración cada vuelta tarda más que el intervalo
+
+    Args:
+        al_terminar: Función fps -> None (se llama en el hilo de Tk)
+    """
+    inicio = time.perf_counter()
+    cuadros = [0]
+
+    def cuadro():
+        if not widget.winfo_exists():
+            return
+        cuadros[0] += 1
+        transcurrido = time.perf_counter() - inicio
+        if transcurrido * 1000 >= duracion_ms:
+            al_terminar(cuadros[0] / transcurrido)
+            return
+        widget.after(intervalo_ms, cuadro)
+
+    widget.after(intervalo_ms, cuadro)
+
+
+def radio(valor):
+    """Radio de las esquinas (0 en el perfil de rendimiento)"""
+    return 0 if perfil_rendimiento() else valor
+
+
+def entrada():
+    """Estilo de las entradas de texto (función: el radio depende del perfil activo)"""
+    return {
+        "border_width": 1,
+        "border_color": GRIS_200,
+        "fg_color": GRIS_50,
+        "corner_radius": radio(8),
+    }
+
+
+def icono(clave, texto=None, separador=" "):
+    """
+    Texto de un botón o etiqueta con su ícono
+
+    Con el perfil de rendimiento se omite el emoji (solo el texto, o un
+    equivalente de ICONOS_TEXTO si el ícono va solo)
+    """
+    if perfil_rendimiento():
+        return texto if texto else ICONOS_TEXTO.get(clave, "")
+    return f"{ICONOS[clave]}{separador}{texto}" if texto else ICONOS[clave]
@@ -3,21 +3,28 @@ Vista para la gestión de ventas
 Incluye tabla, formularios y operaciones CRUD
 """
 import customtkinter as ctk
+from view import tema
 from tkinter import messagebox
 from controller.venta_controller import VentaController
+from model.cambios import notificador_cambios
+from view.filas_en_vivo import FilasEnVivo
+from view.formularios import VentanaFormulario, pool_formularios
+from view.selector_busqueda import SelectorBusqueda
+from view.tabla_canvas import TablaCanvas, Columna, Accion, usar_tabla_canvas
 from controller.auto_controller import AutoController
 from controller.cliente_controller import ClienteController
-from utils.printer import pdf_generator
 from datetime import datetime
 
-class VentaView(ctk.CTkFrame):
+class VentaView(FilasEnVivo, ctk.CTkFrame):
     """Vista de gestión de ventas"""
     
     def __init__(self, parent):
         super().__init__(parent, fg_color="#F4F6F7")
         
         self.selected_venta = None
-        self.selected_row_frame = None  # Para resaltar la fila seleccionada
+        self.al_seleccionar_fila = self.select_venta  # Clic en una fila (ver FilasEnVivo)
+        self.tabla = None  # TablaCanvas con AUTOGEST_TABLA=canvas
+        self.iniciar_filas()
         
         # Configurar grid
         self.grid_columnconfigure(0, weight=1)
@@ -30,10 +37,17 @@ class VentaView(ctk.CTkFrame):
         
         # Cargar datos
         self.load_ventas()
+        
+        # Cambios hechos desde otros equipos
+        notificador_cambios.suscribir('ventas', self.aplicar_cambios)
+    
+    def destroy(self):
+        notificador_cambios.desuscribir('ventas', self.aplicar_cambios)
+        super().destroy()
     
     def create_header(self):
         """Crea el encabezado de la vista"""
-        header_frame = ctk.CTkFrame(self, fg_color="#FFFFFF", corner_radius=10)
+        header_frame = ctk.CTkFrame(self, fg_color=tema.BLANCO, corner_radius=tema.radio(10))
         header_frame.grid(row=0, column=0, sticky="ew", pady=(0, 20))
         header_frame.grid_columnconfigure(2, weight=1)
         
@@ -48,11 +62,8 @@ class VentaView(ctk.CTkFrame):
             placeholder_text="Buscar venta...",
             width=300,
             height=40,
-            border_width=1,
-            border_color="#E5E7EB",
-            fg_color="#F9FAFB",
-            corner_radius=8,
-            font=ctk.CTkFont(family="Inter", size=13)
+            **tema.entrada(),
+            font=tema.fuente(13)
         )
         self.search_entry.grid(row=0, column=0, padx=(0, 10))
         
@@ -62,36 +73,65 @@ class VentaView(ctk.CTkFrame):
         
         btn_nuevo = ctk.CTkButton(
             buttons_frame,
-            text="➕ Nueva Venta",
+            text=tema.icono("nuevo", "Nueva Venta"),
             command=self.show_form_nuevo,
             width=130,
             height=40,
-            fg_color="#10B981",
-            hover_color="#059669",
-            corner_radius=8
+            **tema.BOTON_EXITO,
+            corner_radius=tema.radio(8)
         )
         btn_nuevo.pack(side="left", padx=(0, 10))
         
         btn_imprimir = ctk.CTkButton(
             buttons_frame,
-            text="🖨️ Imprimir",
+            text=tema.icono("imprimir", "Imprimir"),
             command=self.generar_pdf,
             width=130,
             height=40,
-            fg_color="#6366F1",
-            hover_color="#4F46E5",
-            corner_radius=8
+            **tema.BOTON_PRIMARIO,
+            corner_radius=tema.radio(8)
         )
         btn_imprimir.pack(side="left", padx=(0, 10))
+        
+        self.btn_exportar = ctk.CTkButton(
+            buttons_frame,
+            text=tema.icono("exportar", "Exportar CSV"),
+            command=self.exportar_csv,
+            width=130,
+            height=40,
+            **tema.BOTON_PRIMARIO,
+            corner_radius=tema.radio(8)
+        )
+        self.btn_exportar.pack(side="left", padx=(0, 10))
     
     def create_table(self):
         """Crea la tabla de ventas"""
-        table_frame = ctk.CTkFrame(self, fg_color="#FFFFFF", corner_radius=10)
+        table_frame = ctk.CTkFrame(self, fg_color=tema.BLANCO, corner_radius=tema.radio(10))
         table_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 20))
         table_frame.grid_columnconfigure(0, weight=1)
         table_frame.grid_rowconfigure(1, weight=1)
         
-        headers_frame = ctk.CTkFrame(table_frame, fg_color="#F9FAFB", corner_radius=0, height=45)
+        if usar_tabla_canvas():
+            self.tabla = TablaCanvas(
+                table_frame,
+                columnas=[
+                    Columna("ID", 1, lambda v: v['id_venta']),
+                    Columna("Cliente", 3, lambda v: v['cliente_nombre']),
+                    Columna("Auto", 3, lambda v: f"{v['auto_marca']} {v['auto_modelo']} ({v['auto_anio']})"),
+                    Columna("Fecha", 2, lambda v: v['fecha_venta']),
+                    Columna("Monto", 2, lambda v: f"${v['monto']:,.2f}"),
+                    Columna("Método de Pago", 2, lambda v: v['metodo_pago']),
+                    Columna("Acciones", 1, tipo="acciones"),
+                ],
+                acciones=[Accion(tema.icono("eliminar"), "#EF4444", "#DC2626", self.eliminar_venta)],
+                clave='id_venta',
+                alto_fila=50,
+                al_seleccionar=self.select_venta
+            )
+            self.tabla.grid(row=0, column=0, rowspan=2, sticky="nsew")
+            return
+        
+        headers_frame = ctk.CTkFrame(table_frame, fg_color=tema.GRIS_50, corner_radius=0, height=45)
         headers_frame.grid(row=0, column=0, sticky="ew")
         headers_frame.grid_propagate(False)
         
@@ -99,8 +139,7 @@ class VentaView(ctk.CTkFrame):
         weights = [1, 3, 3, 2, 2, 2, 1]
         
         # Configurar columnas del header
-        for i, weight in enumerate(weights):
-            headers_frame.grid_columnconfigure(i, weight=weight)
+        self.configurar_columnas(headers_frame, weights)
         
         # Crear encabezados con celdas para alineación perfecta
         for i, header in enumerate(headers):
@@ -111,13 +150,13 @@ class VentaView(ctk.CTkFrame):
             label = ctk.CTkLabel(
                 header_cell,
                 text=header,
-                font=ctk.CTkFont(family="Inter", size=13, weight="bold"),
-                text_color="#1F2937",
+                font=tema.fuente(13, "bold"),
+                text_color=tema.GRIS_800,
                 anchor="center"
             )
             label.place(relx=0.5, rely=0.5, anchor="center")
         
-        self.table_scroll = ctk.CTkScrollableFrame(table_frame, fg_color="#FFFFFF")
+        self.table_scroll = ctk.CTkScrollableFrame(table_frame, fg_color=tema.BLANCO)
         self.table_scroll.grid(row=1, column=0, sticky="nsew")
         self.table_scroll.grid_columnconfigure(0, weight=1)
     
@@ -128,260 +167,208 @@ class VentaView(ctk.CTkFrame):
     
     def load_ventas(self):
         """Carga las ventas en la tabla"""
-        for widget in self.table_scroll.winfo_children():
-            widget.destroy()
+        if self.tabla is None:
+            for widget in self.table_scroll.winfo_children():
+                widget.destroy()
+        self.iniciar_filas()
         
-        success, result = VentaController.obtener_todas()
+        success, result = VentaController.obtener_todas(compacto=True)
         
         if not success:
             messagebox.showerror("Error", result)
             return
         
+        if self.tabla is not None:
+            self.tabla.cargar(result)
+            return
+        
         for i, venta in enumerate(result):
-            row_frame = ctk.CTkFrame(
-                self.table_scroll,
-                fg_color="#FFFFFF" if i % 2 == 0 else "#F9FAFB",
-                corner_radius=0,
-                height=50
-            )
-            row_frame.grid(row=i, column=0, sticky="ew", pady=1)
-            row_frame.grid_propagate(False)
-            row_frame.grid_columnconfigure(0, weight=1)
-            
-            # Configurar cursor para toda la fila
-            row_frame.configure(cursor="hand2")
-            
-            # Aplicar eventos de clic a toda la fila y sus hijos
-            self.bind_click_recursive(row_frame, venta, row_frame)
-            
-            # Eventos hover
-            row_frame.bind("<Enter>", lambda e, rf=row_frame: rf.configure(fg_color="#DBEAFE") if rf != self.selected_row_frame else None)
-            row_frame.bind("<Leave>", lambda e, rf=row_frame, idx=i: rf.configure(
-                fg_color="#BFDBFE" if rf == self.selected_row_frame else ("#FFFFFF" if idx % 2 == 0 else "#F9FAFB")
-            ))
-            
-            data_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-            data_frame.pack(fill="both", expand=True, padx=10, pady=5)
-            
-            weights = [1, 3, 3, 2, 2, 2, 1]
-            auto_info = f"{venta['auto_marca']} {venta['auto_modelo']} ({venta['auto_anio']})"
-            values = [
-                venta['id_venta'],
-                venta['cliente_nombre'],
-                auto_info,
-                str(venta['fecha_venta']),
-                f"${venta['monto']:,.2f}",
-                venta['metodo_pago']
-            ]
-            
-            # Configurar columnas
-            for col, weight in enumerate(weights):
-                data_frame.grid_columnconfigure(col, weight=weight)
-            
-            # Crear celdas centradas para los datos
-            for j, value in enumerate(values):
-                cell_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=40)
-                cell_frame.grid(row=0, column=j, sticky="nsew", padx=5)
-                cell_frame.grid_propagate(False)
-                
-                label = ctk.CTkLabel(
-                    cell_frame,
-                    text=str(value),
-                    font=ctk.CTkFont(family="Inter", size=12),
-                    text_color="#374151",
-                    anchor="center"
-                )
-                label.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Frame para botones de acción con diseño profesional
-            actions_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=40)
-            actions_frame.grid(row=0, column=len(values), sticky="nsew", padx=5)
-            actions_frame.grid_propagate(False)
-            
-            buttons_container = ctk.CTkFrame(actions_frame, fg_color="transparent")
-            buttons_container.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Botón Eliminar con diseño moderno
-            btn_eliminar = ctk.CTkButton(
-                buttons_container,
-                text="",
-                width=40,
-                height=40,
-                fg_color="#EF4444",
-                hover_color="#DC2626",
-                corner_radius=10,
-                border_width=0,
-                command=lambda v=venta: self.eliminar_venta(v)
-            )
-            btn_eliminar.pack(side="left", padx=4)
-            
-            # Ícono de eliminar (papelera) con mejor diseño
-            icon_delete_label = ctk.CTkLabel(
-                btn_eliminar,
-                text="🗑",
-                font=ctk.CTkFont(family="Segoe UI Emoji", size=18),
-                text_color="#FFFFFF"
-            )
-            icon_delete_label.place(relx=0.5, rely=0.5, anchor="center")
-            icon_delete_label.configure(cursor="hand2")
-            icon_delete_label.bind("<Button-1>", lambda e, v=venta: self.eliminar_venta(v))
+            self.crear_fila(i, venta)
     
-    def bind_click_recursive(self, widget, venta, row_frame):
-        """Vincula eventos de clic a un widget y todos sus hijos recursivamente"""
-        # Excluir botones de acción del binding recursivo
-        widget_class = widget.winfo_class()
-        if 'Button' in widget_class:
-            return
+    def crear_fila(self, i, venta):
+        """Crea la fila de la tabla para un registro y la guarda en el índice de filas"""
+        row_frame = ctk.CTkFrame(
+            self.table_scroll,
+            fg_color=tema.COLORES_FILA[i % 2],
+            corner_radius=0,
+            height=50
+        )
+        row_frame.grid(row=i, column=0, sticky="ew", pady=1)
+        row_frame.grid_propagate(False)
+        row_frame.grid_columnconfigure(0, weight=1)
+        
+        # Configurar cursor para toda la fila
+        row_frame.configure(cursor="hand2")
         
-        # Vincular el evento de clic
-        widget.bind("<Button-1>", lambda e: self.select_venta(venta, row_frame))
+        # Los clics y el hover de la fila se delegan al registrarla (ver FilasEnVivo)
         
-        # Aplicar recursivamente a todos los hijos
-        for child in widget.winfo_children():
-            self.bind_click_recursive(child, venta, row_frame)
+        data_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
+        data_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        weights = [1, 3, 3, 2, 2, 2, 1]
+        auto_info = f"{venta['auto_marca']} {venta['auto_modelo']} ({venta['auto_anio']})"
+        values = [
+            venta['id_venta'],
+            venta['cliente_nombre'],
+            auto_info,
+            str(venta['fecha_venta']),
+            f"${venta['monto']:,.2f}",
+            venta['metodo_pago']
+        ]
+        
+        # Configurar columnas
+        self.configurar_columnas(data_frame, weights)
+        
+        # Crear celdas centradas para los datos
+        for j, value in enumerate(values):
+            self.crear_celda(data_frame, j, str(value), 40)
+        
+        # Botones de acción
+        self.crear_acciones(data_frame, len(values), 40, [
+            ("eliminar", tema.BOTON_PELIGRO, tema.fuente_iconos(18), lambda v=venta: self.eliminar_venta(v)),
+        ])
+        
+        self.registrar_fila(venta['id_venta'], venta, row_frame, i)
+        return row_frame
     
     def select_venta(self, venta, row_frame=None):
         """Selecciona una venta de la tabla con resaltado visual"""
-        # Restaurar color de la fila previamente seleccionada
-        if self.selected_row_frame:
-            try:
-                idx = list(self.table_scroll.winfo_children()).index(self.selected_row_frame)
-                self.selected_row_frame.configure(fg_color="#FFFFFF" if idx % 2 == 0 else "#F9FAFB")
-            except:
-                pass
-        
-        # Seleccionar la nueva venta
+        self.marcar_seleccion(venta['id_venta'], row_frame)
         self.selected_venta = venta
-        self.selected_row_frame = row_frame
-        
-        # Resaltar la nueva fila seleccionada
-        if row_frame:
-            row_frame.configure(fg_color="#BFDBFE")
         
         print(f"✓ Venta seleccionada: ID {venta['id_venta']} - Cliente: {venta['cliente_nombre']}")
     
+    def obtener_fila(self, id_venta):
+        """Fila de lista de una venta para actualizarla en la tabla"""
+        return VentaController.obtener_fila(id_venta)
+    
+    def clave_orden(self, venta):
+        """Más recientes primero, como VentaModel.obtener_todas"""
+        fecha = venta['fecha_venta']
+        return (-fecha.toordinal() if fecha else 0, -venta['id_venta'])
+    
+    def filtro_activo(self):
+        """La tabla de ventas no tiene búsqueda"""
+        return False
+    
+    def recargar(self):
+        """Recarga la tabla completa"""
+        self.load_ventas()
+    
+    def limpiar_seleccion(self):
+        """Olvida la venta seleccionada"""
+        self.selected_venta = None
+    
     def show_form_nuevo(self):
-        """Muestra el formulario para crear una nueva venta"""
-        form_window = ctk.CTkToplevel(self)
-        form_window.title("Nueva Venta")
-        
-        # Calcular tamaño dinámico (65% de la altura de pantalla, máx 550px)
-        screen_height = form_window.winfo_screenheight()
-        window_height = min(int(screen_height * 0.65), 550)
-        window_width = 500
-        
-        form_window.geometry(f"{window_width}x{window_height}")
-        form_window.resizable(True, True)  # Permitir redimensionar
-        form_window.minsize(450, 400)  # Tamaño mínimo
-        
-        # Centrar ventana
-        form_window.transient(self)
-        
-        # Centrar en la pantalla
-        form_window.update_idletasks()
-        #grab_set para evitar interacción con ventana principal
-        form_window.grab_set()
-        
-        screen_width = form_window.winfo_screenwidth()
-        x = (screen_width // 2) - (window_width // 2)
-        y = (screen_height // 2) - (window_height // 2)
-        form_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        """Muestra el formulario para crear una nueva venta (se construye una vez y se reutiliza)"""
+        ventana = pool_formularios.obtener("venta", self, VentaView.crear_formulario)
+        campos = ventana.campos
+        
+        # Vaciar los campos (los clientes y autos se consultan al escribir)
+        campos['cliente'].limpiar()
+        campos['auto'].limpiar()
+        campos['metodo'].set("Efectivo")
+        campos['monto'].delete(0, "end")
+        campos['fecha'].delete(0, "end")
+        campos['fecha'].insert(0, datetime.now().strftime("%Y-%m-%d"))
+        
+        ventana.conectar(guardar=lambda: self.save_venta(
+            campos['cliente'], campos['auto'], campos['monto'], campos['metodo'], campos['fecha'], ventana
+        ))
+        ventana.mostrar("Nueva Venta", enfocar=campos['cliente'].entry)
+    
+    @staticmethod
+    def crear_formulario(parent):
+        """Construye la ventana del formulario de ventas (una vez por aplicación, ver view/formularios.py)"""
+        # Tamaño dinámico (65% de la altura de pantalla, máx 550px)
+        ventana = VentanaFormulario(parent, ancho=500, alto_maximo=550, proporcion=0.65, minimo=(450, 400))
         
         # Contenedor principal
-        main_frame = ctk.CTkFrame(form_window, fg_color="#F4F6F7")
+        main_frame = ctk.CTkFrame(ventana, fg_color="#F4F6F7", corner_radius=tema.radio(6))
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         # Título
         title = ctk.CTkLabel(
             main_frame,
             text="Nueva Venta",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=tema.fuente(20, "bold", familia=None),
             text_color="#2C3E50"
         )
         title.pack(pady=(0, 20))
         
         # Formulario
-        form_frame = ctk.CTkFrame(main_frame, fg_color="#FFFFFF", corner_radius=10)
+        form_frame = ctk.CTkFrame(main_frame, fg_color=tema.BLANCO, corner_radius=tema.radio(10))
         form_frame.pack(fill="both", expand=True)
         
         # Scroll para el formulario
         scroll_frame = ctk.CTkScrollableFrame(form_frame, fg_color="transparent")
         scroll_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        ventana.scroll_frame = scroll_frame
         
-        # Obtener autos y clientes
-        success_autos, autos = AutoController.obtener_todos()
-        success_clientes, clientes = ClienteController.obtener_todos()
-        
-        if not success_autos or not success_clientes:
-            messagebox.showerror("Error", "No se pudieron cargar los datos necesarios")
-            form_window.destroy()
-            return
-        
-        # Cliente
+        # Cliente (sugerencias por nombre mientras se escribe)
         label_cliente = ctk.CTkLabel(
             scroll_frame,
             text="Cliente:",
-            font=ctk.CTkFont(size=12),
+            font=tema.fuente(12, familia=None),
             text_color="#2E2E2E"
         )
         label_cliente.pack(anchor="w", padx=0, pady=(5, 5))
         
-        clientes_dict = {f"{c['nombre']} (ID: {c['id_cliente']})": c['id_cliente'] for c in clientes}
-        cliente_var = ctk.StringVar()
-        cliente_combo = ctk.CTkComboBox(
+        cliente_selector = SelectorBusqueda(
             scroll_frame,
-            values=list(clientes_dict.keys()),
-            variable=cliente_var,
-            height=35
+            buscar=ClienteController.sugerir_clientes,
+            etiqueta=lambda c: f"{c['nombre']} (ID: {c['id_cliente']})",
+            clave=lambda c: c['id_cliente'],
+            placeholder="Escriba el nombre del cliente..."
         )
-        cliente_combo.pack(fill="x", padx=0)
+        cliente_selector.pack(fill="x", padx=0)
         
-        # Auto
+        # Auto (sugerencias por marca, modelo o año)
         label_auto = ctk.CTkLabel(
             scroll_frame,
             text="Auto:",
-            font=ctk.CTkFont(size=12),
+            font=tema.fuente(12, familia=None),
             text_color="#2E2E2E"
         )
         label_auto.pack(anchor="w", padx=0, pady=(10, 5))
         
-        autos_dict = {f"{a['marca']} {a['modelo']} {a['anio']} - ${a['precio']:,.2f}": a['id_auto'] for a in autos}
-        auto_var = ctk.StringVar()
-        auto_combo = ctk.CTkComboBox(
+        auto_selector = SelectorBusqueda(
             scroll_frame,
-            values=list(autos_dict.keys()),
-            variable=auto_var,
-            height=35
+            buscar=AutoController.sugerir_autos,
+            etiqueta=lambda a: f"{a['marca']} {a['modelo']} {a['anio']} - ${a['precio']:,.2f}",
+            clave=lambda a: a['id_auto'],
+            placeholder="Marca, modelo o año..."
         )
-        auto_combo.pack(fill="x", padx=0)
+        auto_selector.pack(fill="x", padx=0)
         
         # Monto
         label_monto = ctk.CTkLabel(
             scroll_frame,
             text="Monto:",
-            font=ctk.CTkFont(size=12),
+            font=tema.fuente(12, familia=None),
             text_color="#2E2E2E"
         )
         label_monto.pack(anchor="w", padx=0, pady=(10, 5))
         
-        monto_entry = ctk.CTkEntry(scroll_frame, height=35)
+        monto_entry = ctk.CTkEntry(scroll_frame, height=35, corner_radius=tema.radio(6))
         monto_entry.pack(fill="x", padx=0)
         
         # Método de pago
         label_metodo = ctk.CTkLabel(
             scroll_frame,
             text="Método de Pago:",
-            font=ctk.CTkFont(size=12),
+            font=tema.fuente(12, familia=None),
             text_color="#2E2E2E"
         )
         label_metodo.pack(anchor="w", padx=0, pady=(10, 5))
         
-        metodo_var = ctk.StringVar(value="Efectivo")
+        metodo_var = ctk.StringVar(master=ventana, value="Efectivo")
         metodo_combo = ctk.CTkComboBox(
             scroll_frame,
             values=["Efectivo", "Tarjeta", "Transferencia"],
             variable=metodo_var,
-            height=35
+            height=35,
+            corner_radius=tema.radio(6)
         )
         metodo_combo.pack(fill="x", padx=0)
         
@@ -389,13 +376,12 @@ class VentaView(ctk.CTkFrame):
         label_fecha = ctk.CTkLabel(
             scroll_frame,
             text="Fecha (YYYY-MM-DD):",
-            font=ctk.CTkFont(size=12),
+            font=tema.fuente(12, familia=None),
             text_color="#2E2E2E"
         )
         label_fecha.pack(anchor="w", padx=0, pady=(10, 5))
         
-        fecha_entry = ctk.CTkEntry(scroll_frame, height=35)
-        fecha_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        fecha_entry = ctk.CTkEntry(scroll_frame, height=35, corner_radius=tema.radio(6))
         fecha_entry.pack(fill="x", padx=0)
         
         # Botones
@@ -405,49 +391,54 @@ class VentaView(ctk.CTkFrame):
         btn_guardar = ctk.CTkButton(
             buttons_frame,
             text="Guardar",
-            command=lambda: self.save_venta(
-                clientes_dict, cliente_var, autos_dict, auto_var,
-                monto_entry, metodo_var, fecha_entry, form_window
-            ),
-            font=ctk.CTkFont(size=14),
+            command=lambda: ventana.ejecutar('guardar'),
+            font=tema.fuente(14, familia=None),
             height=40,
             width=120,
-            fg_color="#27AE60"
+            fg_color="#27AE60",
+            corner_radius=tema.radio(6)
         )
         btn_guardar.pack(side="left", padx=10)
         
         btn_cancelar = ctk.CTkButton(
             buttons_frame,
             text="Cancelar",
-            command=form_window.destroy,
-            font=ctk.CTkFont(size=14),
+            command=ventana.ocultar,
+            font=tema.fuente(14, familia=None),
             height=40,
             width=120,
-            fg_color="#95A5A6"
+            fg_color="#95A5A6",
+            corner_radius=tema.radio(6)
         )
         btn_cancelar.pack(side="left", padx=10)
+        
+        ventana.campos = {
+            'cliente': cliente_selector,
+            'auto': auto_selector,
+            'monto': monto_entry,
+            'metodo': metodo_var,
+            'fecha': fecha_entry,
+        }
+        return ventana
     
-    def save_venta(self, clientes_dict, cliente_var, autos_dict, auto_var, monto_entry, metodo_var, fecha_entry, window):
+    def save_venta(self, cliente_selector, auto_selector, monto_entry, metodo_var, fecha_entry, window):
         """Guarda la venta"""
         # Obtener valores
-        cliente_key = cliente_var.get()
-        auto_key = auto_var.get()
+        id_cliente = cliente_selector.get()
+        id_auto = auto_selector.get()
         monto = monto_entry.get().strip()
         metodo_pago = metodo_var.get()
         fecha = fecha_entry.get().strip()
         
-        if not cliente_key or not auto_key:
-            messagebox.showerror("Error", "Debe seleccionar un cliente y un auto")
+        if id_cliente is None or id_auto is None:
+            messagebox.showerror("Error", "Debe seleccionar un cliente y un auto de la lista")
             return
         
-        id_cliente = clientes_dict[cliente_key]
-        id_auto = autos_dict[auto_key]
-        
         success, result = VentaController.crear_venta(id_auto, id_cliente, monto, metodo_pago, fecha)
         
         if success:
-            # Destruir ventana primero para evitar que se sobreponga
-            window.destroy()
+            # Ocultar la ventana primero para evitar que se sobreponga
+            window.ocultar()
             # Recargar datos
             self.load_ventas()
             # Mostrar mensaje después
@@ -476,15 +467,49 @@ class VentaView(ctk.CTkFrame):
         else:
             messagebox.showerror("Error", result)
     
+    def exportar_csv(self):
+        """
+        Exporta la lista de ventas a CSV en segundo plano
+        db.stream lee con su propia conexión, así que la ventana sigue respondiendo
+        """
+        dispatcher = getattr(self.winfo_toplevel(), "dispatcher", None)
+        if dispatcher is None:
+            self.al_exportar_csv(VentaController.exportar_csv())
+            return
+        self.btn_exportar.configure(state="disabled")
+        dispatcher.run_in_background(VentaController.exportar_csv, self.al_exportar_csv)
+    
+    def al_exportar_csv(self, resultado):
+        """Resultado de la exportación (en el hilo de Tk)"""
+        if self.winfo_exists():
+            self.btn_exportar.configure(state="normal")
+        if isinstance(resultado, Exception):
+            resultado = (False, str(resultado))
+        success, result = resultado
+        if not success:
+            messagebox.showerror("Error", f"No se pudo exportar: {result}")
+            return
+        
+        output_path, filas = result
+        messagebox.showinfo("CSV Generado", f"Se exportaron {filas} ventas a:\n{output_path}")
+    
     def generar_pdf(self):
         """Genera un PDF de la venta seleccionada e invoca el diálogo de impresión"""
         if not self.selected_venta:
             messagebox.showwarning("Advertencia", "Debe seleccionar una venta para generar el PDF")
             return
         
+        from utils.printer import pdf_generator
+        
         try:
-            filename = f"venta_{self.selected_venta['id_venta']}_comprobante.pdf"
-            output_path = pdf_generator.generate_venta_report(self.selected_venta, filename)
+            # El comprobante usa el registro completo, no la fila de la tabla
+            success, venta = VentaController.obtener_por_id(self.selected_venta['id_venta'])
+            if not success or not venta:
+                messagebox.showerror("Error", venta or "La venta ya no existe")
+                return
+            
+            filename = f"venta_{venta['id_venta']}_comprobante.pdf"
+            output_path = pdf_generator.generate_venta_report(venta, filename)
             
             # Preguntar qué acción desea realizar
             respuesta = messagebox.askyesnocancel(